@@ -11,7 +11,8 @@ __all__ = [
     "Role",
     "SpurGear",
     "WormGear",
-    "WormWheel"
+    "WormWheel",
+    "unchecked_assignments"
 ]
 
 
@@ -24,7 +25,8 @@ from .mechanical_object_base import (
         RotatingObject,
         MotorBase,
         GearBase,
-        Role
+        Role,
+        unchecked_assignments
 )
 from .spur_gear import SpurGear
 from .worm_gear import WormGear
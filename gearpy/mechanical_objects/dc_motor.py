@@ -1,13 +1,25 @@
+from collections import OrderedDict
 from gearpy.units import (
     AngularPosition,
     AngularSpeed,
+    AngularSpeedArray,
     AngularAcceleration,
     Current,
+    CurrentArray,
     InertiaMoment,
+    TimeSeries,
     Torque,
-    UnitBase
+    TorqueArray
 )
-from .mechanical_object_base import RotatingObject, MotorBase
+from .mechanical_object_base import (
+    _assignment_checks,
+    MotorBase,
+    RotatingObject
+)
+import numpy as np
+
+
+CHARACTERISTIC_CACHE_SIZE = 256
 
 
 class DCMotor(MotorBase):
@@ -65,6 +77,12 @@ class DCMotor(MotorBase):
         It computes the :py:attr:`driving_torque` developed by the DC motor.
     :py:meth:`compute_electric_current`
         It computes the :py:attr:`electric_current` absorbed by the DC motor.
+    :py:meth:`electric_current_at`
+        It computes the electric current absorbed by the DC motor at many
+        driving torque and :py:attr:`pwm` values at once.
+    :py:meth:`torque_at`
+        It computes the driving torque developed by the DC motor at many
+        angular speed and :py:attr:`pwm` values at once.
     :py:meth:`update_time_variables`
         It updates :py:attr:`time_variables` dictionary by appending the last
         value of each time variable to corresponding list.
@@ -137,10 +155,23 @@ class DCMotor(MotorBase):
         self.__no_load_electric_current = no_load_electric_current
         self.__maximum_electric_current = maximum_electric_current
         self.__pwm = 1
+        # factors which convert the torque, in Nm, and the electric current,
+        # in A, to the units of maximum_torque and maximum_electric_current
+        self.__torque_factor = \
+            Torque._new(value=1.0, unit='Nm')._to_value(maximum_torque.unit)
+        self.__electric_current_factor = Current._new(
+            value=1.0,
+            unit='A'
+        )._to_value(maximum_electric_current.unit) \
+            if maximum_electric_current is not None else None
+        self.__characteristics = OrderedDict()
+        self.__operands = OrderedDict()
 
         if self.electric_current_is_computable:
             self.__electric_current = None
-            self.time_variables['electric current'] = []
+            self.time_variables['electric current'] = TimeSeries(
+                Current
+            )
 
     @property
     def name(self) -> str:
@@ -425,7 +456,10 @@ class DCMotor(MotorBase):
         :py:attr:`no_load_speed` and :py:attr:`maximum_torque` and the two
         variables :py:attr:`angular_speed` and :py:attr:`pwm` of the
         DCMotor. \n
-        The computed torque has the same unit of :py:attr:`maximum_torque`.
+        The computed torque has the same unit of :py:attr:`maximum_torque`. \n
+        The terms of the relationship which depend only on :py:attr:`pwm` are
+        computed once and kept for the most recently used :py:attr:`pwm`
+        values.
         """\
         r"""
         .. admonition:: Notes
@@ -477,40 +511,114 @@ class DCMotor(MotorBase):
            .. math::
                D_{lim} = \frac{i_0}{i_{max}}
         """
-        if not self.electric_current_is_computable:
-            self.driving_torque = Torque(
-                value=(1 - self.angular_speed /
-                       self.no_load_speed)*self.maximum_torque.value,
+        maximum_torque, no_load_speed, _, _, _ = \
+            self.__get_operands(pwm=self.pwm)
+        if maximum_torque is None:
+            self.driving_torque = Torque._new(
+                value=0,
                 unit=self.maximum_torque.unit
             )
             return
 
-        pwm_min = self.no_load_electric_current/self.maximum_electric_current \
-            if self.electric_current_is_computable else 0
-        if abs(self.pwm) <= pwm_min:
-            self.driving_torque = Torque(0, unit=self.maximum_torque.unit)
-            return
-        elif self.pwm > pwm_min:
-            maximum_torque = \
-                self.maximum_torque*(
-                    (self.pwm*self.maximum_electric_current -
-                        self.no_load_electric_current) /
-                    (self.maximum_electric_current -
-                        self.no_load_electric_current)
-                )
-            no_load_speed = self.pwm*self.no_load_speed
-        else:
-            maximum_torque = \
-                self.maximum_torque*(
-                    (self.pwm*self.maximum_electric_current +
-                        self.no_load_electric_current) /
-                    (self.maximum_electric_current -
-                        self.no_load_electric_current)
-                )
-            no_load_speed = self.pwm*self.no_load_speed
+        # the same floating point operations performed by the unit objects
+        angular_speed = self.angular_speed
+        self.driving_torque = Torque._new(
+            value=(1 - angular_speed.value/no_load_speed._to_value(angular_speed.unit))*maximum_torque.value,
+            unit=self.maximum_torque.unit
+        )
+
+    def torque_at(
+        self,
+        angular_speed: AngularSpeedArray,
+        pwm: np.ndarray | list | tuple | float | int = 1
+    ) -> TorqueArray:
+        """It computes the driving torque developed by the DC motor at many
+        angular speed and :py:attr:`pwm` values at once, without changing the
+        DC motor :py:attr:`angular_speed`, :py:attr:`pwm` and
+        :py:attr:`driving_torque`. \n
+        The driving torque is computed with the same relationship of
+        :py:meth:`compute_torque`, including the critical :py:attr:`pwm`
+        below which the DC motor cannot develop any torque. The values of
+        ``angular_speed`` and ``pwm`` are broadcast together following
+        :py:mod:`numpy` rules, so, for example, a column of angular speeds and
+        a row of ``pwm`` values give the whole characteristic map. \n
+        The computed torques have the same unit of :py:attr:`maximum_torque`.
+
+        Parameters
+        ----------
+        ``angular_speed`` : :py:class:`AngularSpeedArray <gearpy.units.unit_arrays.AngularSpeedArray>`
+            Angular speeds of the DC motor.
+        ``pwm`` : :py:class:`numpy.ndarray`, :py:class:`list`, :py:class:`tuple`, :py:class:`float` or :py:class:`int`, optional
+            Pulse Width Modulation duty cycles of the supply voltage of the DC
+            motor, within ``-1`` and ``1``. Default is ``1``.
+
+        Returns
+        -------
+        :py:class:`TorqueArray <gearpy.units.unit_arrays.TorqueArray>`
+            Driving torques developed by the DC motor.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               - If ``angular_speed`` is not an instance of
+                 :py:class:`AngularSpeedArray <gearpy.units.unit_arrays.AngularSpeedArray>`,
+               - if ``pwm`` is not a :py:class:`numpy.ndarray`, a
+                 :py:class:`list`, a :py:class:`tuple`, a :py:class:`float`
+                 or an :py:class:`int`,
+               - if ``pwm`` does not contain only floats or integers.
+           ``ValueError``
+               - If a value of ``pwm`` is not within ``-1`` and ``1``,
+               - if ``angular_speed`` and ``pwm`` cannot be broadcast
+                 together.
+
+        .. admonition:: See Also
+           :class: seealso
 
-        self.driving_torque = Torque(
-            value=(1 - self.angular_speed/no_load_speed)*maximum_torque.value,
+           :py:meth:`compute_torque` \n
+           :py:meth:`electric_current_at`
+
+        .. admonition:: Examples
+           :class: important
+
+           >>> import numpy as np
+           >>> from gearpy.mechanical_objects import DCMotor
+           >>> from gearpy.units import (
+           ...     AngularSpeed,
+           ...     AngularSpeedArray,
+           ...     Current,
+           ...     InertiaMoment,
+           ...     Torque
+           ... )
+           >>> motor = DCMotor(
+           ...     name='motor',
+           ...     inertia_moment=InertiaMoment(1, 'gm^2'),
+           ...     no_load_speed=AngularSpeed(1000, 'rpm'),
+           ...     maximum_torque=Torque(2, 'Nm'),
+           ...     no_load_electric_current=Current(0.2, 'A'),
+           ...     maximum_electric_current=Current(2, 'A')
+           ... )
+           >>> speed = AngularSpeedArray([0, 250, 500], 'rpm')
+           >>> motor.torque_at(angular_speed=speed)
+           [2.  1.5 1. ] Nm
+           >>> motor.torque_at(angular_speed=speed, pwm=[1, 0.5, 0.05])
+           [2.         0.44444444 0.        ] Nm
+        """
+        if not isinstance(angular_speed, AngularSpeedArray):
+            raise TypeError(
+                f"Parameter 'angular_speed' must be an instance of "
+                f"{AngularSpeedArray.__name__!r}."
+            )
+
+        pwm = self.__validate_pwm(pwm=pwm)
+        torque_intercept, torque_slope, _, _ = \
+            self.__get_characteristics(pwm=pwm)
+
+        return TorqueArray._new(
+            values=(
+                torque_intercept -
+                torque_slope*angular_speed.to('rad/s').values
+            )*self.__torque_factor,
             unit=self.maximum_torque.unit
         )
 
@@ -578,7 +686,10 @@ class DCMotor(MotorBase):
         :py:attr:`maximum_electric_current` and the two variables
         :py:attr:`driving_torque` and :py:attr:`pwm` of the DC motor. \n
         The computed electric current has the same unit of
-        :py:attr:`maximum_electric_current`.
+        :py:attr:`maximum_electric_current`. \n
+        The terms of the relationship which depend only on :py:attr:`pwm` are
+        computed once and kept for the most recently used :py:attr:`pwm`
+        values.
         """ \
         r"""
         .. admonition:: Notes
@@ -635,21 +746,193 @@ class DCMotor(MotorBase):
            .. math::
                i_{lim} \left( D \right) = D \, i_{max}
         """
-        maximum_electric_current = self.pwm*self.maximum_electric_current
+        maximum_torque, _, electric_current_range, no_load_electric_current, \
+            dead_band_electric_current = self.__get_operands(pwm=self.pwm)
+        if maximum_torque is None:
+            # a copy, since the cached unit object must not be changed in place
+            self.electric_current = Current._new(
+                value=dead_band_electric_current.value,
+                unit=dead_band_electric_current.unit
+            )
+            return
+
+        # the same floating point operations performed by the unit objects
+        driving_torque = self.driving_torque
+        self.electric_current = Current._new(
+            value=electric_current_range.value*(driving_torque.value/maximum_torque._to_value(driving_torque.unit)) +
+            no_load_electric_current._to_value(electric_current_range.unit),
+            unit=self.maximum_electric_current.unit
+        )
+
+    def electric_current_at(
+        self,
+        driving_torque: TorqueArray,
+        pwm: np.ndarray | list | tuple | float | int = 1
+    ) -> CurrentArray:
+        """It computes the electric current absorbed by the DC motor at many
+        driving torque and :py:attr:`pwm` values at once, without changing
+        the DC motor :py:attr:`driving_torque`, :py:attr:`pwm` and
+        :py:attr:`electric_current`. \n
+        The electric current is computed with the same relationship of
+        :py:meth:`compute_electric_current`, including the critical
+        :py:attr:`pwm` below which the DC motor cannot develop any torque.
+        The values of ``driving_torque`` and ``pwm`` are broadcast together
+        following :py:mod:`numpy` rules. \n
+        The computed electric currents have the same unit of
+        :py:attr:`maximum_electric_current`.
+
+        Parameters
+        ----------
+        ``driving_torque`` : :py:class:`TorqueArray <gearpy.units.unit_arrays.TorqueArray>`
+            Driving torques developed by the DC motor.
+        ``pwm`` : :py:class:`numpy.ndarray`, :py:class:`list`, :py:class:`tuple`, :py:class:`float` or :py:class:`int`, optional
+            Pulse Width Modulation duty cycles of the supply voltage of the DC
+            motor, within ``-1`` and ``1``. Default is ``1``.
+
+        Returns
+        -------
+        :py:class:`CurrentArray <gearpy.units.unit_arrays.CurrentArray>`
+            Electric currents absorbed by the DC motor.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               - If ``driving_torque`` is not an instance of
+                 :py:class:`TorqueArray <gearpy.units.unit_arrays.TorqueArray>`,
+               - if ``pwm`` is not a :py:class:`numpy.ndarray`, a
+                 :py:class:`list`, a :py:class:`tuple`, a :py:class:`float`
+                 or an :py:class:`int`,
+               - if ``pwm`` does not contain only floats or integers.
+           ``ValueError``
+               - If :py:attr:`electric_current_is_computable` is ``False``,
+               - if a value of ``pwm`` is not within ``-1`` and ``1``,
+               - if ``driving_torque`` and ``pwm`` cannot be broadcast
+                 together.
+
+        .. admonition:: See Also
+           :class: seealso
+
+           :py:meth:`compute_electric_current` \n
+           :py:meth:`torque_at`
+
+        .. admonition:: Examples
+           :class: important
+
+           >>> speed = AngularSpeedArray([0, 250, 500], 'rpm')
+           >>> torque = motor.torque_at(angular_speed=speed, pwm=0.5)
+           >>> motor.electric_current_at(driving_torque=torque, pwm=0.5)
+           [1.  0.6 0.2] A
+        """
+        if not isinstance(driving_torque, TorqueArray):
+            raise TypeError(
+                f"Parameter 'driving_torque' must be an instance of "
+                f"{TorqueArray.__name__!r}."
+            )
+
+        if not self.electric_current_is_computable:
+            raise ValueError(
+                f"Impossible to compute electric current for "
+                f"{self.__class__.__name__} {self.name!r} because it misses "
+                f"'no_load_electric_current' or 'maximum_electric_current' "
+                f"parameters."
+            )
+
+        pwm = self.__validate_pwm(pwm=pwm)
+        _, _, electric_current_intercept, electric_current_slope = \
+            self.__get_characteristics(pwm=pwm)
+
+        return CurrentArray._new(
+            values=(
+                electric_current_intercept +
+                electric_current_slope*driving_torque.to('Nm').values
+            )*self.__electric_current_factor,
+            unit=self.maximum_electric_current.unit
+        )
+
+    @staticmethod
+    def __validate_pwm(
+        pwm: np.ndarray | list | tuple | float | int
+    ) -> np.ndarray:
+
+        if not isinstance(pwm, np.ndarray | list | tuple | float | int):
+            raise TypeError(
+                "Parameter 'pwm' must be a numpy array, a list, a tuple, a "
+                "float or an integer."
+            )
+
+        pwm = np.asarray(pwm)
+        if pwm.dtype.kind not in 'biuf':
+            raise TypeError(
+                "Parameter 'pwm' must contain only floats or integers."
+            )
+
+        pwm = pwm.astype(float)
+        if np.any((pwm > 1) | (pwm < -1)):
+            raise ValueError(
+                "Pulse Width Modulation (PWM) must be within -1 and 1."
+            )
+
+        return pwm
+
+    def __get_characteristics(
+        self,
+        pwm: np.ndarray
+    ) -> tuple[np.ndarray | float | None, ...]:
+
+        # a single pwm value uses the cached characteristic
+        if pwm.ndim == 0:
+            return self._get_characteristic(pwm=float(pwm))
+
+        return self.__compute_characteristics(pwm=pwm)
+
+    def _get_characteristic(
+        self,
+        pwm: float | int
+    ) -> tuple[float, float, float | None, float | None]:
+        # linear characteristic of the DC motor at the given pwm, in SI
+        # units: the driving torque is the torque intercept minus the torque
+        # slope times the angular speed and the electric current is the
+        # electric current intercept plus the electric current slope times
+        # the driving torque
+        return _get_cached(
+            cache=self.__characteristics,
+            pwm=pwm,
+            compute=self.__compute_characteristic
+        )
+
+    def __get_operands(self, pwm: float | int) -> tuple:
+        # unit objects of compute_torque and compute_electric_current which
+        # depend only on pwm, computed with the same operations of the
+        # relationships, so that the computed values do not depend on the
+        # cache: pwm maximum torque and no load speed, pwm electric current
+        # range and signed no load electric current, or the electric current
+        # within the pwm dead band
+        return _get_cached(
+            cache=self.__operands,
+            pwm=pwm,
+            compute=self.__compute_operands
+        )
+
+    def __compute_operands(self, pwm: float | int) -> tuple:
+
+        if not self.electric_current_is_computable:
+            return self.maximum_torque, self.no_load_speed, None, None, None
+
+        maximum_electric_current = pwm*self.maximum_electric_current
         pwm_min = self.no_load_electric_current/self.maximum_electric_current
-        if abs(self.pwm) <= pwm_min:
+        if abs(pwm) <= pwm_min:
             if pwm_min == 0:
-                self.electric_current = Current(
+                electric_current = Current(
                     value=0,
                     unit=self.maximum_electric_current.unit
                 )
             else:
-                self.electric_current = \
-                    self.pwm/pwm_min*self.no_load_electric_current.to(
-                        self.maximum_electric_current.unit
-                    )
-            return
-        elif self.pwm > pwm_min:
+                electric_current = pwm/pwm_min*self.no_load_electric_current.to(
+                    self.maximum_electric_current.unit
+                )
+            return None, None, None, None, electric_current
+        elif pwm > pwm_min:
             no_load_electric_current = self.no_load_electric_current
             maximum_torque = \
                 self.maximum_torque*(
@@ -668,12 +951,116 @@ class DCMotor(MotorBase):
                         self.no_load_electric_current)
                 )
 
-        self.electric_current = Current(
-            value=(
-                (maximum_electric_current - no_load_electric_current) *
-                (self.driving_torque/maximum_torque) + no_load_electric_current
-            ).value,
-            unit=self.maximum_electric_current.unit
+        return (
+            maximum_torque,
+            pwm*self.no_load_speed,
+            maximum_electric_current - no_load_electric_current,
+            no_load_electric_current,
+            None
+        )
+
+    def __compute_characteristic(
+        self,
+        pwm: float | int
+    ) -> tuple[float, float, float | None, float | None]:
+
+        maximum_torque = self.__maximum_torque._to_value('Nm')
+        no_load_speed = self.__no_load_speed._to_value('rad/s')
+        if not self.electric_current_is_computable:
+            return maximum_torque, maximum_torque/no_load_speed, None, None
+
+        no_load_electric_current = \
+            self.__no_load_electric_current._to_value('A')
+        maximum_electric_current = \
+            self.__maximum_electric_current._to_value('A')
+        pwm_min = no_load_electric_current/maximum_electric_current
+        if abs(pwm) <= pwm_min:
+            electric_current = 0.0 if pwm_min == 0 else \
+                pwm/pwm_min*no_load_electric_current
+            return 0.0, 0.0, electric_current, 0.0
+        elif pwm < 0:
+            no_load_electric_current = -no_load_electric_current
+
+        return self.__compute_linear_characteristic(
+            pwm=pwm,
+            no_load_electric_current=no_load_electric_current
+        )
+
+    def __compute_characteristics(
+        self,
+        pwm: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray | None, np.ndarray | None]:
+
+        maximum_torque = self.__maximum_torque._to_value('Nm')
+        no_load_speed = self.__no_load_speed._to_value('rad/s')
+        if not self.electric_current_is_computable:
+            torque_intercept = np.full(pwm.shape, maximum_torque)
+            return torque_intercept, torque_intercept/no_load_speed, None, None
+
+        no_load_electric_current = \
+            self.__no_load_electric_current._to_value('A')
+        maximum_electric_current = \
+            self.__maximum_electric_current._to_value('A')
+        pwm_min = no_load_electric_current/maximum_electric_current
+        dead_band = np.abs(pwm) <= pwm_min
+        signed_no_load_electric_current = np.where(
+            pwm < 0,
+            -no_load_electric_current,
+            no_load_electric_current
+        )
+
+        # values out of the dead band are discarded, and vice versa, so are
+        # their overflows and divisions by zero
+        with np.errstate(divide='ignore', over='ignore', invalid='ignore'):
+            if pwm_min == 0:
+                dead_band_electric_current = np.zeros(pwm.shape)
+            else:
+                dead_band_electric_current = \
+                    pwm/pwm_min*no_load_electric_current
+            torque_intercept, torque_slope, _, electric_current_slope = \
+                self.__compute_linear_characteristic(
+                    pwm=pwm,
+                    no_load_electric_current=signed_no_load_electric_current
+                )
+
+        return (
+            np.where(dead_band, 0.0, torque_intercept),
+            np.where(dead_band, 0.0, torque_slope),
+            np.where(
+                dead_band,
+                dead_band_electric_current,
+                signed_no_load_electric_current
+            ),
+            np.where(dead_band, 0.0, electric_current_slope)
+        )
+
+    def __compute_linear_characteristic(
+        self,
+        pwm: float | int | np.ndarray,
+        no_load_electric_current: float | np.ndarray
+    ) -> tuple[float | np.ndarray, ...]:
+        # characteristic outside of the pwm dead band, with the no load
+        # electric current signed as pwm, computed with the same operations on
+        # a single pwm value and on an array of them
+
+        maximum_torque = self.__maximum_torque._to_value('Nm')
+        no_load_speed = self.__no_load_speed._to_value('rad/s')
+        maximum_electric_current = \
+            self.__maximum_electric_current._to_value('A')
+
+        # maximum torque and no load speed keeping into account pwm
+        pwm_maximum_torque = maximum_torque*(
+            (pwm*maximum_electric_current - no_load_electric_current) /
+            (maximum_electric_current - abs(no_load_electric_current))
+        )
+        pwm_no_load_speed = pwm*no_load_speed
+
+        return (
+            pwm_maximum_torque,
+            pwm_maximum_torque/pwm_no_load_speed,
+            no_load_electric_current,
+            (pwm*maximum_electric_current - no_load_electric_current) /
+            pwm_maximum_torque
         )
 
     @property
@@ -727,7 +1114,8 @@ class DCMotor(MotorBase):
 
     @electric_current.setter
     def electric_current(self, electric_current: Current):
-        if not isinstance(electric_current, Current):
+        if _assignment_checks.get() and \
+                not isinstance(electric_current, Current):
             raise TypeError(
                 f"Parameter 'electric_current' must be an instance of "
                 f"{Current.__name__!r}."
@@ -736,7 +1124,7 @@ class DCMotor(MotorBase):
         self.__electric_current = electric_current
 
     @property
-    def time_variables(self) -> dict[str, list[UnitBase]]:
+    def time_variables(self) -> dict[str, TimeSeries]:
         """Time variables of the DC motor. Each time variable is stored as a
         dictionary key-value pair. The available time variables are:
 
@@ -753,8 +1141,10 @@ class DCMotor(MotorBase):
         computable indeed, depending on which motor parameters was set at DC
         motor instantiation; see :py:attr:`electric_current_is_computable` for
         more details. \n
-        Corresponding values of the dictionary are lists of the respective time
-        variable values. \n
+        Corresponding values of the dictionary are
+        :py:class:`TimeSeries <gearpy.units.time_series.TimeSeries>` of the
+        respective time variable values, which behave like lists of unit
+        objects. \n
         At each time iteration, the :py:class:`Solver <gearpy.solver.Solver>`
         appends every time variables' values to the relative list in the
         dictionary.
@@ -782,9 +1172,8 @@ class DCMotor(MotorBase):
                 self.electric_current
             )
         if 'pwm' not in self.time_variables.keys():
-            self.time_variables['pwm'] = [self.pwm]
-        else:
-            self.time_variables['pwm'].append(self.pwm)
+            self.time_variables['pwm'] = TimeSeries()
+        self.time_variables['pwm'].append(self.pwm)
 
     @property
     def pwm(self) -> float | int:
@@ -831,7 +1220,7 @@ class DCMotor(MotorBase):
 
     @pwm.setter
     def pwm(self, pwm: float | int):
-        if not isinstance(pwm, float | int):
+        if _assignment_checks.get() and not isinstance(pwm, float | int):
             raise TypeError("Parameter 'pwm' must be a float or an integer.")
 
         if (pwm > 1) or (pwm < -1):
@@ -840,3 +1229,19 @@ class DCMotor(MotorBase):
             )
 
         self.__pwm = pwm
+
+
+def _get_cached(cache: OrderedDict, pwm: float | int, compute) -> tuple:
+
+    # the values of the most recently used pwm values are kept, up to
+    # CHARACTERISTIC_CACHE_SIZE
+    value = cache.get(pwm)
+    if value is None:
+        value = compute(pwm=pwm)
+        if len(cache) >= CHARACTERISTIC_CACHE_SIZE:
+            cache.popitem(last=False)
+        cache[pwm] = value
+    else:
+        cache.move_to_end(pwm)
+
+    return value
@@ -3,10 +3,10 @@ from gearpy.units import (
     AngularSpeed,
     AngularAcceleration,
     InertiaMoment,
-    Torque,
-    UnitBase
+    TimeSeries,
+    Torque
 )
-from .mechanical_object_base import RotatingObject
+from .mechanical_object_base import _Relations, RotatingObject
 
 
 class Flywheel(RotatingObject):
@@ -128,6 +128,7 @@ class Flywheel(RotatingObject):
             )
 
         self.__driven_by = driven_by
+        _Relations.revision += 1
 
     @property
     def drives(self) -> RotatingObject:
@@ -163,6 +164,7 @@ class Flywheel(RotatingObject):
             )
 
         self.__drives = drives
+        _Relations.revision += 1
 
     @property
     def angular_position(self) -> AngularPosition:
@@ -349,6 +351,7 @@ class Flywheel(RotatingObject):
             raise ValueError("Parameter 'master_gear_ratio' must be positive.")
 
         self.__master_gear_ratio = master_gear_ratio
+        _Relations.revision += 1
 
     @property
     def master_gear_efficiency(self) -> float | int:
@@ -386,7 +389,7 @@ class Flywheel(RotatingObject):
         return super().inertia_moment
 
     @property
-    def time_variables(self) -> dict[str, list[UnitBase]]:
+    def time_variables(self) -> dict[str, TimeSeries]:
         """Time variables of the flywheel. Each time variable is stored as a
         dictionary key-value pair. The available time variables are:
 
@@ -397,8 +400,10 @@ class Flywheel(RotatingObject):
         - :py:attr:`driving_torque`: ``'driving torque'``,
         - :py:attr:`load_torque`: ``'load torque'``.
 
-        Corresponding values of the dictionary are lists of the respective time
-        variable values. \n
+        Corresponding values of the dictionary are
+        :py:class:`TimeSeries <gearpy.units.time_series.TimeSeries>` of the
+        respective time variable values, which behave like lists of unit
+        objects. \n
         At each time iteration, the :py:class:`Solver <gearpy.solver.Solver>`
         appends every time variables' values to the relative list in the
         dictionary.
@@ -0,0 +1,28 @@
+import numpy as np
+
+
+# number of teeth and Lewis factor of spur and helical gears, sorted by
+# number of teeth
+LEWIS_FACTOR_TABLE = np.array([
+    [10, 0.201], [11, 0.226], [12, 0.245], [13, 0.264],
+    [14, 0.276], [15, 0.289], [16, 0.295], [17, 0.302],
+    [18, 0.308], [19, 0.314], [20, 0.32], [21, 0.325],
+    [22, 0.33], [24, 0.337], [26, 0.344], [28, 0.352],
+    [30, 0.358], [32, 0.364], [34, 0.37], [36, 0.377],
+    [38, 0.383], [40, 0.389], [43, 0.394], [45, 0.399],
+    [50, 0.408], [55, 0.415], [60, 0.421], [65, 0.425],
+    [70, 0.429], [75, 0.433], [80, 0.436], [90, 0.442],
+    [100, 0.446], [150, 0.458], [200, 0.463], [300, 0.471],
+    [400, 0.478], [500, 0.484]
+])
+LEWIS_FACTOR_TABLE.setflags(write=False)
+
+# pressure angle (deg), maximum helix angle (deg) and Lewis factor of worm
+# gears and worm wheels
+WORM_GEAR_AND_WHEEL_TABLE = np.array([
+    [14.5, 16.0, 0.1],
+    [20.0, 25.0, 0.125],
+    [25.0, 35.0, 0.15],
+    [30.0, 45.0, 0.175]
+])
+WORM_GEAR_AND_WHEEL_TABLE.setflags(write=False)
@@ -8,8 +8,8 @@ from gearpy.units import (
     Length,
     Stress,
     Time,
-    Torque,
-    UnitBase
+    TimeSeries,
+    Torque
 )
 from math import sqrt, atan
 from .mechanical_object_base import RotatingObject, lewis_factor_function, Role
@@ -146,10 +146,12 @@ class HelicalGear(SpurGear):
         self.__helix_angle = helix_angle
 
         if self.tangential_force_is_computable:
-            self.time_variables['tangential force'] = []
+            self.time_variables['tangential force'] = TimeSeries(Force)
+            self.__reference_radius = \
+                (self.reference_diameter/2)._to_value('m')
 
             if self.bending_stress_is_computable:
-                self.time_variables['bending stress'] = []
+                self.time_variables['bending stress'] = TimeSeries(Stress)
                 PRESSURE_ANGLE = Angle(20, 'deg')
                 self.__TRANSVERSE_PRESSURE_ANGLE = Angle(
                     value=atan(PRESSURE_ANGLE.tan()/helix_angle.cos()),
@@ -168,9 +170,11 @@ class HelicalGear(SpurGear):
                 self.__lewis_factor = lewis_factor_function(
                     virtual_n_teeth
                 ).take(0)
+                self.__bending_surface = \
+                    (self.module*self.face_width)._to_value('m^2')
 
                 if self.contact_stress_is_computable:
-                    self.time_variables['contact stress'] = []
+                    self.time_variables['contact stress'] = TimeSeries(Stress)
 
     @property
     def name(self) -> str:
@@ -752,17 +756,20 @@ class HelicalGear(SpurGear):
                If a gear mating between two gears has not been set.
         """
         if self.mating_role == MatingMaster:
-            self.tangential_force = \
-                abs(self.load_torque)/(self.reference_diameter/2)
+            torque = self.load_torque
         elif self.mating_role == MatingSlave:
-            self.tangential_force = \
-                abs(self.driving_torque)/(self.reference_diameter/2)
+            torque = self.driving_torque
         else:
             raise ValueError(
                 "Gear mating not defined. Use 'gearpy.utils.add_gear_mating' "
                 "to set up a mating between two gears."
             )
 
+        self.tangential_force = Force._new(
+            value=abs(torque._to_value('Nm'))/self.__reference_radius,
+            unit='N'
+        )
+
     @property
     def tangential_force_is_computable(self) -> bool:
         """Whether is possible to compute the :py:attr:`tangential_force` on
@@ -851,8 +858,11 @@ class HelicalGear(SpurGear):
            - :math:`b` is the gear tooth :py:attr:`face_width`,
            - :math:`Y_{LW}` is the gear :py:attr:`lewis_factor`.
         """
-        self.bending_stress = self.tangential_force / \
-            (self.module*self.face_width)/self.lewis_factor
+        self.bending_stress = Stress._new(
+            value=self.tangential_force._to_value('N') /
+            self.__bending_surface/self.__lewis_factor,
+            unit='Pa'
+        )
 
     @property
     def bending_stress_is_computable(self) -> bool:
@@ -971,6 +981,28 @@ class HelicalGear(SpurGear):
            where :math:`\alpha` is the pressure angle of the gear, always
            equal to 20 degrees.
         """
+        equivalent_elastic_modulus, pressure_angle_cosine, surface = \
+            self.__get_contact_stress_operands()
+        self.contact_stress = Stress._new(
+            value=0.262922*sqrt(
+                equivalent_elastic_modulus *
+                (self.tangential_force._to_value('N')/pressure_angle_cosine /
+                 surface)
+            ),
+            unit='Pa'
+        )
+
+    def __get_contact_stress_operands(self) -> tuple[float, float, float]:
+
+        contact_stress_operands = self._mating_constants.get('contact stress')
+        if contact_stress_operands is None:
+            contact_stress_operands = self.__compute_contact_stress_operands()
+            self._mating_constants['contact stress'] = contact_stress_operands
+
+        return contact_stress_operands
+
+    def __compute_contact_stress_operands(self) -> tuple[float, float, float]:
+
         if self.mating_role == MatingMaster:
             if self.drives.module is not None:
                 mate_reference_diameter = self.drives.reference_diameter
@@ -1015,6 +1047,8 @@ class HelicalGear(SpurGear):
                 "to set up a mating between two gears."
             )
 
+        # equivalent elastic modulus in Pa, transverse pressure angle cosine
+        # and contact surface in m^2, computed with the unit objects only once
         equivalent_elastic_modulus = 2*self.elastic_modulus * \
             (mate_elastic_modulus /
                 (self.elastic_modulus + mate_elastic_modulus))
@@ -1024,16 +1058,13 @@ class HelicalGear(SpurGear):
                 mate_reference_diameter /
                 (self.reference_diameter + mate_reference_diameter)
             )
-        contact_pressure = \
-            self.tangential_force/self.__TRANSVERSE_PRESSURE_ANGLE.cos() / \
-            (self.face_width/self.__helix_angle.cos()*inverse_curvature_sum)
+        surface = \
+            self.face_width/self.__helix_angle.cos()*inverse_curvature_sum
 
-        self.contact_stress = Stress(
-            value=0.262922*sqrt(
-                equivalent_elastic_modulus.to('Pa').value *
-                contact_pressure.to('Pa').value
-            ),
-            unit='Pa'
+        return (
+            equivalent_elastic_modulus._to_value('Pa'),
+            self.__TRANSVERSE_PRESSURE_ANGLE.cos(),
+            surface._to_value('m^2')
         )
 
     @property
@@ -1059,6 +1090,27 @@ class HelicalGear(SpurGear):
         """
         return super().contact_stress_is_computable
 
+    @property
+    def _force_and_stress_operands(self) -> dict[str, tuple[float, ...]]:
+        # operands, in SI units, of the tangential force, bending stress and
+        # contact stress computations, used to compute them for the whole
+        # simulation at once
+        if self.mating_role not in (MatingMaster, MatingSlave):
+            raise ValueError(
+                "Gear mating not defined. Use 'gearpy.utils.add_gear_mating' "
+                "to set up a mating between two gears."
+            )
+
+        operands = {'tangential force': (self.__reference_radius, None)}
+        if self.bending_stress_is_computable:
+            operands['bending stress'] = \
+                (self.__bending_surface, self.__lewis_factor)
+            if self.contact_stress_is_computable:
+                operands['contact stress'] = \
+                    self.__get_contact_stress_operands()
+
+        return operands
+
     @property
     def external_torque(
             self
@@ -1152,7 +1204,7 @@ class HelicalGear(SpurGear):
         ).external_torque.fset(self, external_torque)
 
     @property
-    def time_variables(self) -> dict[str, list[UnitBase]]:
+    def time_variables(self) -> dict[str, TimeSeries]:
         """Time variables of the gear. Each time variable is stored as a
         dictionary key-value pair. The available time variables are:
 
@@ -1172,8 +1224,10 @@ class HelicalGear(SpurGear):
         :py:attr:`tangential_force_is_computable`,
         :py:attr:`bending_stress_is_computable` and
         :py:attr:`contact_stress_is_computable` for more details. \n
-        Corresponding values of the dictionary are lists of the respective time
-        variable values. \n
+        Corresponding values of the dictionary are
+        :py:class:`TimeSeries <gearpy.units.time_series.TimeSeries>` of the
+        respective time variable values, which behave like lists of unit
+        objects. \n
         At each time iteration, the :py:class:`Solver <gearpy.solver.Solver>`
         appends every time variables' values to the relative list in the
         dictionary.
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from . import gear_data
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from .gear_data import LEWIS_FACTOR_TABLE, WORM_GEAR_AND_WHEEL_TABLE
 from gearpy.units import (
     Angle,
     AngularPosition,
@@ -10,63 +13,161 @@ from gearpy.units import (
     Length,
     Stress,
     Time,
-    Torque,
-    UnitBase
+    TimeSeries,
+    Torque
 )
-from importlib import resources as imp_resources
 from inspect import signature
-import pandas as pd
-from scipy.interpolate import interp1d
+import numpy as np
 from typing import Callable
 
 
-LEWIS_FACTOR_DATA_FILE = (
-    imp_resources.files(gear_data) / 'lewis_factor_table.csv'
-)
-LEWIS_FACTOR_DATA = pd.read_csv(LEWIS_FACTOR_DATA_FILE)
-MINIMUM_TEETH_NUMBER = LEWIS_FACTOR_DATA.loc[
-    LEWIS_FACTOR_DATA.index[0],
-    'Number of teeth'
-]
-lewis_factor_function = interp1d(
-    x=LEWIS_FACTOR_DATA['Number of teeth'],
-    y=LEWIS_FACTOR_DATA['Lewis Factor'],
-    fill_value=(
-        LEWIS_FACTOR_DATA.loc[LEWIS_FACTOR_DATA.index[0], 'Lewis Factor'],
-        LEWIS_FACTOR_DATA.loc[LEWIS_FACTOR_DATA.index[-1], 'Lewis Factor']
-    ),
-    bounds_error=False
-)
+MINIMUM_TEETH_NUMBER = int(LEWIS_FACTOR_TABLE[0, 0])
+
+
+def lewis_factor_function(n_teeth: int | float) -> np.ndarray:
+    # linear interpolation, clamped to the first and last Lewis factors
+    # outside the tabulated numbers of teeth
+    return np.asarray(
+        np.interp(n_teeth, LEWIS_FACTOR_TABLE[:, 0], LEWIS_FACTOR_TABLE[:, 1])
+    )
+
 
-WORM_GEAR_AND_WHEEL_DATA_FILE = (
-    imp_resources.files(gear_data) / 'worm_gear_and_wheel_data.csv'
-)
-WORM_GEAR_AND_WHEEL_DATA = pd.read_csv(WORM_GEAR_AND_WHEEL_DATA_FILE)
 WORM_GEAR_AND_WHEEL_AVAILABLE_PRESSURE_ANGLES = [
-    Angle(value, 'deg')
-    for value in WORM_GEAR_AND_WHEEL_DATA['Pressure Angle']
+    Angle(float(value), 'deg') for value in WORM_GEAR_AND_WHEEL_TABLE[:, 0]
 ]
+_WORM_GEAR_AND_WHEEL_ROWS = {
+    float(pressure_angle): (float(maximum_helix_angle), float(lewis_factor))
+    for pressure_angle, maximum_helix_angle, lewis_factor
+    in WORM_GEAR_AND_WHEEL_TABLE
+}
 
 
 def worm_gear_and_wheel_maximum_helix_angle_function(
         pressure_angle: Angle
 ) -> Angle:
     return Angle(
-        value=float(
-            WORM_GEAR_AND_WHEEL_DATA.set_index('Pressure Angle').loc[
-                pressure_angle.to('deg').value,
-                'Maximum Helix Angle'
-            ]
-        ),
+        value=_WORM_GEAR_AND_WHEEL_ROWS[pressure_angle.to('deg').value][0],
         unit='deg'
     )
 
 
-def worm_wheel_lewis_factor_function(pressure_angle: Angle) -> Angle:
-    return WORM_GEAR_AND_WHEEL_DATA.set_index('Pressure Angle').loc[
-        pressure_angle.to('deg').value,
-        'Lewis Factor'
-    ]
+def worm_wheel_lewis_factor_function(pressure_angle: Angle) -> float:
+    return _WORM_GEAR_AND_WHEEL_ROWS[pressure_angle.to('deg').value][1]
+
+
+def __getattr__(name: str):
+    # gear tables as pandas DataFrame, built only when requested so that
+    # importing gearpy does not import pandas
+    if name == 'LEWIS_FACTOR_DATA':
+        import pandas as pd
+        return pd.DataFrame(
+            {
+                'Number of teeth': LEWIS_FACTOR_TABLE[:, 0].astype(int),
+                'Lewis Factor': LEWIS_FACTOR_TABLE[:, 1]
+            }
+        )
+
+    if name == 'WORM_GEAR_AND_WHEEL_DATA':
+        import pandas as pd
+        return pd.DataFrame(
+            WORM_GEAR_AND_WHEEL_TABLE,
+            columns=['Pressure Angle', 'Maximum Helix Angle', 'Lewis Factor']
+        )
+
+    raise AttributeError(
+        f"module {__name__!r} has no attribute {name!r}"
+    )
+
+
+# whether the time variables assignments are checked, a context variable so
+# that unchecked_assignments affects only the thread, or the asynchronous
+# task, which enters it
+_assignment_checks = ContextVar('assignment_checks', default=True)
+
+
+class _Relations:
+
+    # incremented whenever a relation between rotating objects changes, so
+    # that the compiled views of the powertrains built before are discarded
+    revision = 0
+
+
+@contextmanager
+def unchecked_assignments() -> Iterator[None]:
+    """Context manager which disables the type checks of the time variables
+    assignments of the rotating objects. \n
+    Within the context, assigning the angular position, angular speed,
+    angular acceleration, torque, driving torque and load torque of a
+    rotating object, the tangential force, bending stress and contact stress
+    of a gear or the electric current and PWM of a DC motor does not check
+    the type of the assigned value. It is meant for trusted models, already
+    validated, in which the assigned values are computed by the simulation
+    itself: a value of the wrong type is stored as it is and makes the
+    simulation fail later, or silently. \n
+    Checks are restored when exiting the context, even if an error is
+    raised. The PWM range is checked anyway. Checks are disabled only in the
+    thread, or in the asynchronous task, which enters the context: other
+    threads running simulations at the same time keep checking.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:meth:`Solver.run <gearpy.solver.Solver.run>`
+
+    .. admonition:: Examples
+       :class: important
+
+       >>> from gearpy.mechanical_objects import unchecked_assignments
+       >>> with unchecked_assignments():
+       ...     solver.run(
+       ...         time_discretization=TimeInterval(1, 'ms'),
+       ...         simulation_time=TimeInterval(10, 'sec')
+       ...     )
+    """
+    token = _assignment_checks.set(False)
+    try:
+        yield
+    finally:
+        _assignment_checks.reset(token)
+
+
+def _compute_force_and_stress_time_variables(
+        gear: 'RotatingObject'
+) -> None:
+    # tangential force and stresses of the time steps recorded without them,
+    # computed at once from the recorded reference torque, with the same
+    # operations of the gear compute methods
+    from .mating_roles import MatingMaster
+
+    operands = gear._force_and_stress_operands
+    time_variables = gear.time_variables
+    tangential_force = time_variables['tangential force']
+    start = len(tangential_force)
+    reference_torque = 'load torque' if gear.mating_role == MatingMaster \
+        else 'driving torque'
+    reference_radius, helix_angle_tangent = operands['tangential force']
+    force = np.abs(
+        time_variables[reference_torque].get_values(unit='Nm', start=start)
+    )/reference_radius
+    if helix_angle_tangent is not None:
+        force = force*helix_angle_tangent
+    tangential_force.extend_values(values=force, unit='N')
+    if 'bending stress' in operands:
+        surface, lewis_factor = operands['bending stress']
+        time_variables['bending stress'].extend_values(
+            values=force/surface/lewis_factor,
+            unit='Pa'
+        )
+    if 'contact stress' in operands:
+        equivalent_elastic_modulus, pressure_angle_cosine, surface = \
+            operands['contact stress']
+        time_variables['contact stress'].extend_values(
+            values=0.262922*np.sqrt(
+                equivalent_elastic_modulus *
+                (force/pressure_angle_cosine/surface)
+            ),
+            unit='Pa'
+        )
 
 
 class MechanicalObject(ABC):
@@ -136,13 +237,14 @@ class RotatingObject(MechanicalObject):
         self.__load_torque = None
         self.__inertia_moment = inertia_moment
         self.__time_variables = {
-            'angular position': [],
-            'angular speed': [],
-            'angular acceleration': [],
-            'torque': [],
-            'driving torque': [],
-            'load torque': []
+            'angular position': TimeSeries(AngularPosition),
+            'angular speed': TimeSeries(AngularSpeed),
+            'angular acceleration': TimeSeries(AngularAcceleration),
+            'torque': TimeSeries(Torque),
+            'driving torque': TimeSeries(Torque),
+            'load torque': TimeSeries(Torque)
         }
+        self.__deferred_time_variables = False
 
     @property
     @abstractmethod
@@ -152,7 +254,8 @@ class RotatingObject(MechanicalObject):
     @angular_position.setter
     @abstractmethod
     def angular_position(self, angular_position: AngularPosition):
-        if not isinstance(angular_position, AngularPosition):
+        if _assignment_checks.get() and \
+                not isinstance(angular_position, AngularPosition):
             raise TypeError(
                 f"Parameter 'angular_position' must be an instance of "
                 f"{AngularPosition.__name__!r}."
@@ -168,7 +271,8 @@ class RotatingObject(MechanicalObject):
     @angular_speed.setter
     @abstractmethod
     def angular_speed(self, angular_speed: AngularSpeed):
-        if not isinstance(angular_speed, AngularSpeed):
+        if _assignment_checks.get() and \
+                not isinstance(angular_speed, AngularSpeed):
             raise TypeError(
                 f"Parameter 'angular_speed' must be an instance of "
                 f"{AngularSpeed.__name__!r}."
@@ -184,7 +288,8 @@ class RotatingObject(MechanicalObject):
     @angular_acceleration.setter
     @abstractmethod
     def angular_acceleration(self, angular_acceleration: AngularAcceleration):
-        if not isinstance(angular_acceleration, AngularAcceleration):
+        if _assignment_checks.get() and \
+                not isinstance(angular_acceleration, AngularAcceleration):
             raise TypeError(
                 f"Parameter 'angular_acceleration' must be an instance of "
                 f"{AngularAcceleration.__name__!r}."
@@ -200,7 +305,8 @@ class RotatingObject(MechanicalObject):
     @torque.setter
     @abstractmethod
     def torque(self, torque: Torque):
-        if not isinstance(torque, Torque):
+        if _assignment_checks.get() and \
+                not isinstance(torque, Torque):
             raise TypeError(
                 f"Parameter 'torque' must be an instance of "
                 f"{Torque.__name__!r}."
@@ -216,7 +322,8 @@ class RotatingObject(MechanicalObject):
     @driving_torque.setter
     @abstractmethod
     def driving_torque(self, driving_torque: Torque):
-        if not isinstance(driving_torque, Torque):
+        if _assignment_checks.get() and \
+                not isinstance(driving_torque, Torque):
             raise TypeError(
                 f"Parameter 'driving_torque' must be an instance of "
                 f"{Torque.__name__!r}."
@@ -232,7 +339,8 @@ class RotatingObject(MechanicalObject):
     @load_torque.setter
     @abstractmethod
     def load_torque(self, load_torque: Torque):
-        if not isinstance(load_torque, Torque):
+        if _assignment_checks.get() and \
+                not isinstance(load_torque, Torque):
             raise TypeError(
                 f"Parameter 'load_torque' must be an instance of "
                 f"{Torque.__name__!r}."
@@ -247,9 +355,20 @@ class RotatingObject(MechanicalObject):
 
     @property
     @abstractmethod
-    def time_variables(self) -> dict[str, list[UnitBase]]:
+    def time_variables(self) -> dict[str, TimeSeries]:
+        if self.__deferred_time_variables:
+            self.__deferred_time_variables = False
+            self._compute_deferred_time_variables()
         return self.__time_variables
 
+    def _defer_time_variables(self) -> None:
+        # the time variables which have not been recorded by the solver are
+        # computed at the next access to time_variables
+        self.__deferred_time_variables = True
+
+    def _compute_deferred_time_variables(self) -> None:
+        pass
+
     @abstractmethod
     def update_time_variables(self):
         self.__time_variables['angular position'].append(
@@ -295,6 +414,7 @@ class MotorBase(RotatingObject):
             )
 
         self.__drives = drives
+        _Relations.revision += 1
 
     @abstractmethod
     def compute_torque(self, **kargs): ...
@@ -370,6 +490,7 @@ class GearBase(RotatingObject):
         self.__module = module
         self.__face_width = face_width
         self.__elastic_modulus = elastic_modulus
+        self.__mating_constants = {}
 
         if self.tangential_force_is_computable:
             self.__reference_diameter = n_teeth*module
@@ -425,6 +546,8 @@ class GearBase(RotatingObject):
             )
 
         self.__driven_by = driven_by
+        self.__mating_constants = {}
+        _Relations.revision += 1
 
     @property
     @abstractmethod
@@ -441,6 +564,8 @@ class GearBase(RotatingObject):
             )
 
         self.__drives = drives
+        self.__mating_constants = {}
+        _Relations.revision += 1
 
     @property
     @abstractmethod
@@ -450,7 +575,8 @@ class GearBase(RotatingObject):
     @tangential_force.setter
     @abstractmethod
     def tangential_force(self, tangential_force: Force):
-        if not isinstance(tangential_force, Force):
+        if _assignment_checks.get() and \
+                not isinstance(tangential_force, Force):
             raise TypeError(
                 f"Parameter 'tangential_force' must be an instance of "
                 f"{Force.__name__!r}."
@@ -474,7 +600,8 @@ class GearBase(RotatingObject):
     @bending_stress.setter
     @abstractmethod
     def bending_stress(self, bending_stress: Stress):
-        if not isinstance(bending_stress, Stress):
+        if _assignment_checks.get() and \
+                not isinstance(bending_stress, Stress):
             raise TypeError(
                 f"Parameter 'bending_stress' must be an instance of "
                 f"{Stress.__name__!r}."
@@ -498,7 +625,8 @@ class GearBase(RotatingObject):
     @contact_stress.setter
     @abstractmethod
     def contact_stress(self, contact_stress: Stress):
-        if not isinstance(contact_stress, Stress):
+        if _assignment_checks.get() and \
+                not isinstance(contact_stress, Stress):
             raise TypeError(
                 f"Parameter 'contact_stress' must be an instance of "
                 f"{Stress.__name__!r}."
@@ -531,6 +659,7 @@ class GearBase(RotatingObject):
             raise ValueError("Parameter 'master_gear_ratio' must be positive.")
 
         self.__master_gear_ratio = master_gear_ratio
+        _Relations.revision += 1
 
     @property
     @abstractmethod
@@ -552,6 +681,7 @@ class GearBase(RotatingObject):
             )
 
         self.__master_gear_efficiency = master_gear_efficiency
+        _Relations.revision += 1
 
     @property
     @abstractmethod
@@ -574,6 +704,18 @@ class GearBase(RotatingObject):
             )
 
         self.__mating_role = mating_role
+        self.__mating_constants = {}
+        _Relations.revision += 1
+
+    @property
+    def _mating_constants(self) -> dict[str, tuple[float, ...]]:
+        # operands of the force and stress computations which depend on the
+        # mating gear, computed at first use and cleared whenever the mating
+        # changes
+        return self.__mating_constants
+
+    def _compute_deferred_time_variables(self) -> None:
+        _compute_force_and_stress_time_variables(gear=self)
 
     @property
     @abstractmethod
@@ -7,12 +7,15 @@ from gearpy.units import (
     InertiaMoment,
     Length,
     Time,
-    Torque,
-    UnitBase
+    TimeSeries,
+    Torque
 )
 from inspect import signature
 from .mating_roles import MatingMaster, MatingSlave
 from .mechanical_object_base import (
+    _assignment_checks,
+    _compute_force_and_stress_time_variables,
+    _Relations,
     RotatingObject,
     Role,
     WORM_GEAR_AND_WHEEL_AVAILABLE_PRESSURE_ANGLES,
@@ -169,7 +172,9 @@ class WormGear(RotatingObject):
 
         if self.tangential_force_is_computable:
             self.__tangential_force = None
-            self.time_variables['tangential force'] = []
+            self.time_variables['tangential force'] = TimeSeries(Force)
+            self.__reference_radius = (reference_diameter/2)._to_value('m')
+            self.__helix_angle_tangent = helix_angle.tan()
 
     @property
     def name(self) -> str:
@@ -342,6 +347,7 @@ class WormGear(RotatingObject):
             raise TypeError("Parameter 'self_locking' must be a boolean.")
 
         self.__self_locking = self_locking
+        _Relations.revision += 1
 
     @property
     def driven_by(self) -> RotatingObject:
@@ -382,6 +388,7 @@ class WormGear(RotatingObject):
             )
 
         self.__driven_by = driven_by
+        _Relations.revision += 1
 
     @property
     def drives(self) -> RotatingObject:
@@ -421,6 +428,7 @@ class WormGear(RotatingObject):
             )
 
         self.__drives = drives
+        _Relations.revision += 1
 
     @property
     def master_gear_ratio(self) -> float:
@@ -460,6 +468,7 @@ class WormGear(RotatingObject):
             raise ValueError("Parameter 'master_gear_ratio' must be positive.")
 
         self.__master_gear_ratio = master_gear_ratio
+        _Relations.revision += 1
 
     @property
     def master_gear_efficiency(self) -> float | int:
@@ -502,6 +511,7 @@ class WormGear(RotatingObject):
             )
 
         self.__master_gear_efficiency = master_gear_efficiency
+        _Relations.revision += 1
 
     @property
     def mating_role(self) -> Role:
@@ -718,7 +728,8 @@ class WormGear(RotatingObject):
 
     @tangential_force.setter
     def tangential_force(self, tangential_force: Force):
-        if not isinstance(tangential_force, Force):
+        if _assignment_checks.get() and \
+                not isinstance(tangential_force, Force):
             raise TypeError(
                 f"Parameter 'tangential_force' must be an instance of "
                 f"{Force.__name__!r}."
@@ -747,12 +758,9 @@ class WormGear(RotatingObject):
                If a gear mating between two gears has not been set.
         """
         if self.mating_role == MatingMaster:
-            self.tangential_force = \
-                abs(self.load_torque)/(self.reference_diameter/2) * \
-                self.helix_angle.tan()
+            torque = self.load_torque
         elif self.mating_role == MatingSlave:
-            self.tangential_force = abs(self.driving_torque) / \
-                (self.reference_diameter/2)*self.helix_angle.tan()
+            torque = self.driving_torque
         else:
             raise ValueError(
                 "Gear mating not defined. Use "
@@ -760,6 +768,12 @@ class WormGear(RotatingObject):
                 "between two gears."
             )
 
+        self.tangential_force = Force._new(
+            value=abs(torque._to_value('Nm'))/self.__reference_radius *
+            self.__helix_angle_tangent,
+            unit='N'
+        )
+
     @property
     def tangential_force_is_computable(self) -> bool:
         """Whether is possible to compute the :py:attr:`tangential_force` on
@@ -782,6 +796,25 @@ class WormGear(RotatingObject):
         """
         return self.__reference_diameter is not None
 
+    @property
+    def _force_and_stress_operands(self) -> dict[str, tuple[float, ...]]:
+        # operands, in SI units, of the tangential force computation, used to
+        # compute it for the whole simulation at once
+        if self.mating_role not in (MatingMaster, MatingSlave):
+            raise ValueError(
+                "Gear mating not defined. Use "
+                "'gearpy.utils.add_worm_gear_mating' to set up a mating "
+                "between two gears."
+            )
+
+        return {
+            'tangential force':
+                (self.__reference_radius, self.__helix_angle_tangent)
+        }
+
+    def _compute_deferred_time_variables(self) -> None:
+        _compute_force_and_stress_time_variables(gear=self)
+
     @property
     def external_torque(
         self
@@ -885,7 +918,7 @@ class WormGear(RotatingObject):
         self.__external_torque = external_torque
 
     @property
-    def time_variables(self) -> dict[str, list[UnitBase]]:
+    def time_variables(self) -> dict[str, TimeSeries]:
         """Time variables of the gear. Each time variable is stored as a
         dictionary key-value pair. The available time variables are:
 
@@ -900,8 +933,10 @@ class WormGear(RotatingObject):
         ``'tangential force'`` is listed among time variables only if they are
         computable indeed, depending on which gear parameters are set at gear
         instantiation; see :py:attr:`tangential_force_is_computable`. \n
-        Corresponding values of the dictionary are lists of the respective time
-        variable values. \n
+        Corresponding values of the dictionary are
+        :py:class:`TimeSeries <gearpy.units.time_series.TimeSeries>` of the
+        respective time variable values, which behave like lists of unit
+        objects. \n
         At each time iteration, the :py:class:`Solver <gearpy.solver.Solver>`
         appends every time variables' values to the relative list in the
         dictionary.
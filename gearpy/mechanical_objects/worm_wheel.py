@@ -8,8 +8,8 @@ from gearpy.units import (
     Length,
     Stress,
     Time,
-    Torque,
-    UnitBase
+    TimeSeries,
+    Torque
 )
 from math import pi
 from .mechanical_object_base import (
@@ -159,10 +159,12 @@ class WormWheel(HelicalGear):
         self.__pressure_angle = pressure_angle
 
         if self.tangential_force_is_computable:
-            self.time_variables['tangential force'] = []
+            self.time_variables['tangential force'] = TimeSeries(Force)
+            self.__reference_radius = \
+                (self.reference_diameter/2)._to_value('m')
 
             if self.bending_stress_is_computable:
-                self.time_variables['bending stress'] = []
+                self.time_variables['bending stress'] = TimeSeries(Stress)
                 self.__lewis_factor = worm_wheel_lewis_factor_function(
                     pressure_angle=pressure_angle
                 )
@@ -717,11 +719,9 @@ class WormWheel(HelicalGear):
                If a gear mating between two gears has not been set.
         """
         if self.mating_role == MatingMaster:
-            self.tangential_force = \
-                abs(self.load_torque)/(self.reference_diameter/2)
+            torque = self.load_torque
         elif self.mating_role == MatingSlave:
-            self.tangential_force = \
-                abs(self.driving_torque)/(self.reference_diameter/2)
+            torque = self.driving_torque
         else:
             raise ValueError(
                 "Gear mating not defined. Use "
@@ -729,6 +729,11 @@ class WormWheel(HelicalGear):
                 "between two gears."
             )
 
+        self.tangential_force = Force._new(
+            value=abs(torque._to_value('Nm'))/self.__reference_radius,
+            unit='N'
+        )
+
     @property
     def tangential_force_is_computable(self) -> bool:
         """Whether is possible to compute the :py:attr:`tangential_force` on
@@ -830,6 +835,23 @@ class WormWheel(HelicalGear):
            between the worm wheel face width :py:attr:`face_width` and the
            mating worm gear reference diameter multiplied by 0.67.
         """
+        surface, lewis_factor = self.__get_bending_stress_operands()
+        self.bending_stress = Stress._new(
+            value=self.tangential_force._to_value('N')/surface/lewis_factor,
+            unit='Pa'
+        )
+
+    def __get_bending_stress_operands(self) -> tuple[float, float]:
+
+        bending_stress_operands = self._mating_constants.get('bending stress')
+        if bending_stress_operands is None:
+            bending_stress_operands = self.__compute_bending_stress_operands()
+            self._mating_constants['bending stress'] = bending_stress_operands
+
+        return bending_stress_operands
+
+    def __compute_bending_stress_operands(self) -> tuple[float, float]:
+
         if self.mating_role == MatingMaster:
             normal_pitch = \
                 pi*self.drives.reference_diameter * \
@@ -850,9 +872,11 @@ class WormWheel(HelicalGear):
                 "'gearpy.utils.add_worm_gear_mating' to set up a mating "
                 "between two gears."
             )
-        self.bending_stress = \
-            self.tangential_force/(normal_pitch*effective_face_width) / \
+        # bending surface in m^2 and Lewis factor
+        return (
+            (normal_pitch*effective_face_width)._to_value('m^2'),
             self.lewis_factor
+        )
 
     @property
     def bending_stress_is_computable(self) -> bool:
@@ -886,6 +910,23 @@ class WormWheel(HelicalGear):
         else:
             return super().bending_stress_is_computable
 
+    @property
+    def _force_and_stress_operands(self) -> dict[str, tuple[float, ...]]:
+        # operands, in SI units, of the tangential force and bending stress
+        # computations, used to compute them for the whole simulation at once
+        if self.mating_role not in (MatingMaster, MatingSlave):
+            raise ValueError(
+                "Gear mating not defined. Use "
+                "'gearpy.utils.add_worm_gear_mating' to set up a mating "
+                "between two gears."
+            )
+
+        operands = {'tangential force': (self.__reference_radius, None)}
+        if self.bending_stress_is_computable:
+            operands['bending stress'] = self.__get_bending_stress_operands()
+
+        return operands
+
     @property
     def external_torque(
         self
@@ -979,7 +1020,7 @@ class WormWheel(HelicalGear):
         ).external_torque.fset(self, external_torque)
 
     @property
-    def time_variables(self) -> dict[str, list[UnitBase]]:
+    def time_variables(self) -> dict[str, TimeSeries]:
         """Time variables of the worm wheel. Each time variable is stored as a
         dictionary key-value pair. The available time variables are:
 
@@ -997,8 +1038,10 @@ class WormWheel(HelicalGear):
         parameters are set at worm wheel instantiation; see
         :py:attr:`tangential_force_is_computable` and
         :py:attr:`bending_stress_is_computable`. \n
-        Corresponding values of the dictionary are lists of the respective time
-        variable values. \n
+        Corresponding values of the dictionary are
+        :py:class:`TimeSeries <gearpy.units.time_series.TimeSeries>` of the
+        respective time variable values, which behave like lists of unit
+        objects. \n
         At each time iteration, the :py:class:`Solver <gearpy.solver.Solver>`
         appends every time variables' values to the relative list in the
         dictionary.
@@ -12,6 +12,14 @@ class ConstantPWM(RuleBase):
     It checks whether the ``timer`` is active and, if so, it sets the ``pwm``
     of ``powertrain`` motor to the constant ``target_pwm_value``.
 
+    Attributes
+    ----------
+    :py:attr:`timer` : :py:class:`Timer <gearpy.sensors.timer.Timer>`
+        Timer defining when the rule is active.
+    :py:attr:`target_pwm_value` : :py:class:`float` or :py:class:`int`
+        The ``pwm`` applied to the ``powertrain`` motor while the rule is
+        active.
+
     Methods
     -------
     :py:meth:`apply`
@@ -70,6 +78,29 @@ class ConstantPWM(RuleBase):
         self.__powertrain = powertrain
         self.__target_pwm_value = target_pwm_value
 
+    @property
+    def timer(self) -> Timer:
+        """Timer defining when the rule is active.
+
+        Returns
+        -------
+        :py:class:`Timer <gearpy.sensors.timer.Timer>`
+            Timer defining when the rule is active.
+        """
+        return self.__timer
+
+    @property
+    def target_pwm_value(self) -> float | int:
+        """The ``pwm`` applied to the ``powertrain`` motor while the rule is
+        active.
+
+        Returns
+        -------
+        :py:class:`float` or :py:class:`int`
+            The ``pwm`` applied to the ``powertrain`` motor.
+        """
+        return self.__target_pwm_value
+
     def apply(self) -> None | float | int:
         r"""It checks if ``timer`` is active and, if so, it returns the ``pwm``
         to apply to the ``powertrain`` motor, equal to ``target_pwm_value``.
@@ -100,6 +100,10 @@ class ReachAngularPosition(RuleBase):
         self.__powertrain = powertrain
         self.__target_angular_position = target_angular_position
         self.__braking_angle = braking_angle
+        # in rad, since apply computes the PWM on floats
+        self.__target_angular_position_value = \
+            target_angular_position._to_value('rad')
+        self.__braking_angle_value = braking_angle._to_value('rad')
 
     def apply(self) -> None | float | int:
         """It computes the ``pwm`` to apply to the ``powertrain``'s DC motor in
@@ -185,16 +189,16 @@ class ReachAngularPosition(RuleBase):
            ``target_angular_position`` by the ``encoder``'s ``target``
            rotating object.
         """
-        angular_position = self.__encoder.get_value()
+        angular_position = self.__encoder.get_value()._to_value('rad')
 
         regime_angular_position_error = _compute_static_error(
-            braking_angle=self.__braking_angle,
+            braking_angle=self.__braking_angle_value,
             powertrain=self.__powertrain
         )
         braking_starting_angle = \
-            self.__target_angular_position - \
-            self.__braking_angle + regime_angular_position_error
+            self.__target_angular_position_value - \
+            self.__braking_angle_value + regime_angular_position_error
 
         if angular_position >= braking_starting_angle:
             return 1 - (angular_position - braking_starting_angle) / \
-                self.__braking_angle
+                self.__braking_angle_value
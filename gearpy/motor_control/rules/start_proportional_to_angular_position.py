@@ -205,6 +205,11 @@ class StartProportionalToAngularPosition(RuleBase):
            - :math:`N` is the total number of gear matings in the
              ``powertrain``.
 
+           The load torque :math:`T_l` is the first recorded one, so the
+           *candidate* minimum applicable ``pwm`` is computed once and kept
+           until the ``powertrain`` is reset (see
+           :py:meth:`Powertrain.reset <gearpy.powertrain.Powertrain.reset>`).
+
            If both the load torque on the ``powertrain`` DC motor :math:`T_l`
            and the motor no load electric current :math:`i_0` are null, then
            also the computed *candidate* minimum applicable ``pwm``
@@ -1,45 +1,65 @@
 from gearpy.mechanical_objects import SpurGear
 from gearpy.powertrain import Powertrain
-from gearpy.units import AngularPosition, Angle
+
+
+def _compute_powertrain_efficiency(powertrain: Powertrain) -> float | int:
+    invariants = powertrain._invariants
+    if 'powertrain efficiency' not in invariants:
+        powertrain_efficiency = 1
+        for element in powertrain.elements:
+            if isinstance(element, SpurGear):
+                powertrain_efficiency *= element.master_gear_efficiency
+        invariants['powertrain efficiency'] = powertrain_efficiency
+
+    return invariants['powertrain efficiency']
 
 
 def _compute_static_error(
-    braking_angle: Angle,
+    braking_angle: float,
     powertrain: Powertrain
-) -> Angle | AngularPosition:
-    maximum_torque = powertrain.elements[0].maximum_torque
+) -> float:
+    # static error in rad, with the braking angle in rad: the load torque in
+    # Nm times a factor cached in the powertrain invariants
     load_torque = powertrain.elements[0].load_torque
+    if load_torque is None:
+        return 0.0
 
-    powertrain_efficiency = 1
-    for element in powertrain.elements:
-        if isinstance(element, SpurGear):
-            powertrain_efficiency *= element.master_gear_efficiency
+    invariants = powertrain._invariants
+    key = ('static error factor', braking_angle)
+    static_error_factor = invariants.get(key)
+    if static_error_factor is None:
+        static_error_factor = braking_angle/(
+            powertrain.elements[0].maximum_torque._to_value('Nm') *
+            _compute_powertrain_efficiency(powertrain=powertrain)
+        )
+        invariants[key] = static_error_factor
 
-    if load_torque is not None:
-        static_error = (
-            (load_torque/maximum_torque)/powertrain_efficiency
-        )*braking_angle
-    else:
-        static_error = AngularPosition(0, 'rad')
-
-    return static_error
+    return load_torque._to_value('Nm')*static_error_factor
 
 
 def _compute_pwm_min(powertrain: Powertrain) -> float | int:
+    invariants = powertrain._invariants
+    if 'pwm min' in invariants:
+        return invariants['pwm min']
+
     maximum_torque = powertrain.elements[0].maximum_torque
-    if powertrain.elements[0].time_variables['load torque']:
-        load_torque = powertrain.elements[0].time_variables['load torque'][0]
+    load_torque_time_variable = \
+        powertrain.elements[0].time_variables['load torque']
+    if load_torque_time_variable:
+        load_torque = load_torque_time_variable[0]
     else:
         load_torque = powertrain.elements[0].load_torque
     no_load_electric_current = powertrain.elements[0].no_load_electric_current
     maximum_electric_current = powertrain.elements[0].maximum_electric_current
 
-    powertrain_efficiency = 1
-    for element in powertrain.elements:
-        if isinstance(element, SpurGear):
-            powertrain_efficiency *= element.master_gear_efficiency
+    pwm_min = 1/_compute_powertrain_efficiency(powertrain=powertrain) * \
+        (load_torque/maximum_torque)*(
+            (maximum_electric_current - no_load_electric_current) /
+            maximum_electric_current
+        ) + no_load_electric_current/maximum_electric_current
+
+    if load_torque_time_variable:
+        # the first recorded load torque is kept until a reset
+        invariants['pwm min'] = pwm_min
 
-    return 1/powertrain_efficiency*(load_torque/maximum_torque)*(
-        (maximum_electric_current - no_load_electric_current) /
-        maximum_electric_current
-    ) + no_load_electric_current/maximum_electric_current
+    return pwm_min
@@ -1,3 +1,4 @@
+from __future__ import annotations
 from collections import Counter
 from gearpy.mechanical_objects import (
     MotorBase,
@@ -5,12 +6,16 @@ from gearpy.mechanical_objects import (
     GearBase,
     WormGear
 )
-from gearpy.units import Time
+from gearpy.mechanical_objects.mechanical_object_base import _Relations
+from gearpy.units import InertiaMoment, Time, TimeSeries
 from gearpy.utils import export_time_variables
-import matplotlib.pyplot as plt
-import pandas as pd
+import numpy as np
 import os
-from scipy.interpolate import interp1d
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 VARIABLES_SORT_ORDER = {
@@ -28,6 +33,264 @@ VARIABLES_SORT_ORDER = {
 }
 
 
+class CompiledPowertrain:
+    r""":py:class:`CompiledPowertrain <gearpy.powertrain.CompiledPowertrain>`
+    object. \n
+    Immutable view of the relations between the elements of a
+    :py:class:`Powertrain <gearpy.powertrain.Powertrain>`: gear ratios and
+    efficiencies, their cumulative products, the moment of inertia reflected
+    to the last element, the self-locking flag and the indices of the gears
+    whose tangential force and stresses are computable. \n
+    It is built from the elements once, so that solvers read plain numbers
+    and arrays instead of walking the elements at each time step. Do not
+    instantiate it directly, but get it from
+    :py:attr:`Powertrain.compiled <gearpy.powertrain.Powertrain.compiled>`,
+    which builds it again whenever a relation between rotating objects
+    changes. All arrays are read-only.
+
+    Attributes
+    ----------
+    :py:attr:`elements` : :py:class:`tuple`
+        Elements in the powertrain.
+    :py:attr:`gear_ratios` : :py:class:`numpy.ndarray`
+        Master gear ratio of each element.
+    :py:attr:`efficiencies` : :py:class:`numpy.ndarray`
+        Master gear efficiency of each element.
+    :py:attr:`kinematic_gains` : :py:class:`numpy.ndarray`
+        Cumulative product of the gear ratios from each element to the last
+        one.
+    :py:attr:`driving_torque_gains` : :py:class:`numpy.ndarray`
+        Cumulative product of the gear ratios and efficiencies from the motor
+        to each element.
+    :py:attr:`inertia_moment` : :py:class:`InertiaMoment <gearpy.units.units.InertiaMoment>`
+        Moment of inertia of the powertrain, reflected to the last element.
+    :py:attr:`self_locking` : :py:class:`bool`
+        Whether the powertrain can only be moved by the motor and not by the
+        effect of the load.
+    :py:attr:`force_elements` : :py:class:`tuple`
+        Indices of the elements whose tangential force is computable.
+    :py:attr:`bending_stress_elements` : :py:class:`tuple`
+        Indices of the elements whose bending stress is computable.
+    :py:attr:`contact_stress_elements` : :py:class:`tuple`
+        Indices of the elements whose contact stress is computable.
+
+    .. admonition:: Raises
+       :class: warning
+
+       ``TypeError``
+           - If ``elements`` is not a :py:class:`tuple`,
+           - if an element of ``elements`` is not an instance of
+             :py:class:`RotatingObject <gearpy.mechanical_objects.mechanical_object_base.RotatingObject>`,
+           - if ``self_locking`` is not a :py:class:`bool`.
+       ``ValueError``
+           If ``elements`` is an empty :py:class:`tuple`.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:attr:`Powertrain.compiled <gearpy.powertrain.Powertrain.compiled>`
+    """
+
+    def __init__(self, elements: tuple[RotatingObject], self_locking: bool):
+        if not isinstance(elements, tuple):
+            raise TypeError("Parameter 'elements' must be a tuple.")
+
+        if not elements:
+            raise ValueError("Parameter 'elements' cannot be an empty tuple.")
+
+        for element in elements:
+            if not isinstance(element, RotatingObject):
+                raise TypeError(
+                    f"Each element of 'elements' must be an instance of "
+                    f"{RotatingObject.__name__!r}."
+                )
+
+        if not isinstance(self_locking, bool):
+            raise TypeError("Parameter 'self_locking' must be a boolean.")
+
+        n_elements = len(elements)
+        gear_ratios = np.ones(n_elements)
+        efficiencies = np.ones(n_elements)
+        inertia_moment = elements[0].inertia_moment
+        for i in range(1, n_elements):
+            gear_ratios[i] = elements[i].master_gear_ratio
+            efficiencies[i] = elements[i].master_gear_efficiency
+            inertia_moment *= elements[i].master_gear_ratio
+            inertia_moment += elements[i].inertia_moment
+
+        kinematic_gains = np.append(np.cumprod(gear_ratios[:0:-1])[::-1], 1.0)
+        driving_torque_gains = np.cumprod(efficiencies*gear_ratios)
+        for array in (
+            gear_ratios,
+            efficiencies,
+            kinematic_gains,
+            driving_torque_gains
+        ):
+            array.setflags(write=False)
+
+        force_elements = tuple(
+            i for i, element in enumerate(elements)
+            if isinstance(element, GearBase | WormGear)
+            and element.tangential_force_is_computable
+        )
+        bending_stress_elements = tuple(
+            i for i in force_elements
+            if isinstance(elements[i], GearBase)
+            and elements[i].bending_stress_is_computable
+        )
+        contact_stress_elements = tuple(
+            i for i in bending_stress_elements
+            if elements[i].contact_stress_is_computable
+        )
+
+        self.__elements = elements
+        self.__gear_ratios = gear_ratios
+        self.__efficiencies = efficiencies
+        self.__kinematic_gains = kinematic_gains
+        self.__driving_torque_gains = driving_torque_gains
+        self.__inertia_moment = inertia_moment
+        self.__self_locking = self_locking
+        self.__force_elements = force_elements
+        self.__bending_stress_elements = bending_stress_elements
+        self.__contact_stress_elements = contact_stress_elements
+
+    @property
+    def elements(self) -> tuple[RotatingObject]:
+        """Rotating objects in the powertrain, from the motor to the farthest
+        element.
+
+        Returns
+        -------
+        :py:class:`tuple`
+            Rotating objects in the powertrain.
+        """
+        return self.__elements
+
+    @property
+    def gear_ratios(self) -> np.ndarray:
+        """Master gear ratio of each element, the ratio between the angular
+        speed of its driving element and its own angular speed. The ratio of
+        the motor, which has no driving element, is ``1``.
+
+        Returns
+        -------
+        :py:class:`numpy.ndarray`
+            Master gear ratio of each element.
+
+        .. admonition:: See Also
+           :class: seealso
+
+           :py:attr:`SpurGear.master_gear_ratio <gearpy.mechanical_objects.spur_gear.SpurGear.master_gear_ratio>`
+        """
+        return self.__gear_ratios
+
+    @property
+    def efficiencies(self) -> np.ndarray:
+        """Master gear efficiency of each element, the efficiency of the
+        mating with its driving element. The efficiency of the motor, which
+        has no driving element, is ``1``.
+
+        Returns
+        -------
+        :py:class:`numpy.ndarray`
+            Master gear efficiency of each element.
+
+        .. admonition:: See Also
+           :class: seealso
+
+           :py:attr:`SpurGear.master_gear_efficiency <gearpy.mechanical_objects.spur_gear.SpurGear.master_gear_efficiency>`
+        """
+        return self.__efficiencies
+
+    @property
+    def kinematic_gains(self) -> np.ndarray:
+        """Cumulative product of the gear ratios from each element to the last
+        one, which is ``1``. The angular position, speed and acceleration of
+        each element are the ones of the last element multiplied by its gain.
+
+        Returns
+        -------
+        :py:class:`numpy.ndarray`
+            Kinematic gain of each element.
+        """
+        return self.__kinematic_gains
+
+    @property
+    def driving_torque_gains(self) -> np.ndarray:
+        """Cumulative product of the gear ratios and efficiencies from the
+        motor, which is ``1``, to each element. The driving torque of each
+        element is the one of the motor multiplied by its gain.
+
+        Returns
+        -------
+        :py:class:`numpy.ndarray`
+            Driving torque gain of each element.
+        """
+        return self.__driving_torque_gains
+
+    @property
+    def inertia_moment(self) -> InertiaMoment:
+        """Moment of inertia of the whole powertrain, reflected to the last
+        element through the gear ratios.
+
+        Returns
+        -------
+        :py:class:`InertiaMoment <gearpy.units.units.InertiaMoment>`
+            Moment of inertia of the powertrain.
+        """
+        return self.__inertia_moment
+
+    @property
+    def self_locking(self) -> bool:
+        """Whether the powertrain can only be moved by the motor and not by the
+        effect of the load.
+
+        Returns
+        -------
+        :py:class:`bool`
+            Whether the powertrain is self-locking.
+
+        .. admonition:: See Also
+           :class: seealso
+
+           :py:attr:`Powertrain.self_locking <gearpy.powertrain.Powertrain.self_locking>`
+        """
+        return self.__self_locking
+
+    @property
+    def force_elements(self) -> tuple[int]:
+        """Indices of the elements whose tangential force is computable.
+
+        Returns
+        -------
+        :py:class:`tuple`
+            Indices of the elements in :py:attr:`elements`.
+        """
+        return self.__force_elements
+
+    @property
+    def bending_stress_elements(self) -> tuple[int]:
+        """Indices of the elements whose bending stress is computable.
+
+        Returns
+        -------
+        :py:class:`tuple`
+            Indices of the elements in :py:attr:`elements`.
+        """
+        return self.__bending_stress_elements
+
+    @property
+    def contact_stress_elements(self) -> tuple[int]:
+        """Indices of the elements whose contact stress is computable.
+
+        Returns
+        -------
+        :py:class:`tuple`
+            Indices of the elements in :py:attr:`elements`.
+        """
+        return self.__contact_stress_elements
+
+
 class Powertrain:
     r""":py:class:`Powertrain <gearpy.powertrain.Powertrain>` object.
 
@@ -40,6 +303,8 @@ class Powertrain:
     :py:attr:`self_locking` : :py:class:`bool`
         Whether the powertrain can only be moved by the motor and not by the
         effect of the load.
+    :py:attr:`compiled` : :py:class:`CompiledPowertrain <gearpy.powertrain.CompiledPowertrain>`
+        Immutable view of the relations between the elements.
 
     Methods
     -------
@@ -98,12 +363,15 @@ class Powertrain:
                 )
 
         self.__elements = tuple(elements)
-        self.__time = []
+        self.__time = TimeSeries(Time)
         self.__self_locking = False
         for element in self.elements:
             if isinstance(element, WormGear):
                 if element.self_locking:
                     self.__self_locking = True
+        self.__compiled = None
+        self.__compiled_revision = None
+        self.__invariants = {}
 
     @property
     def elements(self) -> tuple[RotatingObject]:
@@ -130,17 +398,18 @@ class Powertrain:
         return self.__elements
 
     @property
-    def time(self) -> list[Time]:
-        """List of the simulated time steps. \n
+    def time(self) -> TimeSeries:
+        """Series of the simulated time steps. \n
         During computation, the solver appends a simulated time step to this
-        list at each iteration. \n
-        Every element of this list must be an instance of
-        :py:class:`Time <gearpy.units.units.Time>`.
+        series at each iteration. \n
+        Every element of this series is an instance of
+        :py:class:`Time <gearpy.units.units.Time>`. The series behaves like a
+        :py:class:`list`, but it stores time values in a preallocated array.
 
         Returns
         -------
-        :py:class:`list`
-            The :py:class:`list` of the simulated time steps.
+        :py:class:`TimeSeries <gearpy.units.time_series.TimeSeries>`
+            The series of the simulated time steps.
 
         .. admonition:: See Also
            :class: seealso
@@ -181,6 +450,49 @@ class Powertrain:
         """
         return self.__self_locking
 
+    @property
+    def compiled(self) -> CompiledPowertrain:
+        """Immutable view of the relations between the elements in the
+        powertrain's :py:attr:`elements`, with gear ratios, efficiencies and
+        their cumulative products, the reflected moment of inertia, the
+        :py:attr:`self_locking` flag and the indices of the gears whose
+        tangential force and stresses are computable. \n
+        It is built at first access and kept until a relation between
+        rotating objects changes, like a new gear mating or fixed joint, or
+        a new master gear ratio or efficiency, then it is built again at the
+        next access.
+
+        Returns
+        -------
+        :py:class:`CompiledPowertrain <gearpy.powertrain.CompiledPowertrain>`
+            Immutable view of the powertrain.
+
+        .. admonition:: See Also
+           :class: seealso
+
+           :py:func:`add_fixed_joint <gearpy.utils.relations.add_fixed_joint>` \n
+           :py:func:`add_gear_mating <gearpy.utils.relations.add_gear_mating>` \n
+           :py:func:`add_worm_gear_mating <gearpy.utils.relations.add_worm_gear_mating>`
+        """
+        if self.__compiled_revision != _Relations.revision:
+            self.__compiled = CompiledPowertrain(
+                elements=self.__elements,
+                self_locking=self.__self_locking
+            )
+            self.__compiled_revision = _Relations.revision
+            self.__invariants = {}
+
+        return self.__compiled
+
+    @property
+    def _invariants(self) -> dict:
+        # quantities derived from the elements and from the first recorded
+        # time step, which do not change until a reset or a change of the
+        # relations between rotating objects, so they are computed once. They
+        # are read on each time step without checking the relations, which
+        # are checked by compiled, accessed at the start of each simulation
+        return self.__invariants
+
     def update_time(self, instant: Time) -> None:
         """It updates the :py:attr:`time` by appending the ``instant``
         simulated time step.
@@ -220,7 +532,8 @@ class Powertrain:
            :py:attr:`WormGear.time_variables <gearpy.mechanical_objects.worm_gear.WormGear.time_variables>` \n
            :py:attr:`WormWheel.time_variables <gearpy.mechanical_objects.worm_wheel.WormWheel.time_variables>`
         """
-        self.__time = []
+        self.__time.clear()
+        self.__invariants = {}
 
         for element in self.elements:
             element.angular_position = element.time_variables[
@@ -256,7 +569,7 @@ class Powertrain:
                             ][0]
 
             for variable in element.time_variables.keys():
-                element.time_variables[variable] = []
+                element.time_variables[variable].clear()
 
     def snapshot(
         self,
@@ -518,6 +831,9 @@ class Powertrain:
             f'{variable} ({UNITS[variable]})'
             if UNITS[variable] != '' else variable for variable in variables
         ]
+        import pandas as pd
+        from scipy.interpolate import interp1d
+
         data = pd.DataFrame(columns=columns)
 
         for element in self.elements:
@@ -541,11 +857,8 @@ class Powertrain:
             ):
                 if variable in variables:
                     interpolation_function = interp1d(
-                        x=[instant.to('sec').value for instant in self.time],
-                        y=[
-                            value.to(unit).value
-                            for value in element.time_variables[variable]
-                        ]
+                        x=self.time.get_values('sec'),
+                        y=element.time_variables[variable].get_values(unit)
                     )
                     data.loc[element.name, f'{variable} ({unit})'] = \
                         interpolation_function(
@@ -554,8 +867,8 @@ class Powertrain:
 
             if isinstance(element, MotorBase):
                 interpolation_function = interp1d(
-                    x=[instant.to('sec').value for instant in self.time],
-                    y=element.time_variables['pwm']
+                    x=self.time.get_values('sec'),
+                    y=element.time_variables['pwm'].get_values()
                 )
                 data.loc[element.name, 'pwm'] = interpolation_function(
                     target_time.to('sec').value
@@ -564,15 +877,10 @@ class Powertrain:
                 if 'electric current' in variables:
                     if element.electric_current_is_computable:
                         interpolation_function = interp1d(
-                            x=[
-                                instant.to('sec').value
-                                for instant in self.time
-                            ],
-                            y=[
-                                value.to(current_unit).value
-                                for value in
-                                element.time_variables['electric current']
-                            ]
+                            x=self.time.get_values('sec'),
+                            y=element.time_variables[
+                                'electric current'
+                            ].get_values(current_unit)
                         )
                         data.loc[
                             element.name,
@@ -600,11 +908,8 @@ class Powertrain:
 
                 for variable, unit in zip(variable_list, unit_list):
                     interpolation_function = interp1d(
-                        x=[instant.to('sec').value for instant in self.time],
-                        y=[
-                            value.to(unit).value
-                            for value in element.time_variables[variable]
-                        ]
+                        x=self.time.get_values('sec'),
+                        y=element.time_variables[variable].get_values(unit)
                     )
                     data.loc[
                         element.name,
@@ -926,7 +1231,7 @@ class Powertrain:
         if pwm_variables:
             n_variables += 1
 
-        time_values = [instant.to(time_unit).value for instant in self.time]
+        time_values = self.time.get_values(time_unit)
 
         UNITS = {
             'angular position': angular_position_unit,
@@ -942,6 +1247,8 @@ class Powertrain:
             'pwm': ''
         }
 
+        import matplotlib.pyplot as plt
+
         _, ax = plt.subplots(
             nrows=n_variables,
             ncols=n_elements,
@@ -962,10 +1269,9 @@ class Powertrain:
             for j, variable in enumerate(kinematic_variables, 0):
                 axes[j].plot(
                     time_values,
-                    [
-                        variable_value.to(UNITS[variable]).value
-                        for variable_value in element.time_variables[variable]
-                    ]
+                    element.time_variables[variable].get_values(
+                        UNITS[variable]
+                    )
                 )
 
             for variable in torques_variables:
@@ -973,10 +1279,9 @@ class Powertrain:
                 label = 'net' if label == '' else label
                 axes[torques_variables_index].plot(
                     time_values,
-                    [
-                        variable_value.to(UNITS[variable]).value
-                        for variable_value in element.time_variables[variable]
-                    ],
+                    element.time_variables[variable].get_values(
+                        UNITS[variable]
+                    ),
                     label=label
                 )
 
@@ -985,17 +1290,15 @@ class Powertrain:
                         electric_variables:
                     axes[electric_variables_index].plot(
                         time_values,
-                        [
-                            variable_value.to(UNITS['electric current']).value
-                            for variable_value
-                            in element.time_variables['electric current']
-                        ]
+                        element.time_variables['electric current'].get_values(
+                            UNITS['electric current']
+                        )
                     )
 
                 if pwm_variables:
                     axes[pwm_variables_index].plot(
                         time_values,
-                        element.time_variables['pwm']
+                        element.time_variables['pwm'].get_values()
                     )
 
             else:
@@ -1009,11 +1312,9 @@ class Powertrain:
                     for variable in forces_variables:
                         axes[forces_variables_index].plot(
                             time_values,
-                            [
-                                variable_value.to(UNITS[variable]).value
-                                for variable_value
-                                in element.time_variables[variable]
-                            ]
+                            element.time_variables[variable].get_values(
+                                UNITS[variable]
+                            )
                         )
 
                     if isinstance(element, GearBase):
@@ -1024,13 +1325,9 @@ class Powertrain:
                                      element.contact_stress_is_computable):
                                 axes[stress_variables_index].plot(
                                     time_values,
-                                    [
-                                        variable_value.to(
-                                            UNITS[variable]
-                                        ).value
-                                        for variable_value
-                                        in element.time_variables[variable]
-                                    ],
+                                    element.time_variables[
+                                        variable
+                                    ].get_values(UNITS[variable]),
                                     label=variable.replace(
                                         'stress',
                                         ''
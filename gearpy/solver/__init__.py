@@ -0,0 +1,26 @@
+__all__ = [
+    "ArrayEngine",
+    "BatchSolver",
+    "CallbackSink",
+    "CSVSink",
+    "ParallelSolver",
+    "RecordingPolicy",
+    "SimulationJob",
+    "SinkBase",
+    "Solver",
+    "SteadyStateSolver",
+    "StepSizeControl"
+]
+
+
+from .array_engine import ArrayEngine
+from .batch_solver import BatchSolver
+from .callback_sink import CallbackSink
+from .csv_sink import CSVSink
+from .parallel_solver import ParallelSolver
+from .recording_policy import RecordingPolicy
+from .simulation_job import SimulationJob
+from .sink_base import SinkBase
+from .solver import Solver
+from .steady_state_solver import SteadyStateSolver
+from .step_size_control import StepSizeControl
@@ -0,0 +1,1727 @@
+from gearpy.mechanical_objects import DCMotor, MotorBase, RotatingObject
+from gearpy.motor_control import MotorControlBase, PWMControl
+from gearpy.motor_control.rules import ConstantPWM
+from gearpy.powertrain import Powertrain
+from gearpy.sensors import (
+    AbsoluteRotaryEncoder,
+    Amperometer,
+    SensorBase,
+    Tachometer
+)
+from gearpy.units import (
+    AngularAcceleration,
+    AngularPosition,
+    AngularSpeed,
+    Current,
+    Force,
+    Stress,
+    Time,
+    TimeInterval,
+    TimeSeries,
+    Torque
+)
+from gearpy.units.unit_base import COMPARISON_TOLERANCE
+from gearpy.utils import LinearLoad, StopCondition
+from .recording_policy import RecordingPolicy
+from .event_location import _locate_event
+from .sink_base import SinkBase, _stream_time_variables
+from .step_kernel import (
+    ANGULAR_SPEED_TOLERANCE,
+    ELECTRIC_CURRENT,
+    KERNEL_AGGREGATIONS,
+    KERNEL_INTEGRATORS,
+    LAST_ANGULAR_POSITION,
+    LAST_ANGULAR_SPEED,
+    MOTOR_TORQUE,
+    POWERTRAIN_IS_LOCKED,
+    PWM,
+    STATE_SIZE,
+    TORQUE_TOLERANCE,
+    _load_step_kernels
+)
+from .step_size_control import (
+    StepSizeControl,
+    _compute_next_time_step,
+    _dormand_prince_step
+)
+from typing import Callable
+import numpy as np
+
+
+BUFFER_SIZE = 4096
+NULL_TORQUE = Torque(0, 'Nm')
+SI_UNITS = {
+    'angular position': 'rad',
+    'angular speed': 'rad/s',
+    'angular acceleration': 'rad/s^2',
+    'torque': 'Nm',
+    'driving torque': 'Nm',
+    'load torque': 'Nm',
+    'electric current': 'A',
+    'tangential force': 'N',
+    'bending stress': 'Pa',
+    'contact stress': 'Pa'
+}
+
+
+class ArrayEngine:
+    r""":py:class:`ArrayEngine <gearpy.solver.array_engine.ArrayEngine>`
+    object. \n
+    Array-backed simulation engine used by
+    :py:meth:`Solver.run <gearpy.solver.Solver.run>` when ``engine='array'``
+    is selected. \n
+    It keeps the state of the whole powertrain in NumPy arrays of SI floats
+    and propagates kinematics and torques along the powertrain elements by
+    means of cumulative products of gear ratios and efficiencies, converting
+    values to unit objects only at the API boundary.
+
+    Attributes
+    ----------
+    :py:attr:`powertrain_is_locked` : :py:class:`bool`
+        Whether the powertrain is locked by a self-locking worm gear.
+
+    Methods
+    -------
+    :py:meth:`run`
+        It runs the powertrain simulation.
+
+    .. admonition:: Raises
+       :class: warning
+
+       ``TypeError``
+           If ``powertrain`` is not an instance of
+           :py:class:`Powertrain <gearpy.powertrain.Powertrain>`.
+
+    .. admonition:: Notes
+       :class: tip
+
+       Time variables computed by the engine are recorded in SI units:
+       ``'rad'``, ``'rad/s'``, ``'rad/s^2'``, ``'Nm'``, ``'A'``, ``'N'`` and
+       ``'Pa'``, unless they already store values of a previous simulation,
+       in which case the unit of the stored values is kept. \n
+       Motor control rules, stop conditions and ``external_torque`` functions
+       keep receiving unit objects: the engine updates the powertrain elements
+       properties before evaluating them.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:class:`Solver <gearpy.solver.Solver>`
+    """
+
+    def __init__(self, powertrain: Powertrain):
+        if not isinstance(powertrain, Powertrain):
+            raise TypeError(
+                f"Parameter 'powertrain' must be an instance of "
+                f"{Powertrain.__name__!r}."
+            )
+
+        self.__powertrain = powertrain
+        self.__powertrain_is_locked = False
+
+    @property
+    def powertrain_is_locked(self) -> bool:
+        """Whether the powertrain is locked by a self-locking worm gear. It
+        must be a :py:class:`bool`.
+
+        Returns
+        -------
+        :py:class:`bool`
+            Whether the powertrain is locked.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If :py:attr:`powertrain_is_locked` is not a
+               :py:class:`bool`.
+        """
+        return self.__powertrain_is_locked
+
+    @powertrain_is_locked.setter
+    def powertrain_is_locked(self, powertrain_is_locked: bool):
+        if not isinstance(powertrain_is_locked, bool):
+            raise TypeError(
+                "Parameter 'powertrain_is_locked' must be a boolean."
+            )
+
+        self.__powertrain_is_locked = powertrain_is_locked
+
+    def run(
+        self,
+        time_discretization: TimeInterval,
+        simulation_time: TimeInterval,
+        motor_control: MotorControlBase | None = None,
+        stop_condition: StopCondition | list[StopCondition] | None = None,
+        recording_policy: RecordingPolicy | None = None,
+        sinks: list[SinkBase] | None = None,
+        retain_time_variables: bool = True,
+        integrator: str = 'semi-implicit euler',
+        step_size_control: StepSizeControl | None = None,
+        defer_force_and_stress: bool = False,
+        kernel: bool = False,
+        analytic_segments: bool = False
+    ) -> None:
+        """It runs the powertrain simulation. \n
+        The simulation follows the same steps of
+        :py:meth:`Solver.run <gearpy.solver.Solver.run>`, but the
+        computations are performed on arrays of SI floats. Parameters are
+        supposed to be already validated by
+        :py:meth:`Solver.run <gearpy.solver.Solver.run>`.
+
+        Parameters
+        ----------
+        ``time_discretization`` : :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`
+            Time discretization to be used for the simulation.
+        ``simulation_time`` : :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`
+            Duration of the simulation.
+        ``motor_control`` : :py:class:`MotorControlBase <gearpy.motor_control.motor_control_base.MotorControlBase>`, optional
+            Rules to control the powertrain motor.
+        ``stop_condition`` : :py:class:`StopCondition <gearpy.utils.stop_condition.stop_condition.StopCondition>` or :py:class:`list`, optional
+            Simulation stopping condition, or list of simulation stopping
+            conditions.
+        ``recording_policy`` : :py:class:`RecordingPolicy <gearpy.solver.recording_policy.RecordingPolicy>`, optional
+            Policy defining which time steps are recorded. Default is
+            :py:obj:`None`, so each time step is recorded.
+        ``sinks`` : :py:class:`list`, optional
+            Sinks to which stream the recorded time variables each time the
+            internal buffer is flushed. Default is :py:obj:`None`, so no sink
+            is used. Sinks are supposed to be already opened.
+        ``retain_time_variables`` : :py:class:`bool`, optional
+            Whether to keep the recorded time variables in memory after they
+            have been streamed to the ``sinks``. Default is ``True``.
+        ``integrator`` : :py:class:`str`, optional
+            Time integration scheme. Default is ``'semi-implicit euler'``.
+        ``step_size_control`` : :py:class:`StepSizeControl <gearpy.solver.step_size_control.StepSizeControl>`, optional
+            Error control of the ``'dormand-prince'`` integrator. Default is
+            :py:obj:`None`, so a
+            :py:class:`StepSizeControl <gearpy.solver.step_size_control.StepSizeControl>`
+            with default parameters is used.
+        ``defer_force_and_stress`` : :py:class:`bool`, optional
+            Whether to skip the computation and the recording of tangential
+            force, bending stress and contact stress of the gears, which are
+            computed by :py:meth:`Solver.run <gearpy.solver.Solver.run>`
+            after the simulation. Default is ``False``.
+        ``kernel`` : :py:class:`bool`, optional
+            Whether to advance the time steps through the fused step kernels,
+            compiled with Numba if it is installed. Default is ``False``.
+        ``analytic_segments`` : :py:class:`bool`, optional
+            Whether to advance the time steps at constant motor PWM with the
+            closed-form solution of the equation of motion. Default is
+            ``False``.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If function ``external_torque`` of one gear in the powertrain
+               elements does not return an instance of
+               :py:class:`Torque <gearpy.units.units.Torque>`.
+           ``ValueError``
+               If ``analytic_segments`` is ``True`` and the time steps cannot
+               be advanced with the analytic segments.
+
+        .. admonition:: Notes
+           :class: tip
+
+           The step kernels compute the whole time step, except the
+           ``external_torque`` functions, in two calls on preallocated arrays,
+           with the same floating point operations of the other computations,
+           so the results are bit-for-bit identical. They are used only with a
+           :py:class:`DCMotor <gearpy.mechanical_objects.dc_motor.DCMotor>`,
+           the ``'semi-implicit euler'`` or ``'explicit euler'`` integrators,
+           no ``motor_control``, no ``stop_condition`` and no tangential force,
+           bending stress or contact stress to be computed at each time step,
+           otherwise the time steps are advanced as without ``kernel``. \n
+           The analytic segments are used only with a
+           :py:class:`DCMotor <gearpy.mechanical_objects.dc_motor.DCMotor>`,
+           a fixed-step ``integrator``, no ``motor_control`` or a
+           :py:class:`PWMControl <gearpy.motor_control.pwm_control.PWMControl>`
+           with only
+           :py:class:`ConstantPWM <gearpy.motor_control.rules.constant_pwm.ConstantPWM>`
+           rules, no ``stop_condition``, no tangential force, bending stress
+           or contact stress to be computed at each time step and only
+           :py:class:`LinearLoad <gearpy.utils.linear_load.LinearLoad>` as
+           ``external_torque`` functions, otherwise ``analytic_segments``
+           cannot be ``True``. They take precedence over ``kernel``. \n
+           With a fixed-step ``integrator``, the time steps at which a locked
+           self-locking powertrain has a null motor PWM are not integrated,
+           as described in :py:meth:`Solver.run <gearpy.solver.Solver.run>`.
+           The step kernels do not skip them.
+        """
+        self.__defer_force_and_stress = defer_force_and_stress
+        self._compile()
+        self._load_state()
+        if analytic_segments:
+            self._check_analytic_segments(
+                motor_control=motor_control,
+                stop_condition=stop_condition,
+                integrator=integrator
+            )
+        self.__motor_control = motor_control
+        if recording_policy is None:
+            recording_policy = RecordingPolicy()
+        window = recording_policy.get_window(
+            time_discretization=time_discretization
+        )
+        self.__aggregation = recording_policy.aggregation
+        self.__window_length = 0
+        self.__sinks = sinks if sinks is not None else []
+        self.__retain_time_variables = retain_time_variables
+        self.__stream_start = len(self.__powertrain.time)
+
+        if self.__powertrain.time:
+            initial_time = self.__powertrain.time[-1]
+            final_time = initial_time + simulation_time + time_discretization
+            time_steps = np.arange(
+                initial_time.value + time_discretization.value,
+                final_time.value,
+                time_discretization.value
+            )
+            n_steps = len(time_steps)//window + window
+        else:
+            initial_time = Time(value=0, unit=time_discretization.unit)
+            final_time = initial_time + simulation_time + time_discretization
+            time_steps = np.arange(
+                initial_time.value + time_discretization.value,
+                final_time.value,
+                time_discretization.value
+            )
+            n_steps = len(time_steps)//window + window + 1
+        if not retain_time_variables:
+            n_steps = min(n_steps, BUFFER_SIZE + window)
+        self._reserve_time_variables(n_steps=n_steps)
+        if not self.__powertrain.time:
+            self.__powertrain.update_time(initial_time)
+            self._compute_powertrain_variables(time=initial_time)
+            self._update_time_variables()
+            self._close_window()
+            self._flush_time_variables()
+
+        if stop_condition is None:
+            stop_condition = []
+        elif isinstance(stop_condition, StopCondition):
+            stop_condition = [stop_condition]
+        condition_states = []
+        for condition in stop_condition:
+            self._update_sensor_target(sensor=condition.sensor)
+            condition_states.append(condition.check_condition())
+
+        self.__integrator = integrator
+        if integrator == 'dormand-prince':
+            if step_size_control is None:
+                step_size_control = StepSizeControl()
+        self.__step_size_control = step_size_control
+        # the step kernels cover only the time steps without Python calls
+        # other than the external torques
+        kernel = kernel and self.__motor_is_dc_motor and \
+            motor_control is None and not stop_condition and \
+            integrator in KERNEL_INTEGRATORS and \
+            not self.__force_elements and \
+            not self.__bending_stress_elements and \
+            not self.__contact_stress_elements
+        fast_forward = integrator != 'dormand-prince'
+        if integrator == 'dormand-prince':
+            time_steps = self._advance_adaptive_time_steps(
+                time_discretization=time_discretization,
+                simulation_time=simulation_time,
+                step_size_control=step_size_control
+            )
+        elif not kernel and not analytic_segments:
+            time_steps = self._advance_fixed_time_steps(
+                time_steps=time_steps,
+                time_discretization=time_discretization
+            )
+        try:
+            if analytic_segments:
+                self._run_analytic_segments(
+                    time_steps=time_steps,
+                    time_discretization=time_discretization,
+                    window=window
+                )
+            elif kernel:
+                self._run_step_kernels(
+                    time_steps=time_steps,
+                    time_discretization=time_discretization,
+                    window=window
+                )
+            else:
+                for time in time_steps:
+
+                    if not (fast_forward and
+                            self._fast_forward_locked_time_step(time=time)):
+                        self._compute_powertrain_variables(time=time)
+                    stop = self._check_stop_conditions(
+                        stop_conditions=stop_condition,
+                        condition_states=condition_states
+                    )
+                    self._update_time_variables()
+                    if self.__window_length == window:
+                        self._close_window()
+                    if stop:
+                        break
+        finally:
+            self._close_window()
+            self._flush_time_variables()
+            self._update_elements()
+
+    def _check_analytic_segments(
+        self,
+        motor_control: MotorControlBase | None,
+        stop_condition: StopCondition | list[StopCondition] | None,
+        integrator: str
+    ):
+
+        # the analytic segments need the motor pwm and the load torques to be
+        # known functions of time and angular speed
+        reason = None
+        if not self.__motor_is_dc_motor:
+            reason = f"a motor other than {DCMotor.__name__!r}"
+        elif integrator == 'dormand-prince':
+            reason = f"integrator {integrator!r}"
+        elif stop_condition:
+            reason = "a 'stop_condition'"
+        elif motor_control is not None and not (
+            isinstance(motor_control, PWMControl) and
+            all(isinstance(rule, ConstantPWM) for rule in motor_control.rules)
+        ):
+            reason = (
+                f"a 'motor_control' other than a {PWMControl.__name__!r} "
+                f"with only {ConstantPWM.__name__!r} rules"
+            )
+        elif not all(
+            isinstance(self.__powertrain.elements[i].external_torque,
+                       LinearLoad)
+            for i in self.__loaded_elements
+        ):
+            reason = (
+                f"a function 'external_torque' which is not a "
+                f"{LinearLoad.__name__!r}"
+            )
+        elif self.__force_elements or self.__bending_stress_elements or \
+                self.__contact_stress_elements:
+            reason = (
+                "tangential force, bending stress or contact stress computed "
+                "at each time step"
+            )
+        if reason is not None:
+            raise ValueError(
+                f"Parameter 'analytic_segments' cannot be True with {reason}."
+            )
+
+    def _compile(self):
+
+        compiled = self.__powertrain.compiled
+        elements = compiled.elements
+        n_elements = len(elements)
+        self.__n_elements = n_elements
+        self.__self_locking = compiled.self_locking
+
+        # kinematic gain of each element with respect to the last one
+        self.__kinematic_gain = compiled.kinematic_gains
+        # driving torque gain of each element with respect to the motor
+        self.__driving_torque_gain = compiled.driving_torque_gains
+
+        self.__loaded_elements = [
+            i for i in range(1, n_elements)
+            if getattr(elements[i], 'external_torque', None) is not None
+        ]
+        # each element load torque comes from the closest loaded element
+        # downstream, or from the last element if there is none
+        load_source = np.full(n_elements, n_elements - 1)
+        source = n_elements - 1
+        for i in range(n_elements - 1, -1, -1):
+            if i in self.__loaded_elements:
+                source = i
+            load_source[i] = source
+        self.__load_source = load_source
+        self.__load_torque_gain = self.__driving_torque_gain / \
+            self.__driving_torque_gain[load_source]
+
+        self.__inertia_moment = compiled.inertia_moment.to('kgm^2').value
+
+        motor = elements[0]
+        self.__motor_is_dc_motor = isinstance(motor, DCMotor) and \
+            type(motor).compute_torque is DCMotor.compute_torque and \
+            type(motor).compute_electric_current is \
+            DCMotor.compute_electric_current
+        self.__electric_current_is_computable = \
+            motor.electric_current_is_computable
+        if self.__motor_is_dc_motor:
+            self.__motor = motor
+
+        self.__force_elements = list(compiled.force_elements)
+        self.__bending_stress_elements = list(compiled.bending_stress_elements)
+        self.__contact_stress_elements = list(compiled.contact_stress_elements)
+        if self.__defer_force_and_stress:
+            # neither computed nor recorded
+            self.__force_elements = []
+            self.__bending_stress_elements = []
+            self.__contact_stress_elements = []
+
+        self.__layout = self._compute_layout()
+        self.__buffer = np.empty((BUFFER_SIZE, len(self.__layout)))
+        self.__row = np.empty(len(self.__layout))
+        self.__buffer_length = 0
+
+    def _compute_layout(self):
+
+        n = self.__n_elements
+        # (variable, element index, column index) of each recorded variable
+        layout = [
+            (variable, i, j*n + i)
+            for j, variable in enumerate(
+                [
+                    'angular position',
+                    'angular speed',
+                    'angular acceleration',
+                    'torque',
+                    'driving torque',
+                    'load torque'
+                ]
+            )
+            for i in range(n)
+        ]
+        position = 6*n
+        layout.append(('pwm', 0, position))
+        position += 1
+        if self.__electric_current_is_computable:
+            layout.append(('electric current', 0, position))
+            position += 1
+        for variable, elements in (
+            ('tangential force', self.__force_elements),
+            ('bending stress', self.__bending_stress_elements),
+            ('contact stress', self.__contact_stress_elements)
+        ):
+            for i in elements:
+                layout.append((variable, i, position))
+                position += 1
+
+        return layout
+
+    def _load_state(self):
+
+        elements = self.__powertrain.elements
+        n = self.__n_elements
+        last = elements[-1]
+        motor = elements[0]
+
+        self.__position = np.zeros(n)
+        self.__speed = np.zeros(n)
+        self.__acceleration = np.zeros(n)
+        self.__torque = np.zeros(n)
+        self.__driving_torque = np.zeros(n)
+        self.__load_torque = np.zeros(n)
+        self.__tangential_force = np.zeros(n)
+        self.__bending_stress = np.zeros(n)
+        self.__contact_stress = np.zeros(n)
+        self.__electric_current = 0.0
+        # the electric current, tangential forces and stresses are not loaded,
+        # so the state is complete only after a time step has been computed
+        self.__time_step_computed = False
+        for array, variable, unit in (
+            (self.__acceleration, 'angular_acceleration', 'rad/s^2'),
+            (self.__torque, 'torque', 'Nm'),
+            (self.__driving_torque, 'driving_torque', 'Nm'),
+            (self.__load_torque, 'load_torque', 'Nm')
+        ):
+            for i, element in enumerate(elements):
+                value = getattr(element, variable)
+                if value is not None:
+                    array[i] = value.to(unit).value
+
+        self.__last_angular_position = last.angular_position.to('rad').value
+        self.__last_angular_speed = last.angular_speed.to('rad/s').value
+        self.__motor_torque = motor.torque.to('Nm').value \
+            if motor.torque is not None else None
+        self.__pwm = motor.pwm
+
+        # tolerances used by unit objects comparisons, converted to SI
+        speed_unit = last.angular_speed.unit
+        self.__angular_speed_tolerance = 0 if speed_unit == 'rad/s' else \
+            COMPARISON_TOLERANCE*AngularSpeed(1, speed_unit).to('rad/s').value
+        torque_unit = motor.torque.unit if motor.torque is not None else \
+            getattr(motor, 'maximum_torque', NULL_TORQUE).unit
+        self.__torque_tolerance = 0 if torque_unit == 'Nm' else \
+            COMPARISON_TOLERANCE*Torque(1, torque_unit).to('Nm').value
+
+    def _compute_powertrain_variables(self, time: Time):
+
+        self._compute_angular_position_and_speed()
+        self._check_powertrain_is_locked()
+        if self.__powertrain_is_locked:
+            self._compute_locked_powertrain_angular_speed_and_acceleration()
+        self._compute_load_torque(time=time)
+        self._compute_motor_control()
+        self._compute_driving_torque()
+        self._compute_torque()
+        if not self.__powertrain_is_locked:
+            self._compute_angular_acceleration()
+        self._compute_force()
+        self._compute_stress()
+        self._compute_electric_current()
+        self.__time_step_computed = True
+
+    def _powertrain_is_idle(self) -> bool:
+
+        # a self-locking powertrain locked with null pwm stays still, since
+        # the time integration leaves its angular position unchanged and the
+        # locking check keeps it locked, so the time variables of the previous
+        # time step are still valid, unless the load torques or the pwm change
+        return self.__self_locking and self.__powertrain_is_locked and \
+            self.__pwm == 0 and self.__time_step_computed
+
+    def _fast_forward_locked_time_step(self, time: Time) -> bool:
+
+        if not self._powertrain_is_idle():
+            return False
+
+        load_torque = self.__load_torque
+        self._compute_load_torque(time=time)
+        self._compute_motor_control()
+        if self.__pwm != 0 or \
+                not np.array_equal(self.__load_torque, load_torque):
+            self._compute_driving_torque()
+            self._compute_torque()
+            self._compute_force()
+            self._compute_stress()
+            self._compute_electric_current()
+
+        return True
+
+    def _compute_angular_position_and_speed(self):
+
+        self.__position = self.__kinematic_gain*self.__last_angular_position
+        self.__speed = self.__kinematic_gain*self.__last_angular_speed
+
+    def _check_powertrain_is_locked(self):
+
+        motor_angular_speed = self.__speed[0]
+        angular_speed_tolerance = self.__angular_speed_tolerance
+        pwm = self.__pwm
+        if self.__self_locking and (
+            pwm == 0 or
+            (pwm > 0 and motor_angular_speed < -angular_speed_tolerance) or
+            (pwm < 0 and motor_angular_speed > angular_speed_tolerance)
+        ):
+            self.__powertrain_is_locked = True
+            return
+
+        if self.__motor_torque is not None:
+            torque_tolerance = self.__torque_tolerance
+            if (self.__motor_torque > torque_tolerance and pwm > 0) or \
+                    (self.__motor_torque < -torque_tolerance and pwm < 0):
+                self.__powertrain_is_locked = False
+
+    def _compute_locked_powertrain_angular_speed_and_acceleration(self):
+
+        self.__speed = np.zeros(self.__n_elements)
+        self.__acceleration = np.zeros(self.__n_elements)
+        self.__last_angular_speed = 0.0
+        self.__angular_speed_tolerance = 0
+
+    def _compute_load_torque(self, time: Time):
+
+        elements = self.__powertrain.elements
+        load_torque = self.__load_torque.copy()
+        for i in self.__loaded_elements:
+            external_torque = elements[i].external_torque(
+                time=time,
+                angular_position=AngularPosition(
+                    value=float(self.__position[i]),
+                    unit='rad'
+                ),
+                angular_speed=AngularSpeed(
+                    value=float(self.__speed[i]),
+                    unit='rad/s'
+                )
+            )
+            if not isinstance(external_torque, Torque):
+                raise TypeError(
+                    f"Function 'external_torque' of {elements[i].name!r} "
+                    f"must return an instance of {Torque.__name__!r}."
+                )
+            load_torque[i] = external_torque._to_value('Nm')
+
+        self.__load_torque = \
+            load_torque[self.__load_source]*self.__load_torque_gain
+
+    def _compute_motor_control(self):
+
+        if self.__motor_control is not None:
+            self._update_elements()
+            self.__motor_control.apply_rules()
+            self.__pwm = self.__powertrain.elements[0].pwm
+
+    def _compute_driving_torque(self):
+
+        if self.__motor_is_dc_motor:
+            motor_torque = self._compute_dc_motor_torque()
+        else:
+            motor = self.__powertrain.elements[0]
+            motor.angular_speed = AngularSpeed(
+                value=float(self.__speed[0]),
+                unit='rad/s'
+            )
+            motor.compute_torque()
+            motor_torque = motor.driving_torque._to_value('Nm')
+
+        self.__driving_torque = self.__driving_torque_gain*motor_torque
+
+    def _compute_dc_motor_torque(self) -> float:
+
+        torque_intercept, torque_slope, _, _ = \
+            self.__motor._get_characteristic(pwm=self.__pwm)
+
+        return torque_intercept - torque_slope*float(self.__speed[0])
+
+    def _compute_torque(self):
+
+        self.__torque = self.__driving_torque - self.__load_torque
+        self.__motor_torque = float(self.__torque[0])
+
+    def _compute_angular_acceleration(self):
+
+        self.__acceleration = self.__kinematic_gain * \
+            (self.__torque[-1]/self.__inertia_moment)
+
+    def _compute_force(self):
+
+        elements = self.__powertrain.elements
+        for i in self.__force_elements:
+            element = elements[i]
+            element.driving_torque = Torque(
+                value=float(self.__driving_torque[i]),
+                unit='Nm'
+            )
+            element.load_torque = Torque(
+                value=float(self.__load_torque[i]),
+                unit='Nm'
+            )
+            element.compute_tangential_force()
+            self.__tangential_force[i] = \
+                element.tangential_force._to_value('N')
+
+    def _compute_stress(self):
+
+        elements = self.__powertrain.elements
+        for i in self.__bending_stress_elements:
+            element = elements[i]
+            element.compute_bending_stress()
+            self.__bending_stress[i] = element.bending_stress._to_value('Pa')
+            if i in self.__contact_stress_elements:
+                element.compute_contact_stress()
+                self.__contact_stress[i] = \
+                    element.contact_stress._to_value('Pa')
+
+    def _compute_electric_current(self):
+
+        if not self.__electric_current_is_computable:
+            return
+
+        if not self.__motor_is_dc_motor:
+            motor = self.__powertrain.elements[0]
+            motor.driving_torque = Torque(
+                value=float(self.__driving_torque[0]),
+                unit='Nm'
+            )
+            motor.compute_electric_current()
+            self.__electric_current = motor.electric_current._to_value('A')
+            return
+
+        _, _, electric_current_intercept, electric_current_slope = \
+            self.__motor._get_characteristic(pwm=self.__pwm)
+        self.__electric_current = electric_current_intercept + \
+            electric_current_slope*float(self.__driving_torque[0])
+
+    def _advance_fixed_time_steps(
+        self,
+        time_steps: np.ndarray,
+        time_discretization: TimeInterval
+    ):
+
+        time_step = time_discretization.to('sec').value
+        for k in time_steps:
+            self._save_time_step_start(time_step=time_discretization)
+            time = Time(value=float(k), unit=time_discretization.unit)
+            self.__powertrain.update_time(time)
+            if not self._powertrain_is_idle():
+                self._time_integration(
+                    time_step=time_step,
+                    time=time,
+                    time_discretization=time_discretization
+                )
+            yield time
+
+    def _run_step_kernels(
+        self,
+        time_steps: np.ndarray,
+        time_discretization: TimeInterval,
+        window: int
+    ):
+
+        advance_angular_state, compute_and_record_torques = \
+            _load_step_kernels()
+        powertrain = self.__powertrain
+        elements = powertrain.elements
+        loaded_elements = [
+            (i, elements[i].name, elements[i].external_torque)
+            for i in self.__loaded_elements
+        ]
+        time_unit = time_discretization.unit
+        time_step = time_discretization.to('sec').value
+        explicit = self.__integrator == 'explicit euler'
+        self_locking = self.__self_locking
+        aggregation = KERNEL_AGGREGATIONS.index(self.__aggregation)
+        electric_current_is_computable = self.__electric_current_is_computable
+        # the motor control is not applied, so the pwm does not change
+        characteristic = np.array(
+            [
+                0.0 if value is None else value
+                for value in self.__motor._get_characteristic(pwm=self.__pwm)
+            ]
+        )
+        kinematic_gain = self.__kinematic_gain
+        driving_torque_gain = self.__driving_torque_gain
+        load_source = self.__load_source
+        load_torque_gain = self.__load_torque_gain
+        inertia_moment = self.__inertia_moment
+
+        state = np.empty(STATE_SIZE)
+        state[LAST_ANGULAR_POSITION] = self.__last_angular_position
+        state[LAST_ANGULAR_SPEED] = self.__last_angular_speed
+        state[MOTOR_TORQUE] = np.nan if self.__motor_torque is None \
+            else self.__motor_torque
+        state[PWM] = self.__pwm
+        state[POWERTRAIN_IS_LOCKED] = float(self.__powertrain_is_locked)
+        state[ANGULAR_SPEED_TOLERANCE] = self.__angular_speed_tolerance
+        state[TORQUE_TOLERANCE] = self.__torque_tolerance
+        state[ELECTRIC_CURRENT] = self.__electric_current
+        # the kernels update the arrays in place
+        angular_position = self.__position = self.__position.copy()
+        angular_speed = self.__speed = self.__speed.copy()
+        angular_acceleration = self.__acceleration = \
+            self.__acceleration.copy()
+        torque = self.__torque = self.__torque.copy()
+        driving_torque = self.__driving_torque = self.__driving_torque.copy()
+        load_torque = self.__load_torque = self.__load_torque.copy()
+        row = self.__row
+        buffer = self.__buffer
+
+        try:
+            for k in time_steps:
+
+                if self.__buffer_length == BUFFER_SIZE:
+                    self._flush_time_variables()
+                time = Time(value=float(k), unit=time_unit)
+                powertrain.update_time(time)
+                advance_angular_state(
+                    state,
+                    time_step,
+                    explicit,
+                    self_locking,
+                    kinematic_gain,
+                    angular_position,
+                    angular_speed,
+                    angular_acceleration
+                )
+                for i, name, external_torque in loaded_elements:
+                    value = external_torque(
+                        time=time,
+                        angular_position=AngularPosition(
+                            value=float(angular_position[i]),
+                            unit='rad'
+                        ),
+                        angular_speed=AngularSpeed(
+                            value=float(angular_speed[i]),
+                            unit='rad/s'
+                        )
+                    )
+                    if not isinstance(value, Torque):
+                        raise TypeError(
+                            f"Function 'external_torque' of {name!r} must "
+                            f"return an instance of {Torque.__name__!r}."
+                        )
+                    load_torque[i] = value._to_value('Nm')
+                compute_and_record_torques(
+                    state,
+                    characteristic,
+                    electric_current_is_computable,
+                    kinematic_gain,
+                    driving_torque_gain,
+                    load_source,
+                    load_torque_gain,
+                    inertia_moment,
+                    angular_position,
+                    angular_speed,
+                    angular_acceleration,
+                    torque,
+                    driving_torque,
+                    load_torque,
+                    row,
+                    buffer,
+                    self.__buffer_length,
+                    self.__window_length,
+                    aggregation
+                )
+                self.__window_length += 1
+                if self.__window_length == window:
+                    self._close_window()
+        finally:
+            self.__last_angular_position = float(state[LAST_ANGULAR_POSITION])
+            self.__last_angular_speed = float(state[LAST_ANGULAR_SPEED])
+            self.__motor_torque = float(state[MOTOR_TORQUE])
+            self.__powertrain_is_locked = bool(state[POWERTRAIN_IS_LOCKED])
+            self.__angular_speed_tolerance = \
+                float(state[ANGULAR_SPEED_TOLERANCE])
+            self.__electric_current = float(state[ELECTRIC_CURRENT])
+
+    def _run_analytic_segments(
+        self,
+        time_steps: np.ndarray,
+        time_discretization: TimeInterval,
+        window: int
+    ):
+
+        time_unit = time_discretization.unit
+        time_step = time_discretization.to('sec').value
+        elements = self.__powertrain.elements
+        self.__linear_loads = [
+            (
+                i,
+                elements[i].external_torque.constant_torque.to('Nm').value,
+                elements[i].external_torque.viscous_coefficient
+            )
+            for i in self.__loaded_elements
+        ]
+        pwm = self._compute_pwm_schedule(
+            time_steps=time_steps,
+            time_unit=time_unit
+        )
+        # each time step closes the run of time steps with the same pwm which
+        # it belongs to
+        run_stops = np.append(
+            np.flatnonzero(pwm[1:] != pwm[:-1]) + 1,
+            len(time_steps)
+        )
+
+        k = 0
+        while k < len(time_steps):
+
+            # the motion up to a time step is driven by the pwm of the
+            # previous time steps, so a segment ends at the first time step
+            # after a pwm change, whose torques are computed with the new pwm
+            if pwm[k] == 0 and self._powertrain_is_idle():
+                # the loads do not depend on time, so the time variables of a
+                # powertrain locked with null pwm do not change until the pwm
+                # changes, and the time steps in between are recorded at once
+                stop = run_stops[np.searchsorted(run_stops, k, side='right')]
+                self._record_time_steps(
+                    time_steps=time_steps[k:stop],
+                    time_unit=time_unit,
+                    rows=np.broadcast_to(
+                        self.__row,
+                        (stop - k, len(self.__row))
+                    ),
+                    window=window
+                )
+                k = stop
+                continue
+
+            if pwm[k] == self.__pwm:
+                stop = run_stops[np.searchsorted(run_stops, k, side='right')]
+                stop = min(stop + 1, len(time_steps))
+                if np.isnan(pwm[stop - 1]):
+                    stop -= 1
+            else:
+                stop = k if np.isnan(pwm[k]) else k + 1
+            n_steps = 0
+            if stop > k:
+                n_steps = self._compute_analytic_segment(
+                    time_steps=time_steps[k:stop],
+                    pwm=pwm[k:stop],
+                    time_step=time_step,
+                    time_unit=time_unit,
+                    window=window
+                )
+            if n_steps == 0:
+                # time steps at which the powertrain gets locked, or at which
+                # the motor control raises an error, are computed as usual
+                for time in self._advance_fixed_time_steps(
+                    time_steps=time_steps[k:k + 1],
+                    time_discretization=time_discretization
+                ):
+                    if not self._fast_forward_locked_time_step(time=time):
+                        self._compute_powertrain_variables(time=time)
+                    self._update_time_variables()
+                    if self.__window_length == window:
+                        self._close_window()
+                n_steps = 1
+            k += n_steps
+
+    def _compute_pwm_schedule(
+        self,
+        time_steps: np.ndarray,
+        time_unit: str
+    ) -> np.ndarray:
+
+        if self.__motor_control is None:
+            return np.full(len(time_steps), float(self.__pwm))
+
+        # each rule is active over a contiguous range of time steps, whose
+        # ends are located by bisection with the same comparisons of
+        # Timer.is_active on the time instants stored in the powertrain time
+        time_series_unit = self.__powertrain.time.unit
+
+        def get_time(k: int) -> Time:
+
+            time = Time(value=float(time_steps[k]), unit=time_unit)
+            if time_series_unit == time_unit:
+                return time
+
+            return Time(
+                value=time._to_value(time_series_unit),
+                unit=time_series_unit
+            )
+
+        pwm = np.ones(len(time_steps))
+        n_active_rules = np.zeros(len(time_steps), dtype=int)
+        for rule in self.__motor_control.rules:
+            timer = rule.timer
+            start = _find_first(
+                n=len(time_steps),
+                predicate=lambda k: get_time(k) >= timer.start_time
+            )
+            stop = _find_first(
+                n=len(time_steps),
+                predicate=lambda k: not (
+                    (get_time(k) - timer.start_time) <= timer.duration
+                )
+            )
+            pwm[start:stop] = min(max(rule.target_pwm_value, -1), 1)
+            n_active_rules[start:stop] += 1
+        # simultaneously applicable rules raise an error when applied
+        pwm[n_active_rules > 1] = np.nan
+
+        return pwm
+
+    def _compute_analytic_segment(
+        self,
+        time_steps: np.ndarray,
+        pwm: np.ndarray,
+        time_step: float,
+        time_unit: str,
+        window: int
+    ) -> int:
+
+        if self.__powertrain_is_locked:
+            return 0
+
+        n = self.__n_elements
+        kinematic_gain = self.__kinematic_gain
+        driving_torque_gain = self.__driving_torque_gain
+        inertia_moment = self.__inertia_moment
+
+        # the load torque of the last element is linear in its angular speed,
+        # so the equation of motion is inertia_moment*acceleration =
+        # torque_intercept - torque_slope*speed, whose solution relaxes
+        # exponentially towards the speed at which torques balance
+        constant_torque = float(self.__load_torque[-1])
+        viscous_coefficient = 0.0
+        for i, load_constant_torque, load_viscous_coefficient in \
+                self.__linear_loads:
+            if i == n - 1:
+                constant_torque = load_constant_torque
+                viscous_coefficient = load_viscous_coefficient
+        motor_torque_intercept, motor_torque_slope, _, _ = \
+            self.__motor._get_characteristic(pwm=self.__pwm)
+        torque_intercept = driving_torque_gain[-1]*motor_torque_intercept - \
+            constant_torque
+        torque_slope = driving_torque_gain[-1]*motor_torque_slope * \
+            kinematic_gain[0] + viscous_coefficient
+
+        angular_position = self.__last_angular_position
+        angular_speed = self.__last_angular_speed
+        elapsed_time = time_step*np.arange(1, len(time_steps) + 1)
+        if torque_slope != 0:
+            final_angular_speed = torque_intercept/torque_slope
+            rate = torque_slope/inertia_moment
+            last_angular_speed = final_angular_speed + \
+                (angular_speed - final_angular_speed) * \
+                np.exp(-rate*elapsed_time)
+            last_angular_position = angular_position + \
+                final_angular_speed*elapsed_time - \
+                (angular_speed - final_angular_speed) * \
+                np.expm1(-rate*elapsed_time)/rate
+        else:
+            angular_acceleration = torque_intercept/inertia_moment
+            last_angular_speed = angular_speed + \
+                angular_acceleration*elapsed_time
+            last_angular_position = angular_position + \
+                angular_speed*elapsed_time + \
+                angular_acceleration*elapsed_time**2/2
+
+        # the segment stops before the first time step at which the
+        # powertrain gets locked
+        if self.__self_locking:
+            motor_angular_speed = kinematic_gain[0]*last_angular_speed
+            angular_speed_tolerance = self.__angular_speed_tolerance
+            locked = np.flatnonzero(
+                (self.__pwm == 0) |
+                ((self.__pwm > 0) &
+                 (motor_angular_speed < -angular_speed_tolerance)) |
+                ((self.__pwm < 0) &
+                 (motor_angular_speed > angular_speed_tolerance))
+            )
+            if locked.size:
+                n_steps = int(locked[0])
+                if n_steps == 0:
+                    return 0
+                time_steps = time_steps[:n_steps]
+                pwm = pwm[:n_steps]
+                last_angular_position = last_angular_position[:n_steps]
+                last_angular_speed = last_angular_speed[:n_steps]
+
+        position = np.outer(last_angular_position, kinematic_gain)
+        speed = np.outer(last_angular_speed, kinematic_gain)
+        load_torque = np.empty((len(time_steps), n))
+        load_torque[:] = self.__load_torque
+        for i, load_constant_torque, load_viscous_coefficient in \
+                self.__linear_loads:
+            load_torque[:, i] = load_constant_torque + \
+                load_viscous_coefficient*speed[:, i]
+        load_torque = load_torque[:, self.__load_source]*self.__load_torque_gain
+
+        # torques are computed with the pwm of each time step
+        characteristic = np.empty((len(time_steps), 4))
+        for value in np.unique(pwm):
+            characteristic[pwm == value] = [
+                0.0 if item is None else item
+                for item in self.__motor._get_characteristic(pwm=value)
+            ]
+        motor_torque = characteristic[:, 0] - characteristic[:, 1]*speed[:, 0]
+        driving_torque = np.outer(motor_torque, driving_torque_gain)
+        torque = driving_torque - load_torque
+        acceleration = np.outer(torque[:, -1]/inertia_moment, kinematic_gain)
+
+        rows = np.empty((len(time_steps), len(self.__layout)))
+        rows[:, 0:n] = position
+        rows[:, n:2*n] = speed
+        rows[:, 2*n:3*n] = acceleration
+        rows[:, 3*n:4*n] = torque
+        rows[:, 4*n:5*n] = driving_torque
+        rows[:, 5*n:6*n] = load_torque
+        rows[:, 6*n] = pwm
+        if self.__electric_current_is_computable:
+            rows[:, 6*n + 1] = characteristic[:, 2] + \
+                characteristic[:, 3]*driving_torque[:, 0]
+            self.__electric_current = float(rows[-1, 6*n + 1])
+
+        self.__last_angular_position = float(last_angular_position[-1])
+        self.__last_angular_speed = float(last_angular_speed[-1])
+        self.__position = position[-1]
+        self.__speed = speed[-1]
+        self.__acceleration = acceleration[-1]
+        self.__torque = torque[-1]
+        self.__driving_torque = driving_torque[-1]
+        self.__load_torque = load_torque[-1]
+        self.__motor_torque = float(torque[-1, 0])
+        self.__row[:] = rows[-1]
+        self.__time_step_computed = True
+        if self.__motor_control is not None:
+            self.__powertrain.elements[0].pwm = float(pwm[-1])
+            self.__pwm = self.__powertrain.elements[0].pwm
+        self._record_time_steps(
+            time_steps=time_steps,
+            time_unit=time_unit,
+            rows=rows,
+            window=window
+        )
+
+        return len(time_steps)
+
+    def _advance_adaptive_time_steps(
+        self,
+        time_discretization: TimeInterval,
+        simulation_time: TimeInterval,
+        step_size_control: StepSizeControl
+    ):
+
+        time_unit = time_discretization.unit
+        minimum_time_step, maximum_time_step = \
+            step_size_control.get_time_step_bounds(
+                time_discretization=time_discretization
+            )
+        initial_time_step = min(
+            max(time_discretization.to('sec').value, minimum_time_step),
+            maximum_time_step
+        )
+        time_step = initial_time_step
+        time = self.__powertrain.time[-1].to('sec').value
+        final_time = time + simulation_time.to('sec').value
+
+        while time < final_time:
+
+            remaining_time = final_time - time
+            step = min(time_step, remaining_time)
+            if remaining_time - step < minimum_time_step:
+                step = remaining_time
+
+            angular_speed = self.__last_angular_speed
+            new_angular_position, new_angular_speed, error = \
+                self._compute_dormand_prince_step(
+                    time=self.__powertrain.time[-1],
+                    time_step=step
+                )
+
+            time_step = min(
+                max(
+                    _compute_next_time_step(time_step=step, error=error),
+                    minimum_time_step
+                ),
+                maximum_time_step
+            )
+            if error > 1 and step > minimum_time_step:
+                continue
+
+            # the powertrain may lock only at the simulation time steps, so
+            # the step is reduced to stop close to the speed reversal
+            pwm = self.__pwm
+            if self.__self_locking and \
+                    not self.__powertrain_is_locked and \
+                    angular_speed*pwm > 0 and new_angular_speed*pwm < 0 and \
+                    step > minimum_time_step:
+                time_step = max(
+                    step*angular_speed/(angular_speed - new_angular_speed),
+                    minimum_time_step
+                )
+                continue
+
+            time = final_time if step == remaining_time else time + step
+            self._save_time_step_start(
+                time_step=TimeInterval(value=step, unit='sec').to(time_unit)
+            )
+            current_time = Time(value=time, unit='sec').to(time_unit)
+            self.__powertrain.update_time(current_time)
+            self.__last_angular_position = new_angular_position
+            self.__last_angular_speed = new_angular_speed
+            yield current_time
+
+            if self.__pwm != pwm:
+                time_step = initial_time_step
+
+    def _compute_dormand_prince_step(
+        self,
+        time: Time,
+        time_step: float
+    ) -> tuple[float, float, float]:
+
+        initial_time = time.to('sec').value
+
+        def compute_angular_acceleration(
+            time_offset: float,
+            angular_position: float,
+            angular_speed: float
+        ) -> float:
+
+            return self._compute_stage_angular_acceleration(
+                time=Time(
+                    value=initial_time + time_offset,
+                    unit='sec'
+                ).to(time.unit),
+                angular_position=angular_position,
+                angular_speed=angular_speed
+            )
+
+        angular_position = self.__last_angular_position
+        angular_speed = self.__last_angular_speed
+        motor_torque = self.__motor_torque
+        step = _dormand_prince_step(
+            compute_angular_acceleration=compute_angular_acceleration,
+            time_step=time_step,
+            angular_position=angular_position,
+            angular_speed=angular_speed,
+            angular_acceleration=float(self.__acceleration[-1]),
+            step_size_control=self.__step_size_control
+        )
+        self.__last_angular_position = angular_position
+        self.__last_angular_speed = angular_speed
+        self.__motor_torque = motor_torque
+
+        return step
+
+    def _save_time_step_start(self, time_step: TimeInterval):
+
+        self.__time_step_start = {
+            'time': self.__powertrain.time[-1],
+            'time step': time_step,
+            'angular position': self.__last_angular_position,
+            'angular speed': self.__last_angular_speed,
+            'angular acceleration': self.__acceleration,
+            'motor torque': self.__motor_torque,
+            'pwm': self.__pwm,
+            'powertrain is locked': self.__powertrain_is_locked
+        }
+
+    def _check_stop_conditions(
+        self,
+        stop_conditions: list[StopCondition],
+        condition_states: list[bool]
+    ) -> bool:
+
+        events = []
+        stop = False
+        for i, condition in enumerate(stop_conditions):
+            self._update_sensor_target(sensor=condition.sensor)
+            condition_is_valid = condition.check_condition()
+            if condition_is_valid and not condition_states[i]:
+                events.append(condition)
+            elif condition_is_valid and condition.terminal:
+                stop = True
+            condition_states[i] = condition_is_valid
+
+        if not events:
+            return stop
+
+        state = self._save_powertrain_state()
+        fractions = []
+        for condition in events:
+
+            def compute_condition(fraction: float) -> tuple[bool, float]:
+                self._compute_partial_time_step(fraction=fraction)
+                self._update_sensor_target(sensor=condition.sensor)
+                return condition.check_condition(), \
+                    condition.compute_residual()
+
+            fractions.append(_locate_event(compute_condition=compute_condition))
+        self._restore_powertrain_state(state=state)
+
+        terminal_fractions = [
+            fraction for condition, fraction in zip(events, fractions)
+            if condition.terminal
+        ]
+        stop_fraction = min(terminal_fractions) if terminal_fractions else 1.0
+        time_step_start = self.__time_step_start
+        for condition, fraction in zip(events, fractions):
+            if fraction <= stop_fraction:
+                condition.add_event_time(
+                    time_step_start['time'] +
+                    time_step_start['time step']*fraction
+                )
+
+        if terminal_fractions and stop_fraction < 1:
+            self.__powertrain.time[-1] = self._compute_partial_time_step(
+                fraction=stop_fraction
+            )
+            self._compute_force()
+            self._compute_stress()
+
+        return stop or bool(terminal_fractions)
+
+    def _compute_partial_time_step(self, fraction: float) -> Time:
+
+        time_step_start = self.__time_step_start
+        self.__last_angular_position = time_step_start['angular position']
+        self.__last_angular_speed = time_step_start['angular speed']
+        self.__acceleration = time_step_start['angular acceleration']
+        self.__motor_torque = time_step_start['motor torque']
+        self.__pwm = time_step_start['pwm']
+        self.__powertrain_is_locked = time_step_start['powertrain is locked']
+
+        time = time_step_start['time']
+        if fraction > 0:
+            time_step = time_step_start['time step']*fraction
+            time = time + time_step
+            if self.__integrator == 'dormand-prince':
+                self.__last_angular_position, self.__last_angular_speed, _ = \
+                    self._compute_dormand_prince_step(
+                        time=time_step_start['time'],
+                        time_step=time_step.to('sec').value
+                    )
+            else:
+                self._time_integration(
+                    time_step=time_step.to('sec').value,
+                    time=time,
+                    time_discretization=time_step
+                )
+
+        self._compute_angular_position_and_speed()
+        if self.__powertrain_is_locked:
+            self._compute_locked_powertrain_angular_speed_and_acceleration()
+        self._compute_load_torque(time=time)
+        self._compute_driving_torque()
+        self._compute_torque()
+        if not self.__powertrain_is_locked:
+            self._compute_angular_acceleration()
+        self._compute_electric_current()
+
+        return time
+
+    def _save_powertrain_state(self) -> dict:
+
+        return {
+            'last angular position': self.__last_angular_position,
+            'last angular speed': self.__last_angular_speed,
+            'angular position': self.__position,
+            'angular speed': self.__speed,
+            'angular acceleration': self.__acceleration,
+            'torque': self.__torque,
+            'driving torque': self.__driving_torque,
+            'load torque': self.__load_torque,
+            'motor torque': self.__motor_torque,
+            'electric current': self.__electric_current,
+            'pwm': self.__pwm,
+            'powertrain is locked': self.__powertrain_is_locked,
+            'angular speed tolerance': self.__angular_speed_tolerance
+        }
+
+    def _restore_powertrain_state(self, state: dict):
+
+        self.__last_angular_position = state['last angular position']
+        self.__last_angular_speed = state['last angular speed']
+        self.__position = state['angular position']
+        self.__speed = state['angular speed']
+        self.__acceleration = state['angular acceleration']
+        self.__torque = state['torque']
+        self.__driving_torque = state['driving torque']
+        self.__load_torque = state['load torque']
+        self.__motor_torque = state['motor torque']
+        self.__electric_current = state['electric current']
+        self.__pwm = state['pwm']
+        self.__powertrain_is_locked = state['powertrain is locked']
+        self.__angular_speed_tolerance = state['angular speed tolerance']
+
+    def _time_integration(
+        self,
+        time_step: float,
+        time: Time,
+        time_discretization: TimeInterval
+    ):
+
+        integrator = self.__integrator
+        if integrator == 'semi-implicit euler':
+            self.__last_angular_speed += \
+                float(self.__acceleration[-1])*time_step
+            self.__last_angular_position += \
+                self.__last_angular_speed*time_step
+            return
+
+        angular_position = self.__last_angular_position
+        angular_speed = self.__last_angular_speed
+        angular_acceleration = float(self.__acceleration[-1])
+
+        if integrator == 'explicit euler':
+            self.__last_angular_position = \
+                angular_position + angular_speed*time_step
+            self.__last_angular_speed = \
+                angular_speed + angular_acceleration*time_step
+            return
+
+        # intermediate evaluations overwrite the motor torque, which is needed
+        # to check the powertrain locking condition at the next time step
+        motor_torque = self.__motor_torque
+        if integrator == 'heun':
+            angular_position_1 = angular_position + angular_speed*time_step
+            angular_speed_1 = angular_speed + angular_acceleration*time_step
+            angular_acceleration_1 = self._compute_stage_angular_acceleration(
+                time=time,
+                angular_position=angular_position_1,
+                angular_speed=angular_speed_1
+            )
+            self.__last_angular_position = angular_position + \
+                (angular_speed + angular_speed_1)*time_step/2
+            self.__last_angular_speed = angular_speed + \
+                (angular_acceleration + angular_acceleration_1)*time_step/2
+        else:
+            half_time = time - time_discretization/2
+            angular_position_2 = angular_position + angular_speed*time_step/2
+            angular_speed_2 = angular_speed + angular_acceleration*time_step/2
+            angular_acceleration_2 = self._compute_stage_angular_acceleration(
+                time=half_time,
+                angular_position=angular_position_2,
+                angular_speed=angular_speed_2
+            )
+            angular_position_3 = angular_position + angular_speed_2*time_step/2
+            angular_speed_3 = angular_speed + angular_acceleration_2*time_step/2
+            angular_acceleration_3 = self._compute_stage_angular_acceleration(
+                time=half_time,
+                angular_position=angular_position_3,
+                angular_speed=angular_speed_3
+            )
+            angular_position_4 = angular_position + angular_speed_3*time_step
+            angular_speed_4 = angular_speed + angular_acceleration_3*time_step
+            angular_acceleration_4 = self._compute_stage_angular_acceleration(
+                time=time,
+                angular_position=angular_position_4,
+                angular_speed=angular_speed_4
+            )
+            self.__last_angular_position = angular_position + (
+                angular_speed + 2*angular_speed_2 + 2*angular_speed_3 +
+                angular_speed_4
+            )*time_step/6
+            self.__last_angular_speed = angular_speed + (
+                angular_acceleration + 2*angular_acceleration_2 +
+                2*angular_acceleration_3 + angular_acceleration_4
+            )*time_step/6
+
+        self.__motor_torque = motor_torque
+
+    def _compute_stage_angular_acceleration(
+        self,
+        time: Time,
+        angular_position: float,
+        angular_speed: float
+    ) -> float:
+
+        if self.__powertrain_is_locked:
+            return 0.0
+
+        self.__last_angular_position = angular_position
+        self.__last_angular_speed = angular_speed
+        self._compute_angular_position_and_speed()
+        self._compute_load_torque(time=time)
+        self._compute_driving_torque()
+        self._compute_torque()
+
+        return float(self.__torque[-1])/self.__inertia_moment
+
+    def _update_time_variables(self):
+
+        n = self.__n_elements
+        row = self.__row
+        row[0:n] = self.__position
+        row[n:2*n] = self.__speed
+        row[2*n:3*n] = self.__acceleration
+        row[3*n:4*n] = self.__torque
+        row[4*n:5*n] = self.__driving_torque
+        row[5*n:6*n] = self.__load_torque
+        row[6*n] = self.__pwm
+        position = 6*n + 1
+        if self.__electric_current_is_computable:
+            row[position] = self.__electric_current
+            position += 1
+        for array, indexes in (
+            (self.__tangential_force, self.__force_elements),
+            (self.__bending_stress, self.__bending_stress_elements),
+            (self.__contact_stress, self.__contact_stress_elements)
+        ):
+            if indexes:
+                row[position:position + len(indexes)] = array[indexes]
+                position += len(indexes)
+        self._record_time_step(row=row)
+
+    def _record_time_step(self, row: np.ndarray):
+
+        if self.__buffer_length == BUFFER_SIZE:
+            self._flush_time_variables()
+
+        # the time steps of the current recording window are aggregated in a
+        # single buffer row, which is committed when the window is closed
+        recorded = self.__buffer[self.__buffer_length]
+        if self.__window_length == 0 or self.__aggregation == 'last':
+            recorded[:] = row
+        elif self.__aggregation == 'mean':
+            recorded += row
+        elif self.__aggregation == 'min':
+            np.minimum(recorded, row, out=recorded)
+        else:
+            np.maximum(recorded, row, out=recorded)
+        self.__window_length += 1
+
+    def _record_time_steps(
+        self,
+        time_steps: np.ndarray,
+        time_unit: str,
+        rows: np.ndarray,
+        window: int
+    ):
+
+        # the time steps completing the current recording window are recorded
+        # one by one, then the following complete windows are aggregated at
+        # once and the remaining time steps open a new window
+        powertrain = self.__powertrain
+        k = 0
+        while k < len(rows) and self.__window_length:
+            powertrain.update_time(
+                Time(value=float(time_steps[k]), unit=time_unit)
+            )
+            self._record_time_step(row=rows[k])
+            k += 1
+            if self.__window_length == window:
+                self._close_window()
+
+        n_windows = (len(rows) - k)//window
+        windows = rows[k:k + n_windows*window].reshape(
+            n_windows, window, rows.shape[1]
+        )
+        if self.__aggregation == 'last':
+            recorded = windows[:, -1]
+        elif self.__aggregation == 'mean':
+            recorded = windows.mean(axis=1)
+        elif self.__aggregation == 'min':
+            recorded = windows.min(axis=1)
+        else:
+            recorded = windows.max(axis=1)
+        window_time_steps = \
+            time_steps[k + window - 1:k + n_windows*window:window]
+        start = 0
+        while start < n_windows:
+            if self.__buffer_length == BUFFER_SIZE:
+                self._flush_time_variables()
+            stop = min(n_windows, start + BUFFER_SIZE - self.__buffer_length)
+            powertrain.time.extend_values(
+                values=window_time_steps[start:stop],
+                unit=time_unit
+            )
+            self.__buffer[
+                self.__buffer_length:self.__buffer_length + stop - start
+            ] = recorded[start:stop]
+            self.__buffer_length += stop - start
+            start = stop
+
+        for k in range(k + n_windows*window, len(rows)):
+            powertrain.update_time(
+                Time(value=float(time_steps[k]), unit=time_unit)
+            )
+            self._record_time_step(row=rows[k])
+
+    def _close_window(self):
+
+        if self.__window_length == 0:
+            return
+
+        if self.__window_length > 1:
+            if self.__aggregation == 'mean':
+                self.__buffer[self.__buffer_length] /= self.__window_length
+            self.__powertrain.time.aggregate(window=self.__window_length)
+        self.__buffer_length += 1
+        self.__window_length = 0
+
+    def _flush_time_variables(self):
+
+        if self.__buffer_length == 0:
+            return
+
+        elements = self.__powertrain.elements
+        buffer = self.__buffer[:self.__buffer_length]
+        for variable, i, column in self.__layout:
+            time_variables = elements[i].time_variables
+            if variable == 'pwm':
+                time_variables.setdefault('pwm', TimeSeries()).extend_values(
+                    values=buffer[:, column]
+                )
+            else:
+                time_variables[variable].extend_values(
+                    values=buffer[:, column],
+                    unit=SI_UNITS[variable]
+                )
+        self.__buffer_length = 0
+
+        if self.__sinks:
+            self.__stream_start = _stream_time_variables(
+                powertrain=self.__powertrain,
+                sinks=self.__sinks,
+                start=self.__stream_start,
+                retain_time_variables=self.__retain_time_variables
+            )
+
+    def _reserve_time_variables(self, n_steps: int):
+
+        time = self.__powertrain.time
+        time.reserve(len(time) + n_steps)
+        for element in self.__powertrain.elements:
+            for time_variable in element.time_variables.values():
+                time_variable.reserve(len(time_variable) + n_steps)
+
+    def _update_sensor_target(self, sensor: SensorBase):
+
+        indexes = [
+            i for i, element in enumerate(self.__powertrain.elements)
+            if element is sensor.target
+        ]
+        if not indexes:
+            return
+
+        i = indexes[0]
+        if isinstance(sensor, AbsoluteRotaryEncoder):
+            sensor.target.angular_position = AngularPosition(
+                value=float(self.__position[i]),
+                unit='rad'
+            )
+        elif isinstance(sensor, Tachometer):
+            sensor.target.angular_speed = AngularSpeed(
+                value=float(self.__speed[i]),
+                unit='rad/s'
+            )
+        elif isinstance(sensor, Amperometer):
+            sensor.target.electric_current = Current(
+                value=self.__electric_current,
+                unit='A'
+            )
+        else:
+            self._update_elements()
+
+    def _update_elements(self):
+
+        for i, element in enumerate(self.__powertrain.elements):
+            self._update_element(element=element, i=i)
+
+    def _update_element(self, element: RotatingObject, i: int):
+
+        element.angular_position = AngularPosition(
+            value=float(self.__position[i]),
+            unit='rad'
+        )
+        element.angular_speed = AngularSpeed(
+            value=float(self.__speed[i]),
+            unit='rad/s'
+        )
+        element.angular_acceleration = AngularAcceleration(
+            value=float(self.__acceleration[i]),
+            unit='rad/s^2'
+        )
+        element.torque = Torque(value=float(self.__torque[i]), unit='Nm')
+        element.driving_torque = Torque(
+            value=float(self.__driving_torque[i]),
+            unit='Nm'
+        )
+        element.load_torque = Torque(
+            value=float(self.__load_torque[i]),
+            unit='Nm'
+        )
+        if i in self.__force_elements:
+            element.tangential_force = Force(
+                value=float(self.__tangential_force[i]),
+                unit='N'
+            )
+        if i in self.__bending_stress_elements:
+            element.bending_stress = Stress(
+                value=float(self.__bending_stress[i]),
+                unit='Pa'
+            )
+        if i in self.__contact_stress_elements:
+            element.contact_stress = Stress(
+                value=float(self.__contact_stress[i]),
+                unit='Pa'
+            )
+        if isinstance(element, MotorBase) and \
+                self.__electric_current_is_computable:
+            element.electric_current = Current(
+                value=self.__electric_current,
+                unit='A'
+            )
+
+
+def _find_first(n: int, predicate: Callable[[int], bool]) -> int:
+
+    # first index within n for which a monotone predicate is true, or n if
+    # there is none
+    lower, upper = 0, n
+    while lower < upper:
+        middle = (lower + upper)//2
+        if predicate(middle):
+            upper = middle
+        else:
+            lower = middle + 1
+
+    return lower
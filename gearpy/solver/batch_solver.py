@@ -0,0 +1,1007 @@
+from gearpy.mechanical_objects import (
+    DCMotor,
+    GearBase,
+    MotorBase,
+    RotatingObject,
+    WormGear
+)
+from gearpy.powertrain import Powertrain
+from gearpy.units import (
+    AngularPosition,
+    AngularSpeed,
+    Current,
+    InertiaMoment,
+    Time,
+    TimeInterval,
+    TimeSeries,
+    Torque,
+    UnitArrayBase
+)
+from gearpy.units.unit_base import COMPARISON_TOLERANCE
+from .recording_policy import RecordingPolicy
+from .solver import ADAPTIVE_INTEGRATORS, INTEGRATORS
+import numpy as np
+
+
+BATCH_INTEGRATORS = tuple(
+    integrator for integrator in INTEGRATORS
+    if integrator not in ADAPTIVE_INTEGRATORS
+)
+# type and SI unit of each parameter which can be swept by the batch solver
+BATCH_PARAMETERS = {
+    'inertia_moment': (InertiaMoment, 'kgm^2'),
+    'master_gear_ratio': (float, None),
+    'master_gear_efficiency': (float, None),
+    'no_load_speed': (AngularSpeed, 'rad/s'),
+    'maximum_torque': (Torque, 'Nm'),
+    'no_load_electric_current': (Current, 'A'),
+    'maximum_electric_current': (Current, 'A')
+}
+BATCH_TIME_VARIABLES = (
+    'angular position',
+    'angular speed',
+    'angular acceleration',
+    'torque',
+    'driving torque',
+    'load torque'
+)
+
+
+class BatchSolver:
+    r""":py:class:`BatchSolver <gearpy.solver.batch_solver.BatchSolver>`
+    object. \n
+    It simulates many variants of a template powertrain at once, each one
+    obtained by replacing some parameters of the template elements, as in a
+    parameter sweep. \n
+    The state of all the variants is kept in 2-D NumPy arrays of SI floats,
+    with a row for each variant and a column for each powertrain element,
+    and all the variants are integrated in lock-step with the same time
+    steps, so the computations of each time step are performed once for the
+    whole batch.
+
+    Attributes
+    ----------
+    :py:attr:`n_variants` : :py:class:`int`
+        Number of simulated powertrain variants.
+    :py:attr:`time` : :py:class:`TimeSeries <gearpy.units.time_series.TimeSeries>`
+        Simulated time steps.
+    :py:attr:`time_variables` : :py:class:`dict`
+        Simulated time variables of each powertrain element and variant.
+
+    Methods
+    -------
+    :py:meth:`run`
+        It runs the simulation of the powertrain variants.
+
+    .. admonition:: Raises
+       :class: warning
+
+       ``TypeError``
+           - If ``powertrain`` is not an instance of
+             :py:class:`Powertrain <gearpy.powertrain.Powertrain>`,
+           - if the first element in ``powertrain`` is not an instance of
+             :py:class:`DCMotor <gearpy.mechanical_objects.dc_motor.DCMotor>`,
+           - if an element of ``powertrain`` is not an instance of
+             :py:class:`RotatingObject <gearpy.mechanical_objects.mechanical_object_base.RotatingObject>`.
+       ``ValueError``
+           If
+           :py:attr:`Powertrain.elements <gearpy.powertrain.Powertrain.elements>`
+           is an empty :py:class:`tuple`.
+
+    .. admonition:: Notes
+       :class: tip
+
+       The template powertrain is not modified by the simulation: its
+       elements only provide the parameters which are not swept, the
+       ``external_torque`` functions and the initial state of the variants.
+       The motor PWM is the one of the template motor and it is held
+       constant during the simulation, since motor control rules are not
+       supported. \n
+       The ``external_torque`` functions are called once per variant and
+       loaded element at each time step, so they are the main cost of a
+       batch simulation.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:class:`Solver <gearpy.solver.Solver>`
+    """
+
+    def __init__(self, powertrain: Powertrain):
+        if not isinstance(powertrain, Powertrain):
+            raise TypeError(
+                f"Parameter 'powertrain' must be an instance of "
+                f"{Powertrain.__name__!r}."
+            )
+
+        if not powertrain.elements:
+            raise ValueError(
+                "Parameter 'powertrain.elements' cannot be an empty tuple."
+            )
+
+        motor = powertrain.elements[0]
+        if not isinstance(motor, DCMotor) or \
+                type(motor).compute_torque is not DCMotor.compute_torque or \
+                type(motor).compute_electric_current is not \
+                DCMotor.compute_electric_current:
+            raise TypeError(
+                f"First element in 'powertrain' must be an instance of "
+                f"{DCMotor.__name__!r}."
+            )
+
+        if not all(
+            [isinstance(element, RotatingObject)
+                for element in powertrain.elements]
+        ):
+            raise TypeError(
+                f"All elements of 'powertrain' must be instances of "
+                f"{RotatingObject.__name__!r}."
+            )
+
+        self.__powertrain = powertrain
+        self.__n_variants = None
+        self.__time = TimeSeries(unit_class=Time)
+        self.__time_variables = {}
+
+    @property
+    def n_variants(self) -> int | None:
+        """Number of simulated powertrain variants. It is :py:obj:`None`
+        until :py:meth:`run` is called.
+
+        Returns
+        -------
+        :py:class:`int` or :py:obj:`None`
+            Number of simulated powertrain variants.
+        """
+        return self.__n_variants
+
+    @property
+    def time(self) -> TimeSeries:
+        """Simulated time steps, shared by all the variants, in the unit of
+        the ``time_discretization`` of the last :py:meth:`run`.
+
+        Returns
+        -------
+        :py:class:`TimeSeries <gearpy.units.time_series.TimeSeries>`
+            Simulated time steps.
+        """
+        return self.__time
+
+    @property
+    def time_variables(self) -> dict[str, dict[str, np.ndarray]]:
+        """Simulated time variables of each powertrain element and variant.
+        Keys are the names of the powertrain elements and values are
+        dictionaries which map each time variable to a 2-D
+        :py:class:`numpy.ndarray` with a row for each variant and a column
+        for each time step in :py:attr:`time`. \n
+        Time variables are ``'angular position'``, ``'angular speed'``,
+        ``'angular acceleration'``, ``'torque'``, ``'driving torque'`` and
+        ``'load torque'`` for each element, and ``'electric current'`` for
+        the motor, if computable. Values are in SI units: ``'rad'``,
+        ``'rad/s'``, ``'rad/s^2'``, ``'Nm'`` and ``'A'``.
+
+        Returns
+        -------
+        :py:class:`dict`
+            Simulated time variables of each powertrain element and variant.
+        """
+        return self.__time_variables
+
+    def run(
+        self,
+        time_discretization: TimeInterval,
+        simulation_time: TimeInterval,
+        parameters: dict[RotatingObject, dict[str, list | np.ndarray]],
+        integrator: str = 'semi-implicit euler',
+        recording_policy: RecordingPolicy | None = None
+    ) -> None:
+        """It runs the simulation of the powertrain variants. \n
+        Each variant is the template powertrain in which the parameters of
+        some elements are replaced by the values in ``parameters``: the
+        ``k``-th variant takes the ``k``-th value of each parameter. The
+        simulation follows the same steps of
+        :py:meth:`Solver.run <gearpy.solver.Solver.run>` with
+        ``engine='array'``, performed on the whole batch at once, and the
+        results are stored in :py:attr:`time` and :py:attr:`time_variables`,
+        replacing the ones of a previous run.
+
+        Parameters
+        ----------
+        ``time_discretization`` : :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`
+            Time discretization to be used for the simulation.
+        ``simulation_time`` : :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`
+            Duration of the simulation.
+        ``parameters`` : :py:class:`dict`
+            Swept parameters. Keys are the powertrain elements and values are
+            dictionaries which map each parameter name to a :py:class:`list`
+            or a :py:class:`numpy.ndarray` of values, one for each variant,
+            or to a unit array, like
+            :py:class:`TorqueArray <gearpy.units.unit_arrays.TorqueArray>`,
+            for parameters with a unit. Available parameters are:
+
+            - ``'inertia_moment'``, for each element, with values instances
+              of :py:class:`InertiaMoment <gearpy.units.units.InertiaMoment>`,
+            - ``'master_gear_ratio'``, for gears, with positive
+              :py:class:`float` or :py:class:`int` values,
+            - ``'master_gear_efficiency'``, for gears, with
+              :py:class:`float` or :py:class:`int` values within ``0`` and
+              ``1``,
+            - ``'no_load_speed'``, for the motor, with values instances of
+              :py:class:`AngularSpeed <gearpy.units.units.AngularSpeed>`,
+            - ``'maximum_torque'``, for the motor, with values instances of
+              :py:class:`Torque <gearpy.units.units.Torque>`,
+            - ``'no_load_electric_current'`` and
+              ``'maximum_electric_current'``, for the motor, if its electric
+              current is computable, with values instances of
+              :py:class:`Current <gearpy.units.units.Current>`.
+
+        ``integrator`` : :py:class:`str`, optional
+            Time integration scheme. Available integrators are
+            ``'semi-implicit euler'`` (default), ``'explicit euler'``,
+            ``'heun'`` and ``'rk4'``.
+        ``recording_policy`` : :py:class:`RecordingPolicy <gearpy.solver.recording_policy.RecordingPolicy>`, optional
+            Policy defining which time steps are recorded. Default is
+            :py:obj:`None`, so each time step is recorded.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               - If ``time_discretization`` is not an instance of
+                 :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`,
+               - if ``simulation_time`` is not an instance of
+                 :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`,
+               - if ``parameters`` is not a :py:class:`dict`,
+               - if a key of ``parameters`` is not an instance of
+                 :py:class:`RotatingObject <gearpy.mechanical_objects.mechanical_object_base.RotatingObject>`,
+               - if a value of ``parameters`` is not a :py:class:`dict`,
+               - if a parameter name is not a :py:class:`str`,
+               - if parameter values are not a :py:class:`list`, a
+                 :py:class:`numpy.ndarray` or an instance of
+                 :py:class:`UnitArrayBase <gearpy.units.unit_array_base.UnitArrayBase>`,
+               - if a parameter value is not of the type of the parameter,
+               - if ``integrator`` is not a :py:class:`str`,
+               - if ``recording_policy`` is not an instance of
+                 :py:class:`RecordingPolicy <gearpy.solver.recording_policy.RecordingPolicy>`,
+               - if function ``external_torque`` of one gear in the
+                 powertrain elements does not return an instance of
+                 :py:class:`Torque <gearpy.units.units.Torque>`.
+           ``ValueError``
+               - If ``time_discretization`` is greater or equal to
+                 ``simulation_time``,
+               - if no gear in the powertrain elements has an
+                 ``external_torque`` function,
+               - if ``parameters`` is empty,
+               - if a key of ``parameters`` is not in the powertrain
+                 elements,
+               - if a parameter is not available for its element,
+               - if parameter values are empty or they do not have the same
+                 length for all the parameters,
+               - if a ``'master_gear_ratio'`` value is not positive,
+               - if a ``'master_gear_efficiency'`` value is not within
+                 ``0`` and ``1``,
+               - if ``integrator`` is not among available ones.
+
+        .. admonition:: Notes
+           :class: tip
+
+           The gear ratio of a mating depends on the number of teeth of the
+           gears only through ``'master_gear_ratio'``, so a sweep over the
+           number of teeth of a gear is performed by sweeping the
+           ``'master_gear_ratio'`` of the gear and the one of the following
+           mated gear accordingly. \n
+           Each variant can be locked by a self-locking worm gear
+           independently of the other ones.
+        """
+        if not isinstance(time_discretization, TimeInterval):
+            raise TypeError(
+                f"Parameter 'time_discretization' must be an instance of "
+                f"{TimeInterval.__name__!r}."
+            )
+
+        if not isinstance(simulation_time, TimeInterval):
+            raise TypeError(
+                f"Parameter 'simulation_time' must be an instance of "
+                f"{TimeInterval.__name__!r}."
+            )
+
+        if time_discretization >= simulation_time:
+            raise ValueError(
+                "Parameter 'time_discretization' cannot be greater or equal "
+                "to 'simulation_time'."
+            )
+
+        if not any(
+            [element.external_torque is not None
+                for element in self.__powertrain.elements
+                if isinstance(element, GearBase)]
+        ):
+            raise ValueError(
+                "The function 'external_torque' has not been defined for any "
+                "gear of the powertrain. Add this function to a powertrain "
+                "gear."
+            )
+
+        n_variants = self._validate_parameters(parameters=parameters)
+
+        if not isinstance(integrator, str):
+            raise TypeError("Parameter 'integrator' must be a string.")
+
+        if integrator not in BATCH_INTEGRATORS:
+            raise ValueError(
+                f"Integrator {integrator!r} not available. Available "
+                f"integrators are: {list(BATCH_INTEGRATORS)}."
+            )
+
+        if not isinstance(recording_policy, RecordingPolicy) and \
+                recording_policy is not None:
+            raise TypeError(
+                f"Parameter 'recording_policy' must be an instance of "
+                f"{RecordingPolicy.__name__!r}."
+            )
+
+        if recording_policy is None:
+            recording_policy = RecordingPolicy()
+
+        self.__n_variants = n_variants
+        self.__integrator = integrator
+        self._compile(parameters=parameters)
+        self._load_state()
+
+        time_unit = time_discretization.unit
+        if self.__powertrain.time:
+            initial_time = self.__powertrain.time[-1].to(time_unit).value
+        else:
+            initial_time = 0.0
+        time_steps = np.arange(
+            initial_time + time_discretization.value,
+            initial_time + simulation_time.to(time_unit).value +
+            time_discretization.value,
+            time_discretization.value
+        )
+        window = recording_policy.get_window(
+            time_discretization=time_discretization
+        )
+        self.__aggregation = recording_policy.aggregation
+        self.__window_length = 0
+        n_records = -(-len(time_steps)//window) + 1
+        self.__records = np.empty(
+            (n_records, n_variants, self.__n_columns)
+        )
+        self.__record_times = np.empty(n_records)
+        self.__n_records = 0
+
+        self._compute_powertrain_variables(
+            time=Time(value=initial_time, unit=time_unit)
+        )
+        self._update_time_variables(time=initial_time)
+        self._close_window()
+
+        time_step = time_discretization.to('sec').value
+        for k in time_steps:
+            time = Time(value=float(k), unit=time_unit)
+            self._time_integration(
+                time_step=time_step,
+                time=time,
+                time_discretization=time_discretization
+            )
+            self._compute_powertrain_variables(time=time)
+            self._update_time_variables(time=float(k))
+            if self.__window_length == window:
+                self._close_window()
+        self._close_window()
+
+        self._export_time_variables(time_unit=time_unit)
+
+    def _validate_parameters(
+        self,
+        parameters: dict[RotatingObject, dict[str, list | np.ndarray]]
+    ) -> int:
+
+        if not isinstance(parameters, dict):
+            raise TypeError("Parameter 'parameters' must be a dictionary.")
+
+        if not parameters:
+            raise ValueError("Parameter 'parameters' cannot be empty.")
+
+        elements = self.__powertrain.elements
+        n_variants = None
+        for element, element_parameters in parameters.items():
+            if not isinstance(element, RotatingObject):
+                raise TypeError(
+                    f"Each key of 'parameters' must be an instance of "
+                    f"{RotatingObject.__name__!r}."
+                )
+
+            if not any(element is item for item in elements):
+                raise ValueError(
+                    f"Element {element.name!r} is not in the powertrain "
+                    f"elements."
+                )
+
+            if not isinstance(element_parameters, dict):
+                raise TypeError(
+                    "Each value of 'parameters' must be a dictionary."
+                )
+
+            available_parameters = \
+                self._get_available_parameters(element=element)
+            for name, values in element_parameters.items():
+                if not isinstance(name, str):
+                    raise TypeError("Each parameter name must be a string.")
+
+                if name not in available_parameters:
+                    raise ValueError(
+                        f"Parameter {name!r} not available for element "
+                        f"{element.name!r}. Available parameters are: "
+                        f"{available_parameters}."
+                    )
+
+                if not isinstance(values, list | np.ndarray | UnitArrayBase):
+                    raise TypeError(
+                        f"Values of parameter {name!r} must be a list, a "
+                        f"numpy array or a unit array."
+                    )
+
+                if len(values) == 0:
+                    raise ValueError(
+                        f"Values of parameter {name!r} cannot be empty."
+                    )
+
+                if n_variants is None:
+                    n_variants = len(values)
+                elif len(values) != n_variants:
+                    raise ValueError(
+                        "Values of all the parameters must have the same "
+                        "length."
+                    )
+
+                parameter_type, _ = BATCH_PARAMETERS[name]
+                if isinstance(values, UnitArrayBase):
+                    if not issubclass(values.unit_class, parameter_type):
+                        raise TypeError(
+                            f"Values of parameter {name!r} must be instances "
+                            f"of {parameter_type.__name__!r}."
+                        )
+                else:
+                    for value in values:
+                        if parameter_type is float:
+                            if not isinstance(
+                                value,
+                                float | int | np.number
+                            ) or isinstance(value, bool | np.bool_):
+                                raise TypeError(
+                                    f"Values of parameter {name!r} must be "
+                                    f"floats or integers."
+                                )
+                        elif not isinstance(value, parameter_type):
+                            raise TypeError(
+                                f"Values of parameter {name!r} must be "
+                                f"instances of {parameter_type.__name__!r}."
+                            )
+
+                if name == 'master_gear_ratio':
+                    if np.any(np.asarray(values, dtype=float) <= 0):
+                        raise ValueError(
+                            "Values of parameter 'master_gear_ratio' must be "
+                            "positive."
+                        )
+                elif name == 'master_gear_efficiency':
+                    efficiencies = np.asarray(values, dtype=float)
+                    if np.any((efficiencies < 0) | (efficiencies > 1)):
+                        raise ValueError(
+                            "Values of parameter 'master_gear_efficiency' "
+                            "must be within 0 and 1."
+                        )
+
+        if n_variants is None:
+            raise ValueError("Parameter 'parameters' cannot be empty.")
+
+        return n_variants
+
+    def _get_available_parameters(self, element: RotatingObject) -> list[str]:
+
+        if isinstance(element, MotorBase):
+            available_parameters = [
+                'inertia_moment',
+                'no_load_speed',
+                'maximum_torque'
+            ]
+            if element.electric_current_is_computable:
+                available_parameters.extend(
+                    ['no_load_electric_current', 'maximum_electric_current']
+                )
+            return available_parameters
+
+        if isinstance(element, GearBase | WormGear):
+            return [
+                'inertia_moment',
+                'master_gear_ratio',
+                'master_gear_efficiency'
+            ]
+
+        return ['inertia_moment']
+
+    def _get_parameter_values(
+        self,
+        parameters: dict[RotatingObject, dict[str, list | np.ndarray]],
+        element: RotatingObject,
+        name: str,
+        default
+    ) -> np.ndarray:
+
+        values = default
+        for key, element_parameters in parameters.items():
+            if key is element and name in element_parameters:
+                values = element_parameters[name]
+
+        _, unit = BATCH_PARAMETERS[name]
+        if isinstance(values, UnitArrayBase):
+            return values.to(unit).values
+        if isinstance(values, list | np.ndarray):
+            if unit is None:
+                return np.asarray(values, dtype=float)
+            return np.array([value.to(unit).value for value in values])
+
+        value = values if unit is None else values.to(unit).value
+        return np.full(self.__n_variants, float(value))
+
+    def _compile(
+        self,
+        parameters: dict[RotatingObject, dict[str, list | np.ndarray]]
+    ):
+
+        elements = self.__powertrain.elements
+        n_elements = len(elements)
+        n_variants = self.__n_variants
+        self.__n_elements = n_elements
+
+        gear_ratio = np.ones((n_variants, n_elements))
+        efficiency = np.ones((n_variants, n_elements))
+        inertia_moment = np.empty((n_variants, n_elements))
+        for i, element in enumerate(elements):
+            inertia_moment[:, i] = self._get_parameter_values(
+                parameters=parameters,
+                element=element,
+                name='inertia_moment',
+                default=element.inertia_moment
+            )
+            if i == 0:
+                continue
+            gear_ratio[:, i] = self._get_parameter_values(
+                parameters=parameters,
+                element=element,
+                name='master_gear_ratio',
+                default=element.master_gear_ratio
+            )
+            efficiency[:, i] = self._get_parameter_values(
+                parameters=parameters,
+                element=element,
+                name='master_gear_efficiency',
+                default=element.master_gear_efficiency
+            )
+
+        # kinematic gain of each element with respect to the last one
+        self.__kinematic_gain = np.hstack((
+            np.cumprod(gear_ratio[:, :0:-1], axis=1)[:, ::-1],
+            np.ones((n_variants, 1))
+        ))
+        # driving torque gain of each element with respect to the motor
+        self.__driving_torque_gain = np.cumprod(efficiency*gear_ratio, axis=1)
+
+        self.__loaded_elements = [
+            i for i in range(1, n_elements)
+            if getattr(elements[i], 'external_torque', None) is not None
+        ]
+        # each element load torque comes from the closest loaded element
+        # downstream, or from the last element if there is none
+        load_source = np.full(n_elements, n_elements - 1)
+        source = n_elements - 1
+        for i in range(n_elements - 1, -1, -1):
+            if i in self.__loaded_elements:
+                source = i
+            load_source[i] = source
+        self.__load_source = load_source
+        self.__load_torque_gain = self.__driving_torque_gain / \
+            self.__driving_torque_gain[:, load_source]
+
+        equivalent_inertia_moment = inertia_moment[:, 0].copy()
+        for i in range(1, n_elements):
+            equivalent_inertia_moment *= gear_ratio[:, i]
+            equivalent_inertia_moment += inertia_moment[:, i]
+        self.__inertia_moment = equivalent_inertia_moment
+
+        motor = elements[0]
+        self.__electric_current_is_computable = \
+            motor.electric_current_is_computable
+        self.__no_load_speed = self._get_parameter_values(
+            parameters=parameters,
+            element=motor,
+            name='no_load_speed',
+            default=motor.no_load_speed
+        )
+        self.__maximum_torque = self._get_parameter_values(
+            parameters=parameters,
+            element=motor,
+            name='maximum_torque',
+            default=motor.maximum_torque
+        )
+        if self.__electric_current_is_computable:
+            self.__no_load_electric_current = self._get_parameter_values(
+                parameters=parameters,
+                element=motor,
+                name='no_load_electric_current',
+                default=motor.no_load_electric_current
+            )
+            self.__maximum_electric_current = self._get_parameter_values(
+                parameters=parameters,
+                element=motor,
+                name='maximum_electric_current',
+                default=motor.maximum_electric_current
+            )
+
+        self.__n_columns = len(BATCH_TIME_VARIABLES)*n_elements + \
+            int(self.__electric_current_is_computable)
+
+    def _load_state(self):
+
+        elements = self.__powertrain.elements
+        n_variants = self.__n_variants
+        n_elements = self.__n_elements
+        last = elements[-1]
+        motor = elements[0]
+
+        self.__acceleration = np.zeros((n_variants, n_elements))
+        self.__load_torque = np.zeros((n_variants, n_elements))
+        for array, variable, unit in (
+            (self.__acceleration, 'angular_acceleration', 'rad/s^2'),
+            (self.__load_torque, 'load_torque', 'Nm')
+        ):
+            for i, element in enumerate(elements):
+                value = getattr(element, variable)
+                if value is not None:
+                    array[:, i] = value.to(unit).value
+        self.__electric_current = np.zeros(n_variants)
+
+        self.__last_angular_position = np.full(
+            n_variants,
+            last.angular_position.to('rad').value
+            if last.angular_position is not None else 0.0
+        )
+        self.__last_angular_speed = np.full(
+            n_variants,
+            last.angular_speed.to('rad/s').value
+            if last.angular_speed is not None else 0.0
+        )
+        self.__motor_torque = np.full(
+            n_variants,
+            motor.torque.to('Nm').value if motor.torque is not None
+            else np.nan
+        )
+        self.__pwm = motor.pwm
+        self.__powertrain_is_locked = np.zeros(n_variants, dtype=bool)
+
+        # tolerances used by unit objects comparisons, converted to SI
+        speed_unit = last.angular_speed.unit \
+            if last.angular_speed is not None else 'rad/s'
+        self.__angular_speed_tolerance = np.full(
+            n_variants,
+            0 if speed_unit == 'rad/s' else
+            COMPARISON_TOLERANCE*AngularSpeed(1, speed_unit).to('rad/s').value
+        )
+        torque_unit = motor.torque.unit if motor.torque is not None else \
+            motor.maximum_torque.unit
+        self.__torque_tolerance = 0 if torque_unit == 'Nm' else \
+            COMPARISON_TOLERANCE*Torque(1, torque_unit).to('Nm').value
+
+    def _compute_powertrain_variables(self, time: Time):
+
+        self._compute_angular_position_and_speed()
+        self._check_powertrain_is_locked()
+        self._compute_locked_powertrain_angular_speed_and_acceleration()
+        self._compute_load_torque(time=time)
+        self._compute_driving_torque()
+        self._compute_torque()
+        self._compute_angular_acceleration()
+        self._compute_electric_current()
+
+    def _compute_angular_position_and_speed(self):
+
+        self.__position = \
+            self.__kinematic_gain*self.__last_angular_position[:, np.newaxis]
+        self.__speed = \
+            self.__kinematic_gain*self.__last_angular_speed[:, np.newaxis]
+
+    def _check_powertrain_is_locked(self):
+
+        motor_angular_speed = self.__speed[:, 0]
+        angular_speed_tolerance = self.__angular_speed_tolerance
+        pwm = self.__pwm
+        if self.__powertrain.self_locking:
+            is_locking = np.full(self.__n_variants, pwm == 0)
+            if pwm > 0:
+                is_locking |= motor_angular_speed < -angular_speed_tolerance
+            elif pwm < 0:
+                is_locking |= motor_angular_speed > angular_speed_tolerance
+        else:
+            is_locking = np.zeros(self.__n_variants, dtype=bool)
+
+        torque_tolerance = self.__torque_tolerance
+        if pwm > 0:
+            is_unlocking = self.__motor_torque > torque_tolerance
+        elif pwm < 0:
+            is_unlocking = self.__motor_torque < -torque_tolerance
+        else:
+            is_unlocking = np.zeros(self.__n_variants, dtype=bool)
+
+        self.__powertrain_is_locked = is_locking | \
+            (self.__powertrain_is_locked & ~is_unlocking)
+
+    def _compute_locked_powertrain_angular_speed_and_acceleration(self):
+
+        locked = self.__powertrain_is_locked
+        if not locked.any():
+            return
+
+        self.__speed[locked] = 0.0
+        self.__acceleration[locked] = 0.0
+        self.__last_angular_speed[locked] = 0.0
+        self.__angular_speed_tolerance[locked] = 0
+
+    def _compute_load_torque(self, time: Time):
+
+        elements = self.__powertrain.elements
+        load_torque = self.__load_torque.copy()
+        for i in self.__loaded_elements:
+            external_torque = elements[i].external_torque
+            for k in range(self.__n_variants):
+                torque = external_torque(
+                    time=time,
+                    angular_position=AngularPosition(
+                        value=float(self.__position[k, i]),
+                        unit='rad'
+                    ),
+                    angular_speed=AngularSpeed(
+                        value=float(self.__speed[k, i]),
+                        unit='rad/s'
+                    )
+                )
+                if not isinstance(torque, Torque):
+                    raise TypeError(
+                        f"Function 'external_torque' of {elements[i].name!r} "
+                        f"must return an instance of {Torque.__name__!r}."
+                    )
+                load_torque[k, i] = torque.to('Nm').value
+
+        self.__load_torque = \
+            load_torque[:, self.__load_source]*self.__load_torque_gain
+
+    def _compute_driving_torque(self):
+
+        motor_torque = self._compute_dc_motor_torque()
+        self.__driving_torque = \
+            self.__driving_torque_gain*motor_torque[:, np.newaxis]
+
+    def _compute_dc_motor_torque(self) -> np.ndarray:
+
+        angular_speed = self.__speed[:, 0]
+        if not self.__electric_current_is_computable:
+            return (1 - angular_speed/self.__no_load_speed) * \
+                self.__maximum_torque
+
+        pwm = self.__pwm
+        no_load_electric_current = self.__no_load_electric_current
+        maximum_electric_current = self.__maximum_electric_current
+        pwm_min = no_load_electric_current/maximum_electric_current
+        sign = 1 if pwm > 0 else -1
+        maximum_torque = self.__maximum_torque*(
+            (pwm*maximum_electric_current - sign*no_load_electric_current) /
+            (maximum_electric_current - no_load_electric_current)
+        )
+        with np.errstate(divide='ignore', invalid='ignore'):
+            torque = (1 - angular_speed/(pwm*self.__no_load_speed)) * \
+                maximum_torque
+
+        return np.where(abs(pwm) <= pwm_min, 0.0, torque)
+
+    def _compute_torque(self):
+
+        self.__torque = self.__driving_torque - self.__load_torque
+        self.__motor_torque = self.__torque[:, 0].copy()
+
+    def _compute_angular_acceleration(self):
+
+        acceleration = self.__kinematic_gain * \
+            (self.__torque[:, -1]/self.__inertia_moment)[:, np.newaxis]
+        locked = self.__powertrain_is_locked
+        self.__acceleration = np.where(
+            locked[:, np.newaxis],
+            self.__acceleration,
+            acceleration
+        )
+
+    def _compute_electric_current(self):
+
+        if not self.__electric_current_is_computable:
+            return
+
+        pwm = self.__pwm
+        no_load_electric_current = self.__no_load_electric_current
+        maximum_electric_current = pwm*self.__maximum_electric_current
+        pwm_min = no_load_electric_current/self.__maximum_electric_current
+        sign = 1 if pwm > 0 else -1
+        maximum_torque = self.__maximum_torque*(
+            (maximum_electric_current - sign*no_load_electric_current) /
+            (self.__maximum_electric_current - no_load_electric_current)
+        )
+        with np.errstate(divide='ignore', invalid='ignore'):
+            electric_current = \
+                (maximum_electric_current - sign*no_load_electric_current) * \
+                (self.__driving_torque[:, 0]/maximum_torque) + \
+                sign*no_load_electric_current
+            idle_electric_current = np.where(
+                pwm_min == 0,
+                0.0,
+                pwm/pwm_min*no_load_electric_current
+            )
+
+        self.__electric_current = np.where(
+            abs(pwm) <= pwm_min,
+            idle_electric_current,
+            electric_current
+        )
+
+    def _time_integration(
+        self,
+        time_step: float,
+        time: Time,
+        time_discretization: TimeInterval
+    ):
+
+        integrator = self.__integrator
+        if integrator == 'semi-implicit euler':
+            self.__last_angular_speed = self.__last_angular_speed + \
+                self.__acceleration[:, -1]*time_step
+            self.__last_angular_position = self.__last_angular_position + \
+                self.__last_angular_speed*time_step
+            return
+
+        angular_position = self.__last_angular_position
+        angular_speed = self.__last_angular_speed
+        angular_acceleration = self.__acceleration[:, -1]
+
+        if integrator == 'explicit euler':
+            self.__last_angular_position = \
+                angular_position + angular_speed*time_step
+            self.__last_angular_speed = \
+                angular_speed + angular_acceleration*time_step
+            return
+
+        # intermediate evaluations overwrite the motor torque, which is needed
+        # to check the powertrain locking condition at the next time step
+        motor_torque = self.__motor_torque
+        if integrator == 'heun':
+            angular_position_1 = angular_position + angular_speed*time_step
+            angular_speed_1 = angular_speed + angular_acceleration*time_step
+            angular_acceleration_1 = self._compute_stage_angular_acceleration(
+                time=time,
+                angular_position=angular_position_1,
+                angular_speed=angular_speed_1
+            )
+            self.__last_angular_position = angular_position + \
+                (angular_speed + angular_speed_1)*time_step/2
+            self.__last_angular_speed = angular_speed + \
+                (angular_acceleration + angular_acceleration_1)*time_step/2
+        else:
+            half_time = time - time_discretization/2
+            angular_position_2 = angular_position + angular_speed*time_step/2
+            angular_speed_2 = angular_speed + angular_acceleration*time_step/2
+            angular_acceleration_2 = self._compute_stage_angular_acceleration(
+                time=half_time,
+                angular_position=angular_position_2,
+                angular_speed=angular_speed_2
+            )
+            angular_position_3 = angular_position + angular_speed_2*time_step/2
+            angular_speed_3 = angular_speed + angular_acceleration_2*time_step/2
+            angular_acceleration_3 = self._compute_stage_angular_acceleration(
+                time=half_time,
+                angular_position=angular_position_3,
+                angular_speed=angular_speed_3
+            )
+            angular_position_4 = angular_position + angular_speed_3*time_step
+            angular_speed_4 = angular_speed + angular_acceleration_3*time_step
+            angular_acceleration_4 = self._compute_stage_angular_acceleration(
+                time=time,
+                angular_position=angular_position_4,
+                angular_speed=angular_speed_4
+            )
+            self.__last_angular_position = angular_position + (
+                angular_speed + 2*angular_speed_2 + 2*angular_speed_3 +
+                angular_speed_4
+            )*time_step/6
+            self.__last_angular_speed = angular_speed + (
+                angular_acceleration + 2*angular_acceleration_2 +
+                2*angular_acceleration_3 + angular_acceleration_4
+            )*time_step/6
+
+        self.__motor_torque = motor_torque
+
+    def _compute_stage_angular_acceleration(
+        self,
+        time: Time,
+        angular_position: np.ndarray,
+        angular_speed: np.ndarray
+    ) -> np.ndarray:
+
+        self.__last_angular_position = angular_position
+        self.__last_angular_speed = angular_speed
+        self._compute_angular_position_and_speed()
+        self._compute_load_torque(time=time)
+        self._compute_driving_torque()
+        self._compute_torque()
+
+        return np.where(
+            self.__powertrain_is_locked,
+            0.0,
+            self.__torque[:, -1]/self.__inertia_moment
+        )
+
+    def _update_time_variables(self, time: float):
+
+        n = self.__n_elements
+        row = np.empty((self.__n_variants, self.__n_columns))
+        for j, array in enumerate((
+            self.__position,
+            self.__speed,
+            self.__acceleration,
+            self.__torque,
+            self.__driving_torque,
+            self.__load_torque
+        )):
+            row[:, j*n:(j + 1)*n] = array
+        if self.__electric_current_is_computable:
+            row[:, -1] = self.__electric_current
+
+        # the time steps of the current recording window are aggregated in a
+        # single record, which is committed when the window is closed
+        recorded = self.__records[self.__n_records]
+        if self.__window_length == 0 or self.__aggregation == 'last':
+            recorded[:] = row
+        elif self.__aggregation == 'mean':
+            recorded += row
+        elif self.__aggregation == 'min':
+            np.minimum(recorded, row, out=recorded)
+        else:
+            np.maximum(recorded, row, out=recorded)
+        self.__record_times[self.__n_records] = time
+        self.__window_length += 1
+
+    def _close_window(self):
+
+        if self.__window_length == 0:
+            return
+
+        if self.__window_length > 1 and self.__aggregation == 'mean':
+            self.__records[self.__n_records] /= self.__window_length
+        self.__n_records += 1
+        self.__window_length = 0
+
+    def _export_time_variables(self, time_unit: str):
+
+        n = self.__n_elements
+        records = self.__records[:self.__n_records]
+        self.__time = TimeSeries(unit_class=Time)
+        self.__time.extend_values(
+            values=self.__record_times[:self.__n_records],
+            unit=time_unit
+        )
+        self.__time_variables = {}
+        for i, element in enumerate(self.__powertrain.elements):
+            self.__time_variables[element.name] = {
+                variable: records[:, :, j*n + i].T
+                for j, variable in enumerate(BATCH_TIME_VARIABLES)
+            }
+        if self.__electric_current_is_computable:
+            self.__time_variables[self.__powertrain.elements[0].name][
+                'electric current'
+            ] = records[:, :, -1].T
@@ -0,0 +1,128 @@
+from __future__ import annotations
+from .sink_base import SinkBase
+from typing import Callable, TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class CallbackSink(SinkBase):
+    """:py:class:`CallbackSink <gearpy.solver.callback_sink.CallbackSink>`
+    object. \n
+    It passes the time variables of the powertrain elements to a user
+    defined ``callback`` function as the simulation advances. \n
+    The ``callback`` is called once for each batch of time steps, with a
+    ``data`` :py:class:`dict` as the only parameter: its keys are the
+    elements names and its values are :py:class:`pandas.DataFrame` of the
+    time variables, with the same columns of the files exported by
+    :py:meth:`Powertrain.export_time_variables <gearpy.powertrain.Powertrain.export_time_variables>`.
+
+    Attributes
+    ----------
+    :py:attr:`callback` : :py:class:`Callable`
+        Function to be called with each batch of time steps.
+    :py:attr:`units` : :py:class:`dict`
+        Symbols of the units of measurement of each time variable.
+
+    Methods
+    -------
+    :py:meth:`open`
+        It prepares the sink to receive the time variables of a powertrain.
+    :py:meth:`write`
+        It passes a batch of time steps to :py:attr:`callback`.
+    :py:meth:`close`
+        It releases the resources held by the sink.
+
+    .. admonition:: Raises
+       :class: warning
+
+       ``TypeError``
+           - If ``callback`` is not callable,
+           - if ``time_unit`` is not a :py:class:`str`,
+           - if ``angular_position_unit`` is not a :py:class:`str`,
+           - if ``angular_speed_unit`` is not a :py:class:`str`,
+           - if ``angular_acceleration_unit`` is not a :py:class:`str`,
+           - if ``torque_unit`` is not a :py:class:`str`,
+           - if ``driving_torque_unit`` is not a :py:class:`str`,
+           - if ``load_torque_unit`` is not a :py:class:`str`,
+           - if ``force_unit`` is not a :py:class:`str`,
+           - if ``stress_unit`` is not a :py:class:`str`,
+           - if ``current_unit`` is not a :py:class:`str`.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:meth:`Solver.run <gearpy.solver.Solver.run>`
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[dict[str, pd.DataFrame]], None],
+        time_unit: str = 'sec',
+        angular_position_unit: str = 'rad',
+        angular_speed_unit: str = 'rad/s',
+        angular_acceleration_unit: str = 'rad/s^2',
+        torque_unit: str = 'Nm',
+        driving_torque_unit: str = 'Nm',
+        load_torque_unit: str = 'Nm',
+        force_unit: str = 'N',
+        stress_unit: str = 'MPa',
+        current_unit: str = 'A'
+    ):
+        super().__init__(
+            time_unit=time_unit,
+            angular_position_unit=angular_position_unit,
+            angular_speed_unit=angular_speed_unit,
+            angular_acceleration_unit=angular_acceleration_unit,
+            torque_unit=torque_unit,
+            driving_torque_unit=driving_torque_unit,
+            load_torque_unit=load_torque_unit,
+            force_unit=force_unit,
+            stress_unit=stress_unit,
+            current_unit=current_unit
+        )
+
+        if not callable(callback):
+            raise TypeError("Parameter 'callback' must be callable.")
+
+        self.__callback = callback
+
+    @property
+    def callback(self) -> Callable[[dict[str, pd.DataFrame]], None]:
+        """Function to be called with each batch of time steps. It must be
+        callable and it must accept a ``data`` parameter.
+
+        Returns
+        -------
+        :py:class:`Callable`
+            Function to be called with each batch of time steps.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If :py:attr:`callback` is not callable.
+        """
+        return self.__callback
+
+    def write(self, data: dict[str, pd.DataFrame]) -> None:
+        """It passes a batch of time steps to :py:attr:`callback`.
+
+        Parameters
+        ----------
+        ``data`` : :py:class:`dict`
+            Time variables of each powertrain element. The keys of the
+            dictionary are the elements names and the values are
+            :py:class:`pandas.DataFrame` of the time variables, with a column
+            for each time variable and a row for each time step.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If ``data`` is not a :py:class:`dict`.
+        """
+        super().write(data=data)
+
+        self.__callback(data=data)
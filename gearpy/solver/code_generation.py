@@ -0,0 +1,153 @@
+from functools import lru_cache
+from gearpy.mechanical_objects import RotatingObject
+from gearpy.units import Torque
+import linecache
+import numpy as np
+
+
+CODE_GENERATION_CACHE_SIZE = 128
+
+# the setters of the mechanical objects only delegate to the ones of
+# RotatingObject, which check the assigned values unless within
+# unchecked_assignments, so the generated functions call them directly
+_NAMESPACE = {
+    'Torque': Torque,
+    'set_angular_position': RotatingObject.angular_position.fset,
+    'set_angular_speed': RotatingObject.angular_speed.fset,
+    'set_angular_acceleration': RotatingObject.angular_acceleration.fset,
+    'set_torque': RotatingObject.torque.fset,
+    'set_driving_torque': RotatingObject.driving_torque.fset,
+    'set_load_torque': RotatingObject.load_torque.fset
+}
+
+
+def _get_topology(
+    gear_ratios: list[float],
+    efficiencies: list[float],
+    loaded: list[bool]
+) -> tuple[tuple[str, ...], tuple[str, ...], tuple[bool, ...]]:
+
+    # the topology holds the literals baked in the generated code, so two
+    # powertrains share the generated functions only if their code is the
+    # same
+    return tuple(_to_literal(value) for value in gear_ratios), \
+        tuple(_to_literal(value) for value in efficiencies), \
+        tuple(loaded)
+
+
+def _to_literal(value: float) -> str:
+
+    if np.isfinite(value):
+        return repr(float(value))
+
+    return f"float({repr(float(value))!r})"
+
+
+@lru_cache(maxsize=CODE_GENERATION_CACHE_SIZE)
+def _generate_step_functions(
+    topology: tuple[tuple[str, ...], tuple[str, ...], tuple[bool, ...]]
+) -> dict:
+
+    # each function takes the powertrain elements and computes a stage of the
+    # time step with the same operations, in the same order, of the loops of
+    # Solver, unrolled with gear ratios and efficiencies as literals and with
+    # the external torques called only for the elements which have one
+    gear_ratios, efficiencies, loaded = topology
+    n = len(gear_ratios)
+    elements = ', '.join(f'e{i}' for i in range(n)) + ','
+
+    lines = [
+        'def compute_angular_position_and_speed(elements):',
+        f'    {elements} = elements'
+    ]
+    for i in range(n - 2, -1, -1):
+        lines += [
+            f'    set_angular_position(e{i}, '
+            f'{gear_ratios[i + 1]}*e{i + 1}.angular_position)',
+            f'    set_angular_speed(e{i}, '
+            f'{gear_ratios[i + 1]}*e{i + 1}.angular_speed)'
+        ]
+
+    lines += [
+        '',
+        'def compute_load_torque(elements, time):',
+        f'    {elements} = elements'
+    ]
+    for i in range(n - 1, 0, -1):
+        if loaded[i]:
+            lines += [
+                f'    external_torque = e{i}.external_torque(',
+                '        time=time,',
+                f'        angular_position=e{i}.angular_position,',
+                f'        angular_speed=e{i}.angular_speed',
+                '    )',
+                '    if not isinstance(external_torque, Torque):',
+                '        raise TypeError(',
+                f'            f"Function \'external_torque\' of '
+                f'{{e{i}.name!r}} must return an instance of "',
+                '            f"{Torque.__name__!r}."',
+                '        )',
+                f'    set_load_torque(e{i}, external_torque)'
+            ]
+        lines.append(
+            f'    set_load_torque(e{i - 1}, '
+            f'e{i}.load_torque/{efficiencies[i]}/{gear_ratios[i]})'
+        )
+
+    lines += [
+        '',
+        'def compute_driving_torque(elements):',
+        f'    {elements} = elements',
+        '    e0.compute_torque()'
+    ]
+    for i in range(1, n):
+        lines.append(
+            f'    set_driving_torque(e{i}, '
+            f'e{i - 1}.driving_torque*{efficiencies[i]}*{gear_ratios[i]})'
+        )
+
+    lines += [
+        '',
+        'def compute_torque(elements):',
+        f'    {elements} = elements'
+    ]
+    for i in range(n):
+        lines.append(
+            f'    set_torque(e{i}, e{i}.driving_torque - e{i}.load_torque)'
+        )
+
+    lines += [
+        '',
+        'def compute_angular_acceleration(elements, inertia_moment):',
+        f'    {elements} = elements',
+        f'    set_angular_acceleration(e{n - 1}, '
+        f'e{n - 1}.torque/inertia_moment)'
+    ]
+    for i in range(n - 2, -1, -1):
+        lines.append(
+            f'    set_angular_acceleration(e{i}, '
+            f'{gear_ratios[i + 1]}*e{i + 1}.angular_acceleration)'
+        )
+
+    source = '\n'.join(lines) + '\n'
+    # the source is registered in linecache, so that tracebacks show the
+    # lines of the generated code
+    filename = f'<gearpy powertrain {hash(topology):x}>'
+    linecache.cache[filename] = (
+        len(source),
+        None,
+        source.splitlines(keepends=True),
+        filename
+    )
+    namespace = dict(_NAMESPACE)
+    exec(compile(source, filename, 'exec'), namespace)
+
+    return {
+        name: namespace[name] for name in (
+            'compute_angular_position_and_speed',
+            'compute_load_torque',
+            'compute_driving_torque',
+            'compute_torque',
+            'compute_angular_acceleration'
+        )
+    }
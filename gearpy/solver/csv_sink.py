@@ -0,0 +1,174 @@
+from __future__ import annotations
+from gearpy.powertrain import Powertrain
+from .sink_base import SinkBase
+import os
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class CSVSink(SinkBase):
+    """:py:class:`CSVSink <gearpy.solver.csv_sink.CSVSink>` object. \n
+    It appends the time variables of each powertrain element to a ``.csv``
+    file as the simulation advances. \n
+    It creates a file for each element in the powertrain, named after the
+    element :py:attr:`name <gearpy.mechanical_objects.mechanical_object_base.RotatingObject.name>`,
+    with the same tabular form of
+    :py:meth:`Powertrain.export_time_variables <gearpy.powertrain.Powertrain.export_time_variables>`:
+    each column is a time variable and each row is a simulated time step.
+    The first row, which reports the column names, is written with the first
+    batch of time steps received by the sink, so files are overwritten by
+    the first simulation run with a new sink and appended by the following
+    concatenated simulations.
+
+    Attributes
+    ----------
+    :py:attr:`folder_path` : :py:class:`str`
+        Path to the folder in which to save the files.
+    :py:attr:`units` : :py:class:`dict`
+        Symbols of the units of measurement of each time variable.
+
+    Methods
+    -------
+    :py:meth:`open`
+        It prepares the sink to receive the time variables of a powertrain.
+    :py:meth:`write`
+        It appends a batch of time steps to the files.
+    :py:meth:`close`
+        It releases the resources held by the sink.
+
+    .. admonition:: Raises
+       :class: warning
+
+       ``TypeError``
+           - If ``folder_path`` is not a :py:class:`str`,
+           - if ``time_unit`` is not a :py:class:`str`,
+           - if ``angular_position_unit`` is not a :py:class:`str`,
+           - if ``angular_speed_unit`` is not a :py:class:`str`,
+           - if ``angular_acceleration_unit`` is not a :py:class:`str`,
+           - if ``torque_unit`` is not a :py:class:`str`,
+           - if ``driving_torque_unit`` is not a :py:class:`str`,
+           - if ``load_torque_unit`` is not a :py:class:`str`,
+           - if ``force_unit`` is not a :py:class:`str`,
+           - if ``stress_unit`` is not a :py:class:`str`,
+           - if ``current_unit`` is not a :py:class:`str`.
+       ``ValueError``
+           If ``folder_path`` is an empty :py:class:`str`.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:meth:`Powertrain.export_time_variables <gearpy.powertrain.Powertrain.export_time_variables>` \n
+       :py:meth:`Solver.run <gearpy.solver.Solver.run>`
+    """
+
+    def __init__(
+        self,
+        folder_path: str,
+        time_unit: str = 'sec',
+        angular_position_unit: str = 'rad',
+        angular_speed_unit: str = 'rad/s',
+        angular_acceleration_unit: str = 'rad/s^2',
+        torque_unit: str = 'Nm',
+        driving_torque_unit: str = 'Nm',
+        load_torque_unit: str = 'Nm',
+        force_unit: str = 'N',
+        stress_unit: str = 'MPa',
+        current_unit: str = 'A'
+    ):
+        super().__init__(
+            time_unit=time_unit,
+            angular_position_unit=angular_position_unit,
+            angular_speed_unit=angular_speed_unit,
+            angular_acceleration_unit=angular_acceleration_unit,
+            torque_unit=torque_unit,
+            driving_torque_unit=driving_torque_unit,
+            load_torque_unit=load_torque_unit,
+            force_unit=force_unit,
+            stress_unit=stress_unit,
+            current_unit=current_unit
+        )
+
+        if not isinstance(folder_path, str):
+            raise TypeError("Parameter 'folder_path' must be a string.")
+
+        if not folder_path:
+            raise ValueError("Parameter 'folder_path' cannot be an empty string.")
+
+        self.__folder_path = folder_path
+        self.__written_files = set()
+
+    @property
+    def folder_path(self) -> str:
+        """Path to the folder in which to save the files. It must be a
+        non-empty :py:class:`str`.
+
+        Returns
+        -------
+        :py:class:`str`
+            Path to the folder in which to save the files.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If :py:attr:`folder_path` is not a :py:class:`str`.
+           ``ValueError``
+               If :py:attr:`folder_path` is an empty :py:class:`str`.
+        """
+        return self.__folder_path
+
+    def open(self, powertrain: Powertrain) -> None:
+        """It prepares the sink to receive the time variables of
+        ``powertrain``, creating :py:attr:`folder_path` if it does not
+        exist.
+
+        Parameters
+        ----------
+        ``powertrain`` : :py:class:`Powertrain <gearpy.powertrain.Powertrain>`
+            Powertrain whose time variables are to be written.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If ``powertrain`` is not an instance of
+               :py:class:`Powertrain <gearpy.powertrain.Powertrain>`.
+        """
+        super().open(powertrain=powertrain)
+
+        if not os.path.exists(self.__folder_path):
+            os.makedirs(self.__folder_path)
+
+    def write(self, data: dict[str, pd.DataFrame]) -> None:
+        """It appends a batch of time steps to the files, one for each
+        powertrain element.
+
+        Parameters
+        ----------
+        ``data`` : :py:class:`dict`
+            Time variables of each powertrain element. The keys of the
+            dictionary are the elements names and the values are
+            :py:class:`pandas.DataFrame` of the time variables, with a column
+            for each time variable and a row for each time step.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If ``data`` is not a :py:class:`dict`.
+        """
+        super().write(data=data)
+
+        for name, element_data in data.items():
+            file_path = os.path.join(self.__folder_path, name + '.csv')
+            is_written = file_path in self.__written_files
+            element_data.to_csv(
+                file_path,
+                mode='a' if is_written else 'w',
+                header=not is_written,
+                index=False
+            )
+            self.__written_files.add(file_path)
@@ -0,0 +1,45 @@
+from typing import Callable
+import numpy as np
+
+
+EVENT_LOCATION_TOLERANCE = 1e-9
+EVENT_LOCATION_MAXIMUM_ITERATIONS = 100
+
+
+def _locate_event(
+    compute_condition: Callable[[float], tuple[bool, float]]
+) -> float:
+
+    # compute_condition maps a fraction of the time step to the validity and
+    # the residual of the stop condition: the fraction at which the condition
+    # becomes valid is bracketed by the validity and approached with the
+    # Illinois variant of the regula falsi on the residual
+    _, lower_residual = compute_condition(0.0)
+    _, upper_residual = compute_condition(1.0)
+    lower, upper = 0.0, 1.0
+    side = 0
+    for _ in range(EVENT_LOCATION_MAXIMUM_ITERATIONS):
+        if upper - lower <= EVENT_LOCATION_TOLERANCE:
+            break
+
+        fraction = (lower + upper)/2
+        if np.isfinite(lower_residual) and np.isfinite(upper_residual) and \
+                lower_residual != upper_residual:
+            secant_fraction = (lower*upper_residual - upper*lower_residual) / \
+                (upper_residual - lower_residual)
+            if lower < secant_fraction < upper:
+                fraction = secant_fraction
+
+        condition_is_valid, residual = compute_condition(fraction)
+        if condition_is_valid:
+            upper, upper_residual = fraction, residual
+            if side == 1:
+                lower_residual /= 2
+            side = 1
+        else:
+            lower, lower_residual = fraction, residual
+            if side == -1:
+                upper_residual /= 2
+            side = -1
+
+    return upper
@@ -0,0 +1,165 @@
+from concurrent.futures import ProcessPoolExecutor
+from .simulation_job import SimulationJob
+import numpy as np
+
+
+class ParallelSolver:
+    r""":py:class:`ParallelSolver <gearpy.solver.parallel_solver.ParallelSolver>`
+    object. \n
+    It runs independent simulation jobs across the processes of a
+    :py:class:`concurrent.futures.ProcessPoolExecutor`, in order to use all
+    the available cores, for example in a Monte Carlo tolerance study. \n
+    Each process builds its own powertrain and sends back only the recorded
+    time variables as :py:class:`numpy.ndarray`, instead of the whole
+    powertrain with its unit objects.
+
+    Attributes
+    ----------
+    :py:attr:`jobs` : :py:class:`list`
+        Simulation jobs to be run.
+    :py:attr:`results` : :py:class:`list`
+        Recorded time variables of each simulation job.
+
+    Methods
+    -------
+    :py:meth:`run`
+        It runs the simulation jobs.
+
+    .. admonition:: Raises
+       :class: warning
+
+       ``TypeError``
+           - If ``jobs`` is not a :py:class:`list`,
+           - if an element of ``jobs`` is not an instance of
+             :py:class:`SimulationJob <gearpy.solver.simulation_job.SimulationJob>`.
+       ``ValueError``
+           If ``jobs`` is an empty :py:class:`list`.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:class:`SimulationJob <gearpy.solver.simulation_job.SimulationJob>`
+    """
+
+    def __init__(self, jobs: list[SimulationJob]):
+        if not isinstance(jobs, list):
+            raise TypeError("Parameter 'jobs' must be a list.")
+
+        if not jobs:
+            raise ValueError("Parameter 'jobs' cannot be an empty list.")
+
+        for job in jobs:
+            if not isinstance(job, SimulationJob):
+                raise TypeError(
+                    f"Each element of 'jobs' must be an instance of "
+                    f"{SimulationJob.__name__!r}."
+                )
+
+        self.__jobs = jobs
+        self.__results = []
+
+    @property
+    def jobs(self) -> list[SimulationJob]:
+        """Simulation jobs to be run.
+
+        Returns
+        -------
+        :py:class:`list`
+            Simulation jobs to be run.
+        """
+        return self.__jobs
+
+    @property
+    def results(self) -> list[dict]:
+        """Recorded time variables of each simulation job, in the same order
+        of :py:attr:`jobs`, as returned by
+        :py:meth:`SimulationJob.run <gearpy.solver.simulation_job.SimulationJob.run>`.
+        It is an empty :py:class:`list` until :py:meth:`run` is called.
+
+        Returns
+        -------
+        :py:class:`list`
+            Recorded time variables of each simulation job.
+        """
+        return self.__results
+
+    def run(
+        self,
+        max_workers: int | None = None,
+        chunk_size: int = 1,
+        seed: int | None = None
+    ) -> None:
+        """It runs the simulation jobs and stores their recorded time
+        variables in :py:attr:`results`. \n
+        The seed of each job is spawned from ``seed`` through a
+        :py:class:`numpy.random.SeedSequence`, based on the job position in
+        :py:attr:`jobs`, so results do not depend on ``max_workers``,
+        ``chunk_size`` and on the order in which the processes complete the
+        jobs.
+
+        Parameters
+        ----------
+        ``max_workers`` : :py:class:`int`, optional
+            Maximum number of processes. Default is :py:obj:`None`, so the
+            number of processors of the machine is used. If it is ``1``, the
+            jobs are run in the current process.
+        ``chunk_size`` : :py:class:`int`, optional
+            Number of jobs sent to a process at once. Larger chunks reduce
+            the inter-process communication overhead for many short jobs.
+            Default is ``1``.
+        ``seed`` : :py:class:`int`, optional
+            Seed from which the seeds of all jobs are spawned. Default is
+            :py:obj:`None`, so results are not reproducible.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               - If ``max_workers`` is not an :py:class:`int`,
+               - if ``chunk_size`` is not an :py:class:`int`,
+               - if ``seed`` is not an :py:class:`int`.
+           ``ValueError``
+               - If ``max_workers`` is not positive,
+               - if ``chunk_size`` is not positive,
+               - if ``seed`` is negative.
+        """
+        if max_workers is not None:
+            if not isinstance(max_workers, int) or \
+                    isinstance(max_workers, bool):
+                raise TypeError("Parameter 'max_workers' must be an integer.")
+
+            if max_workers <= 0:
+                raise ValueError("Parameter 'max_workers' must be positive.")
+
+        if not isinstance(chunk_size, int) or isinstance(chunk_size, bool):
+            raise TypeError("Parameter 'chunk_size' must be an integer.")
+
+        if chunk_size <= 0:
+            raise ValueError("Parameter 'chunk_size' must be positive.")
+
+        if seed is not None:
+            if not isinstance(seed, int) or isinstance(seed, bool):
+                raise TypeError("Parameter 'seed' must be an integer.")
+
+            if seed < 0:
+                raise ValueError("Parameter 'seed' must be non-negative.")
+
+        seeds = np.random.SeedSequence(seed).spawn(len(self.__jobs))
+        if max_workers == 1:
+            self.__results = list(map(_run_job, self.__jobs, seeds))
+            return
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            self.__results = list(
+                executor.map(
+                    _run_job,
+                    self.__jobs,
+                    seeds,
+                    chunksize=chunk_size
+                )
+            )
+
+
+def _run_job(job: SimulationJob, seed: np.random.SeedSequence) -> dict:
+
+    return job.run(seed=seed)
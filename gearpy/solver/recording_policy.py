@@ -0,0 +1,197 @@
+from gearpy.units import TimeInterval
+from gearpy.units.time_series import AGGREGATIONS
+
+
+class RecordingPolicy:
+    r""":py:class:`RecordingPolicy <gearpy.solver.recording_policy.RecordingPolicy>`
+    object. \n
+    It defines which simulation time steps are recorded in
+    :py:attr:`Powertrain.time <gearpy.powertrain.Powertrain.time>` and in
+    :py:attr:`RotatingObject.time_variables <gearpy.mechanical_objects.mechanical_object_base.RotatingObject.time_variables>`
+    by :py:meth:`Solver.run <gearpy.solver.Solver.run>`. \n
+    The simulation time steps are grouped in consecutive windows, each one
+    spanning :py:attr:`every` time steps or a duration of
+    :py:attr:`interval`, and each window is recorded as a single time step,
+    aggregated according to :py:attr:`aggregation`. The time integration is
+    still performed at each time step.
+
+    Attributes
+    ----------
+    :py:attr:`every` : :py:class:`int`
+        Number of simulation time steps in each recording window.
+    :py:attr:`interval` : :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`
+        Duration of each recording window.
+    :py:attr:`aggregation` : :py:class:`str`
+        Aggregation applied to the time variables in each recording window.
+
+    Methods
+    -------
+    :py:meth:`get_window`
+        It computes the number of simulation time steps in each recording
+        window.
+
+    .. admonition:: Raises
+       :class: warning
+
+       ``TypeError``
+           - If ``every`` is not an :py:class:`int`,
+           - if ``interval`` is not an instance of
+             :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`,
+           - if ``aggregation`` is not a :py:class:`str`.
+       ``ValueError``
+           - If ``every`` is not positive,
+           - if both ``every`` and ``interval`` are set,
+           - if ``aggregation`` is not among available ones.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:meth:`TimeSeries.aggregate <gearpy.units.time_series.TimeSeries.aggregate>`
+    """
+
+    def __init__(
+        self,
+        every: int | None = None,
+        interval: TimeInterval | None = None,
+        aggregation: str = 'last'
+    ):
+        if every is not None:
+            if not isinstance(every, int) or isinstance(every, bool):
+                raise TypeError("Parameter 'every' must be an integer.")
+
+            if every <= 0:
+                raise ValueError("Parameter 'every' must be positive.")
+
+        if interval is not None:
+            if not isinstance(interval, TimeInterval):
+                raise TypeError(
+                    f"Parameter 'interval' must be an instance of "
+                    f"{TimeInterval.__name__!r}."
+                )
+
+            if every is not None:
+                raise ValueError(
+                    "Parameters 'every' and 'interval' cannot be both set."
+                )
+
+        if not isinstance(aggregation, str):
+            raise TypeError("Parameter 'aggregation' must be a string.")
+
+        if aggregation not in AGGREGATIONS.keys():
+            raise ValueError(
+                f"Aggregation {aggregation!r} not available. Available "
+                f"aggregations are: {list(AGGREGATIONS.keys())}."
+            )
+
+        if every is None and interval is None:
+            every = 1
+
+        self.__every = every
+        self.__interval = interval
+        self.__aggregation = aggregation
+
+    @property
+    def every(self) -> int | None:
+        """Number of simulation time steps in each recording window. If
+        neither ``every`` nor ``interval`` are set, then it is ``1`` and each
+        simulation time step is recorded.
+
+        Returns
+        -------
+        :py:class:`int` or :py:obj:`None`
+            Number of simulation time steps in each recording window.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If :py:attr:`every` is not an :py:class:`int`.
+           ``ValueError``
+               If :py:attr:`every` is not positive.
+        """
+        return self.__every
+
+    @property
+    def interval(self) -> TimeInterval | None:
+        """Duration of each recording window. It is rounded to the closest
+        multiple of the simulation time discretization.
+
+        Returns
+        -------
+        :py:class:`TimeInterval <gearpy.units.units.TimeInterval>` or :py:obj:`None`
+            Duration of each recording window.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If :py:attr:`interval` is not an instance of
+               :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`.
+        """
+        return self.__interval
+
+    @property
+    def aggregation(self) -> str:
+        """Aggregation applied to the time variables in each recording
+        window. \n
+        The available aggregations are:
+
+        - ``'last'``, which records the values at the last time step of the
+          window,
+        - ``'mean'``, which records the mean of the values in the window,
+        - ``'min'``, which records the minimum of the values in the window,
+        - ``'max'``, which records the maximum of the values in the window.
+
+        The recorded time is always the one of the last time step of the
+        window.
+
+        Returns
+        -------
+        :py:class:`str`
+            Aggregation applied to the time variables in each recording
+            window.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If :py:attr:`aggregation` is not a :py:class:`str`.
+           ``ValueError``
+               If :py:attr:`aggregation` is not among available ones.
+        """
+        return self.__aggregation
+
+    def get_window(self, time_discretization: TimeInterval) -> int:
+        """It computes the number of simulation time steps in each recording
+        window. \n
+        If :py:attr:`interval` is set, then it is the ratio between
+        :py:attr:`interval` and ``time_discretization``, rounded to the
+        closest positive integer.
+
+        Parameters
+        ----------
+        ``time_discretization`` : :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`
+            Time discretization of the simulation.
+
+        Returns
+        -------
+        :py:class:`int`
+            Number of simulation time steps in each recording window.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If ``time_discretization`` is not an instance of
+               :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`.
+        """
+        if not isinstance(time_discretization, TimeInterval):
+            raise TypeError(
+                f"Parameter 'time_discretization' must be an instance of "
+                f"{TimeInterval.__name__!r}."
+            )
+
+        if self.__interval is None:
+            return self.__every
+
+        return max(1, round(self.__interval/time_discretization))
@@ -0,0 +1,371 @@
+from gearpy.motor_control import MotorControlBase
+from gearpy.powertrain import Powertrain
+from gearpy.units import TimeInterval
+from gearpy.utils import StopCondition
+from .recording_policy import RecordingPolicy
+from .solver import ENGINES, INTEGRATORS, Solver
+from typing import Callable
+import numpy as np
+
+
+SI_UNITS = {
+    'angular position': 'rad',
+    'angular speed': 'rad/s',
+    'angular acceleration': 'rad/s^2',
+    'torque': 'Nm',
+    'driving torque': 'Nm',
+    'load torque': 'Nm',
+    'tangential force': 'N',
+    'bending stress': 'Pa',
+    'contact stress': 'Pa',
+    'electric current': 'A',
+    'pwm': None
+}
+
+
+class SimulationJob:
+    r""":py:class:`SimulationJob <gearpy.solver.simulation_job.SimulationJob>`
+    object. \n
+    It describes an independent powertrain simulation, to be run by
+    :py:class:`ParallelSolver <gearpy.solver.parallel_solver.ParallelSolver>`
+    in a separate process. \n
+    Since powertrain elements, motor control rules and stop conditions
+    reference each other, the job does not hold them: it holds the
+    functions which build them, so that each process builds its own
+    powertrain. The functions must be picklable, so they must be defined at
+    module level.
+
+    Attributes
+    ----------
+    :py:attr:`powertrain_factory` : :py:class:`Callable`
+        Function which builds the powertrain to be simulated.
+    :py:attr:`time_discretization` : :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`
+        Time discretization to be used for the simulation.
+    :py:attr:`simulation_time` : :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`
+        Duration of the simulation.
+    :py:attr:`motor_control_factory` : :py:class:`Callable`
+        Function which builds the rules to control the powertrain motor.
+    :py:attr:`stop_condition_factory` : :py:class:`Callable`
+        Function which builds the simulation stopping conditions.
+    :py:attr:`engine` : :py:class:`str`
+        Simulation engine.
+    :py:attr:`integrator` : :py:class:`str`
+        Time integration scheme.
+    :py:attr:`recording_policy` : :py:class:`RecordingPolicy <gearpy.solver.recording_policy.RecordingPolicy>`
+        Policy defining which time steps are recorded.
+
+    Methods
+    -------
+    :py:meth:`run`
+        It runs the simulation and returns the recorded time variables.
+
+    .. admonition:: Raises
+       :class: warning
+
+       ``TypeError``
+           - If ``powertrain_factory`` is not callable,
+           - if ``time_discretization`` is not an instance of
+             :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`,
+           - if ``simulation_time`` is not an instance of
+             :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`,
+           - if ``motor_control_factory`` is not callable,
+           - if ``stop_condition_factory`` is not callable,
+           - if ``engine`` is not a :py:class:`str`,
+           - if ``integrator`` is not a :py:class:`str`,
+           - if ``recording_policy`` is not an instance of
+             :py:class:`RecordingPolicy <gearpy.solver.recording_policy.RecordingPolicy>`.
+       ``ValueError``
+           - If ``time_discretization`` is greater or equal to
+             ``simulation_time``,
+           - if ``engine`` is not among available ones,
+           - if ``integrator`` is not among available ones.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:class:`ParallelSolver <gearpy.solver.parallel_solver.ParallelSolver>` \n
+       :py:meth:`Solver.run <gearpy.solver.Solver.run>`
+    """
+
+    def __init__(
+        self,
+        powertrain_factory: Callable[[np.random.Generator], Powertrain],
+        time_discretization: TimeInterval,
+        simulation_time: TimeInterval,
+        motor_control_factory: Callable[[Powertrain], MotorControlBase]
+        | None = None,
+        stop_condition_factory: Callable[
+            [Powertrain],
+            StopCondition | list[StopCondition]
+        ] | None = None,
+        engine: str = 'array',
+        integrator: str = 'semi-implicit euler',
+        recording_policy: RecordingPolicy | None = None
+    ):
+        if not callable(powertrain_factory):
+            raise TypeError("Parameter 'powertrain_factory' must be callable.")
+
+        if not isinstance(time_discretization, TimeInterval):
+            raise TypeError(
+                f"Parameter 'time_discretization' must be an instance of "
+                f"{TimeInterval.__name__!r}."
+            )
+
+        if not isinstance(simulation_time, TimeInterval):
+            raise TypeError(
+                f"Parameter 'simulation_time' must be an instance of "
+                f"{TimeInterval.__name__!r}."
+            )
+
+        if time_discretization >= simulation_time:
+            raise ValueError(
+                "Parameter 'time_discretization' cannot be greater or equal "
+                "to 'simulation_time'."
+            )
+
+        if not callable(motor_control_factory) and \
+                motor_control_factory is not None:
+            raise TypeError(
+                "Parameter 'motor_control_factory' must be callable."
+            )
+
+        if not callable(stop_condition_factory) and \
+                stop_condition_factory is not None:
+            raise TypeError(
+                "Parameter 'stop_condition_factory' must be callable."
+            )
+
+        if not isinstance(engine, str):
+            raise TypeError("Parameter 'engine' must be a string.")
+
+        if engine not in ENGINES:
+            raise ValueError(
+                f"Engine {engine!r} not available. Available engines are: "
+                f"{list(ENGINES)}."
+            )
+
+        if not isinstance(integrator, str):
+            raise TypeError("Parameter 'integrator' must be a string.")
+
+        if integrator not in INTEGRATORS:
+            raise ValueError(
+                f"Integrator {integrator!r} not available. Available "
+                f"integrators are: {list(INTEGRATORS)}."
+            )
+
+        if not isinstance(recording_policy, RecordingPolicy) and \
+                recording_policy is not None:
+            raise TypeError(
+                f"Parameter 'recording_policy' must be an instance of "
+                f"{RecordingPolicy.__name__!r}."
+            )
+
+        self.__powertrain_factory = powertrain_factory
+        self.__time_discretization = time_discretization
+        self.__simulation_time = simulation_time
+        self.__motor_control_factory = motor_control_factory
+        self.__stop_condition_factory = stop_condition_factory
+        self.__engine = engine
+        self.__integrator = integrator
+        self.__recording_policy = recording_policy
+
+    @property
+    def powertrain_factory(
+        self
+    ) -> Callable[[np.random.Generator], Powertrain]:
+        """Function which builds the powertrain to be simulated. It takes a
+        :py:class:`numpy.random.Generator` as the only argument, to be used
+        for any random draw, like the tolerances of a Monte Carlo study, and
+        it returns an instance of
+        :py:class:`Powertrain <gearpy.powertrain.Powertrain>`.
+
+        Returns
+        -------
+        :py:class:`Callable`
+            Function which builds the powertrain to be simulated.
+        """
+        return self.__powertrain_factory
+
+    @property
+    def time_discretization(self) -> TimeInterval:
+        """Time discretization to be used for the simulation.
+
+        Returns
+        -------
+        :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`
+            Time discretization to be used for the simulation.
+        """
+        return self.__time_discretization
+
+    @property
+    def simulation_time(self) -> TimeInterval:
+        """Duration of the simulation.
+
+        Returns
+        -------
+        :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`
+            Duration of the simulation.
+        """
+        return self.__simulation_time
+
+    @property
+    def motor_control_factory(
+        self
+    ) -> Callable[[Powertrain], MotorControlBase] | None:
+        """Function which builds the rules to control the powertrain motor.
+        It takes the built powertrain as the only argument and it returns an
+        instance of
+        :py:class:`MotorControlBase <gearpy.motor_control.motor_control_base.MotorControlBase>`.
+
+        Returns
+        -------
+        :py:class:`Callable` or :py:obj:`None`
+            Function which builds the rules to control the powertrain motor.
+        """
+        return self.__motor_control_factory
+
+    @property
+    def stop_condition_factory(
+        self
+    ) -> Callable[
+        [Powertrain],
+        StopCondition | list[StopCondition]
+    ] | None:
+        """Function which builds the simulation stopping conditions. It
+        takes the built powertrain as the only argument and it returns an
+        instance of
+        :py:class:`StopCondition <gearpy.utils.stop_condition.stop_condition.StopCondition>`
+        or a :py:class:`list` of them.
+
+        Returns
+        -------
+        :py:class:`Callable` or :py:obj:`None`
+            Function which builds the simulation stopping conditions.
+        """
+        return self.__stop_condition_factory
+
+    @property
+    def engine(self) -> str:
+        """Simulation engine, as in
+        :py:meth:`Solver.run <gearpy.solver.Solver.run>`. Default is
+        ``'array'``.
+
+        Returns
+        -------
+        :py:class:`str`
+            Simulation engine.
+        """
+        return self.__engine
+
+    @property
+    def integrator(self) -> str:
+        """Time integration scheme, as in
+        :py:meth:`Solver.run <gearpy.solver.Solver.run>`. Default is
+        ``'semi-implicit euler'``.
+
+        Returns
+        -------
+        :py:class:`str`
+            Time integration scheme.
+        """
+        return self.__integrator
+
+    @property
+    def recording_policy(self) -> RecordingPolicy | None:
+        """Policy defining which time steps are recorded. Default is
+        :py:obj:`None`, so each time step is recorded.
+
+        Returns
+        -------
+        :py:class:`RecordingPolicy <gearpy.solver.recording_policy.RecordingPolicy>` or :py:obj:`None`
+            Policy defining which time steps are recorded.
+        """
+        return self.__recording_policy
+
+    def run(
+        self,
+        seed: int | np.random.SeedSequence | None = None
+    ) -> dict[str, np.ndarray | dict[str, dict[str, np.ndarray]]]:
+        """It runs the simulation and returns the recorded time variables. \n
+        It builds the powertrain with :py:attr:`powertrain_factory`, passing
+        it a :py:class:`numpy.random.Generator` initialized with ``seed``,
+        then it builds motor control rules and stop conditions, if any, and
+        it runs the simulation with
+        :py:meth:`Solver.run <gearpy.solver.Solver.run>`.
+
+        Parameters
+        ----------
+        ``seed`` : :py:class:`int` or :py:class:`numpy.random.SeedSequence`, optional
+            Seed of the random generator passed to
+            :py:attr:`powertrain_factory`. Default is :py:obj:`None`, so
+            the generator is initialized with fresh entropy.
+
+        Returns
+        -------
+        :py:class:`dict`
+            Recorded time variables. Key ``'time'`` maps to a
+            :py:class:`numpy.ndarray` of simulated time steps, in seconds,
+            and key ``'time_variables'`` maps to a :py:class:`dict` whose keys
+            are the names of the powertrain elements and whose values are
+            dictionaries which map each time variable to a
+            :py:class:`numpy.ndarray`, in SI units: ``'rad'``, ``'rad/s'``,
+            ``'rad/s^2'``, ``'Nm'``, ``'N'``, ``'Pa'`` and ``'A'``.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               - If ``seed`` is not an :py:class:`int` or an instance of
+                 :py:class:`numpy.random.SeedSequence`,
+               - if :py:attr:`powertrain_factory` does not return an
+                 instance of :py:class:`Powertrain <gearpy.powertrain.Powertrain>`.
+           ``ValueError``
+               If ``seed`` is negative.
+        """
+        if seed is not None:
+            if not isinstance(seed, int | np.random.SeedSequence) or \
+                    isinstance(seed, bool):
+                raise TypeError(
+                    "Parameter 'seed' must be an integer or a "
+                    "numpy SeedSequence."
+                )
+
+            if isinstance(seed, int) and seed < 0:
+                raise ValueError("Parameter 'seed' must be non-negative.")
+
+        powertrain = self.__powertrain_factory(np.random.default_rng(seed))
+        if not isinstance(powertrain, Powertrain):
+            raise TypeError(
+                f"Function 'powertrain_factory' must return an instance of "
+                f"{Powertrain.__name__!r}."
+            )
+
+        motor_control = self.__motor_control_factory(powertrain) \
+            if self.__motor_control_factory is not None else None
+        stop_condition = self.__stop_condition_factory(powertrain) \
+            if self.__stop_condition_factory is not None else None
+
+        solver = Solver(powertrain=powertrain)
+        solver.run(
+            time_discretization=self.__time_discretization,
+            simulation_time=self.__simulation_time,
+            motor_control=motor_control,
+            stop_condition=stop_condition,
+            engine=self.__engine,
+            recording_policy=self.__recording_policy,
+            integrator=self.__integrator
+        )
+
+        return {
+            'time': powertrain.time.get_values(unit='sec'),
+            'time_variables': {
+                element.name: {
+                    variable: time_variable.get_values(
+                        unit=SI_UNITS[variable]
+                    )
+                    for variable, time_variable in
+                    element.time_variables.items()
+                }
+                for element in powertrain.elements
+            }
+        }
@@ -0,0 +1,194 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from gearpy.powertrain import Powertrain
+from gearpy.utils.export import _get_time_variables_data
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+STREAMING_BATCH_SIZE = 1000
+
+
+class SinkBase(ABC):
+    """:py:class:`SinkBase <gearpy.solver.sink_base.SinkBase>` object. \n
+    Abstract base class for creating sink objects. \n
+    A sink receives the time variables of the powertrain elements from
+    :py:meth:`Solver.run <gearpy.solver.Solver.run>` in batches of time
+    steps, as the simulation advances, each time variable converted to the
+    unit of measurement set for the sink.
+
+    .. admonition:: Raises
+       :class: warning
+
+       ``TypeError``
+           - If ``time_unit`` is not a :py:class:`str`,
+           - if ``angular_position_unit`` is not a :py:class:`str`,
+           - if ``angular_speed_unit`` is not a :py:class:`str`,
+           - if ``angular_acceleration_unit`` is not a :py:class:`str`,
+           - if ``torque_unit`` is not a :py:class:`str`,
+           - if ``driving_torque_unit`` is not a :py:class:`str`,
+           - if ``load_torque_unit`` is not a :py:class:`str`,
+           - if ``force_unit`` is not a :py:class:`str`,
+           - if ``stress_unit`` is not a :py:class:`str`,
+           - if ``current_unit`` is not a :py:class:`str`.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:class:`CallbackSink <gearpy.solver.callback_sink.CallbackSink>` \n
+       :py:class:`CSVSink <gearpy.solver.csv_sink.CSVSink>`
+    """
+
+    @abstractmethod
+    def __init__(
+        self,
+        time_unit: str = 'sec',
+        angular_position_unit: str = 'rad',
+        angular_speed_unit: str = 'rad/s',
+        angular_acceleration_unit: str = 'rad/s^2',
+        torque_unit: str = 'Nm',
+        driving_torque_unit: str = 'Nm',
+        load_torque_unit: str = 'Nm',
+        force_unit: str = 'N',
+        stress_unit: str = 'MPa',
+        current_unit: str = 'A'
+    ):
+        if not isinstance(time_unit, str):
+            raise TypeError("Parameter 'time_unit' must be a string.")
+
+        if not isinstance(angular_position_unit, str):
+            raise TypeError("Parameter 'angular_position_unit' must be a string.")
+
+        if not isinstance(angular_speed_unit, str):
+            raise TypeError("Parameter 'angular_speed_unit' must be a string.")
+
+        if not isinstance(angular_acceleration_unit, str):
+            raise TypeError(
+                "Parameter 'angular_acceleration_unit' must be a string."
+            )
+
+        if not isinstance(torque_unit, str):
+            raise TypeError("Parameter 'torque_unit' must be a string.")
+
+        if not isinstance(driving_torque_unit, str):
+            raise TypeError("Parameter 'driving_torque_unit' must be a string.")
+
+        if not isinstance(load_torque_unit, str):
+            raise TypeError("Parameter 'load_torque_unit' must be a string.")
+
+        if not isinstance(force_unit, str):
+            raise TypeError("Parameter 'force_unit' must be a string.")
+
+        if not isinstance(stress_unit, str):
+            raise TypeError("Parameter 'stress_unit' must be a string.")
+
+        if not isinstance(current_unit, str):
+            raise TypeError("Parameter 'current_unit' must be a string.")
+
+        self.__units = {
+            'time': time_unit,
+            'angular position': angular_position_unit,
+            'angular speed': angular_speed_unit,
+            'angular acceleration': angular_acceleration_unit,
+            'torque': torque_unit,
+            'driving torque': driving_torque_unit,
+            'load torque': load_torque_unit,
+            'tangential force': force_unit,
+            'bending stress': stress_unit,
+            'contact stress': stress_unit,
+            'electric current': current_unit,
+            'pwm': ''
+        }
+
+    @property
+    def units(self) -> dict[str, str]:
+        """Symbols of the units of measurement to which convert each time
+        variable before writing it. The keys of the dictionary are the names
+        of the time variables, ``'time'`` included, and the values are the
+        symbols of the units. Dimensionless variables, like ``'pwm'``, have
+        an empty :py:class:`str` as unit.
+
+        Returns
+        -------
+        :py:class:`dict`
+            Symbols of the units of measurement of each time variable.
+        """
+        return self.__units.copy()
+
+    def open(self, powertrain: Powertrain) -> None:
+        """It prepares the sink to receive the time variables of
+        ``powertrain``. \n
+        It is called by :py:meth:`Solver.run <gearpy.solver.Solver.run>`
+        before starting the simulation, so it is called once for each
+        simulation concatenated with the same sink.
+
+        Parameters
+        ----------
+        ``powertrain`` : :py:class:`Powertrain <gearpy.powertrain.Powertrain>`
+            Powertrain whose time variables are to be written.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If ``powertrain`` is not an instance of
+               :py:class:`Powertrain <gearpy.powertrain.Powertrain>`.
+        """
+        if not isinstance(powertrain, Powertrain):
+            raise TypeError(
+                f"Parameter 'powertrain' must be an instance of "
+                f"{Powertrain.__name__!r}."
+            )
+
+    @abstractmethod
+    def write(self, data: dict[str, pd.DataFrame]) -> None:
+        if not isinstance(data, dict):
+            raise TypeError("Parameter 'data' must be a dictionary.")
+
+    def close(self) -> None:
+        """It releases the resources held by the sink. \n
+        It is called by :py:meth:`Solver.run <gearpy.solver.Solver.run>`
+        at the end of the simulation, even if the simulation is interrupted
+        by an error.
+        """
+
+
+def _stream_time_variables(
+    powertrain: Powertrain,
+    sinks: list[SinkBase],
+    start: int,
+    retain_time_variables: bool
+) -> int:
+
+    elements = powertrain.elements
+    # time variables may lag behind the time, if the latter is updated before
+    # the former, so only complete time steps are streamed
+    stop = len(elements[0].time_variables['angular position'])
+    if stop > start:
+        for sink in sinks:
+            sink.write(
+                data={
+                    element.name: _get_time_variables_data(
+                        rotating_object=element,
+                        time_array=powertrain.time,
+                        units=sink.units,
+                        start=start,
+                        stop=stop
+                    ) for element in elements
+                }
+            )
+
+    if retain_time_variables or stop <= 2:
+        return stop
+
+    # first and last time steps are kept, since they are needed by motor
+    # control rules and by concatenated simulations
+    del powertrain.time[1:stop - 1]
+    for element in elements:
+        for time_variable in element.time_variables.values():
+            del time_variable[1:stop - 1]
+
+    return 2
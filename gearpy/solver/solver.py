@@ -0,0 +1,1324 @@
+from contextlib import nullcontext
+from gearpy.mechanical_objects import (
+    RotatingObject,
+    MotorBase,
+    GearBase,
+    unchecked_assignments
+)
+from gearpy.motor_control import MotorControlBase
+from gearpy.powertrain import Powertrain
+from gearpy.units import (
+    Time,
+    TimeInterval,
+    Torque,
+    AngularPosition,
+    AngularSpeed,
+    AngularAcceleration
+)
+from gearpy.utils import StopCondition
+from .array_engine import ArrayEngine
+from .code_generation import _generate_step_functions, _get_topology
+from .event_location import _locate_event
+from .recording_policy import RecordingPolicy
+from .sink_base import (
+    SinkBase,
+    STREAMING_BATCH_SIZE,
+    _stream_time_variables
+)
+from .step_size_control import (
+    StepSizeControl,
+    _compute_next_time_step,
+    _dormand_prince_step
+)
+import numpy as np
+
+
+NULL_ANGULAR_SPEED = AngularSpeed(0, 'rad/s')
+NULL_ANGULAR_ACCELERATION = AngularAcceleration(0, 'rad/s^2')
+NULL_TORQUE = Torque(0, 'Nm')
+ENGINES = ('object', 'array', 'kernel')
+INTEGRATORS = (
+    'semi-implicit euler',
+    'explicit euler',
+    'heun',
+    'rk4',
+    'dormand-prince'
+)
+ADAPTIVE_INTEGRATORS = ('dormand-prince',)
+POWERTRAIN_STATE_VARIABLES = (
+    'angular_position',
+    'angular_speed',
+    'angular_acceleration',
+    'torque',
+    'driving_torque',
+    'load_torque'
+)
+DEFERRED_TIME_VARIABLES = (
+    'tangential force',
+    'bending stress',
+    'contact stress'
+)
+
+# with deferred force and stress, the gears record only the time variables of
+# RotatingObject during the simulation
+_update_rotating_object_time_variables = RotatingObject.update_time_variables
+
+
+class Solver:
+    r""":py:class:`Solver <gearpy.solver.Solver>` object.
+
+    Methods
+    -------
+    :py:meth:`run`
+        It runs the powertrain simulation.
+
+    .. admonition:: Raises
+       :class: warning
+
+       ``TypeError``
+           - If ``powertrain`` is not an instance of
+             :py:class:`Powertrain <gearpy.powertrain.Powertrain>`,
+           - if the first element in ``powertrain`` is not an instance of
+             :py:class:`MotorBase <gearpy.mechanical_objects.mechanical_object_base.MotorBase>`,
+           - if an element of ``powertrain`` is not an instance of
+             :py:class:`RotatingObject <gearpy.mechanical_objects.mechanical_object_base.RotatingObject>`.
+       ``ValueError``
+           If
+           :py:attr:`Powertrain.elements <gearpy.powertrain.Powertrain.elements>`
+           is an empty :py:class:`tuple`.
+    """
+
+    def __init__(self, powertrain: Powertrain):
+        if not isinstance(powertrain, Powertrain):
+            raise TypeError(
+                f"Parameter 'powertrain' must be an instance of "
+                f"{Powertrain.__name__!r}."
+            )
+
+        if not powertrain.elements:
+            raise ValueError(
+                "Parameter 'powertrain.elements' cannot be an empty tuple."
+            )
+
+        if not isinstance(powertrain.elements[0], MotorBase):
+            raise TypeError(
+                f"First element in 'powertrain' must be an instance of "
+                f"{MotorBase.__name__!r}."
+            )
+
+        if not all(
+            [isinstance(element, RotatingObject)
+                for element in powertrain.elements]
+        ):
+            raise TypeError(
+                f"All elements of 'powertrain' must be instances of "
+                f"{RotatingObject.__name__!r}."
+            )
+
+        self.__powertrain = powertrain
+        self.__powertrain_is_locked = False
+        self.__time_step_computed = False
+        self.__deferred_elements = []
+
+    def run(
+        self,
+        time_discretization: TimeInterval,
+        simulation_time: TimeInterval,
+        motor_control: MotorControlBase | None = None,
+        stop_condition: StopCondition | list[StopCondition] | None = None,
+        engine: str = 'object',
+        recording_policy: RecordingPolicy | None = None,
+        sinks: list[SinkBase] | None = None,
+        retain_time_variables: bool = True,
+        integrator: str = 'semi-implicit euler',
+        step_size_control: StepSizeControl | None = None,
+        check_assignments: bool = True,
+        defer_force_and_stress: bool = False,
+        analytic_segments: bool = False
+    ) -> None:
+        """It runs the powertrain simulation. \n
+        The simulation is performed in several steps:
+
+        - it computes the whole powertrain equivalent moment of inertia with
+          respect to the last gear, by multiplying each element's moment of
+          inertia, starting from the motor, by it gear ratio with respect to
+          the following element in the powertrain elements and sum them up,
+        - for each time step and for each powertrain element, it computes:
+
+          - the angular position and angular speed, from the last element in
+            the powertrain elements to the first one,
+          - the driving torque, load torque, net torque, electrical current for
+            motors (if computable), tangential force, bending stress and
+            contact stress for gears (if computable), motor control rules (if
+            available), simulation stopping condition (if available),
+          - the angular acceleration of each powertrain element,
+
+        - for each time step it performs a time integration to compute angular
+          position and speed of the last element in the powertrain elements.
+
+        Parameters
+        ----------
+        ``time_discretization`` : :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`
+            Time discretization to be used for the simulation.
+        ``simulation_time`` : :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`
+            Duration of the simulation.
+        ``motor_control`` : :py:class:`MotorControlBase <gearpy.motor_control.motor_control_base.MotorControlBase>`, optional
+            Rules to control the powertrain motor.
+        ``stop_condition`` : :py:class:`StopCondition <gearpy.utils.stop_condition.stop_condition.StopCondition>` or :py:class:`list`, optional
+            Simulation stopping condition, or list of simulation stopping
+            conditions. The time instant at which each condition becomes
+            valid is located within the time step, by repeating the time
+            integration over fractions of the time step, and appended to its
+            :py:attr:`event_times <gearpy.utils.stop_condition.stop_condition.StopCondition.event_times>`.
+            The simulation stops at the first time instant at which a
+            :py:attr:`terminal <gearpy.utils.stop_condition.stop_condition.StopCondition.terminal>`
+            condition becomes valid, so the last simulated time step is moved
+            to that instant.
+        ``engine`` : :py:class:`str`, optional
+            Simulation engine. Available engines are:
+
+            - ``'object'`` (default), which computes the powertrain variables
+              through the unit objects of each element, with functions
+              generated for the powertrain topology and shared by the
+              powertrains with the same gear ratios, efficiencies and loaded
+              gears,
+            - ``'array'``, which computes the powertrain variables on arrays
+              of SI floats by means of an
+              :py:class:`ArrayEngine <gearpy.solver.array_engine.ArrayEngine>`
+              and records them in SI units, so it is much faster on long
+              simulations, but its results can differ from the ``'object'``
+              ones by a few ulps,
+            - ``'kernel'``, which is the ``'array'`` engine with the time steps
+              advanced by fused step kernels, compiled with Numba if it is
+              installed, with bit-for-bit the same results. They are used only
+              with a
+              :py:class:`DCMotor <gearpy.mechanical_objects.dc_motor.DCMotor>`
+              and the ``'semi-implicit euler'`` or ``'explicit euler'``
+              ``integrator``. With other motors or integrators, and whenever a
+              ``motor_control`` or a ``stop_condition`` is passed or the
+              tangential force, bending stress or contact stress of a gear are
+              computed at each time step (see ``defer_force_and_stress``),
+              the ``'kernel'`` engine silently falls back to the ``'array'``
+              one.
+
+        ``recording_policy`` : :py:class:`RecordingPolicy <gearpy.solver.recording_policy.RecordingPolicy>`, optional
+            Policy defining which time steps are recorded in
+            :py:attr:`Powertrain.time <gearpy.powertrain.Powertrain.time>`
+            and in the powertrain elements time variables. The time
+            integration is still performed at each time step and the initial
+            time step of a new simulation is always recorded. Default is
+            :py:obj:`None`, so each time step is recorded.
+        ``sinks`` : :py:class:`list`, optional
+            Sinks to which stream the recorded time variables as the
+            simulation advances, in batches of time steps, with the same
+            columns of
+            :py:meth:`Powertrain.export_time_variables <gearpy.powertrain.Powertrain.export_time_variables>`.
+            Each sink must be an instance of
+            :py:class:`SinkBase <gearpy.solver.sink_base.SinkBase>` and it is
+            closed even if the simulation is interrupted by an error. Default
+            is :py:obj:`None`, so no sink is used.
+        ``retain_time_variables`` : :py:class:`bool`, optional
+            Whether to keep the recorded time variables in memory after they
+            have been streamed to the ``sinks``. If ``False``, only the first
+            and the last recorded time steps are kept, so the memory usage
+            does not grow with the simulation time. Default is ``True``.
+        ``integrator`` : :py:class:`str`, optional
+            Time integration scheme of the angular position and speed of the
+            last element in the powertrain elements. Available integrators
+            are:
+
+            - ``'semi-implicit euler'`` (default), first order, which updates
+              the angular speed and then the angular position with the
+              updated angular speed,
+            - ``'explicit euler'``, first order, which updates the angular
+              position with the angular speed at the beginning of the time
+              step,
+            - ``'heun'``, second order, with two evaluations of the angular
+              acceleration per time step,
+            - ``'rk4'``, the classic fourth order Runge-Kutta scheme, with
+              four evaluations of the angular acceleration per time step,
+            - ``'dormand-prince'``, the adaptive Dormand-Prince 5(4) scheme,
+              with six evaluations of the angular acceleration per time step
+              and a time step adapted to the estimated local error according
+              to ``step_size_control``, starting from
+              ``time_discretization``. If the powertrain is self-locking, the
+              time step is reduced to stop close to the motor angular speed
+              reversal.
+
+            The fixed-step integrators skip the time steps at which a locked
+            self-locking powertrain has a null motor PWM, since it stays
+            still, but the ``external_torque`` functions, the
+            ``motor_control`` and the ``stop_condition`` are still evaluated
+            and each time step is still recorded.
+        ``step_size_control`` : :py:class:`StepSizeControl <gearpy.solver.step_size_control.StepSizeControl>`, optional
+            Error control of the ``'dormand-prince'`` integrator. Default is
+            :py:obj:`None`, so a
+            :py:class:`StepSizeControl <gearpy.solver.step_size_control.StepSizeControl>`
+            with default parameters is used. It cannot be set for fixed-step
+            integrators.
+        ``check_assignments`` : :py:class:`bool`, optional
+            Whether to check the type of the time variables assigned to the
+            powertrain elements at each time step. If ``False``, the
+            simulation runs within
+            :py:func:`unchecked_assignments <gearpy.mechanical_objects.mechanical_object_base.unchecked_assignments>`,
+            so it should be set only for trusted powertrain models. The type
+            checks take a small fraction of a time step, so this does not
+            noticeably speed up the simulation. Default is ``True``.
+        ``defer_force_and_stress`` : :py:class:`bool`, optional
+            Whether to skip the computation of tangential force, bending
+            stress and contact stress of the gears during the simulation and
+            compute them for all recorded time steps at once afterwards, when
+            the gears time variables are accessed. They do not affect the
+            motion of the powertrain, and the values of the last time step are
+            computed at the end of the simulation anyway. It cannot be
+            ``True`` with ``sinks`` or with an aggregation of
+            ``recording_policy`` other than ``'last'``. Default is ``False``.
+        ``analytic_segments`` : :py:class:`bool`, optional
+            Whether to compute the time steps at constant motor PWM at once,
+            from the exponential closed-form solution of the equation of
+            motion, so that the recorded values are exact regardless of
+            ``time_discretization``. It requires a
+            :py:class:`DCMotor <gearpy.mechanical_objects.dc_motor.DCMotor>`,
+            :py:class:`LinearLoad <gearpy.utils.linear_load.LinearLoad>`
+            loads, no ``stop_condition``, no ``motor_control`` or a
+            :py:class:`PWMControl <gearpy.motor_control.pwm_control.PWMControl>`
+            with only
+            :py:class:`ConstantPWM <gearpy.motor_control.rules.constant_pwm.ConstantPWM>`
+            rules and no tangential force, bending stress or contact stress
+            computed at each time step, otherwise it cannot be ``True``. The
+            time steps at which a self-locking powertrain gets locked are
+            integrated too, while the following ones with null motor PWM are
+            recorded at once. It cannot be ``True`` with the ``'object'``
+            ``engine`` or with an adaptive ``integrator``. Default is
+            ``False``.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               - If ``time_discretization`` is not an instance of
+                 :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`,
+               - if ``simulation_time`` is not an instance of
+                 :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`,
+               - if ``motor_control`` is not an instance of
+                 :py:class:`MotorControlBase <gearpy.motor_control.motor_control_base.MotorControlBase>`,
+               - if ``stop_condition`` is not an instance of
+                 :py:class:`StopCondition <gearpy.utils.stop_condition.stop_condition.StopCondition>`
+                 or a :py:class:`list`,
+               - if an element of ``stop_condition`` is not an instance of
+                 :py:class:`StopCondition <gearpy.utils.stop_condition.stop_condition.StopCondition>`,
+               - if ``engine`` is not a :py:class:`str`,
+               - if ``recording_policy`` is not an instance of
+                 :py:class:`RecordingPolicy <gearpy.solver.recording_policy.RecordingPolicy>`,
+               - if ``sinks`` is not a :py:class:`list`,
+               - if an element of ``sinks`` is not an instance of
+                 :py:class:`SinkBase <gearpy.solver.sink_base.SinkBase>`,
+               - if ``retain_time_variables`` is not a :py:class:`bool`,
+               - if ``integrator`` is not a :py:class:`str`,
+               - if ``step_size_control`` is not an instance of
+                 :py:class:`StepSizeControl <gearpy.solver.step_size_control.StepSizeControl>`,
+               - if ``check_assignments`` is not a :py:class:`bool`,
+               - if ``defer_force_and_stress`` is not a :py:class:`bool`,
+               - if ``analytic_segments`` is not a :py:class:`bool`,
+               - if function ``external_torque`` of one gear in the powertrain
+                 elements does not return an instance of
+                 :py:class:`Torque <gearpy.units.units.Torque>`,
+           ``ValueError``
+               - If ``time_discretization`` is greater or equal to
+                 ``simulation_time``,
+               - if function ``external_torque`` has not been defined for any
+                 gear of the powertrain,
+               - if ``engine`` is not among available ones,
+               - if ``integrator`` is not among available ones,
+               - if ``step_size_control`` is set for a fixed-step
+                 ``integrator``,
+               - if ``recording_policy`` has an
+                 :py:attr:`interval <gearpy.solver.recording_policy.RecordingPolicy.interval>`
+                 and ``integrator`` is ``'dormand-prince'``,
+               - if ``retain_time_variables`` is ``False`` and no sink is
+                 set,
+               - if ``defer_force_and_stress`` is ``True`` and a sink is set,
+               - if ``defer_force_and_stress`` is ``True`` and the
+                 :py:attr:`aggregation <gearpy.solver.recording_policy.RecordingPolicy.aggregation>`
+                 of ``recording_policy`` is not ``'last'``,
+               - if ``defer_force_and_stress`` is ``True`` and the tangential
+                 force, bending stress or contact stress of a gear cannot be
+                 computed because of its gear mating,
+               - if ``analytic_segments`` is ``True`` and ``engine`` is
+                 ``'object'``,
+               - if ``analytic_segments`` is ``True`` and ``integrator`` is
+                 ``'dormand-prince'``,
+               - if ``analytic_segments`` is ``True`` and the motor is not a
+                 :py:class:`DCMotor <gearpy.mechanical_objects.dc_motor.DCMotor>`,
+                 a ``stop_condition`` is set, ``motor_control`` is not a
+                 :py:class:`PWMControl <gearpy.motor_control.pwm_control.PWMControl>`
+                 with only
+                 :py:class:`ConstantPWM <gearpy.motor_control.rules.constant_pwm.ConstantPWM>`
+                 rules, a function ``external_torque`` is not a
+                 :py:class:`LinearLoad <gearpy.utils.linear_load.LinearLoad>`
+                 or the tangential force, bending stress or contact stress are
+                 computed at each time step.
+
+        .. admonition:: Notes
+           :class: tip
+
+           If :py:attr:`Powertrain.time <gearpy.powertrain.Powertrain.time>` is
+           an empty :py:class:`list`, it performs the simulation starting the
+           time from ``0 sec``; otherwise it concatenates another simulation to
+           existing values of time and time variables. \n
+           Motor control rules are applied only at the simulation time steps,
+           so the motor PWM and the powertrain locking condition are held
+           constant within each time step.
+        """
+        if not isinstance(time_discretization, TimeInterval):
+            raise TypeError(
+                f"Parameter 'time_discretization' must be an instance of "
+                f"{TimeInterval.__name__!r}."
+            )
+
+        if not isinstance(simulation_time, TimeInterval):
+            raise TypeError(
+                f"Parameter 'simulation_time' must be an instance of "
+                f"{TimeInterval.__name__!r}."
+            )
+
+        if time_discretization >= simulation_time:
+            raise ValueError(
+                "Parameter 'time_discretization' cannot be greater or equal "
+                "to 'simulation_time'."
+            )
+
+        if not any(
+            [element.external_torque is not None
+                for element in self.__powertrain.elements
+                if isinstance(element, GearBase)]
+        ):
+            raise ValueError(
+                "The function 'external_torque' has not been defined for any "
+                "gear of the powertrain. Add this function to a powertrain "
+                "gear."
+            )
+
+        if not isinstance(motor_control, MotorControlBase) and \
+                motor_control is not None:
+            raise TypeError(
+                f"Parameter 'motor_control' must be an instance of "
+                f"{MotorControlBase.__name__!r}."
+            )
+
+        if not isinstance(stop_condition, StopCondition | list) and \
+                stop_condition is not None:
+            raise TypeError(
+                f"Parameter 'stop_condition' must be an instance of "
+                f"{StopCondition.__name__!r} or a list."
+            )
+
+        if stop_condition is None:
+            stop_condition = []
+        elif isinstance(stop_condition, StopCondition):
+            stop_condition = [stop_condition]
+
+        for condition in stop_condition:
+            if not isinstance(condition, StopCondition):
+                raise TypeError(
+                    f"Each element of 'stop_condition' must be an instance of "
+                    f"{StopCondition.__name__!r}."
+                )
+
+        if not isinstance(engine, str):
+            raise TypeError("Parameter 'engine' must be a string.")
+
+        if engine not in ENGINES:
+            raise ValueError(
+                f"Engine {engine!r} not available. Available engines are: "
+                f"{list(ENGINES)}."
+            )
+
+        if not isinstance(recording_policy, RecordingPolicy) and \
+                recording_policy is not None:
+            raise TypeError(
+                f"Parameter 'recording_policy' must be an instance of "
+                f"{RecordingPolicy.__name__!r}."
+            )
+
+        if recording_policy is None:
+            recording_policy = RecordingPolicy()
+
+        if not isinstance(sinks, list) and sinks is not None:
+            raise TypeError("Parameter 'sinks' must be a list.")
+
+        if sinks is None:
+            sinks = []
+
+        for sink in sinks:
+            if not isinstance(sink, SinkBase):
+                raise TypeError(
+                    f"Each element of 'sinks' must be an instance of "
+                    f"{SinkBase.__name__!r}."
+                )
+
+        if not isinstance(retain_time_variables, bool):
+            raise TypeError(
+                "Parameter 'retain_time_variables' must be a boolean."
+            )
+
+        if not isinstance(integrator, str):
+            raise TypeError("Parameter 'integrator' must be a string.")
+
+        if integrator not in INTEGRATORS:
+            raise ValueError(
+                f"Integrator {integrator!r} not available. Available "
+                f"integrators are: {list(INTEGRATORS)}."
+            )
+
+        if not isinstance(step_size_control, StepSizeControl) and \
+                step_size_control is not None:
+            raise TypeError(
+                f"Parameter 'step_size_control' must be an instance of "
+                f"{StepSizeControl.__name__!r}."
+            )
+
+        if integrator in ADAPTIVE_INTEGRATORS:
+            if step_size_control is None:
+                step_size_control = StepSizeControl()
+
+            if recording_policy.interval is not None:
+                raise ValueError(
+                    f"Parameter 'recording_policy' cannot have an 'interval' "
+                    f"with integrator {integrator!r}."
+                )
+        elif step_size_control is not None:
+            raise ValueError(
+                f"Parameter 'step_size_control' cannot be set with fixed-step "
+                f"integrator {integrator!r}."
+            )
+
+        if not retain_time_variables and not sinks:
+            raise ValueError(
+                "Parameter 'retain_time_variables' cannot be False if no sink "
+                "is set."
+            )
+
+        if not isinstance(check_assignments, bool):
+            raise TypeError("Parameter 'check_assignments' must be a boolean.")
+
+        if not isinstance(defer_force_and_stress, bool):
+            raise TypeError(
+                "Parameter 'defer_force_and_stress' must be a boolean."
+            )
+
+        if not isinstance(analytic_segments, bool):
+            raise TypeError("Parameter 'analytic_segments' must be a boolean.")
+
+        if analytic_segments:
+            if engine == 'object':
+                raise ValueError(
+                    f"Parameter 'analytic_segments' cannot be True with "
+                    f"engine {engine!r}."
+                )
+
+            if integrator in ADAPTIVE_INTEGRATORS:
+                raise ValueError(
+                    f"Parameter 'analytic_segments' cannot be True with "
+                    f"integrator {integrator!r}."
+                )
+
+        self._compile()
+        deferred_elements = []
+        if defer_force_and_stress:
+            if sinks:
+                raise ValueError(
+                    "Parameter 'defer_force_and_stress' cannot be True if a "
+                    "sink is set."
+                )
+
+            if recording_policy.aggregation != 'last':
+                raise ValueError(
+                    f"Parameter 'defer_force_and_stress' cannot be True with "
+                    f"aggregation {recording_policy.aggregation!r} of "
+                    f"'recording_policy'."
+                )
+
+            deferred_elements = [
+                self.__powertrain.elements[i] for i in self.__force_elements
+            ]
+            for element in deferred_elements:
+                # same errors of the force and stress computations, raised
+                # before the simulation
+                element._force_and_stress_operands
+
+        for sink in sinks:
+            sink.open(powertrain=self.__powertrain)
+        self.__deferred_elements = deferred_elements
+        try:
+            with nullcontext() if check_assignments \
+                    else unchecked_assignments():
+                if engine in ('array', 'kernel'):
+                    array_engine = ArrayEngine(powertrain=self.__powertrain)
+                    array_engine.powertrain_is_locked = \
+                        self.__powertrain_is_locked
+                    array_engine.run(
+                        time_discretization=time_discretization,
+                        simulation_time=simulation_time,
+                        motor_control=motor_control,
+                        stop_condition=stop_condition,
+                        recording_policy=recording_policy,
+                        sinks=sinks,
+                        retain_time_variables=retain_time_variables,
+                        integrator=integrator,
+                        step_size_control=step_size_control,
+                        defer_force_and_stress=defer_force_and_stress,
+                        kernel=engine == 'kernel',
+                        analytic_segments=analytic_segments
+                    )
+                    self.__powertrain_is_locked = \
+                        array_engine.powertrain_is_locked
+                else:
+                    self._run(
+                        time_discretization=time_discretization,
+                        simulation_time=simulation_time,
+                        motor_control=motor_control,
+                        stop_condition=stop_condition,
+                        recording_policy=recording_policy,
+                        sinks=sinks,
+                        retain_time_variables=retain_time_variables,
+                        integrator=integrator,
+                        step_size_control=step_size_control
+                    )
+        finally:
+            self.__deferred_elements = []
+            for element in deferred_elements:
+                element._defer_time_variables()
+            for sink in sinks:
+                sink.close()
+
+        if deferred_elements:
+            self._compute_force()
+            self._compute_stress()
+
+    def _run(
+        self,
+        time_discretization: TimeInterval,
+        simulation_time: TimeInterval,
+        motor_control: MotorControlBase | None,
+        stop_condition: list[StopCondition],
+        recording_policy: RecordingPolicy,
+        sinks: list[SinkBase],
+        retain_time_variables: bool,
+        integrator: str,
+        step_size_control: StepSizeControl | None
+    ):
+
+        window = recording_policy.get_window(
+            time_discretization=time_discretization
+        )
+        aggregation = recording_policy.aggregation
+        stream_start = len(self.__powertrain.time)
+        if self.__powertrain.time:
+            initial_time = self.__powertrain.time[-1]
+            final_time = initial_time + simulation_time + time_discretization
+            time_steps = np.arange(
+                initial_time.value + time_discretization.value,
+                final_time.value,
+                time_discretization.value
+            )
+            n_steps = len(time_steps)//window + window
+        else:
+            initial_time = Time(value=0, unit=time_discretization.unit)
+            final_time = initial_time + simulation_time + time_discretization
+            time_steps = np.arange(
+                initial_time.value + time_discretization.value,
+                final_time.value,
+                time_discretization.value
+            )
+            n_steps = len(time_steps)//window + window + 1
+        if not retain_time_variables:
+            n_steps = min(n_steps, STREAMING_BATCH_SIZE + window)
+        self._reserve_time_variables(n_steps=n_steps)
+        # the powertrain elements may have been changed since the previous
+        # simulation, so their time variables are not reused until a time
+        # step has been computed
+        self.__time_step_computed = False
+        if not self.__powertrain.time:
+            self.__powertrain.update_time(initial_time)
+            self._compute_powertrain_variables(motor_control=motor_control)
+            self._update_time_variables()
+        condition_states = [
+            condition.check_condition() for condition in stop_condition
+        ]
+
+        if integrator in ADAPTIVE_INTEGRATORS:
+            time_steps = self._advance_adaptive_time_steps(
+                time_discretization=time_discretization,
+                simulation_time=simulation_time,
+                step_size_control=step_size_control
+            )
+        else:
+            time_steps = self._advance_fixed_time_steps(
+                time_steps=time_steps,
+                time_discretization=time_discretization,
+                integrator=integrator
+            )
+
+        fast_forward = integrator not in ADAPTIVE_INTEGRATORS
+        window_length = 0
+        for _ in time_steps:
+
+            if not (fast_forward and self._fast_forward_locked_time_step(
+                motor_control=motor_control
+            )):
+                self._compute_powertrain_variables(motor_control=motor_control)
+            stop = self._check_stop_conditions(
+                stop_conditions=stop_condition,
+                condition_states=condition_states,
+                integrator=integrator,
+                step_size_control=step_size_control
+            )
+            self._update_time_variables()
+            window_length += 1
+            if window_length == window:
+                self._aggregate_time_variables(
+                    window=window_length,
+                    aggregation=aggregation
+                )
+                window_length = 0
+                if sinks and len(self.__powertrain.time) - stream_start >= \
+                        STREAMING_BATCH_SIZE:
+                    stream_start = _stream_time_variables(
+                        powertrain=self.__powertrain,
+                        sinks=sinks,
+                        start=stream_start,
+                        retain_time_variables=retain_time_variables
+                    )
+            if stop:
+                break
+
+        if window_length:
+            self._aggregate_time_variables(
+                window=window_length,
+                aggregation=aggregation
+            )
+
+        if sinks:
+            _stream_time_variables(
+                powertrain=self.__powertrain,
+                sinks=sinks,
+                start=stream_start,
+                retain_time_variables=retain_time_variables
+            )
+
+    def _advance_fixed_time_steps(
+        self,
+        time_steps: np.ndarray,
+        time_discretization: TimeInterval,
+        integrator: str
+    ):
+
+        for k in time_steps:
+            self._save_time_step_start(time_step=time_discretization)
+            time = Time(value=float(k), unit=time_discretization.unit)
+            self.__powertrain.update_time(time)
+            if not self._powertrain_is_idle():
+                self._time_integration(
+                    time_discretization=time_discretization,
+                    integrator=integrator,
+                    time=time
+                )
+            yield
+
+    def _advance_adaptive_time_steps(
+        self,
+        time_discretization: TimeInterval,
+        simulation_time: TimeInterval,
+        step_size_control: StepSizeControl
+    ):
+
+        motor = self.__powertrain.elements[0]
+        last_element = self.__powertrain.elements[-1]
+        time_unit = time_discretization.unit
+        minimum_time_step, maximum_time_step = \
+            step_size_control.get_time_step_bounds(
+                time_discretization=time_discretization
+            )
+        initial_time_step = min(
+            max(time_discretization.to('sec').value, minimum_time_step),
+            maximum_time_step
+        )
+        time_step = initial_time_step
+        time = self.__powertrain.time[-1].to('sec').value
+        final_time = time + simulation_time.to('sec').value
+
+        while time < final_time:
+
+            remaining_time = final_time - time
+            step = min(time_step, remaining_time)
+            if remaining_time - step < minimum_time_step:
+                step = remaining_time
+
+            angular_position = last_element.angular_position
+            angular_speed = last_element.angular_speed
+            new_angular_position, new_angular_speed, error = \
+                self._compute_dormand_prince_step(
+                    time=self.__powertrain.time[-1],
+                    time_step=step,
+                    step_size_control=step_size_control
+                )
+
+            time_step = min(
+                max(
+                    _compute_next_time_step(time_step=step, error=error),
+                    minimum_time_step
+                ),
+                maximum_time_step
+            )
+            if error > 1 and step > minimum_time_step:
+                continue
+
+            # the powertrain may lock only at the simulation time steps, so
+            # the step is reduced to stop close to the speed reversal
+            speed = angular_speed._to_value('rad/s')
+            if self.__self_locking and \
+                    not self.__powertrain_is_locked and \
+                    speed*motor.pwm > 0 and new_angular_speed*motor.pwm < 0 \
+                    and step > minimum_time_step:
+                time_step = max(
+                    step*speed/(speed - new_angular_speed),
+                    minimum_time_step
+                )
+                continue
+
+            time = final_time if step == remaining_time else time + step
+            pwm = motor.pwm
+            self._save_time_step_start(
+                time_step=TimeInterval(value=step, unit='sec').to(time_unit)
+            )
+            self.__powertrain.update_time(
+                Time(value=time, unit='sec').to(time_unit)
+            )
+            last_element.angular_position = AngularPosition(
+                value=new_angular_position,
+                unit='rad'
+            ).to(angular_position.unit)
+            last_element.angular_speed = AngularSpeed(
+                value=new_angular_speed,
+                unit='rad/s'
+            ).to(angular_speed.unit)
+            yield
+
+            if motor.pwm != pwm:
+                time_step = initial_time_step
+
+    def _compute_dormand_prince_step(
+        self,
+        time: Time,
+        time_step: float,
+        step_size_control: StepSizeControl
+    ) -> tuple[float, float, float]:
+
+        motor = self.__powertrain.elements[0]
+        last_element = self.__powertrain.elements[-1]
+        initial_time = time.to('sec').value
+
+        def compute_angular_acceleration(
+            time_offset: float,
+            angular_position: float,
+            angular_speed: float
+        ) -> float:
+
+            return self._compute_stage_angular_acceleration(
+                time=Time._new(
+                    value=initial_time + time_offset,
+                    unit='sec'
+                ).to(time.unit),
+                angular_position=AngularPosition._new(
+                    value=angular_position,
+                    unit='rad'
+                ),
+                angular_speed=AngularSpeed._new(
+                    value=angular_speed,
+                    unit='rad/s'
+                )
+            )._to_value('rad/s^2')
+
+        angular_position = last_element.angular_position
+        angular_speed = last_element.angular_speed
+        motor_torque = motor.torque
+        step = _dormand_prince_step(
+            compute_angular_acceleration=compute_angular_acceleration,
+            time_step=time_step,
+            angular_position=angular_position._to_value('rad'),
+            angular_speed=angular_speed._to_value('rad/s'),
+            angular_acceleration=last_element.angular_acceleration.
+            _to_value('rad/s^2'),
+            step_size_control=step_size_control
+        )
+        last_element.angular_position = angular_position
+        last_element.angular_speed = angular_speed
+        motor.torque = motor_torque
+
+        return step
+
+    def _save_time_step_start(self, time_step: TimeInterval):
+
+        motor = self.__powertrain.elements[0]
+        last_element = self.__powertrain.elements[-1]
+        self.__time_step_start = {
+            'time': self.__powertrain.time[-1],
+            'time step': time_step,
+            'angular position': last_element.angular_position,
+            'angular speed': last_element.angular_speed,
+            'angular acceleration': last_element.angular_acceleration,
+            'motor torque': motor.torque,
+            'pwm': motor.pwm,
+            'powertrain is locked': self.__powertrain_is_locked
+        }
+
+    def _check_stop_conditions(
+        self,
+        stop_conditions: list[StopCondition],
+        condition_states: list[bool],
+        integrator: str,
+        step_size_control: StepSizeControl | None
+    ) -> bool:
+
+        events = []
+        stop = False
+        for i, condition in enumerate(stop_conditions):
+            condition_is_valid = condition.check_condition()
+            if condition_is_valid and not condition_states[i]:
+                events.append(condition)
+            elif condition_is_valid and condition.terminal:
+                stop = True
+            condition_states[i] = condition_is_valid
+
+        if not events:
+            return stop
+
+        state = self._save_powertrain_state()
+        fractions = []
+        for condition in events:
+
+            def compute_condition(fraction: float) -> tuple[bool, float]:
+                self._compute_partial_time_step(
+                    fraction=fraction,
+                    integrator=integrator,
+                    step_size_control=step_size_control
+                )
+                return condition.check_condition(), \
+                    condition.compute_residual()
+
+            fractions.append(_locate_event(compute_condition=compute_condition))
+        self._restore_powertrain_state(state=state)
+
+        terminal_fractions = [
+            fraction for condition, fraction in zip(events, fractions)
+            if condition.terminal
+        ]
+        stop_fraction = min(terminal_fractions) if terminal_fractions else 1.0
+        time_step_start = self.__time_step_start
+        for condition, fraction in zip(events, fractions):
+            if fraction <= stop_fraction:
+                condition.add_event_time(
+                    time_step_start['time'] +
+                    time_step_start['time step']*fraction
+                )
+
+        if terminal_fractions and stop_fraction < 1:
+            self.__powertrain.time[-1] = self._compute_partial_time_step(
+                fraction=stop_fraction,
+                integrator=integrator,
+                step_size_control=step_size_control
+            )
+            self._compute_force()
+            self._compute_stress()
+
+        return stop or bool(terminal_fractions)
+
+    def _compute_partial_time_step(
+        self,
+        fraction: float,
+        integrator: str,
+        step_size_control: StepSizeControl | None
+    ) -> Time:
+
+        motor = self.__powertrain.elements[0]
+        last_element = self.__powertrain.elements[-1]
+        time_step_start = self.__time_step_start
+        last_element.angular_position = time_step_start['angular position']
+        last_element.angular_speed = time_step_start['angular speed']
+        last_element.angular_acceleration = \
+            time_step_start['angular acceleration']
+        motor.torque = time_step_start['motor torque']
+        motor.pwm = time_step_start['pwm']
+        self.__powertrain_is_locked = time_step_start['powertrain is locked']
+
+        time = time_step_start['time']
+        if fraction > 0:
+            time_step = time_step_start['time step']*fraction
+            if integrator in ADAPTIVE_INTEGRATORS:
+                angular_position_unit = last_element.angular_position.unit
+                angular_speed_unit = last_element.angular_speed.unit
+                new_angular_position, new_angular_speed, _ = \
+                    self._compute_dormand_prince_step(
+                        time=time,
+                        time_step=time_step.to('sec').value,
+                        step_size_control=step_size_control
+                    )
+                last_element.angular_position = AngularPosition(
+                    value=new_angular_position,
+                    unit='rad'
+                ).to(angular_position_unit)
+                last_element.angular_speed = AngularSpeed(
+                    value=new_angular_speed,
+                    unit='rad/s'
+                ).to(angular_speed_unit)
+                time = time + time_step
+            else:
+                time = time + time_step
+                self._time_integration(
+                    time_discretization=time_step,
+                    integrator=integrator,
+                    time=time
+                )
+
+        self._compute_angular_position_and_speed()
+        if self.__powertrain_is_locked:
+            self._compute_locked_powertrain_angular_speed_and_acceleration()
+        self._compute_load_torque(time=time)
+        self._compute_driving_torque()
+        self._compute_torque()
+        if not self.__powertrain_is_locked:
+            self._compute_angular_acceleration()
+        self._compute_electric_current()
+
+        return time
+
+    def _save_powertrain_state(self) -> dict:
+
+        motor = self.__powertrain.elements[0]
+        return {
+            'elements': [
+                {
+                    variable: getattr(element, variable)
+                    for variable in POWERTRAIN_STATE_VARIABLES
+                } for element in self.__powertrain.elements
+            ],
+            'pwm': motor.pwm,
+            'electric current': motor.electric_current
+            if motor.electric_current_is_computable else None,
+            'powertrain is locked': self.__powertrain_is_locked
+        }
+
+    def _restore_powertrain_state(self, state: dict):
+
+        motor = self.__powertrain.elements[0]
+        for element, element_state in zip(
+            self.__powertrain.elements,
+            state['elements']
+        ):
+            for variable, value in element_state.items():
+                if value is not None:
+                    setattr(element, variable, value)
+        motor.pwm = state['pwm']
+        if state['electric current'] is not None:
+            motor.electric_current = state['electric current']
+        self.__powertrain_is_locked = state['powertrain is locked']
+
+    def _compile(self):
+
+        compiled = self.__powertrain.compiled
+        self.__powertrain_inertia_moment = compiled.inertia_moment
+        self.__self_locking = compiled.self_locking
+        self.__gear_ratios = compiled.gear_ratios.tolist()
+        self.__efficiencies = compiled.efficiencies.tolist()
+        self.__force_elements = compiled.force_elements
+        self.__bending_stress_elements = compiled.bending_stress_elements
+        self.__contact_stress_elements = compiled.contact_stress_elements
+        elements = compiled.elements
+        self.__elements = elements
+        self.__step_functions = _generate_step_functions(
+            topology=_get_topology(
+                gear_ratios=self.__gear_ratios,
+                efficiencies=self.__efficiencies,
+                loaded=[
+                    getattr(element, 'external_torque', None) is not None
+                    for element in elements
+                ]
+            )
+        )
+
+    def _compute_powertrain_variables(
+        self,
+        motor_control: MotorControlBase | None
+    ):
+
+        self._compute_angular_position_and_speed()
+        self._check_powertrain_is_locked()
+        if self.__powertrain_is_locked:
+            self._compute_locked_powertrain_angular_speed_and_acceleration()
+        self._compute_load_torque()
+        self._compute_motor_control(motor_control=motor_control)
+        self._compute_driving_torque()
+        self._compute_torque()
+        if not self.__powertrain_is_locked:
+            self._compute_angular_acceleration()
+        self._compute_force()
+        self._compute_stress()
+        self._compute_electric_current()
+        self.__time_step_computed = True
+
+    def _powertrain_is_idle(self) -> bool:
+
+        # a self-locking powertrain locked with null pwm stays still, since
+        # the time integration leaves its angular position unchanged and the
+        # locking check keeps it locked, so the time variables of the previous
+        # time step are still valid, unless the load torques or the pwm change
+        return self.__self_locking and self.__powertrain_is_locked and \
+            self.__powertrain.elements[0].pwm == 0 and \
+            self.__time_step_computed
+
+    def _fast_forward_locked_time_step(
+        self,
+        motor_control: MotorControlBase | None
+    ) -> bool:
+
+        if not self._powertrain_is_idle():
+            return False
+
+        motor = self.__powertrain.elements[0]
+        load_torques = [
+            (element.load_torque.value, element.load_torque.unit)
+            for element in self.__elements
+        ]
+        self._compute_load_torque()
+        self._compute_motor_control(motor_control=motor_control)
+        if motor.pwm != 0 or load_torques != [
+            (element.load_torque.value, element.load_torque.unit)
+            for element in self.__elements
+        ]:
+            self._compute_driving_torque()
+            self._compute_torque()
+            self._compute_force()
+            self._compute_stress()
+            self._compute_electric_current()
+
+        return True
+
+    def _compute_angular_position_and_speed(self):
+
+        self.__step_functions['compute_angular_position_and_speed'](
+            self.__elements
+        )
+
+    def _compute_motor_control(
+        self,
+        motor_control: MotorControlBase | None
+    ):
+
+        if motor_control is not None:
+            motor_control.apply_rules()
+
+    def _compute_driving_torque(self):
+
+        self.__step_functions['compute_driving_torque'](self.__elements)
+
+    def _compute_load_torque(self, time: Time | None = None):
+
+        if time is None:
+            time = self.__powertrain.time[-1]
+
+        self.__step_functions['compute_load_torque'](self.__elements, time)
+
+    def _compute_torque(self):
+
+        self.__step_functions['compute_torque'](self.__elements)
+
+    def _compute_force(self):
+
+        if self.__deferred_elements:
+            return
+
+        elements = self.__powertrain.elements
+        for i in self.__force_elements:
+            elements[i].compute_tangential_force()
+
+    def _compute_stress(self):
+
+        if self.__deferred_elements:
+            return
+
+        elements = self.__powertrain.elements
+        for i in self.__bending_stress_elements:
+            elements[i].compute_bending_stress()
+        for i in self.__contact_stress_elements:
+            elements[i].compute_contact_stress()
+
+    def _compute_electric_current(self):
+
+        if self.__powertrain.elements[0].electric_current_is_computable:
+            self.__powertrain.elements[0].compute_electric_current()
+
+    def _compute_angular_acceleration(self):
+
+        self.__step_functions['compute_angular_acceleration'](
+            self.__elements,
+            self.__powertrain_inertia_moment
+        )
+
+    def _update_time_variables(self):
+
+        for element in self.__powertrain.elements:
+            if element in self.__deferred_elements:
+                _update_rotating_object_time_variables(element)
+            else:
+                element.update_time_variables()
+
+    def _aggregate_time_variables(self, window: int, aggregation: str):
+
+        if window == 1:
+            return
+
+        self.__powertrain.time.aggregate(window=window)
+        for element in self.__powertrain.elements:
+            deferred = element in self.__deferred_elements
+            for variable, time_variable in element.time_variables.items():
+                if deferred and variable in DEFERRED_TIME_VARIABLES:
+                    continue
+                time_variable.aggregate(
+                    window=window,
+                    aggregation=aggregation
+                )
+
+    def _reserve_time_variables(self, n_steps: int):
+
+        time = self.__powertrain.time
+        time.reserve(len(time) + n_steps)
+        for element in self.__powertrain.elements:
+            for time_variable in element.time_variables.values():
+                time_variable.reserve(len(time_variable) + n_steps)
+
+    def _time_integration(
+        self,
+        time_discretization: TimeInterval,
+        integrator: str,
+        time: Time
+    ):
+
+        last_element = self.__powertrain.elements[-1]
+        if integrator == 'semi-implicit euler':
+            last_element.angular_speed += \
+                last_element.angular_acceleration*time_discretization
+            last_element.angular_position += \
+                last_element.angular_speed*time_discretization
+            return
+
+        if integrator == 'explicit euler':
+            last_element.angular_position += \
+                last_element.angular_speed*time_discretization
+            last_element.angular_speed += \
+                last_element.angular_acceleration*time_discretization
+            return
+
+        # intermediate evaluations overwrite the motor torque, which is needed
+        # to check the powertrain locking condition at the next time step
+        motor_torque = self.__powertrain.elements[0].torque
+        angular_position = last_element.angular_position
+        angular_speed = last_element.angular_speed
+        angular_acceleration = last_element.angular_acceleration
+
+        if integrator == 'heun':
+            angular_position_1 = angular_position + \
+                angular_speed*time_discretization
+            angular_speed_1 = angular_speed + \
+                angular_acceleration*time_discretization
+            angular_acceleration_1 = self._compute_stage_angular_acceleration(
+                time=time,
+                angular_position=angular_position_1,
+                angular_speed=angular_speed_1
+            )
+            last_element.angular_position = angular_position + \
+                (angular_speed + angular_speed_1)*time_discretization/2
+            last_element.angular_speed = angular_speed + \
+                (angular_acceleration + angular_acceleration_1) * \
+                time_discretization/2
+        else:
+            half_time = time - time_discretization/2
+            angular_position_2 = angular_position + \
+                angular_speed*time_discretization/2
+            angular_speed_2 = angular_speed + \
+                angular_acceleration*time_discretization/2
+            angular_acceleration_2 = self._compute_stage_angular_acceleration(
+                time=half_time,
+                angular_position=angular_position_2,
+                angular_speed=angular_speed_2
+            )
+            angular_position_3 = angular_position + \
+                angular_speed_2*time_discretization/2
+            angular_speed_3 = angular_speed + \
+                angular_acceleration_2*time_discretization/2
+            angular_acceleration_3 = self._compute_stage_angular_acceleration(
+                time=half_time,
+                angular_position=angular_position_3,
+                angular_speed=angular_speed_3
+            )
+            angular_position_4 = angular_position + \
+                angular_speed_3*time_discretization
+            angular_speed_4 = angular_speed + \
+                angular_acceleration_3*time_discretization
+            angular_acceleration_4 = self._compute_stage_angular_acceleration(
+                time=time,
+                angular_position=angular_position_4,
+                angular_speed=angular_speed_4
+            )
+            last_element.angular_position = angular_position + (
+                angular_speed + 2*angular_speed_2 + 2*angular_speed_3 +
+                angular_speed_4
+            )*time_discretization/6
+            last_element.angular_speed = angular_speed + (
+                angular_acceleration + 2*angular_acceleration_2 +
+                2*angular_acceleration_3 + angular_acceleration_4
+            )*time_discretization/6
+
+        self.__powertrain.elements[0].torque = motor_torque
+
+    def _compute_stage_angular_acceleration(
+        self,
+        time: Time,
+        angular_position: AngularPosition,
+        angular_speed: AngularSpeed
+    ) -> AngularAcceleration:
+
+        if self.__powertrain_is_locked:
+            return NULL_ANGULAR_ACCELERATION
+
+        last_element = self.__powertrain.elements[-1]
+        last_element.angular_position = angular_position
+        last_element.angular_speed = angular_speed
+        self._compute_angular_position_and_speed()
+        self._compute_load_torque(time=time)
+        self._compute_driving_torque()
+        self._compute_torque()
+
+        return last_element.torque/self.__powertrain_inertia_moment
+
+    def _check_powertrain_is_locked(self):
+
+        motor = self.__powertrain.elements[0]
+        if self.__self_locking and (
+            motor.pwm == 0 or
+            (motor.pwm > 0 and motor.angular_speed < NULL_ANGULAR_SPEED) or
+            (motor.pwm < 0 and motor.angular_speed > NULL_ANGULAR_SPEED)
+        ):
+            self.__powertrain_is_locked = True
+            return
+
+        if motor.torque is not None:
+            if (motor.torque > NULL_TORQUE and motor.pwm > 0) or \
+                    (motor.torque < NULL_TORQUE and motor.pwm < 0):
+                self.__powertrain_is_locked = False
+
+    def _compute_locked_powertrain_angular_speed_and_acceleration(self):
+
+        for element in self.__powertrain.elements:
+            element.angular_speed = NULL_ANGULAR_SPEED
+            element.angular_acceleration = NULL_ANGULAR_ACCELERATION
@@ -0,0 +1,251 @@
+from gearpy.mechanical_objects import DCMotor, RotatingObject
+from gearpy.powertrain import Powertrain
+from gearpy.units import (
+    AngularAcceleration,
+    AngularPosition,
+    AngularSpeed,
+    Time,
+    Torque
+)
+from .code_generation import _generate_step_functions, _get_topology
+
+
+NULL_ANGULAR_ACCELERATION = AngularAcceleration(0, 'rad/s^2')
+MAXIMUM_BRACKET_EXPANSIONS = 60
+
+
+class SteadyStateSolver:
+    r""":py:class:`SteadyStateSolver <gearpy.solver.steady_state_solver.SteadyStateSolver>`
+    object. \n
+    It computes the steady-state operating point of a powertrain driven by a
+    :py:class:`DCMotor <gearpy.mechanical_objects.dc_motor.DCMotor>` at
+    constant PWM and under a constant load, without simulating the
+    transient. \n
+    The steady state is the one at which the angular acceleration computed by
+    :py:meth:`Solver.run <gearpy.solver.Solver.run>` is null, so the driving
+    torque transmitted to the last element in the powertrain elements, through
+    the same gear ratios and efficiencies of the simulation, balances the load
+    torque of its ``external_torque`` function, which must be the only load in
+    the powertrain. The angular speed of the last element which balances the
+    torques is found with a scalar root-finder, then the variables of all the
+    powertrain elements are computed in a single pass.
+
+    Methods
+    -------
+    :py:meth:`run`
+        It computes the steady-state operating point of the powertrain.
+
+    .. admonition:: Raises
+       :class: warning
+
+       ``TypeError``
+           - If ``powertrain`` is not an instance of
+             :py:class:`Powertrain <gearpy.powertrain.Powertrain>`,
+           - if the first element in ``powertrain`` is not an instance of
+             :py:class:`DCMotor <gearpy.mechanical_objects.dc_motor.DCMotor>`,
+           - if an element of ``powertrain`` is not an instance of
+             :py:class:`RotatingObject <gearpy.mechanical_objects.mechanical_object_base.RotatingObject>`.
+       ``ValueError``
+           If
+           :py:attr:`Powertrain.elements <gearpy.powertrain.Powertrain.elements>`
+           is an empty :py:class:`tuple`.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:class:`Solver <gearpy.solver.Solver>`
+    """
+
+    def __init__(self, powertrain: Powertrain):
+        if not isinstance(powertrain, Powertrain):
+            raise TypeError(
+                f"Parameter 'powertrain' must be an instance of "
+                f"{Powertrain.__name__!r}."
+            )
+
+        if not powertrain.elements:
+            raise ValueError(
+                "Parameter 'powertrain.elements' cannot be an empty tuple."
+            )
+
+        if not isinstance(powertrain.elements[0], DCMotor):
+            raise TypeError(
+                f"First element in 'powertrain' must be an instance of "
+                f"{DCMotor.__name__!r}."
+            )
+
+        if not all(
+            [isinstance(element, RotatingObject)
+                for element in powertrain.elements]
+        ):
+            raise TypeError(
+                f"All elements of 'powertrain' must be instances of "
+                f"{RotatingObject.__name__!r}."
+            )
+
+        self.__powertrain = powertrain
+
+    def run(self, time: Time | None = None) -> None:
+        """It computes the steady-state operating point of the powertrain at
+        the current motor
+        :py:attr:`pwm <gearpy.mechanical_objects.dc_motor.DCMotor.pwm>`. \n
+        It sets angular position, angular speed, angular acceleration,
+        torque, driving torque and load torque of each powertrain element,
+        the electric current of the motor (if computable) and the tangential
+        force, bending stress and contact stress of the gears (if
+        computable). The time variables are not updated.
+
+        Parameters
+        ----------
+        ``time`` : :py:class:`Time <gearpy.units.units.Time>`, optional
+            Time instant passed to the ``external_torque`` functions. Default
+            is :py:obj:`None`, so ``0 sec`` is used.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               - If ``time`` is not an instance of
+                 :py:class:`Time <gearpy.units.units.Time>`,
+               - if function ``external_torque`` of one gear in the powertrain
+                 elements does not return an instance of
+                 :py:class:`Torque <gearpy.units.units.Torque>`.
+           ``ValueError``
+               - If function ``external_torque`` has not been defined for the
+                 last element in the powertrain elements,
+               - if function ``external_torque`` has been defined for an
+                 element other than the last one in the powertrain elements,
+               - if no angular speed balances the driving torque and the load
+                 torque of the last element in the powertrain elements.
+
+        .. admonition:: Notes
+           :class: tip
+
+           The load is supposed to be constant, or to depend only on the
+           angular speed: the ``external_torque`` functions are evaluated at
+           ``time`` and at the current angular position of the last element in
+           the powertrain elements, or at ``0 rad`` if it is not set, which is
+           kept. \n
+           If the powertrain is self-locking and the motor PWM is null, or the
+           balancing angular speed is opposite to the motor PWM, then the
+           powertrain is locked, so angular speeds are null, as in
+           :py:meth:`Solver.run <gearpy.solver.Solver.run>`.
+        """
+        if not isinstance(time, Time) and time is not None:
+            raise TypeError(
+                f"Parameter 'time' must be an instance of {Time.__name__!r}."
+            )
+
+        if time is None:
+            time = Time(value=0, unit='sec')
+
+        elements = self.__powertrain.elements
+        motor = elements[0]
+        last_element = elements[-1]
+        external_torque = getattr(last_element, 'external_torque', None)
+        if external_torque is None:
+            raise ValueError(
+                "The function 'external_torque' has not been defined for the "
+                "last element of the powertrain. Add this function to the "
+                "last element."
+            )
+        for element in elements[1:-1]:
+            if getattr(element, 'external_torque', None) is not None:
+                raise ValueError(
+                    f"The function 'external_torque' has been defined for "
+                    f"{element.name!r}, which is not the last element of the "
+                    f"powertrain. The steady state can be computed only with "
+                    f"the load applied to the last element."
+                )
+
+        compiled = self.__powertrain.compiled
+        angular_position = last_element.angular_position
+        if angular_position is None:
+            angular_position = AngularPosition(value=0, unit='rad')
+        torque_intercept, torque_slope, _, _ = \
+            motor._get_characteristic(pwm=motor.pwm)
+        kinematic_gain = float(compiled.kinematic_gains[0])
+        driving_torque_gain = float(compiled.driving_torque_gains[-1])
+
+        def compute_torque(angular_speed: float) -> float:
+
+            load_torque = external_torque(
+                time=time,
+                angular_position=angular_position,
+                angular_speed=AngularSpeed(value=angular_speed, unit='rad/s')
+            )
+            if not isinstance(load_torque, Torque):
+                raise TypeError(
+                    f"Function 'external_torque' of {last_element.name!r} "
+                    f"must return an instance of {Torque.__name__!r}."
+                )
+
+            return driving_torque_gain*(
+                torque_intercept - torque_slope*kinematic_gain*angular_speed
+            ) - load_torque.to('Nm').value
+
+        if compiled.self_locking and motor.pwm == 0:
+            angular_speed = 0.0
+        else:
+            angular_speed = _find_root(
+                function=compute_torque,
+                guess=torque_intercept/(torque_slope*kinematic_gain)
+                if torque_slope != 0 else 0.0
+            )
+            if compiled.self_locking and angular_speed*motor.pwm < 0:
+                angular_speed = 0.0
+
+        last_element.angular_position = angular_position
+        last_element.angular_speed = AngularSpeed(
+            value=angular_speed,
+            unit='rad/s'
+        )
+        step_functions = _generate_step_functions(
+            topology=_get_topology(
+                gear_ratios=compiled.gear_ratios.tolist(),
+                efficiencies=compiled.efficiencies.tolist(),
+                loaded=[
+                    getattr(element, 'external_torque', None) is not None
+                    for element in elements
+                ]
+            )
+        )
+        step_functions['compute_angular_position_and_speed'](elements)
+        step_functions['compute_load_torque'](elements, time)
+        step_functions['compute_driving_torque'](elements)
+        step_functions['compute_torque'](elements)
+        for element in elements:
+            element.angular_acceleration = NULL_ANGULAR_ACCELERATION
+        for i in compiled.force_elements:
+            elements[i].compute_tangential_force()
+        for i in compiled.bending_stress_elements:
+            elements[i].compute_bending_stress()
+        for i in compiled.contact_stress_elements:
+            elements[i].compute_contact_stress()
+        if motor.electric_current_is_computable:
+            motor.compute_electric_current()
+
+
+def _find_root(function, guess: float) -> float:
+
+    # the root is bracketed between zero and the guess, and the bracket is
+    # expanded on both sides until the function changes sign
+    from scipy.optimize import brentq
+
+    lower, upper = sorted((0.0, guess))
+    if lower == upper:
+        lower, upper = -1.0, 1.0
+    lower_value, upper_value = function(lower), function(upper)
+    for _ in range(MAXIMUM_BRACKET_EXPANSIONS):
+        if lower_value*upper_value <= 0:
+            return brentq(function, lower, upper)
+
+        width = upper - lower
+        lower -= width
+        upper += width
+        lower_value, upper_value = function(lower), function(upper)
+
+    raise ValueError(
+        "No angular speed balances the driving torque and the load torque of "
+        "the last element of the powertrain."
+    )
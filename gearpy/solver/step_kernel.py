@@ -0,0 +1,147 @@
+from functools import cache
+from typing import Callable
+import numpy as np
+
+
+# positions of the scalar state of the powertrain in the state array shared by
+# the step kernels
+LAST_ANGULAR_POSITION = 0
+LAST_ANGULAR_SPEED = 1
+MOTOR_TORQUE = 2
+PWM = 3
+POWERTRAIN_IS_LOCKED = 4
+ANGULAR_SPEED_TOLERANCE = 5
+TORQUE_TOLERANCE = 6
+ELECTRIC_CURRENT = 7
+STATE_SIZE = 8
+KERNEL_INTEGRATORS = ('semi-implicit euler', 'explicit euler')
+KERNEL_AGGREGATIONS = ('last', 'mean', 'min', 'max')
+
+
+def _advance_angular_state(
+    state: np.ndarray,
+    time_step: float,
+    explicit: bool,
+    self_locking: bool,
+    kinematic_gain: np.ndarray,
+    angular_position: np.ndarray,
+    angular_speed: np.ndarray,
+    angular_acceleration: np.ndarray
+) -> None:
+
+    # time integration of the last element, followed by the angular position
+    # and speed of all the elements and by the powertrain locking check, with
+    # the same operations of ArrayEngine, so that results are bit-for-bit
+    # identical
+    last_angular_position = state[LAST_ANGULAR_POSITION]
+    last_angular_speed = state[LAST_ANGULAR_SPEED]
+    last_angular_acceleration = angular_acceleration[-1]
+    if explicit:
+        state[LAST_ANGULAR_POSITION] = \
+            last_angular_position + last_angular_speed*time_step
+        state[LAST_ANGULAR_SPEED] = \
+            last_angular_speed + last_angular_acceleration*time_step
+    else:
+        state[LAST_ANGULAR_SPEED] = \
+            last_angular_speed + last_angular_acceleration*time_step
+        state[LAST_ANGULAR_POSITION] = \
+            last_angular_position + state[LAST_ANGULAR_SPEED]*time_step
+
+    angular_position[:] = kinematic_gain*state[LAST_ANGULAR_POSITION]
+    angular_speed[:] = kinematic_gain*state[LAST_ANGULAR_SPEED]
+
+    # a null motor torque before the first time step is a NaN, which never
+    # unlocks the powertrain
+    motor_angular_speed = angular_speed[0]
+    angular_speed_tolerance = state[ANGULAR_SPEED_TOLERANCE]
+    motor_torque = state[MOTOR_TORQUE]
+    torque_tolerance = state[TORQUE_TOLERANCE]
+    pwm = state[PWM]
+    if self_locking and (
+        pwm == 0 or
+        (pwm > 0 and motor_angular_speed < -angular_speed_tolerance) or
+        (pwm < 0 and motor_angular_speed > angular_speed_tolerance)
+    ):
+        state[POWERTRAIN_IS_LOCKED] = 1.0
+    elif (motor_torque > torque_tolerance and pwm > 0) or \
+            (motor_torque < -torque_tolerance and pwm < 0):
+        state[POWERTRAIN_IS_LOCKED] = 0.0
+
+    if state[POWERTRAIN_IS_LOCKED] != 0:
+        angular_speed[:] = 0.0
+        angular_acceleration[:] = 0.0
+        state[LAST_ANGULAR_SPEED] = 0.0
+        state[ANGULAR_SPEED_TOLERANCE] = 0.0
+
+
+def _compute_and_record_torques(
+    state: np.ndarray,
+    characteristic: np.ndarray,
+    electric_current_is_computable: bool,
+    kinematic_gain: np.ndarray,
+    driving_torque_gain: np.ndarray,
+    load_source: np.ndarray,
+    load_torque_gain: np.ndarray,
+    inertia_moment: float,
+    angular_position: np.ndarray,
+    angular_speed: np.ndarray,
+    angular_acceleration: np.ndarray,
+    torque: np.ndarray,
+    driving_torque: np.ndarray,
+    load_torque: np.ndarray,
+    row: np.ndarray,
+    buffer: np.ndarray,
+    buffer_length: int,
+    window_length: int,
+    aggregation: int
+) -> None:
+
+    # load_torque already holds the external torques of the loaded elements,
+    # which are propagated to the other elements
+    load_torque[:] = load_torque[load_source]*load_torque_gain
+    motor_torque = characteristic[0] - characteristic[1]*angular_speed[0]
+    driving_torque[:] = driving_torque_gain*motor_torque
+    torque[:] = driving_torque - load_torque
+    state[MOTOR_TORQUE] = torque[0]
+    if state[POWERTRAIN_IS_LOCKED] == 0:
+        angular_acceleration[:] = \
+            kinematic_gain*(torque[-1]/inertia_moment)
+    if electric_current_is_computable:
+        state[ELECTRIC_CURRENT] = \
+            characteristic[2] + characteristic[3]*driving_torque[0]
+
+    n = angular_position.size
+    row[0:n] = angular_position
+    row[n:2*n] = angular_speed
+    row[2*n:3*n] = angular_acceleration
+    row[3*n:4*n] = torque
+    row[4*n:5*n] = driving_torque
+    row[5*n:6*n] = load_torque
+    row[6*n] = state[PWM]
+    if electric_current_is_computable:
+        row[6*n + 1] = state[ELECTRIC_CURRENT]
+
+    # same aggregation of the recording window of ArrayEngine
+    recorded = buffer[buffer_length]
+    if window_length == 0 or aggregation == 0:
+        recorded[:] = row
+    elif aggregation == 1:
+        recorded += row
+    elif aggregation == 2:
+        recorded[:] = np.minimum(recorded, row)
+    else:
+        recorded[:] = np.maximum(recorded, row)
+
+
+@cache
+def _load_step_kernels() -> tuple[Callable, Callable]:
+
+    # the kernels are compiled with Numba, if available, the first time they
+    # are needed, otherwise they run as plain NumPy functions
+    try:
+        from numba import njit
+    except ImportError:
+        return _advance_angular_state, _compute_and_record_torques
+
+    return njit(cache=True)(_advance_angular_state), \
+        njit(cache=True)(_compute_and_record_torques)
@@ -0,0 +1,340 @@
+from gearpy.units import TimeInterval
+from typing import Callable
+import numpy as np
+
+
+# Dormand-Prince 5(4) Butcher tableau
+DORMAND_PRINCE_NODES = (0, 1/5, 3/10, 4/5, 8/9, 1, 1)
+DORMAND_PRINCE_COEFFICIENTS = (
+    (),
+    (1/5,),
+    (3/40, 9/40),
+    (44/45, -56/15, 32/9),
+    (19372/6561, -25360/2187, 64448/6561, -212/729),
+    (9017/3168, -355/33, 46732/5247, 49/176, -5103/18656),
+    (35/384, 0, 500/1113, 125/192, -2187/6784, 11/84)
+)
+DORMAND_PRINCE_WEIGHTS = DORMAND_PRINCE_COEFFICIENTS[-1] + (0,)
+DORMAND_PRINCE_ERROR_WEIGHTS = (
+    71/57600, 0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40
+)
+SAFETY_FACTOR = 0.9
+MINIMUM_STEP_FACTOR = 0.2
+MAXIMUM_STEP_FACTOR = 5.0
+MINIMUM_TIME_DISCRETIZATION_RATIO = 1e-3
+
+
+class StepSizeControl:
+    r""":py:class:`StepSizeControl <gearpy.solver.step_size_control.StepSizeControl>`
+    object. \n
+    It defines the error control of the adaptive ``'dormand-prince'``
+    integrator of :py:meth:`Solver.run <gearpy.solver.Solver.run>`. \n
+    At each time step the integrator estimates the local error of the
+    angular position and speed of the last element in the powertrain
+    elements, through the embedded fourth order solution of the
+    Dormand-Prince 5(4) pair. The time step is accepted if the error, scaled
+    by :py:attr:`absolute_tolerance` plus :py:attr:`relative_tolerance`
+    times the magnitude of the state, is not greater than ``1``, otherwise
+    it is rejected and repeated with a smaller time step. In both cases the
+    next time step is estimated from the error, within
+    :py:attr:`minimum_time_discretization` and
+    :py:attr:`maximum_time_discretization`.
+
+    Attributes
+    ----------
+    :py:attr:`relative_tolerance` : :py:class:`float`
+        Relative tolerance of the local error.
+    :py:attr:`absolute_tolerance` : :py:class:`float`
+        Absolute tolerance of the local error.
+    :py:attr:`minimum_time_discretization` : :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`
+        Minimum time step of the simulation.
+    :py:attr:`maximum_time_discretization` : :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`
+        Maximum time step of the simulation.
+
+    Methods
+    -------
+    :py:meth:`get_time_step_bounds`
+        It computes the minimum and maximum time steps of the simulation.
+
+    .. admonition:: Raises
+       :class: warning
+
+       ``TypeError``
+           - If ``relative_tolerance`` is not a :py:class:`float` or an
+             :py:class:`int`,
+           - if ``absolute_tolerance`` is not a :py:class:`float` or an
+             :py:class:`int`,
+           - if ``minimum_time_discretization`` is not an instance of
+             :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`,
+           - if ``maximum_time_discretization`` is not an instance of
+             :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`.
+       ``ValueError``
+           - If ``relative_tolerance`` is not positive,
+           - if ``absolute_tolerance`` is not positive,
+           - if ``minimum_time_discretization`` is greater than
+             ``maximum_time_discretization``.
+
+    .. admonition:: Notes
+       :class: tip
+
+       The angular position and speed are compared with the tolerances in
+       SI units, so in radians and radians per second respectively.
+    """
+
+    def __init__(
+        self,
+        relative_tolerance: float | int = 1e-3,
+        absolute_tolerance: float | int = 1e-6,
+        minimum_time_discretization: TimeInterval | None = None,
+        maximum_time_discretization: TimeInterval | None = None
+    ):
+        if not isinstance(relative_tolerance, float | int) or \
+                isinstance(relative_tolerance, bool):
+            raise TypeError(
+                "Parameter 'relative_tolerance' must be a float or an integer."
+            )
+
+        if relative_tolerance <= 0:
+            raise ValueError("Parameter 'relative_tolerance' must be positive.")
+
+        if not isinstance(absolute_tolerance, float | int) or \
+                isinstance(absolute_tolerance, bool):
+            raise TypeError(
+                "Parameter 'absolute_tolerance' must be a float or an integer."
+            )
+
+        if absolute_tolerance <= 0:
+            raise ValueError("Parameter 'absolute_tolerance' must be positive.")
+
+        if not isinstance(minimum_time_discretization, TimeInterval) and \
+                minimum_time_discretization is not None:
+            raise TypeError(
+                f"Parameter 'minimum_time_discretization' must be an instance "
+                f"of {TimeInterval.__name__!r}."
+            )
+
+        if not isinstance(maximum_time_discretization, TimeInterval) and \
+                maximum_time_discretization is not None:
+            raise TypeError(
+                f"Parameter 'maximum_time_discretization' must be an instance "
+                f"of {TimeInterval.__name__!r}."
+            )
+
+        if minimum_time_discretization is not None and \
+                maximum_time_discretization is not None:
+            if minimum_time_discretization > maximum_time_discretization:
+                raise ValueError(
+                    "Parameter 'minimum_time_discretization' cannot be greater "
+                    "than 'maximum_time_discretization'."
+                )
+
+        self.__relative_tolerance = relative_tolerance
+        self.__absolute_tolerance = absolute_tolerance
+        self.__minimum_time_discretization = minimum_time_discretization
+        self.__maximum_time_discretization = maximum_time_discretization
+
+    @property
+    def relative_tolerance(self) -> float | int:
+        """Relative tolerance of the local error. It must be positive.
+
+        Returns
+        -------
+        :py:class:`float` or :py:class:`int`
+            Relative tolerance of the local error.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If :py:attr:`relative_tolerance` is not a :py:class:`float`
+               or an :py:class:`int`.
+           ``ValueError``
+               If :py:attr:`relative_tolerance` is not positive.
+        """
+        return self.__relative_tolerance
+
+    @property
+    def absolute_tolerance(self) -> float | int:
+        """Absolute tolerance of the local error. It must be positive.
+
+        Returns
+        -------
+        :py:class:`float` or :py:class:`int`
+            Absolute tolerance of the local error.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If :py:attr:`absolute_tolerance` is not a :py:class:`float`
+               or an :py:class:`int`.
+           ``ValueError``
+               If :py:attr:`absolute_tolerance` is not positive.
+        """
+        return self.__absolute_tolerance
+
+    @property
+    def minimum_time_discretization(self) -> TimeInterval | None:
+        """Minimum time step of the simulation. Time steps are accepted
+        regardless of the local error if they cannot be further reduced. If
+        it is :py:obj:`None`, then it is a thousandth of the initial time
+        discretization.
+
+        Returns
+        -------
+        :py:class:`TimeInterval <gearpy.units.units.TimeInterval>` or :py:obj:`None`
+            Minimum time step of the simulation.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If :py:attr:`minimum_time_discretization` is not an instance
+               of :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`.
+           ``ValueError``
+               If :py:attr:`minimum_time_discretization` is greater than
+               :py:attr:`maximum_time_discretization`.
+        """
+        return self.__minimum_time_discretization
+
+    @property
+    def maximum_time_discretization(self) -> TimeInterval | None:
+        """Maximum time step of the simulation. Since motor control rules
+        are applied only at the simulation time steps, it also bounds the
+        delay with which the motor PWM reacts to the powertrain state. If it
+        is :py:obj:`None`, then the time step is not bounded.
+
+        Returns
+        -------
+        :py:class:`TimeInterval <gearpy.units.units.TimeInterval>` or :py:obj:`None`
+            Maximum time step of the simulation.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If :py:attr:`maximum_time_discretization` is not an instance
+               of :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`.
+        """
+        return self.__maximum_time_discretization
+
+    def get_time_step_bounds(
+        self,
+        time_discretization: TimeInterval
+    ) -> tuple[float, float]:
+        """It computes the minimum and maximum time steps of the simulation,
+        in seconds.
+
+        Parameters
+        ----------
+        ``time_discretization`` : :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`
+            Initial time discretization of the simulation.
+
+        Returns
+        -------
+        :py:class:`tuple`
+            Minimum and maximum time steps of the simulation, in seconds.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If ``time_discretization`` is not an instance of
+               :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`.
+        """
+        if not isinstance(time_discretization, TimeInterval):
+            raise TypeError(
+                f"Parameter 'time_discretization' must be an instance of "
+                f"{TimeInterval.__name__!r}."
+            )
+
+        if self.__minimum_time_discretization is None:
+            minimum_time_step = time_discretization.to('sec').value * \
+                MINIMUM_TIME_DISCRETIZATION_RATIO
+        else:
+            minimum_time_step = \
+                self.__minimum_time_discretization.to('sec').value
+
+        if self.__maximum_time_discretization is None:
+            maximum_time_step = np.inf
+        else:
+            maximum_time_step = \
+                self.__maximum_time_discretization.to('sec').value
+
+        return minimum_time_step, max(minimum_time_step, maximum_time_step)
+
+
+def _dormand_prince_step(
+    compute_angular_acceleration: Callable[[float, float, float], float],
+    time_step: float,
+    angular_position: float,
+    angular_speed: float,
+    angular_acceleration: float,
+    step_size_control: StepSizeControl
+) -> tuple[float, float, float]:
+
+    # the state is made of angular position and speed, whose derivatives are
+    # angular speed and acceleration respectively
+    speeds = [angular_speed]
+    accelerations = [angular_acceleration]
+    for node, coefficients in zip(
+        DORMAND_PRINCE_NODES[1:],
+        DORMAND_PRINCE_COEFFICIENTS[1:]
+    ):
+        stage_angular_position = angular_position + time_step*sum(
+            coefficient*speed
+            for coefficient, speed in zip(coefficients, speeds)
+        )
+        stage_angular_speed = angular_speed + time_step*sum(
+            coefficient*acceleration
+            for coefficient, acceleration in zip(coefficients, accelerations)
+        )
+        speeds.append(stage_angular_speed)
+        accelerations.append(compute_angular_acceleration(
+            node*time_step,
+            stage_angular_position,
+            stage_angular_speed
+        ))
+
+    # last stage is evaluated at the 5th order solution
+    new_angular_position = stage_angular_position
+    new_angular_speed = stage_angular_speed
+    angular_position_error = time_step*sum(
+        weight*speed
+        for weight, speed in zip(DORMAND_PRINCE_ERROR_WEIGHTS, speeds)
+    )
+    angular_speed_error = time_step*sum(
+        weight*acceleration
+        for weight, acceleration in zip(
+            DORMAND_PRINCE_ERROR_WEIGHTS,
+            accelerations
+        )
+    )
+
+    relative_tolerance = step_size_control.relative_tolerance
+    absolute_tolerance = step_size_control.absolute_tolerance
+    angular_position_scale = absolute_tolerance + relative_tolerance*max(
+        abs(angular_position), abs(new_angular_position)
+    )
+    angular_speed_scale = absolute_tolerance + relative_tolerance*max(
+        abs(angular_speed), abs(new_angular_speed)
+    )
+    error = np.sqrt((
+        (angular_position_error/angular_position_scale)**2 +
+        (angular_speed_error/angular_speed_scale)**2
+    )/2)
+
+    return new_angular_position, new_angular_speed, error
+
+
+def _compute_next_time_step(time_step: float, error: float) -> float:
+
+    if error == 0 or not np.isfinite(error):
+        factor = MAXIMUM_STEP_FACTOR if error == 0 else MINIMUM_STEP_FACTOR
+    else:
+        factor = min(
+            MAXIMUM_STEP_FACTOR,
+            max(MINIMUM_STEP_FACTOR, SAFETY_FACTOR*error**(-1/5))
+        )
+
+    return time_step*factor
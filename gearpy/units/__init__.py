@@ -1,17 +1,32 @@
 __all__ = [
     "AngularPosition",
+    "AngularPositionArray",
     "Angle",
+    "AngleArray",
     "AngularSpeed",
+    "AngularSpeedArray",
     "AngularAcceleration",
+    "AngularAccelerationArray",
     "Current",
+    "CurrentArray",
     "Force",
+    "ForceArray",
     "InertiaMoment",
+    "InertiaMomentArray",
     "Length",
+    "LengthArray",
     "Stress",
+    "StressArray",
     "Surface",
+    "SurfaceArray",
     "Torque",
+    "TorqueArray",
     "Time",
+    "TimeArray",
     "TimeInterval",
+    "TimeIntervalArray",
+    "TimeSeries",
+    "UnitArrayBase",
     "UnitBase"
 ]
 
@@ -31,4 +46,21 @@ from .units import (
     Time,
     TimeInterval
 )
+from .unit_arrays import (
+    AngularPositionArray,
+    AngleArray,
+    AngularSpeedArray,
+    AngularAccelerationArray,
+    CurrentArray,
+    ForceArray,
+    InertiaMomentArray,
+    LengthArray,
+    StressArray,
+    SurfaceArray,
+    TorqueArray,
+    TimeArray,
+    TimeIntervalArray
+)
+from .time_series import TimeSeries
+from .unit_array_base import UnitArrayBase
 from .unit_base import UnitBase
@@ -0,0 +1,628 @@
+from __future__ import annotations
+from collections.abc import Iterable, MutableSequence
+from .unit_array_base import UnitArrayBase
+from .unit_base import UnitBase
+import numpy as np
+
+
+MINIMUM_CAPACITY = 16
+AGGREGATIONS = {
+    'last': lambda values: values[-1],
+    'mean': np.mean,
+    'min': np.min,
+    'max': np.max
+}
+
+
+class TimeSeries(MutableSequence):
+    r""":py:class:`TimeSeries <gearpy.units.time_series.TimeSeries>` object. \n
+    Columnar storage of the values of a time variable. \n
+    Values are stored in a preallocated :py:class:`numpy.ndarray` of floats,
+    all expressed in the same :py:attr:`unit`, which is the unit of the first
+    stored value. The buffer is grown geometrically when it is full, so
+    appending a value has an amortized constant cost and each stored value
+    takes 8 bytes. \n
+    It behaves like a :py:class:`list` of unit objects: indexing, iterating
+    and appending work on instances of :py:attr:`unit_class`, which are
+    created on demand. If :py:attr:`unit_class` is :py:obj:`None`, then the
+    series stores dimensionless numbers, like
+    :py:attr:`DCMotor.pwm <gearpy.mechanical_objects.dc_motor.DCMotor.pwm>`.
+
+    Attributes
+    ----------
+    :py:attr:`unit_class` : :py:class:`type`
+        Class of the unit objects stored in the series.
+    :py:attr:`unit` : :py:class:`str`
+        Symbol of the unit of measurement in which values are stored.
+    :py:attr:`capacity` : :py:class:`int`
+        Number of values the series can store before growing its buffer.
+
+    Methods
+    -------
+    :py:meth:`aggregate`
+        It replaces the last values of the series with a single aggregated
+        value.
+    :py:meth:`append`
+        It appends a value at the end of the series.
+    :py:meth:`extend_values`
+        It appends an array of numerical values at the end of the series.
+    :py:meth:`get_array`
+        It gets the values of the series as a unit array.
+    :py:meth:`get_values`
+        It gets the numerical values of the series as a
+        :py:class:`numpy.ndarray`.
+    :py:meth:`reserve`
+        It preallocates the buffer in order to store at least ``capacity``
+        values.
+
+    .. admonition:: Raises
+       :class: warning
+
+       ``TypeError``
+           If ``unit_class`` is not a subclass of
+           :py:class:`UnitBase <gearpy.units.unit_base.UnitBase>`.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:attr:`Powertrain.time <gearpy.powertrain.Powertrain.time>` \n
+       :py:attr:`RotatingObject.time_variables <gearpy.mechanical_objects.mechanical_object_base.RotatingObject.time_variables>`
+    """
+
+    def __init__(self, unit_class: type[UnitBase] | None = None):
+        if unit_class is not None:
+            if not isinstance(unit_class, type) or \
+                    not issubclass(unit_class, UnitBase):
+                raise TypeError(
+                    f"Parameter 'unit_class' must be a subclass of "
+                    f"{UnitBase.__name__!r}."
+                )
+
+        self.__unit_class = unit_class
+        self.__unit = None
+        self.__values = np.empty(0)
+        self.__missing = None
+        self.__length = 0
+
+    @property
+    def unit_class(self) -> type[UnitBase] | None:
+        """Class of the unit objects stored in the series. If it is
+        :py:obj:`None`, then the series stores dimensionless numbers.
+
+        Returns
+        -------
+        :py:class:`type` or :py:obj:`None`
+            Class of the unit objects stored in the series.
+        """
+        return self.__unit_class
+
+    @property
+    def unit(self) -> str | None:
+        """Symbol of the unit of measurement in which values are stored. It is
+        the unit of the first value stored in the series and it is
+        :py:obj:`None` if the series is empty or if it stores dimensionless
+        numbers.
+
+        Returns
+        -------
+        :py:class:`str` or :py:obj:`None`
+            Symbol of the unit of measurement in which values are stored.
+        """
+        return self.__unit
+
+    @property
+    def capacity(self) -> int:
+        """Number of values the series can store before growing its buffer.
+
+        Returns
+        -------
+        :py:class:`int`
+            Number of values the series can store before growing its buffer.
+
+        .. admonition:: See Also
+           :class: seealso
+
+           :py:meth:`reserve`
+        """
+        return len(self.__values)
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __getitem__(
+        self,
+        index: int | slice
+    ) -> UnitBase | float | None | list[UnitBase | float | None]:
+        if isinstance(index, slice):
+            return [
+                self._get_item(i) for i in range(self.__length)[index]
+            ]
+
+        return self._get_item(range(self.__length)[index])
+
+    def __setitem__(self, index: int | slice, value):
+        if isinstance(index, slice):
+            positions = range(self.__length)[index]
+            value = list(value)
+            if len(value) != len(positions):
+                raise ValueError(
+                    f"Cannot assign {len(value)} values to a slice of "
+                    f"{len(positions)} elements."
+                )
+            for i, item in zip(positions, value):
+                self._set_item(i, item)
+        else:
+            self._set_item(range(self.__length)[index], value)
+
+    def __delitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            positions = list(range(self.__length)[index])
+        else:
+            positions = [range(self.__length)[index]]
+
+        values = np.delete(self.__values[:self.__length], positions)
+        self.__values[:len(values)] = values
+        if self.__missing is not None:
+            missing = np.delete(self.__missing[:self.__length], positions)
+            self.__missing[:len(missing)] = missing
+        self.__length = len(values)
+
+    def __iter__(self):
+        for i in range(self.__length):
+            yield self._get_item(i)
+
+    def __eq__(self, other: TimeSeries | list) -> bool:
+        if not isinstance(other, TimeSeries | list):
+            return NotImplemented
+
+        if len(self) != len(other):
+            return False
+
+        return all(item == other_item for item, other_item in zip(self, other))
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def insert(self, index: int, value: UnitBase | float | int | None):
+        """It inserts a value before ``index``.
+
+        Parameters
+        ----------
+        ``index`` : :py:class:`int`
+            Position before which to insert the value.
+        ``value`` : :py:class:`UnitBase <gearpy.units.unit_base.UnitBase>` or :py:class:`float` or :py:class:`int`
+            Value to be inserted.
+        """
+        index = max(0, min(
+            index + self.__length if index < 0 else index,
+            self.__length
+        ))
+        value = self._convert(value)
+        if self.__length == len(self.__values):
+            self._grow(self.__length + 1)
+
+        self.__values[index + 1:self.__length + 1] = \
+            self.__values[index:self.__length].copy()
+        if self.__missing is not None:
+            self.__missing[index + 1:self.__length + 1] = \
+                self.__missing[index:self.__length].copy()
+        self.__length += 1
+        self._store(index, value)
+
+    def append(self, value: UnitBase | float | int | None) -> None:
+        """It appends a value at the end of the series. \n
+        The value is converted to the series :py:attr:`unit` before being
+        stored.
+
+        Parameters
+        ----------
+        ``value`` : :py:class:`UnitBase <gearpy.units.unit_base.UnitBase>` or :py:class:`float` or :py:class:`int`
+            Value to be appended. It must be an instance of
+            :py:attr:`unit_class` or a :py:class:`float` or an
+            :py:class:`int` if :py:attr:`unit_class` is :py:obj:`None`. A
+            :py:obj:`None` value is stored as a missing value.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If ``value`` is not an instance of :py:attr:`unit_class`.
+        """
+        value = self._convert(value)
+        if self.__length == len(self.__values):
+            self._grow(self.__length + 1)
+
+        self._store(self.__length, value)
+        self.__length += 1
+
+    def extend(self, values: Iterable) -> None:
+        if isinstance(values, TimeSeries) and \
+                values.unit_class is self.__unit_class:
+            self.extend_values(values=values.get_values(), unit=values.unit)
+        else:
+            for value in values:
+                self.append(value)
+
+    def clear(self) -> None:
+        """It removes all the values from the series, keeping the allocated
+        buffer. The series :py:attr:`unit` is reset as well, so that it is
+        set again by the first appended value.
+        """
+        self.__length = 0
+        self.__unit = None
+        self.__missing = None
+
+    def reserve(self, capacity: int) -> None:
+        """It preallocates the buffer in order to store at least ``capacity``
+        values without growing it again. \n
+        If the buffer is already large enough, it does nothing, otherwise the
+        buffer size is at least doubled, so that repeated reservations, like
+        the ones of concatenated simulations, have an amortized linear cost.
+
+        Parameters
+        ----------
+        ``capacity`` : :py:class:`int`
+            Number of values to be stored without growing the buffer.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If ``capacity`` is not an :py:class:`int`.
+           ``ValueError``
+               If ``capacity`` is negative.
+        """
+        if not isinstance(capacity, int) or isinstance(capacity, bool):
+            raise TypeError("Parameter 'capacity' must be an integer.")
+
+        if capacity < 0:
+            raise ValueError("Parameter 'capacity' must be positive or null.")
+
+        if capacity > len(self.__values):
+            self._grow(capacity)
+
+    def aggregate(self, window: int, aggregation: str = 'last') -> None:
+        """It replaces the last ``window`` values of the series with a single
+        value, obtained by aggregating them according to ``aggregation``. \n
+        Missing values are ignored, unless all the values in the window are
+        missing, in which case the aggregated value is missing as well.
+
+        Parameters
+        ----------
+        ``window`` : :py:class:`int`
+            Number of values at the end of the series to be aggregated. It
+            must be a positive :py:class:`int`, not greater than the length of
+            the series.
+        ``aggregation`` : :py:class:`str`, optional
+            Aggregation to be applied to the values in the window. Available
+            aggregations are:
+
+            - ``'last'`` (default), which keeps the last value,
+            - ``'mean'``, which computes the mean of the values,
+            - ``'min'``, which keeps the minimum value,
+            - ``'max'``, which keeps the maximum value.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               - If ``window`` is not an :py:class:`int`,
+               - if ``aggregation`` is not a :py:class:`str`.
+           ``ValueError``
+               - If ``window`` is not positive,
+               - if ``window`` is greater than the length of the series,
+               - if ``aggregation`` is not among available ones.
+        """
+        if not isinstance(window, int) or isinstance(window, bool):
+            raise TypeError("Parameter 'window' must be an integer.")
+
+        if window <= 0:
+            raise ValueError("Parameter 'window' must be positive.")
+
+        if window > self.__length:
+            raise ValueError(
+                "Parameter 'window' cannot be greater than the length of the "
+                "series."
+            )
+
+        if not isinstance(aggregation, str):
+            raise TypeError("Parameter 'aggregation' must be a string.")
+
+        if aggregation not in AGGREGATIONS.keys():
+            raise ValueError(
+                f"Aggregation {aggregation!r} not available. Available "
+                f"aggregations are: {list(AGGREGATIONS.keys())}."
+            )
+
+        if window == 1:
+            return
+
+        start = self.__length - window
+        values = self.__values[start:self.__length]
+        if self.__missing is not None:
+            values = values[~self.__missing[start:self.__length]]
+
+        self.__length = start + 1
+        if values.size:
+            self._store(start, float(AGGREGATIONS[aggregation](values)))
+        else:
+            self._store(start, None)
+
+    def extend_values(
+        self,
+        values: np.ndarray | list[float],
+        unit: str | None = None
+    ) -> None:
+        """It appends an array of numerical values at the end of the series,
+        without creating any unit object. \n
+        Values are converted from ``unit`` to the series :py:attr:`unit`. If
+        the series is empty, then ``unit`` becomes the series
+        :py:attr:`unit`.
+
+        Parameters
+        ----------
+        ``values`` : :py:class:`numpy.ndarray` or :py:class:`list`
+            Numerical values to be appended.
+        ``unit`` : :py:class:`str`, optional
+            Symbol of the unit of measurement of ``values``. It is required
+            if :py:attr:`unit_class` is not :py:obj:`None` and it must be
+            :py:obj:`None` otherwise.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If ``unit`` is not a :py:class:`str`.
+           ``ValueError``
+               - If ``unit`` is not set for a series of unit objects,
+               - if ``unit`` is set for a series of dimensionless numbers.
+        """
+        if unit is not None and not isinstance(unit, str):
+            raise TypeError("Parameter 'unit' must be a string.")
+
+        values = np.asarray(values, dtype=float)
+        if self.__unit_class is None:
+            if unit is not None:
+                raise ValueError(
+                    "Parameter 'unit' cannot be set for a series of "
+                    "dimensionless numbers."
+                )
+        else:
+            if unit is None:
+                raise ValueError(
+                    f"Parameter 'unit' must be set for a series of "
+                    f"{self.__unit_class.__name__!r}."
+                )
+            if self.__unit is None:
+                self.__unit_class(1, unit)
+                self.__unit = unit
+            elif unit != self.__unit:
+                values = values*self._conversion_factor(
+                    source_unit=unit,
+                    target_unit=self.__unit
+                )
+
+        n_values = len(values)
+        if self.__length + n_values > len(self.__values):
+            self._grow(self.__length + n_values)
+
+        self.__values[self.__length:self.__length + n_values] = values
+        if self.__missing is not None:
+            self.__missing[self.__length:self.__length + n_values] = False
+        self.__length += n_values
+
+    def get_values(
+        self,
+        unit: str | None = None,
+        start: int = 0,
+        stop: int | None = None
+    ) -> np.ndarray:
+        """It gets the numerical values of the series as a
+        :py:class:`numpy.ndarray`, without creating any unit object. \n
+        If a ``unit`` is set, then it converts the values to that unit,
+        otherwise values are expressed in the series :py:attr:`unit`. Missing
+        values are returned as ``nan``. \n
+        Only the values from index ``start`` to index ``stop`` (excluded) are
+        returned, following the same rules of :py:class:`list` slicing.
+
+        Parameters
+        ----------
+        ``unit`` : :py:class:`str`, optional
+            The unit to which convert the values. Default is :py:obj:`None`,
+            so values are expressed in the series :py:attr:`unit`.
+        ``start`` : :py:class:`int`, optional
+            Index of the first value to get. Default is ``0``.
+        ``stop`` : :py:class:`int`, optional
+            Index of the value at which to stop. Default is :py:obj:`None`,
+            so values are got up to the end of the series.
+
+        Returns
+        -------
+        :py:class:`numpy.ndarray`
+            Numerical values of the series.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               - If ``unit`` is not a :py:class:`str`,
+               - if ``start`` is not an :py:class:`int`,
+               - if ``stop`` is not an :py:class:`int`.
+           ``ValueError``
+               If ``unit`` is set for a series of dimensionless numbers.
+        """
+        if unit is not None and not isinstance(unit, str):
+            raise TypeError("Parameter 'unit' must be a string.")
+
+        if not isinstance(start, int) or isinstance(start, bool):
+            raise TypeError("Parameter 'start' must be an integer.")
+
+        if stop is not None and \
+                (not isinstance(stop, int) or isinstance(stop, bool)):
+            raise TypeError("Parameter 'stop' must be an integer.")
+
+        if unit is not None and self.__unit_class is None:
+            raise ValueError(
+                "Parameter 'unit' cannot be set for a series of dimensionless "
+                "numbers."
+            )
+
+        indexes = slice(start, stop).indices(self.__length)
+        values = self.__values[indexes[0]:indexes[1]].copy()
+        if self.__missing is not None:
+            values[self.__missing[indexes[0]:indexes[1]]] = np.nan
+
+        if unit is not None and self.__unit is not None and \
+                unit != self.__unit:
+            values *= self._conversion_factor(
+                source_unit=self.__unit,
+                target_unit=unit
+            )
+
+        return values
+
+    def get_array(
+        self,
+        unit: str | None = None,
+        start: int = 0,
+        stop: int | None = None
+    ) -> UnitArrayBase:
+        """It gets the values of the series as a unit array, without creating
+        any unit object. \n
+        The class of the returned unit array corresponds to the series
+        :py:attr:`unit_class`, for example a series of
+        :py:class:`Torque <gearpy.units.units.Torque>` gives a
+        :py:class:`TorqueArray <gearpy.units.unit_arrays.TorqueArray>`.
+        Parameters have the same meaning of :py:meth:`get_values`.
+
+        Parameters
+        ----------
+        ``unit`` : :py:class:`str`, optional
+            The unit to which convert the values. Default is :py:obj:`None`,
+            so values are expressed in the series :py:attr:`unit`.
+        ``start`` : :py:class:`int`, optional
+            Index of the first value to get. Default is ``0``.
+        ``stop`` : :py:class:`int`, optional
+            Index of the value at which to stop. Default is :py:obj:`None`,
+            so values are got up to the end of the series.
+
+        Returns
+        -------
+        :py:class:`UnitArrayBase <gearpy.units.unit_array_base.UnitArrayBase>`
+            Values of the series as a unit array.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               - If ``unit`` is not a :py:class:`str`,
+               - if ``start`` is not an :py:class:`int`,
+               - if ``stop`` is not an :py:class:`int`.
+           ``ValueError``
+               - If the series stores dimensionless numbers,
+               - if both ``unit`` and the series :py:attr:`unit` are
+                 :py:obj:`None`, because the series is empty.
+        """
+        if self.__unit_class is None:
+            raise ValueError(
+                "Cannot get a unit array from a series of dimensionless "
+                "numbers."
+            )
+
+        values = self.get_values(unit=unit, start=start, stop=stop)
+        if unit is None:
+            if self.__unit is None:
+                raise ValueError(
+                    "Parameter 'unit' must be set for an empty series."
+                )
+            unit = self.__unit
+        else:
+            # the unit class raises the same errors of a single value
+            self.__unit_class(value=1, unit=unit)
+
+        return UnitArrayBase._from_values(
+            unit_class=self.__unit_class,
+            values=values,
+            unit=unit
+        )
+
+    def _conversion_factor(self, source_unit: str, target_unit: str) -> float:
+
+        try:
+            return self.__unit_class._conversion_factor(
+                unit=source_unit,
+                target_unit=target_unit
+            )
+        except KeyError:
+            # the unit class raises the same errors of a single value
+            self.__unit_class(1, source_unit).to(target_unit)
+            raise
+
+    def _get_item(self, i: int) -> UnitBase | float | None:
+
+        if self.__missing is not None and self.__missing[i]:
+            return None
+
+        value = float(self.__values[i])
+        if self.__unit_class is None:
+            return value
+
+        return self.__unit_class(value=value, unit=self.__unit)
+
+    def _set_item(self, i: int, value: UnitBase | float | int | None):
+
+        self._store(i, self._convert(value))
+
+    def _convert(self, value: UnitBase | float | int | None) -> float | None:
+
+        if value is None:
+            return None
+
+        if self.__unit_class is None:
+            if not isinstance(value, float | int):
+                raise TypeError(
+                    "Each element of the series must be a float or an "
+                    "integer."
+                )
+            return value
+
+        if not isinstance(value, self.__unit_class):
+            raise TypeError(
+                f"Each element of the series must be an instance of "
+                f"{self.__unit_class.__name__!r}."
+            )
+
+        if self.__unit is None:
+            self.__unit = value.unit
+
+        if value.unit == self.__unit:
+            return value.value
+
+        return value._to_value(self.__unit)
+
+    def _store(self, i: int, value: float | None):
+
+        if value is None:
+            if self.__missing is None:
+                self.__missing = np.zeros(len(self.__values), dtype=bool)
+            self.__missing[i] = True
+            self.__values[i] = np.nan
+            return
+
+        self.__values[i] = value
+        if self.__missing is not None:
+            self.__missing[i] = False
+
+    def _grow(self, capacity: int):
+
+        self._resize(max(capacity, 2*len(self.__values), MINIMUM_CAPACITY))
+
+    def _resize(self, capacity: int):
+
+        values = np.empty(capacity)
+        values[:self.__length] = self.__values[:self.__length]
+        self.__values = values
+        if self.__missing is not None:
+            missing = np.zeros(capacity, dtype=bool)
+            missing[:self.__length] = self.__missing[:self.__length]
+            self.__missing = missing
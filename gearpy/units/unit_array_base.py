@@ -0,0 +1,468 @@
+from __future__ import annotations
+from .unit_base import UnitBase, COMPARISON_TOLERANCE
+import numpy as np
+
+
+class UnitArrayBase:
+    r""":py:class:`UnitArrayBase <gearpy.units.unit_array_base.UnitArrayBase>`
+    object. \n
+    Base class for creating unit array objects. \n
+    A unit array stores many numerical values of the same physical quantity
+    in a :py:class:`numpy.ndarray` of floats, all expressed in the same
+    :py:attr:`unit`, so that conversions and arithmetic are carried out on
+    the whole array at once, instead of creating a unit object for each
+    value. \n
+    Each unit array class refers to a unit class through the
+    :py:attr:`unit_class` attribute and it follows the same dimensional
+    rules: available units, allowed operations and classes of the results
+    are the ones of :py:attr:`unit_class`, so, for example, dividing a
+    :py:class:`TorqueArray <gearpy.units.unit_arrays.TorqueArray>` by an
+    :py:class:`InertiaMoment <gearpy.units.units.InertiaMoment>` gives an
+    :py:class:`AngularAccelerationArray <gearpy.units.unit_arrays.AngularAccelerationArray>`.
+
+    Attributes
+    ----------
+    :py:attr:`unit_class` : :py:class:`type`
+        Class of the unit objects corresponding to the array values.
+    :py:attr:`values` : :py:class:`numpy.ndarray`
+        Numerical values of the array.
+    :py:attr:`unit` : :py:class:`str`
+        Symbol of the unit of measurement of the array values.
+
+    Methods
+    -------
+    :py:meth:`to`
+        It converts actual :py:attr:`values` to new values computed using
+        ``target_unit`` as the reference unit of measurement.
+
+    .. admonition:: Raises
+       :class: warning
+
+       ``TypeError``
+           - If ``values`` is not a :py:class:`numpy.ndarray`, a
+             :py:class:`list` or a :py:class:`tuple`,
+           - if ``values`` does not contain only floats or integers,
+           - if ``unit`` is not a :py:class:`str`.
+       ``KeyError``
+           If the ``unit`` is not among the ones available for
+           :py:attr:`unit_class`.
+       ``ValueError``
+           If some ``values`` are not allowed for :py:attr:`unit_class`, for
+           example negative values of an
+           :py:class:`InertiaMoment <gearpy.units.units.InertiaMoment>`.
+
+    .. admonition:: Notes
+       :class: tip
+
+       Unit arrays behave like :py:class:`numpy.ndarray` for indexing and
+       broadcasting: indexing with an integer returns a unit object, while
+       slicing returns a unit array. Comparisons return a
+       :py:class:`numpy.ndarray` of booleans and, differently from unit
+       objects, division by zero follows :py:mod:`numpy` rules, so it
+       results in ``inf`` or ``nan`` instead of raising a
+       ``ZeroDivisionError``.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:class:`UnitBase <gearpy.units.unit_base.UnitBase>` \n
+       :py:meth:`TimeSeries.get_array <gearpy.units.time_series.TimeSeries.get_array>`
+    """
+
+    __slots__ = ('__values', '__unit')
+
+    # let numpy defer binary operators with an array on the left to the
+    # reflected methods of this class, instead of broadcasting on objects
+    __array_ufunc__ = None
+
+    unit_class: type[UnitBase] = UnitBase
+    _check_values: bool = False
+
+    __ARRAY_CLASSES = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        UnitArrayBase.__ARRAY_CLASSES[cls.unit_class] = cls
+
+    def __init__(self, values: np.ndarray | list | tuple, unit: str):
+        if not isinstance(values, np.ndarray | list | tuple):
+            raise TypeError(
+                "Parameter 'values' must be a numpy array, a list or a tuple."
+            )
+
+        values = np.array(values)
+        if values.dtype.kind not in 'biuf':
+            raise TypeError(
+                "Parameter 'values' must contain only floats or integers."
+            )
+
+        if not isinstance(unit, str):
+            raise TypeError("Parameter 'unit' must be a string.")
+
+        # the unit class raises the same errors of a single value
+        self.unit_class(value=1, unit=unit)
+
+        self.__values = values.astype(float)
+        self.__unit = unit
+        self._validate()
+
+    @classmethod
+    def _new(cls, values: np.ndarray, unit: str) -> UnitArrayBase:
+        """It creates a unit array without validating or copying ``values``
+        and without validating ``unit``. It is meant for internal
+        computations, in which both are already known to be valid.
+
+        Parameters
+        ----------
+        ``values`` : :py:class:`numpy.ndarray`
+            Array of floats, which becomes the array :py:attr:`values`.
+        ``unit`` : :py:class:`str`
+            Symbol of the unit of measurement, among the available ones.
+
+        Returns
+        -------
+        :py:class:`UnitArrayBase <gearpy.units.unit_array_base.UnitArrayBase>`
+            Unit array of the calling class.
+        """
+        instance = object.__new__(cls)
+        instance.__values = values
+        instance.__unit = unit
+
+        return instance
+
+    @classmethod
+    def _from_values(
+        cls,
+        unit_class: type[UnitBase],
+        values: np.ndarray,
+        unit: str
+    ) -> UnitArrayBase:
+        """It creates the unit array corresponding to ``unit_class``,
+        validating ``values`` only if the unit class restricts them.
+        """
+        array = UnitArrayBase.__ARRAY_CLASSES[unit_class]._new(
+            values=values,
+            unit=unit
+        )
+        array._validate()
+
+        return array
+
+    def _validate(self):
+
+        if self._check_values and self.__values.size:
+            # the extreme values raise the same errors of a single value
+            self.unit_class(value=float(self.__values.min()), unit=self.__unit)
+
+    @property
+    def values(self) -> np.ndarray:
+        """Numerical values of the array. The relative unit is expressed by
+        the :py:attr:`unit` property.
+
+        Returns
+        -------
+        :py:class:`numpy.ndarray`
+            Numerical values of the array.
+        """
+        return self.__values
+
+    @property
+    def unit(self) -> str:
+        """Symbol of the unit of measurement of the array values. Available
+        units are the ones of :py:attr:`unit_class`.
+
+        Returns
+        -------
+        :py:class:`str`
+            Symbol of the unit of measurement of the array values.
+        """
+        return self.__unit
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def __getitem__(self, index) -> UnitBase | UnitArrayBase:
+        values = self.__values[index]
+        if isinstance(values, np.ndarray):
+            return self.__class__._new(values=values, unit=self.__unit)
+
+        return self.unit_class._new(value=float(values), unit=self.__unit)
+
+    def __iter__(self):
+        for value in self.__values:
+            yield self.unit_class._new(value=float(value), unit=self.__unit)
+
+    def __repr__(self):
+        return f'{self.__values} {self.__unit}'
+
+    def __abs__(self) -> UnitArrayBase:
+        return self.__class__._new(
+            values=np.abs(self.__values),
+            unit=self.__unit
+        )
+
+    def __neg__(self) -> UnitArrayBase:
+        return self._from_values(
+            unit_class=self.unit_class,
+            values=-self.__values,
+            unit=self.__unit
+        )
+
+    def __add__(self, other: UnitArrayBase | UnitBase) -> UnitArrayBase:
+        result, other_values = self._apply(other, lambda a, b: a + b)
+
+        return self._from_values(
+            unit_class=result.__class__,
+            values=self.__values + other_values*self._conversion_factor(other),
+            unit=self.__unit
+        )
+
+    def __sub__(self, other: UnitArrayBase | UnitBase) -> UnitArrayBase:
+        # the sum of unitary values gives the same result class of the
+        # difference, without the risk of negative values for the classes
+        # which do not allow them
+        result, other_values = self._apply(other, lambda a, b: a + b)
+
+        return self._from_values(
+            unit_class=result.__class__,
+            values=self.__values - other_values*self._conversion_factor(other),
+            unit=self.__unit
+        )
+
+    def __mul__(
+        self,
+        other: UnitArrayBase | UnitBase | np.ndarray | float | int
+    ) -> UnitArrayBase | np.ndarray:
+        result, other_values = self._apply(other, lambda a, b: a*b)
+
+        return self._scale(self.__values*other_values, result)
+
+    def __rmul__(
+        self,
+        other: UnitBase | np.ndarray | float | int
+    ) -> UnitArrayBase | np.ndarray:
+        result, other_values = self._apply(other, lambda a, b: b*a)
+
+        return self._scale(other_values*self.__values, result)
+
+    def __truediv__(
+        self,
+        other: UnitArrayBase | UnitBase | np.ndarray | float | int
+    ) -> UnitArrayBase | np.ndarray:
+        result, other_values = self._apply(other, lambda a, b: a/b)
+
+        return self._scale(self.__values/other_values, result)
+
+    def __eq__(self, other: UnitArrayBase | UnitBase) -> np.ndarray:
+        difference = self._compare(other)
+        if difference is None:
+            return self.__values == self._other_values(other)
+
+        return np.abs(difference) < COMPARISON_TOLERANCE
+
+    def __ne__(self, other: UnitArrayBase | UnitBase) -> np.ndarray:
+        difference = self._compare(other)
+        if difference is None:
+            return self.__values != self._other_values(other)
+
+        return np.abs(difference) > COMPARISON_TOLERANCE
+
+    def __gt__(self, other: UnitArrayBase | UnitBase) -> np.ndarray:
+        difference = self._compare(other)
+        if difference is None:
+            return self.__values > self._other_values(other)
+
+        return difference > COMPARISON_TOLERANCE
+
+    def __ge__(self, other: UnitArrayBase | UnitBase) -> np.ndarray:
+        difference = self._compare(other)
+        if difference is None:
+            return self.__values >= self._other_values(other)
+
+        return difference >= -COMPARISON_TOLERANCE
+
+    def __lt__(self, other: UnitArrayBase | UnitBase) -> np.ndarray:
+        difference = self._compare(other)
+        if difference is None:
+            return self.__values < self._other_values(other)
+
+        return difference < -COMPARISON_TOLERANCE
+
+    def __le__(self, other: UnitArrayBase | UnitBase) -> np.ndarray:
+        difference = self._compare(other)
+        if difference is None:
+            return self.__values <= self._other_values(other)
+
+        return difference <= COMPARISON_TOLERANCE
+
+    __hash__ = None
+
+    def to(
+        self,
+        target_unit: str,
+        inplace: bool = False
+    ) -> UnitArrayBase:
+        """It converts actual :py:attr:`values` to new values computed using
+        ``target_unit`` as the reference unit of measurement, with a single
+        multiplication by the conversion factor. \n
+        If ``inplace`` is ``True``, it overrides actual :py:attr:`values` and
+        :py:attr:`unit`, otherwise it returns a new instance with the
+        converted :py:attr:`values` and the ``target_unit`` as
+        :py:attr:`unit`.
+
+        Parameters
+        ----------
+        ``target_unit`` : :py:class:`str`
+            Target unit to which convert the current values.
+        ``inplace`` : :py:class:`bool`, optional
+            Whether to override the current instance values. Default is
+            ``False``, so it does not override the current values.
+
+        Returns
+        -------
+        :py:class:`UnitArrayBase <gearpy.units.unit_array_base.UnitArrayBase>`
+            Converted unit array.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               - If ``target_unit`` is not a :py:class:`str`,
+               - if ``inplace`` is not a :py:class:`bool`.
+           ``KeyError``
+               If the ``target_unit`` is not among available ones.
+
+        .. admonition:: Examples
+           :class: important
+
+           ``TorqueArray`` instantiation.
+
+           >>> from gearpy.units import TorqueArray
+           >>> T = TorqueArray([1, 2, 3], 'Nm')
+           >>> T
+           [1. 2. 3.] Nm
+
+           Conversion from newton-meter to milli-newton-meter with
+           ``inplace=False`` by default, so it does not override the current
+           values.
+
+           >>> T.to('mNm')
+           [1000. 2000. 3000.] mNm
+           >>> T
+           [1. 2. 3.] Nm
+        """
+        if not isinstance(target_unit, str):
+            raise TypeError("Parameter 'target_unit' must be a string.")
+
+        if not isinstance(inplace, bool):
+            raise TypeError("Parameter 'inplace' must be a bool.")
+
+        # the unit class raises the same errors of a single value
+        self.unit_class(value=1, unit=target_unit)
+
+        factor = self.unit_class._conversion_factor(
+            unit=self.__unit,
+            target_unit=target_unit
+        )
+        values = self.__values*factor if factor != 1 else self.__values
+
+        if inplace:
+            self.__values = values
+            self.__unit = target_unit
+            return self
+        else:
+            return self.__class__._new(values=values, unit=target_unit)
+
+    def _apply(
+        self,
+        other: UnitArrayBase | UnitBase | np.ndarray | float | int,
+        operation
+    ) -> tuple[UnitBase | float, np.ndarray | float | int]:
+
+        # the operation is applied to unitary values in order to get the unit
+        # and the scale factor of the result from the unit classes, so that
+        # they check the dimensional consistency of the operands
+        if isinstance(other, UnitArrayBase):
+            probe = other.unit_class._new(value=1.0, unit=other.unit)
+            other_values = other.values
+        elif isinstance(other, UnitBase):
+            probe = other.__class__._new(value=1.0, unit=other.unit)
+            other_values = other.value
+        elif isinstance(other, float | int) or (
+            isinstance(other, np.ndarray) and other.dtype.kind in 'biuf'
+        ):
+            probe = 1.0
+            other_values = other
+        else:
+            probe = other
+            other_values = other
+
+        result = operation(
+            self.unit_class._new(value=1.0, unit=self.__unit),
+            probe
+        )
+
+        return result, other_values
+
+    def _scale(
+        self,
+        values: np.ndarray,
+        result: UnitBase | float
+    ) -> UnitArrayBase | np.ndarray:
+
+        if isinstance(result, UnitBase):
+            if result.value != 1:
+                values = values*result.value
+            return self._from_values(
+                unit_class=result.__class__,
+                values=values,
+                unit=result.unit
+            )
+
+        return values*result if result != 1 else values
+
+    def _compare(
+        self,
+        other: UnitArrayBase | UnitBase
+    ) -> np.ndarray | None:
+
+        if isinstance(other, UnitArrayBase):
+            probe = other.unit_class._new(value=1.0, unit=other.unit)
+        elif isinstance(other, UnitBase):
+            probe = other
+        else:
+            raise TypeError(
+                f"Cannot compare {self.__class__.__name__} and "
+                f"{other.__class__.__name__}."
+            )
+
+        # the unit classes check whether the two quantities can be compared
+        self.unit_class._new(value=1.0, unit=self.__unit) == probe
+
+        if other.unit == self.__unit:
+            return None
+
+        return self.__values - \
+            self._other_values(other)*self._conversion_factor(other)
+
+    def _conversion_factor(self, other: UnitArrayBase | UnitBase) -> float:
+
+        if other.unit == self.__unit:
+            return 1
+
+        unit_class = other.unit_class if isinstance(other, UnitArrayBase) \
+            else other.__class__
+
+        return unit_class._conversion_factor(
+            unit=other.unit,
+            target_unit=self.__unit
+        )
+
+    @staticmethod
+    def _other_values(other: UnitArrayBase | UnitBase) -> np.ndarray | float:
+
+        if isinstance(other, UnitArrayBase):
+            return other.values
+
+        return other.value
@@ -0,0 +1,255 @@
+from .unit_array_base import UnitArrayBase
+from .units import (
+    Angle,
+    AngularAcceleration,
+    AngularPosition,
+    AngularSpeed,
+    Current,
+    Force,
+    InertiaMoment,
+    Length,
+    Stress,
+    Surface,
+    Time,
+    TimeInterval,
+    Torque
+)
+
+
+class AngularPositionArray(UnitArrayBase):
+    r""":py:class:`AngularPositionArray <gearpy.units.unit_arrays.AngularPositionArray>`
+    object. \n
+    Array of angular positions, whose values are instances of
+    :py:class:`AngularPosition <gearpy.units.units.AngularPosition>` and have
+    the same available units.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:class:`UnitArrayBase <gearpy.units.unit_array_base.UnitArrayBase>` \n
+       :py:class:`AngularPosition <gearpy.units.units.AngularPosition>`
+    """
+
+    __slots__ = ()
+
+    unit_class = AngularPosition
+
+
+class AngleArray(AngularPositionArray):
+    r""":py:class:`AngleArray <gearpy.units.unit_arrays.AngleArray>` object. \n
+    Array of angles, whose values are instances of :py:class:`Angle
+    <gearpy.units.units.Angle>` and have the same available units.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:class:`UnitArrayBase <gearpy.units.unit_array_base.UnitArrayBase>` \n
+       :py:class:`Angle <gearpy.units.units.Angle>`
+    """
+
+    __slots__ = ()
+
+    unit_class = Angle
+    _check_values = True
+
+
+class AngularSpeedArray(UnitArrayBase):
+    r""":py:class:`AngularSpeedArray <gearpy.units.unit_arrays.AngularSpeedArray>`
+    object. \n
+    Array of angular speeds, whose values are instances of
+    :py:class:`AngularSpeed <gearpy.units.units.AngularSpeed>` and have the
+    same available units.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:class:`UnitArrayBase <gearpy.units.unit_array_base.UnitArrayBase>` \n
+       :py:class:`AngularSpeed <gearpy.units.units.AngularSpeed>`
+    """
+
+    __slots__ = ()
+
+    unit_class = AngularSpeed
+
+
+class AngularAccelerationArray(UnitArrayBase):
+    r""":py:class:`AngularAccelerationArray <gearpy.units.unit_arrays.AngularAccelerationArray>`
+    object. \n
+    Array of angular accelerations, whose values are instances of
+    :py:class:`AngularAcceleration <gearpy.units.units.AngularAcceleration>`
+    and have the same available units.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:class:`UnitArrayBase <gearpy.units.unit_array_base.UnitArrayBase>` \n
+       :py:class:`AngularAcceleration <gearpy.units.units.AngularAcceleration>`
+    """
+
+    __slots__ = ()
+
+    unit_class = AngularAcceleration
+
+
+class InertiaMomentArray(UnitArrayBase):
+    r""":py:class:`InertiaMomentArray <gearpy.units.unit_arrays.InertiaMomentArray>`
+    object. \n
+    Array of moments of inertia, whose values are instances of
+    :py:class:`InertiaMoment <gearpy.units.units.InertiaMoment>` and have the
+    same available units.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:class:`UnitArrayBase <gearpy.units.unit_array_base.UnitArrayBase>` \n
+       :py:class:`InertiaMoment <gearpy.units.units.InertiaMoment>`
+    """
+
+    __slots__ = ()
+
+    unit_class = InertiaMoment
+    _check_values = True
+
+
+class TorqueArray(UnitArrayBase):
+    r""":py:class:`TorqueArray <gearpy.units.unit_arrays.TorqueArray>` object. \n
+    Array of torques, whose values are instances of :py:class:`Torque
+    <gearpy.units.units.Torque>` and have the same available units.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:class:`UnitArrayBase <gearpy.units.unit_array_base.UnitArrayBase>` \n
+       :py:class:`Torque <gearpy.units.units.Torque>`
+    """
+
+    __slots__ = ()
+
+    unit_class = Torque
+
+
+class TimeArray(UnitArrayBase):
+    r""":py:class:`TimeArray <gearpy.units.unit_arrays.TimeArray>` object. \n
+    Array of time instants, whose values are instances of :py:class:`Time
+    <gearpy.units.units.Time>` and have the same available units.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:class:`UnitArrayBase <gearpy.units.unit_array_base.UnitArrayBase>` \n
+       :py:class:`Time <gearpy.units.units.Time>`
+    """
+
+    __slots__ = ()
+
+    unit_class = Time
+
+
+class TimeIntervalArray(TimeArray):
+    r""":py:class:`TimeIntervalArray <gearpy.units.unit_arrays.TimeIntervalArray>`
+    object. \n
+    Array of time intervals, whose values are instances of
+    :py:class:`TimeInterval <gearpy.units.units.TimeInterval>` and have the
+    same available units.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:class:`UnitArrayBase <gearpy.units.unit_array_base.UnitArrayBase>` \n
+       :py:class:`TimeInterval <gearpy.units.units.TimeInterval>`
+    """
+
+    __slots__ = ()
+
+    unit_class = TimeInterval
+    _check_values = True
+
+
+class LengthArray(UnitArrayBase):
+    r""":py:class:`LengthArray <gearpy.units.unit_arrays.LengthArray>` object. \n
+    Array of lengths, whose values are instances of :py:class:`Length
+    <gearpy.units.units.Length>` and have the same available units.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:class:`UnitArrayBase <gearpy.units.unit_array_base.UnitArrayBase>` \n
+       :py:class:`Length <gearpy.units.units.Length>`
+    """
+
+    __slots__ = ()
+
+    unit_class = Length
+    _check_values = True
+
+
+class SurfaceArray(UnitArrayBase):
+    r""":py:class:`SurfaceArray <gearpy.units.unit_arrays.SurfaceArray>`
+    object. \n
+    Array of surfaces, whose values are instances of :py:class:`Surface
+    <gearpy.units.units.Surface>` and have the same available units.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:class:`UnitArrayBase <gearpy.units.unit_array_base.UnitArrayBase>` \n
+       :py:class:`Surface <gearpy.units.units.Surface>`
+    """
+
+    __slots__ = ()
+
+    unit_class = Surface
+    _check_values = True
+
+
+class ForceArray(UnitArrayBase):
+    r""":py:class:`ForceArray <gearpy.units.unit_arrays.ForceArray>` object. \n
+    Array of forces, whose values are instances of :py:class:`Force
+    <gearpy.units.units.Force>` and have the same available units.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:class:`UnitArrayBase <gearpy.units.unit_array_base.UnitArrayBase>` \n
+       :py:class:`Force <gearpy.units.units.Force>`
+    """
+
+    __slots__ = ()
+
+    unit_class = Force
+
+
+class StressArray(UnitArrayBase):
+    r""":py:class:`StressArray <gearpy.units.unit_arrays.StressArray>` object. \n
+    Array of stresses, whose values are instances of :py:class:`Stress
+    <gearpy.units.units.Stress>` and have the same available units.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:class:`UnitArrayBase <gearpy.units.unit_array_base.UnitArrayBase>` \n
+       :py:class:`Stress <gearpy.units.units.Stress>`
+    """
+
+    __slots__ = ()
+
+    unit_class = Stress
+
+
+class CurrentArray(UnitArrayBase):
+    r""":py:class:`CurrentArray <gearpy.units.unit_arrays.CurrentArray>`
+    object. \n
+    Array of electric currents, whose values are instances of
+    :py:class:`Current <gearpy.units.units.Current>` and have the same
+    available units.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:class:`UnitArrayBase <gearpy.units.unit_array_base.UnitArrayBase>` \n
+       :py:class:`Current <gearpy.units.units.Current>`
+    """
+
+    __slots__ = ()
+
+    unit_class = Current
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from math import fabs
+from .unit_registry import UNIT_REGISTRY
 
 
 COMPARISON_TOLERANCE = 1e-12
@@ -28,7 +29,109 @@ class UnitBase(ABC):
        :py:class:`Torque <gearpy.units.units.Torque>`
     """
 
+    __slots__ = ()
+
     __UNITS = {}
+    __CONVERSIONS = {}
+    __STORAGE = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # name-mangled slots in which each class of the hierarchy stores value
+        # and unit, and conversion factors of the closest class defining them
+        cls.__STORAGE = tuple(
+            (f'_{klass.__name__}__value', f'_{klass.__name__}__unit')
+            for klass in cls.__mro__
+            if f'_{klass.__name__}__value' in klass.__dict__
+        )
+        dimension_class = next(
+            klass for klass in cls.__mro__
+            if f'_{klass.__name__}__UNITS' in klass.__dict__
+        )
+        cls.__UNITS = dimension_class.__dict__[
+            f'_{dimension_class.__name__}__UNITS'
+        ]
+
+        # the closest class defining units registers its dimension, derived
+        # classes share its precomputed conversion factors
+        if cls.__UNITS:
+            UNIT_REGISTRY.register(
+                dimension=dimension_class.__name__,
+                units=cls.__UNITS
+            )
+            cls.__CONVERSIONS = UNIT_REGISTRY.get_conversions(
+                dimension=dimension_class.__name__
+            )
+
+    @classmethod
+    def _new(cls, value: float | int, unit: str) -> UnitBase:
+        """It creates a unit object without validating ``value`` and
+        ``unit``. It is meant for internal computations, in which both are
+        already known to be valid, so that the hot loop of the solver does not
+        pay for the checks of the public constructor.
+
+        Parameters
+        ----------
+        ``value`` : :py:class:`float` or :py:class:`int`
+            Numerical value of the unit object.
+        ``unit`` : :py:class:`str`
+            Symbol of the unit of measurement, among the available ones.
+
+        Returns
+        -------
+        :py:class:`UnitBase <gearpy.units.unit_base.UnitBase>`
+            Unit object of the calling class.
+        """
+        instance = object.__new__(cls)
+        for value_attribute, unit_attribute in cls.__STORAGE:
+            setattr(instance, value_attribute, value)
+            setattr(instance, unit_attribute, unit)
+
+        return instance
+
+    def _to_value(self, target_unit: str) -> float | int:
+        """It computes the numerical value of the unit object in
+        ``target_unit``, without creating a new unit object. \n
+        The result is the same as ``self.to(target_unit).value``.
+
+        Parameters
+        ----------
+        ``target_unit`` : :py:class:`str`
+            Target unit to which convert the current value.
+
+        Returns
+        -------
+        :py:class:`float` or :py:class:`int`
+            Converted numerical value.
+        """
+        unit = self.unit
+        if target_unit == unit:
+            return self.value
+
+        # the product and division of the two factors of the units give
+        # the same result of to, which a single precomputed factor does not
+        return self.value*self.__UNITS[unit]/self.__UNITS[target_unit]
+
+    @classmethod
+    def _conversion_factor(cls, unit: str, target_unit: str) -> float:
+        """It gets the precomputed factor which converts a value from
+        ``unit`` to ``target_unit``, both among the available units of the
+        calling class.
+
+        Parameters
+        ----------
+        ``unit`` : :py:class:`str`
+            Unit from which to convert.
+        ``target_unit`` : :py:class:`str`
+            Target unit to which convert.
+
+        Returns
+        -------
+        :py:class:`float`
+            Conversion factor.
+        """
+        return cls.__CONVERSIONS[unit][target_unit]
 
     @abstractmethod
     def __init__(self, value: float | int, unit: str):
@@ -51,7 +154,8 @@ class UnitBase(ABC):
         return self.__class__(-self.value, self.unit)
 
     def __add__(self, other: UnitBase) -> None:
-        if not isinstance(other, self.__class__) and \
+        if other.__class__ is not self.__class__ and \
+                not isinstance(other, self.__class__) and \
                 not issubclass(self.__class__, other.__class__):
             raise TypeError(
                 f"It is not allowed to sum a {self.__class__.__name__} and a "
@@ -59,12 +163,13 @@ class UnitBase(ABC):
             )
 
         return self.__class__(
-            value=self.value + other.to(self.unit).value,
+            value=self.value + other._to_value(self.unit),
             unit=self.unit
         )
 
     def __sub__(self, other: UnitBase) -> None:
-        if not isinstance(other, self.__class__) and \
+        if other.__class__ is not self.__class__ and \
+                not isinstance(other, self.__class__) and \
                 not issubclass(self.__class__, other.__class__):
             raise TypeError(
                 f"It is not allowed to subtract a {other.__class__.__name__} "
@@ -73,11 +178,11 @@ class UnitBase(ABC):
 
         try:
             return self.__class__(
-                value=self.value - other.to(self.unit).value,
+                value=self.value - other._to_value(self.unit),
                 unit=self.unit
             )
         except ValueError:
-            if self.value - other.to(self.unit).value <= 0:
+            if self.value - other._to_value(self.unit) <= 0:
                 raise ValueError(
                     "Cannot perform the subtraction because the result is "
                     "negative or null."
@@ -91,25 +196,25 @@ class UnitBase(ABC):
 
     @abstractmethod
     def __truediv__(self, other: UnitBase | float | int) -> None:
-        if not isinstance(other, UnitBase | float | int):
-            raise TypeError(
-                f"It is not allowed to divide a Unit by a "
-                f"{other.__class__.__name__}."
-            )
-
-        if isinstance(other, UnitBase):
-            if other.value == 0:
+        if isinstance(other, float | int):
+            if other == 0:
                 raise ZeroDivisionError(
                     "It is not allowed to divide a Unit by zero."
                 )
-        else:
-            if other == 0:
+        elif isinstance(other, UnitBase):
+            if other.value == 0:
                 raise ZeroDivisionError(
                     "It is not allowed to divide a Unit by zero."
                 )
+        else:
+            raise TypeError(
+                f"It is not allowed to divide a Unit by a "
+                f"{other.__class__.__name__}."
+            )
 
     def __eq__(self, other: UnitBase) -> None:
-        if not isinstance(other, self.__class__) and \
+        if other.__class__ is not self.__class__ and \
+                not isinstance(other, self.__class__) and \
                 not issubclass(self.__class__, other.__class__):
             raise TypeError(
                 f"Cannot compare {self.__class__.__name__} and "
@@ -120,11 +225,12 @@ class UnitBase(ABC):
             return self.value == other.value
         else:
             return fabs(
-                self.value - other.to(self.unit).value
+                self.value - other._to_value(self.unit)
             ) < COMPARISON_TOLERANCE
 
     def __ne__(self, other: UnitBase) -> None:
-        if not isinstance(other, self.__class__) and \
+        if other.__class__ is not self.__class__ and \
+                not isinstance(other, self.__class__) and \
                 not issubclass(self.__class__, other.__class__):
             raise TypeError(
                 f"Cannot compare {self.__class__.__name__} and "
@@ -135,11 +241,12 @@ class UnitBase(ABC):
             return self.value != other.value
         else:
             return fabs(
-                self.value - other.to(self.unit).value
+                self.value - other._to_value(self.unit)
             ) > COMPARISON_TOLERANCE
 
     def __gt__(self, other: UnitBase) -> None:
-        if not isinstance(other, self.__class__) and \
+        if other.__class__ is not self.__class__ and \
+                not isinstance(other, self.__class__) and \
                 not issubclass(self.__class__, other.__class__):
             raise TypeError(
                 f"Cannot compare {self.__class__.__name__} and "
@@ -149,12 +256,12 @@ class UnitBase(ABC):
         if self.unit == other.unit:
             return self.value > other.value
         else:
-            return self.value - other.to(
-                self.unit
-            ).value > COMPARISON_TOLERANCE
+            return self.value - \
+                other._to_value(self.unit) > COMPARISON_TOLERANCE
 
     def __ge__(self, other: UnitBase) -> None:
-        if not isinstance(other, self.__class__) and \
+        if other.__class__ is not self.__class__ and \
+                not isinstance(other, self.__class__) and \
                 not issubclass(self.__class__, other.__class__):
             raise TypeError(
                 f"Cannot compare {self.__class__.__name__} and "
@@ -164,12 +271,12 @@ class UnitBase(ABC):
         if self.unit == other.unit:
             return self.value >= other.value
         else:
-            return self.value - other.to(
-                self.unit
-            ).value >= -COMPARISON_TOLERANCE
+            return self.value - \
+                other._to_value(self.unit) >= -COMPARISON_TOLERANCE
 
     def __lt__(self, other: UnitBase) -> None:
-        if not isinstance(other, self.__class__) and \
+        if other.__class__ is not self.__class__ and \
+                not isinstance(other, self.__class__) and \
                 not issubclass(self.__class__, other.__class__):
             raise TypeError(
                 f"Cannot compare {self.__class__.__name__} and "
@@ -179,12 +286,12 @@ class UnitBase(ABC):
         if self.unit == other.unit:
             return self.value < other.value
         else:
-            return self.value - other.to(
-                self.unit
-            ).value < -COMPARISON_TOLERANCE
+            return self.value - \
+                other._to_value(self.unit) < -COMPARISON_TOLERANCE
 
     def __le__(self, other: UnitBase) -> None:
-        if not isinstance(other, self.__class__) and \
+        if other.__class__ is not self.__class__ and \
+                not isinstance(other, self.__class__) and \
                 not issubclass(self.__class__, other.__class__):
             raise TypeError(
                 f"Cannot compare {self.__class__.__name__} and "
@@ -194,9 +301,8 @@ class UnitBase(ABC):
         if self.unit == other.unit:
             return self.value <= other.value
         else:
-            return self.value - other.to(
-                self.unit
-            ).value <= COMPARISON_TOLERANCE
+            return self.value - \
+                other._to_value(self.unit) <= COMPARISON_TOLERANCE
 
     @property
     @abstractmethod
@@ -0,0 +1,314 @@
+from sys import intern
+import numpy as np
+
+
+class UnitRegistry:
+    r""":py:class:`UnitRegistry <gearpy.units.unit_registry.UnitRegistry>`
+    object. \n
+    Central registry of the units of measurement of all unit objects. \n
+    Units are grouped by dimension: each dimension is registered once, with
+    the conversion factor of each unit symbol to the reference unit of the
+    dimension. At registration, unit symbols are interned and mapped to small
+    integer ids and the conversion factors between each pair of units are
+    precomputed, so that unit arrays and time series convert all their values
+    with a single multiplication by a precomputed factor. Single unit objects
+    keep multiplying and dividing by the factors of the two units, so their
+    converted values are not changed by rounding. \n
+    Each unit class registers its dimension when it is defined, so
+    :py:data:`UNIT_REGISTRY` already holds the dimensions of all unit
+    objects.
+
+    Attributes
+    ----------
+    :py:attr:`dimensions` : :py:class:`tuple`
+        Names of the registered dimensions.
+
+    Methods
+    -------
+    :py:meth:`get_conversion_factor`
+        It gets the factor which converts a value from a unit to another.
+    :py:meth:`get_conversion_matrix`
+        It gets the matrix of the conversion factors between the units of a
+        dimension.
+    :py:meth:`get_conversions`
+        It gets the conversion factors between the units of a dimension,
+        indexed by unit symbols.
+    :py:meth:`get_unit_id`
+        It gets the integer id of a unit symbol.
+    :py:meth:`get_units`
+        It gets the unit symbols of a dimension.
+    :py:meth:`register`
+        It registers a dimension and its units.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:class:`UnitBase <gearpy.units.unit_base.UnitBase>`
+    """
+
+    def __init__(self):
+        self.__units = {}
+        self.__unit_ids = {}
+        self.__matrices = {}
+        self.__conversions = {}
+
+    @property
+    def dimensions(self) -> tuple[str, ...]:
+        """Names of the registered dimensions, in registration order.
+
+        Returns
+        -------
+        :py:class:`tuple`
+            Names of the registered dimensions.
+        """
+        return tuple(self.__unit_ids)
+
+    def register(self, dimension: str, units: dict[str, float | int]) -> None:
+        """It registers a dimension and its units. \n
+        Unit ids are assigned in the order of ``units``, starting from ``0``.
+        Registering again a dimension with the same units has no effect.
+
+        Parameters
+        ----------
+        ``dimension`` : :py:class:`str`
+            Name of the dimension, like the name of the unit class.
+        ``units`` : :py:class:`dict`
+            Conversion factor of each unit symbol to the reference unit of the
+            dimension.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               - If ``dimension`` is not a :py:class:`str`,
+               - if ``units`` is not a :py:class:`dict`,
+               - if a key of ``units`` is not a :py:class:`str`,
+               - if a value of ``units`` is not a :py:class:`float` or an
+                 :py:class:`int`.
+           ``ValueError``
+               - If ``units`` is an empty :py:class:`dict`,
+               - if a value of ``units`` is not positive,
+               - if ``dimension`` is already registered with different
+                 units.
+        """
+        if not isinstance(dimension, str):
+            raise TypeError("Parameter 'dimension' must be a string.")
+
+        if not isinstance(units, dict):
+            raise TypeError("Parameter 'units' must be a dictionary.")
+
+        if not units:
+            raise ValueError(
+                "Parameter 'units' cannot be an empty dictionary."
+            )
+
+        for unit, factor in units.items():
+            if not isinstance(unit, str):
+                raise TypeError("Each key of 'units' must be a string.")
+
+            if not isinstance(factor, float | int) or \
+                    isinstance(factor, bool):
+                raise TypeError(
+                    "Each value of 'units' must be a float or an integer."
+                )
+
+            if factor <= 0:
+                raise ValueError("Each value of 'units' must be positive.")
+
+        if dimension in self.__unit_ids:
+            if units != self.__units[dimension]:
+                raise ValueError(
+                    f"Dimension {dimension!r} is already registered with "
+                    f"different units."
+                )
+            return
+
+        dimension = intern(dimension)
+        symbols = [intern(unit) for unit in units]
+        factors = np.array(list(units.values()), dtype=float)
+
+        # entry (i, j) converts a value from unit i to unit j, with exact
+        # ones on the diagonal
+        matrix = factors[:, np.newaxis]/factors[np.newaxis, :]
+        np.fill_diagonal(matrix, 1.0)
+        matrix.setflags(write=False)
+
+        self.__units[dimension] = dict(units)
+        self.__unit_ids[dimension] = {
+            unit: unit_id for unit_id, unit in enumerate(symbols)
+        }
+        self.__matrices[dimension] = matrix
+        self.__conversions[dimension] = {
+            unit: {
+                target_unit: float(matrix[i, j])
+                for j, target_unit in enumerate(symbols)
+            }
+            for i, unit in enumerate(symbols)
+        }
+
+    def get_units(self, dimension: str) -> tuple[str, ...]:
+        """It gets the unit symbols of a dimension, sorted by unit id.
+
+        Parameters
+        ----------
+        ``dimension`` : :py:class:`str`
+            Name of the registered dimension.
+
+        Returns
+        -------
+        :py:class:`tuple`
+            Unit symbols of the dimension.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``KeyError``
+               If ``dimension`` is not registered.
+        """
+        return tuple(self.__get(self.__unit_ids, dimension))
+
+    def get_unit_id(self, dimension: str, unit: str) -> int:
+        """It gets the integer id of a unit symbol, which is the index of the
+        unit in the rows and columns of the conversion matrix of the
+        dimension.
+
+        Parameters
+        ----------
+        ``dimension`` : :py:class:`str`
+            Name of the registered dimension.
+        ``unit`` : :py:class:`str`
+            Symbol of the unit of measurement.
+
+        Returns
+        -------
+        :py:class:`int`
+            Id of the unit symbol.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``KeyError``
+               - If ``dimension`` is not registered,
+               - if ``unit`` is not among the units of ``dimension``.
+        """
+        unit_ids = self.__get(self.__unit_ids, dimension)
+        if unit not in unit_ids:
+            raise KeyError(
+                f"{dimension} unit {unit!r} not available. Available units "
+                f"are: {list(unit_ids)}."
+            )
+
+        return unit_ids[unit]
+
+    def get_conversion_matrix(self, dimension: str) -> np.ndarray:
+        """It gets the matrix of the conversion factors between the units of a
+        dimension. \n
+        Entry ``(i, j)`` is the factor which converts a value from the unit
+        with id ``i`` to the unit with id ``j``, so many values in different
+        units can be converted at once by indexing the matrix with arrays of
+        unit ids. The matrix is read-only.
+
+        Parameters
+        ----------
+        ``dimension`` : :py:class:`str`
+            Name of the registered dimension.
+
+        Returns
+        -------
+        :py:class:`numpy.ndarray`
+            Square matrix of conversion factors.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``KeyError``
+               If ``dimension`` is not registered.
+        """
+        return self.__get(self.__matrices, dimension)
+
+    def get_conversions(self, dimension: str) -> dict[str, dict[str, float]]:
+        """It gets the conversion factors between the units of a dimension,
+        as a nested :py:class:`dict` indexed by source and target unit
+        symbols. \n
+        It holds the same factors of :py:meth:`get_conversion_matrix`, but it
+        is faster to index with unit symbols, so unit objects use it to look
+        up the factor of a pair of units. It must not be modified.
+
+        Parameters
+        ----------
+        ``dimension`` : :py:class:`str`
+            Name of the registered dimension.
+
+        Returns
+        -------
+        :py:class:`dict`
+            Conversion factors between the units of the dimension.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``KeyError``
+               If ``dimension`` is not registered.
+        """
+        return self.__get(self.__conversions, dimension)
+
+    def get_conversion_factor(
+        self,
+        dimension: str,
+        unit: str,
+        target_unit: str
+    ) -> float:
+        """It gets the factor which converts a value from ``unit`` to
+        ``target_unit``.
+
+        Parameters
+        ----------
+        ``dimension`` : :py:class:`str`
+            Name of the registered dimension.
+        ``unit`` : :py:class:`str`
+            Symbol of the unit from which to convert.
+        ``target_unit`` : :py:class:`str`
+            Symbol of the unit to which to convert.
+
+        Returns
+        -------
+        :py:class:`float`
+            Conversion factor.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``KeyError``
+               - If ``dimension`` is not registered,
+               - if ``unit`` or ``target_unit`` is not among the units of
+                 ``dimension``.
+
+        .. admonition:: Examples
+           :class: important
+
+           >>> from gearpy.units.unit_registry import UNIT_REGISTRY
+           >>> UNIT_REGISTRY.get_conversion_factor('Time', 'hour', 'sec')
+           3600.0
+        """
+        conversions = self.__get(self.__conversions, dimension)
+        for symbol in (unit, target_unit):
+            if symbol not in conversions:
+                raise KeyError(
+                    f"{dimension} unit {symbol!r} not available. Available "
+                    f"units are: {list(conversions)}."
+                )
+
+        return conversions[unit][target_unit]
+
+    def __get(self, registry: dict, dimension: str):
+
+        if dimension not in registry:
+            raise KeyError(
+                f"Dimension {dimension!r} not registered. Registered "
+                f"dimensions are: {list(self.__unit_ids)}."
+            )
+
+        return registry[dimension]
+
+
+UNIT_REGISTRY = UnitRegistry()
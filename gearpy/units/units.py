@@ -27,6 +27,8 @@ class AngularPosition(UnitBase):
         It computes the tangent of the angular position at a given frequency.
     """
 
+    __slots__ = ('__value', '__unit')
+
     __UNITS = {
         'rad': 1,
         'deg': pi/180,
@@ -38,7 +40,7 @@ class AngularPosition(UnitBase):
     def __init__(self, value: float | int, unit: str):
         super().__init__(value=value, unit=unit)
 
-        if unit not in self.__UNITS.keys():
+        if unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{unit}' not available. "
                 f"Available units are: {list(self.__UNITS.keys())}."
@@ -56,7 +58,7 @@ class AngularPosition(UnitBase):
                 f"by a {other.__class__.__name__}."
             )
 
-        return AngularPosition(value=self.__value*other, unit=self.__unit)
+        return AngularPosition._new(value=self.__value*other, unit=self.__unit)
 
     def __rmul__(self, other: float | int) -> AngularPosition:
         super().__rmul__(other=other)
@@ -67,7 +69,7 @@ class AngularPosition(UnitBase):
                 f"by an {self.__class__.__name__}."
             )
 
-        return AngularPosition(value=self.__value*other, unit=self.__unit)
+        return AngularPosition._new(value=self.__value*other, unit=self.__unit)
 
     def __truediv__(
         self,
@@ -75,16 +77,19 @@ class AngularPosition(UnitBase):
     ) -> AngularPosition | float:
         super().__truediv__(other=other)
 
-        if not isinstance(other, AngularPosition | float | int):
+        if not isinstance(other, float | int | AngularPosition):
             raise TypeError(
                 f"It is not allowed to divide an {self.__class__.__name__} by "
                 f"a {other.__class__.__name__}."
             )
 
-        if isinstance(other, AngularPosition):
-            return self.__value/other.to(self.__unit).value
+        if isinstance(other, float | int):
+            return AngularPosition._new(
+                value=self.__value/other,
+                unit=self.__unit
+            )
         else:
-            return AngularPosition(value=self.__value/other, unit=self.__unit)
+            return self.__value/other._to_value(self.__unit)
 
     @property
     def value(self) -> float | int:
@@ -188,7 +193,7 @@ class AngularPosition(UnitBase):
         """
         super().to(target_unit=target_unit, inplace=inplace)
 
-        if target_unit not in self.__UNITS.keys():
+        if target_unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{target_unit}' not "
                 f"available. Available units are: {list(self.__UNITS.keys())}."
@@ -205,7 +210,7 @@ class AngularPosition(UnitBase):
             self.__unit = target_unit
             return self
         else:
-            return AngularPosition(value=target_value, unit=target_unit)
+            return AngularPosition._new(value=target_value, unit=target_unit)
 
     def sin(self, frequency: float | int | None = 1/2/pi) -> float:
         r"""It computes the sine of the angular position at a given frequency.
@@ -221,7 +226,7 @@ class AngularPosition(UnitBase):
         :py:class:`float`
             Computed sine of the angular position.
         """
-        return sin(2*pi*frequency*self.to('rad').value)
+        return sin(2*pi*frequency*self._to_value('rad'))
 
     def cos(self, frequency: float | int | None = 1/2/pi) -> float:
         r"""It computes the cosine of the angular position at a given
@@ -238,7 +243,7 @@ class AngularPosition(UnitBase):
         :py:class:`float`
             Computed cosine of the angular position.
         """
-        return cos(2*pi*frequency*self.to('rad').value)
+        return cos(2*pi*frequency*self._to_value('rad'))
 
     def tan(self, frequency: float | int | None = 1/2/pi) -> float:
         r"""It computes the tangent of the angular position at a given
@@ -255,7 +260,7 @@ class AngularPosition(UnitBase):
         :py:class:`float`
             Computed tangent of the angular position.
         """
-        return tan(2*pi*frequency*self.to('rad').value)
+        return tan(2*pi*frequency*self._to_value('rad'))
 
 
 class Angle(AngularPosition):
@@ -281,6 +286,8 @@ class Angle(AngularPosition):
         It computes the tangent of the angle at a given frequency.
     """
 
+    __slots__ = ('__value', '__unit')
+
     def __init__(self, value: float | int, unit: str):
         super().__init__(value=value, unit=unit)
 
@@ -298,12 +305,12 @@ class Angle(AngularPosition):
 
         if isinstance(other, Angle):
             return Angle(
-                value=self.__value + other.to(self.__unit).value,
+                value=self.__value + other._to_value(self.__unit),
                 unit=self.__unit
             )
         else:
             return AngularPosition(
-                value=self.__value + other.to(self.__unit).value,
+                value=self.__value + other._to_value(self.__unit),
                 unit=self.__unit
             )
 
@@ -315,12 +322,12 @@ class Angle(AngularPosition):
 
         if isinstance(other, Angle):
             return Angle(
-                value=self.__value - other.to(self.__unit).value,
+                value=self.__value - other._to_value(self.__unit),
                 unit=self.__unit
             )
         else:
             return AngularPosition(
-                value=self.__value + other.to(self.__unit).value,
+                value=self.__value + other._to_value(self.__unit),
                 unit=self.__unit
             )
 
@@ -351,7 +358,7 @@ class Angle(AngularPosition):
         super().__truediv__(other=other)
 
         if isinstance(other, AngularPosition):
-            return self.__value/other.to(self.__unit).value
+            return self.__value/other._to_value(self.__unit)
         else:
             return Angle(value=self.__value/other, unit=self.__unit)
 
@@ -532,6 +539,8 @@ class AngularSpeed(UnitBase):
         ``target_unit`` as the reference unit of measurement.
     """
 
+    __slots__ = ('__value', '__unit')
+
     __UNITS = {
         'rad/s': 1,
         'rad/min': 1/60,
@@ -547,7 +556,7 @@ class AngularSpeed(UnitBase):
     def __init__(self, value: float | int, unit: str):
         super().__init__(value=value, unit=unit)
 
-        if unit not in self.__UNITS.keys():
+        if unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{unit}' not available. "
                 f"Available units are: {list(self.__UNITS.keys())}."
@@ -562,19 +571,22 @@ class AngularSpeed(UnitBase):
     ) -> AngularPosition | AngularSpeed:
         super().__mul__(other=other)
 
-        if not isinstance(other, Time | float | int):
+        if not isinstance(other, float | int | Time):
             raise TypeError(
                 f"It is not allowed to multiply a {self.__class__.__name__} "
                 f"by a {other.__class__.__name__}."
             )
 
-        if isinstance(other, Time):
-            return AngularPosition(
-                value=self.to('rad/s').value*other.to('sec').value,
-                unit='rad'
+        if isinstance(other, float | int):
+            return AngularSpeed._new(
+                value=self.__value*other,
+                unit=self.__unit
             )
         else:
-            return AngularSpeed(value=self.__value*other, unit=self.__unit)
+            return AngularPosition._new(
+                value=self._to_value('rad/s')*other._to_value('sec'),
+                unit='rad'
+            )
 
     def __rmul__(
         self,
@@ -582,19 +594,22 @@ class AngularSpeed(UnitBase):
     ) -> AngularPosition | AngularSpeed:
         super().__rmul__(other=other)
 
-        if not isinstance(other, Time | float | int):
+        if not isinstance(other, float | int | Time):
             raise TypeError(
                 f"It is not allowed to multiply a {other.__class__.__name__} "
                 f"by a {self.__class__.__name__}."
             )
 
-        if isinstance(other, Time):
-            return AngularPosition(
-                value=self.to('rad/s').value*other.to('sec').value,
-                unit='rad'
+        if isinstance(other, float | int):
+            return AngularSpeed._new(
+                value=self.__value*other,
+                unit=self.__unit
             )
         else:
-            return AngularSpeed(value=self.__value*other, unit=self.__unit)
+            return AngularPosition._new(
+                value=self._to_value('rad/s')*other._to_value('sec'),
+                unit='rad'
+            )
 
     def __truediv__(
         self,
@@ -602,16 +617,19 @@ class AngularSpeed(UnitBase):
     ) -> AngularSpeed | float:
         super().__truediv__(other=other)
 
-        if not isinstance(other, AngularSpeed | float | int):
+        if not isinstance(other, float | int | AngularSpeed):
             raise TypeError(
                 f"It is not allowed to divide a {self.__class__.__name__} by "
                 f"a {other.__class__.__name__}."
             )
 
-        if isinstance(other, AngularSpeed):
-            return self.__value/other.to(self.__unit).value
+        if isinstance(other, float | int):
+            return AngularSpeed._new(
+                value=self.__value/other,
+                unit=self.__unit
+            )
         else:
-            return AngularSpeed(value=self.__value/other, unit=self.__unit)
+            return self.__value/other._to_value(self.__unit)
 
     @property
     def value(self) -> float | int:
@@ -721,7 +739,7 @@ class AngularSpeed(UnitBase):
         """
         super().to(target_unit=target_unit, inplace=inplace)
 
-        if target_unit not in self.__UNITS.keys():
+        if target_unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{target_unit}' not "
                 f"available. Available units are: {list(self.__UNITS.keys())}."
@@ -738,7 +756,7 @@ class AngularSpeed(UnitBase):
             self.__unit = target_unit
             return self
         else:
-            return AngularSpeed(value=target_value, unit=target_unit)
+            return AngularSpeed._new(value=target_value, unit=target_unit)
 
 
 class AngularAcceleration(UnitBase):
@@ -760,6 +778,8 @@ class AngularAcceleration(UnitBase):
         measurement.
     """
 
+    __slots__ = ('__value', '__unit')
+
     __UNITS = {
         'rad/s^2': 1,
         'deg/s^2': pi/180,
@@ -769,7 +789,7 @@ class AngularAcceleration(UnitBase):
     def __init__(self, value: float | int, unit: str):
         super().__init__(value=value, unit=unit)
 
-        if unit not in self.__UNITS.keys():
+        if unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{unit}' not available. "
                 f"Available units are: {list(self.__UNITS.keys())}."
@@ -784,22 +804,22 @@ class AngularAcceleration(UnitBase):
     ) -> AngularAcceleration | AngularSpeed:
         super().__mul__(other=other)
 
-        if not isinstance(other, Time | float | int):
+        if not isinstance(other, float | int | Time):
             raise TypeError(
                 f"It is not allowed to multiply an {self.__class__.__name__} "
                 f"by a {other.__class__.__name__}."
             )
 
-        if isinstance(other, Time):
-            return AngularSpeed(
-                value=self.to('rad/s^2').value*other.to('sec').value,
-                unit='rad/s'
-            )
-        else:
-            return AngularAcceleration(
+        if isinstance(other, float | int):
+            return AngularAcceleration._new(
                 value=self.__value*other,
                 unit=self.__unit
             )
+        else:
+            return AngularSpeed._new(
+                value=self._to_value('rad/s^2')*other._to_value('sec'),
+                unit='rad/s'
+            )
 
     def __rmul__(
         self,
@@ -807,22 +827,22 @@ class AngularAcceleration(UnitBase):
     ) -> AngularAcceleration | AngularSpeed:
         super().__rmul__(other=other)
 
-        if not isinstance(other, Time | float | int):
+        if not isinstance(other, float | int | Time):
             raise TypeError(
                 f"It is not allowed to multiply a {other.__class__.__name__} "
                 f"by an {self.__class__.__name__}."
             )
 
-        if isinstance(other, Time):
-            return AngularSpeed(
-                value=self.to('rad/s^2').value*other.to('sec').value,
-                unit='rad/s'
-            )
-        else:
-            return AngularAcceleration(
+        if isinstance(other, float | int):
+            return AngularAcceleration._new(
                 value=self.__value*other,
                 unit=self.__unit
             )
+        else:
+            return AngularSpeed._new(
+                value=self._to_value('rad/s^2')*other._to_value('sec'),
+                unit='rad/s'
+            )
 
     def __truediv__(
         self,
@@ -830,19 +850,19 @@ class AngularAcceleration(UnitBase):
     ) -> AngularAcceleration | float:
         super().__truediv__(other=other)
 
-        if not isinstance(other, AngularAcceleration | float | int):
+        if not isinstance(other, float | int | AngularAcceleration):
             raise TypeError(
                 f"It is not allowed to divide an {self.__class__.__name__} by "
                 f"a {other.__class__.__name__}."
             )
 
-        if isinstance(other, AngularAcceleration):
-            return self.__value/other.to(self.__unit).value
-        else:
-            return AngularAcceleration(
+        if isinstance(other, float | int):
+            return AngularAcceleration._new(
                 value=self.__value/other,
                 unit=self.__unit
             )
+        else:
+            return self.__value/other._to_value(self.__unit)
 
     @property
     def value(self) -> float | int:
@@ -950,7 +970,7 @@ class AngularAcceleration(UnitBase):
         """
         super().to(target_unit=target_unit, inplace=inplace)
 
-        if target_unit not in self.__UNITS.keys():
+        if target_unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{target_unit}' not "
                 f"available. Available units are: {list(self.__UNITS.keys())}."
@@ -967,7 +987,10 @@ class AngularAcceleration(UnitBase):
             self.__unit = target_unit
             return self
         else:
-            return AngularAcceleration(value=target_value, unit=target_unit)
+            return AngularAcceleration._new(
+                value=target_value,
+                unit=target_unit
+            )
 
 
 class InertiaMoment(UnitBase):
@@ -987,6 +1010,8 @@ class InertiaMoment(UnitBase):
         ``target_unit`` as the reference unit of measurement.
     """
 
+    __slots__ = ('__value', '__unit')
+
     __UNITS = {
         'kgm^2': 1,
         'kgdm^2': 1e-2,
@@ -1001,7 +1026,7 @@ class InertiaMoment(UnitBase):
     def __init__(self, value: float | int, unit: str):
         super().__init__(value=value, unit=unit)
 
-        if unit not in self.__UNITS.keys():
+        if unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{unit}' not available. "
                 f"Available units are: {list(self.__UNITS.keys())}."
@@ -1053,16 +1078,16 @@ class InertiaMoment(UnitBase):
     ) -> InertiaMoment | float:
         super().__truediv__(other=other)
 
-        if not isinstance(other, InertiaMoment | float | int):
+        if not isinstance(other, float | int | InertiaMoment):
             raise TypeError(
                 f"It is not allowed to divide an {self.__class__.__name__} by "
                 f"a {other.__class__.__name__}."
             )
 
-        if isinstance(other, InertiaMoment):
-            return self.__value/other.to(self.__unit).value
-        else:
+        if isinstance(other, float | int):
             return InertiaMoment(value=self.__value/other, unit=self.__unit)
+        else:
+            return self.__value/other._to_value(self.__unit)
 
     @property
     def value(self) -> float | int:
@@ -1172,7 +1197,7 @@ class InertiaMoment(UnitBase):
         """
         super().to(target_unit=target_unit, inplace=inplace)
 
-        if target_unit not in self.__UNITS.keys():
+        if target_unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{target_unit}' not "
                 f"available. Available units are: {list(self.__UNITS.keys())}."
@@ -1209,6 +1234,8 @@ class Torque(UnitBase):
         ``target_unit`` as the reference unit of measurement.
     """
 
+    __slots__ = ('__value', '__unit')
+
     __UNITS = {
         'Nm': 1,
         'mNm': 1e-3,
@@ -1232,7 +1259,7 @@ class Torque(UnitBase):
     def __init__(self, value: float | int, unit: str):
         super().__init__(value=value, unit=unit)
 
-        if unit not in self.__UNITS.keys():
+        if unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{unit}' not available. "
                 f"Available units are: {list(self.__UNITS.keys())}."
@@ -1250,7 +1277,7 @@ class Torque(UnitBase):
                 f"by a {other.__class__.__name__}."
             )
 
-        return Torque(value=self.__value*other, unit=self.__unit)
+        return Torque._new(value=self.__value*other, unit=self.__unit)
 
     def __rmul__(self, other: float | int) -> Torque:
         super().__rmul__(other=other)
@@ -1261,7 +1288,7 @@ class Torque(UnitBase):
                 f"by a {self.__class__.__name__}."
             )
 
-        return Torque(value=self.__value*other, unit=self.__unit)
+        return Torque._new(value=self.__value*other, unit=self.__unit)
 
     def __truediv__(
         self,
@@ -1271,30 +1298,30 @@ class Torque(UnitBase):
 
         if not isinstance(
             other,
-            InertiaMoment | Length | Torque | float | int
+            float | int | InertiaMoment | Length | Torque
         ):
             raise TypeError(
                 f"It is not allowed to divide a {self.__class__.__name__} by "
                 f"a {other.__class__.__name__}."
             )
 
-        if isinstance(other, InertiaMoment):
-            return AngularAcceleration(
-                value=self.to('Nm').value/other.to('kgm^2').value,
+        if isinstance(other, float | int):
+            return Torque._new(
+                value=self.__value/other,
+                unit=self.__unit
+            )
+        elif isinstance(other, InertiaMoment):
+            return AngularAcceleration._new(
+                value=self._to_value('Nm')/other._to_value('kgm^2'),
                 unit='rad/s^2'
             )
         elif isinstance(other, Length):
-            return Force(
-                value=self.to('Nm').value/other.to('m').value,
+            return Force._new(
+                value=self._to_value('Nm')/other._to_value('m'),
                 unit='N'
             )
-        elif isinstance(other, Torque):
-            return self.__value/other.to(self.__unit).value
         else:
-            return Torque(
-                value=self.__value/other,
-                unit=self.__unit
-            )
+            return self.__value/other._to_value(self.__unit)
 
     @property
     def value(self) -> float | int:
@@ -1411,7 +1438,7 @@ class Torque(UnitBase):
         """
         super().to(target_unit=target_unit, inplace=inplace)
 
-        if target_unit not in self.__UNITS.keys():
+        if target_unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{target_unit}' not "
                 f"available. Available units are: {list(self.__UNITS.keys())}."
@@ -1428,7 +1455,7 @@ class Torque(UnitBase):
             self.__unit = target_unit
             return self
         else:
-            return Torque(value=target_value, unit=target_unit)
+            return Torque._new(value=target_value, unit=target_unit)
 
 
 class Time(UnitBase):
@@ -1448,6 +1475,8 @@ class Time(UnitBase):
         ``target_unit`` as the reference unit of measurement.
     """
 
+    __slots__ = ('__value', '__unit')
+
     __UNITS = {
         'sec': 1,
         'min': 60,
@@ -1458,7 +1487,7 @@ class Time(UnitBase):
     def __init__(self, value: float | int, unit: str):
         super().__init__(value=value, unit=unit)
 
-        if unit not in self.__UNITS.keys():
+        if unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{unit}' not available. "
                 f"Available units are: {list(self.__UNITS.keys())}."
@@ -1475,25 +1504,25 @@ class Time(UnitBase):
 
         if not isinstance(
             other,
-            AngularAcceleration | AngularSpeed | float | int
+            float | int | AngularAcceleration | AngularSpeed
         ):
             raise TypeError(
                 f"It is not allowed to multiply a {self.__class__.__name__} "
                 f"by a {other.__class__.__name__}."
             )
 
-        if isinstance(other, AngularAcceleration):
-            return AngularSpeed(
-                value=self.to('sec').value*other.to('rad/s^2').value,
+        if isinstance(other, float | int):
+            return Time._new(value=self.__value*other, unit=self.__unit)
+        elif isinstance(other, AngularAcceleration):
+            return AngularSpeed._new(
+                value=self._to_value('sec')*other._to_value('rad/s^2'),
                 unit='rad/s'
             )
-        elif isinstance(other, AngularSpeed):
-            return AngularPosition(
-                value=self.to('sec').value*other.to('rad/s').value,
+        else:
+            return AngularPosition._new(
+                value=self._to_value('sec')*other._to_value('rad/s'),
                 unit='rad'
             )
-        else:
-            return Time(value=self.__value*other, unit=self.__unit)
 
     def __rmul__(
         self,
@@ -1503,39 +1532,39 @@ class Time(UnitBase):
 
         if not isinstance(
             other,
-            AngularAcceleration | AngularSpeed | float | int
+            float | int | AngularAcceleration | AngularSpeed
         ):
             raise TypeError(
                 f"It is not allowed to multiply a {other.__class__.__name__} "
                 f"by a {self.__class__.__name__}."
             )
 
-        if isinstance(other, AngularAcceleration):
-            return AngularSpeed(
-                value=self.to('sec').value*other.to('rad/s^2').value,
+        if isinstance(other, float | int):
+            return Time._new(value=self.__value*other, unit=self.__unit)
+        elif isinstance(other, AngularAcceleration):
+            return AngularSpeed._new(
+                value=self._to_value('sec')*other._to_value('rad/s^2'),
                 unit='rad/s'
             )
-        elif isinstance(other, AngularSpeed):
-            return AngularPosition(
-                value=self.to('sec').value*other.to('rad/s').value,
+        else:
+            return AngularPosition._new(
+                value=self._to_value('sec')*other._to_value('rad/s'),
                 unit='rad'
             )
-        else:
-            return Time(value=self.__value*other, unit=self.__unit)
 
     def __truediv__(self, other: Time | float | int) -> Time | float:
         super().__truediv__(other=other)
 
-        if not isinstance(other, Time | float | int):
+        if not isinstance(other, float | int | Time):
             raise TypeError(
                 f"It is not allowed to divide a {self.__class__.__name__} "
                 f"by a {other.__class__.__name__}."
             )
 
-        if isinstance(other, Time):
-            return self.__value/other.to(self.__unit).value
+        if isinstance(other, float | int):
+            return Time._new(value=self.__value/other, unit=self.__unit)
         else:
-            return Time(value=self.__value/other, unit=self.__unit)
+            return self.__value/other._to_value(self.__unit)
 
     @property
     def value(self) -> float | int:
@@ -1639,7 +1668,7 @@ class Time(UnitBase):
         """
         super().to(target_unit=target_unit, inplace=inplace)
 
-        if target_unit not in self.__UNITS.keys():
+        if target_unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{target_unit}' not "
                 f"available. Available units are: {list(self.__UNITS.keys())}."
@@ -1656,7 +1685,7 @@ class Time(UnitBase):
             self.__unit = target_unit
             return self
         else:
-            return Time(value=target_value, unit=target_unit)
+            return Time._new(value=target_value, unit=target_unit)
 
 
 class TimeInterval(Time):
@@ -1676,6 +1705,8 @@ class TimeInterval(Time):
         ``target_unit`` as the reference unit of measurement.
     """
 
+    __slots__ = ('__value', '__unit')
+
     def __init__(self, value: float | int, unit: str):
         super().__init__(value=value, unit=unit)
 
@@ -1690,12 +1721,12 @@ class TimeInterval(Time):
 
         if isinstance(other, TimeInterval):
             return TimeInterval(
-                value=self.__value + other.to(self.__unit).value,
+                value=self.__value + other._to_value(self.__unit),
                 unit=self.__unit
             )
         else:
             return Time(
-                value=self.__value + other.to(self.__unit).value,
+                value=self.__value + other._to_value(self.__unit),
                 unit=self.__unit
             )
 
@@ -1704,12 +1735,12 @@ class TimeInterval(Time):
 
         if isinstance(other, TimeInterval):
             return TimeInterval(
-                value=self.__value - other.to(self.__unit).value,
+                value=self.__value - other._to_value(self.__unit),
                 unit=self.__unit
             )
         else:
             return Time(
-                value=self.__value + other.to(self.__unit).value,
+                value=self.__value + other._to_value(self.__unit),
                 unit=self.__unit
             )
 
@@ -1739,7 +1770,7 @@ class TimeInterval(Time):
         super().__truediv__(other=other)
 
         if isinstance(other, Time):
-            return self.__value/other.to(self.__unit).value
+            return self.__value/other._to_value(self.__unit)
         else:
             return TimeInterval(value=self.__value/other, unit=self.__unit)
 
@@ -1871,6 +1902,8 @@ class Length(UnitBase):
         ``target_unit`` as the reference unit of measurement.
     """
 
+    __slots__ = ('__value', '__unit')
+
     __UNITS = {
         'm': 1,
         'dm': 1e-1,
@@ -1881,7 +1914,7 @@ class Length(UnitBase):
     def __init__(self, value: float | int, unit: str):
         super().__init__(value=value, unit=unit)
 
-        if unit not in self.__UNITS.keys():
+        if unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{unit}' not available. "
                 f"Available units are: {list(self.__UNITS.keys())}."
@@ -1896,19 +1929,19 @@ class Length(UnitBase):
     def __mul__(self, other: Length | float | int) -> Surface | Length:
         super().__mul__(other=other)
 
-        if not isinstance(other, Length | float | int):
+        if not isinstance(other, float | int | Length):
             raise TypeError(
                 f"It is not allowed to multiply an {self.__class__.__name__} "
                 f"by a {other.__class__.__name__}."
             )
 
-        if isinstance(other, Length):
+        if isinstance(other, float | int):
+            return Length(value=self.__value*other, unit=self.__unit)
+        else:
             return Surface(
-                value=self.to('m').value*other.to('m').value,
+                value=self._to_value('m')*other._to_value('m'),
                 unit='m^2'
             )
-        else:
-            return Length(value=self.__value*other, unit=self.__unit)
 
     def __rmul__(self, other: float | int) -> Length:
         super().__rmul__(other=other)
@@ -1924,16 +1957,16 @@ class Length(UnitBase):
     def __truediv__(self, other: Length | float | int) -> Length | float:
         super().__truediv__(other=other)
 
-        if not isinstance(other, Length | float | int):
+        if not isinstance(other, float | int | Length):
             raise TypeError(
                 f"It is not allowed to divide an {self.__class__.__name__} by "
                 f"a {other.__class__.__name__}."
             )
 
-        if isinstance(other, Length):
-            return self.__value/other.to(self.__unit).value
-        else:
+        if isinstance(other, float | int):
             return Length(value=self.__value/other, unit=self.__unit)
+        else:
+            return self.__value/other._to_value(self.__unit)
 
     @property
     def value(self) -> float | int:
@@ -2038,7 +2071,7 @@ class Length(UnitBase):
         """
         super().to(target_unit=target_unit, inplace=inplace)
 
-        if target_unit not in self.__UNITS.keys():
+        if target_unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{target_unit}' not "
                 f"available. Available units are: {list(self.__UNITS.keys())}."
@@ -2075,6 +2108,8 @@ class Surface(UnitBase):
         ``target_unit`` as the reference unit of measurement.
     """
 
+    __slots__ = ('__value', '__unit')
+
     __UNITS = {
         'm^2': 1,
         'dm^2': 1e-2,
@@ -2085,7 +2120,7 @@ class Surface(UnitBase):
     def __init__(self, value: float | int, unit: str):
         super().__init__(value=value, unit=unit)
 
-        if unit not in self.__UNITS.keys():
+        if unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{unit}' not available. "
                 f"Available units are: {list(self.__UNITS.keys())}."
@@ -2122,16 +2157,16 @@ class Surface(UnitBase):
     def __truediv__(self, other: Surface | float | int) -> Surface | float:
         super().__truediv__(other=other)
 
-        if not isinstance(other, Surface | float | int):
+        if not isinstance(other, float | int | Surface):
             raise TypeError(
                 f"It is not allowed to divide an {self.__class__.__name__} by "
                 f"a {other.__class__.__name__}."
             )
 
-        if isinstance(other, Surface):
-            return self.__value/other.to(self.__unit).value
-        else:
+        if isinstance(other, float | int):
             return Surface(value=self.__value/other, unit=self.__unit)
+        else:
+            return self.__value/other._to_value(self.__unit)
 
     @property
     def value(self) -> float | int:
@@ -2237,7 +2272,7 @@ class Surface(UnitBase):
         """
         super().to(target_unit=target_unit, inplace=inplace)
 
-        if target_unit not in self.__UNITS.keys():
+        if target_unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{target_unit}' not "
                 f"available. Available units are: {list(self.__UNITS.keys())}."
@@ -2274,6 +2309,8 @@ class Force(UnitBase):
         ``target_unit`` as the reference unit of measurement.
     """
 
+    __slots__ = ('__value', '__unit')
+
     __UNITS = {
         'N': 1,
         'mN': 1e-3,
@@ -2285,7 +2322,7 @@ class Force(UnitBase):
     def __init__(self, value: float | int, unit: str):
         super().__init__(value=value, unit=unit)
 
-        if unit not in self.__UNITS.keys():
+        if unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{unit}' not available. "
                 f"Available units are: {list(self.__UNITS.keys())}."
@@ -2303,7 +2340,7 @@ class Force(UnitBase):
                 f"by a {other.__class__.__name__}."
             )
 
-        return Force(value=self.__value*other, unit=self.__unit)
+        return Force._new(value=self.__value*other, unit=self.__unit)
 
     def __rmul__(self, other: float | int) -> Force:
         super().__rmul__(other=other)
@@ -2314,7 +2351,7 @@ class Force(UnitBase):
                 f"by an {self.__class__.__name__}."
             )
 
-        return Force(value=self.__value*other, unit=self.__unit)
+        return Force._new(value=self.__value*other, unit=self.__unit)
 
     def __truediv__(
         self,
@@ -2322,21 +2359,21 @@ class Force(UnitBase):
     ) -> Force | Stress | float:
         super().__truediv__(other=other)
 
-        if not isinstance(other, Force | Surface | float | int):
+        if not isinstance(other, float | int | Force | Surface):
             raise TypeError(
                 f"It is not allowed to divide an {self.__class__.__name__} by "
                 f"a {other.__class__.__name__}."
             )
 
         if isinstance(other, Force):
-            return self.__value/other.to(self.__unit).value
+            return self.__value/other._to_value(self.__unit)
         elif isinstance(other, Surface):
-            return Stress(
-                value=self.to('N').value/other.to('m^2').value,
+            return Stress._new(
+                value=self._to_value('N')/other._to_value('m^2'),
                 unit='Pa'
             )
         else:
-            return Force(value=self.__value/other, unit=self.__unit)
+            return Force._new(value=self.__value/other, unit=self.__unit)
 
     @property
     def value(self) -> float | int:
@@ -2440,7 +2477,7 @@ class Force(UnitBase):
         """
         super().to(target_unit=target_unit, inplace=inplace)
 
-        if target_unit not in self.__UNITS.keys():
+        if target_unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{target_unit}' not "
                 f"available. Available units are: {list(self.__UNITS.keys())}."
@@ -2457,7 +2494,7 @@ class Force(UnitBase):
             self.__unit = target_unit
             return self
         else:
-            return Force(value=target_value, unit=target_unit)
+            return Force._new(value=target_value, unit=target_unit)
 
 
 class Stress(UnitBase):
@@ -2477,6 +2514,8 @@ class Stress(UnitBase):
         ``target_unit`` as the reference unit of measurement.
     """
 
+    __slots__ = ('__value', '__unit')
+
     __UNITS = {
         'Pa': 1,
         'kPa': 1e3,
@@ -2487,7 +2526,7 @@ class Stress(UnitBase):
     def __init__(self, value: float | int, unit: str):
         super().__init__(value=value, unit=unit)
 
-        if unit not in self.__UNITS.keys():
+        if unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{unit}' not available. "
                 f"Available units are: {list(self.__UNITS.keys())}."
@@ -2505,7 +2544,7 @@ class Stress(UnitBase):
                 f"by a {other.__class__.__name__}."
             )
 
-        return Stress(value=self.__value*other, unit=self.__unit)
+        return Stress._new(value=self.__value*other, unit=self.__unit)
 
     def __rmul__(self, other: float | int) -> Stress:
         super().__rmul__(other=other)
@@ -2516,21 +2555,21 @@ class Stress(UnitBase):
                 f"by an {self.__class__.__name__}."
             )
 
-        return Stress(value=self.__value*other, unit=self.__unit)
+        return Stress._new(value=self.__value*other, unit=self.__unit)
 
     def __truediv__(self, other: Stress | float | int) -> Stress | float:
         super().__truediv__(other=other)
 
-        if not isinstance(other, Stress | float | int):
+        if not isinstance(other, float | int | Stress):
             raise TypeError(
                 f"It is not allowed to divide an {self.__class__.__name__} by "
                 f"a {other.__class__.__name__}."
             )
 
-        if isinstance(other, Stress):
-            return self.__value/other.to(self.__unit).value
+        if isinstance(other, float | int):
+            return Stress._new(value=self.__value/other, unit=self.__unit)
         else:
-            return Stress(value=self.__value/other, unit=self.__unit)
+            return self.__value/other._to_value(self.__unit)
 
     @property
     def value(self) -> float | int:
@@ -2633,7 +2672,7 @@ class Stress(UnitBase):
         """
         super().to(target_unit=target_unit, inplace=inplace)
 
-        if target_unit not in self.__UNITS.keys():
+        if target_unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{target_unit}' not "
                 f"available. Available units are: {list(self.__UNITS.keys())}."
@@ -2650,7 +2689,7 @@ class Stress(UnitBase):
             self.__unit = target_unit
             return self
         else:
-            return Stress(value=target_value, unit=target_unit)
+            return Stress._new(value=target_value, unit=target_unit)
 
 
 class Current(UnitBase):
@@ -2670,6 +2709,8 @@ class Current(UnitBase):
         ``target_unit`` as the reference unit of measurement.
     """
 
+    __slots__ = ('__value', '__unit')
+
     __UNITS = {
         'A': 1,
         'mA': 1e-3,
@@ -2679,7 +2720,7 @@ class Current(UnitBase):
     def __init__(self, value: float | int, unit: str):
         super().__init__(value=value, unit=unit)
 
-        if unit not in self.__UNITS.keys():
+        if unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{unit}' not available. "
                 f"Available units are: {list(self.__UNITS.keys())}."
@@ -2697,7 +2738,7 @@ class Current(UnitBase):
                 f"by a {other.__class__.__name__}."
             )
 
-        return Current(value=self.__value*other, unit=self.__unit)
+        return Current._new(value=self.__value*other, unit=self.__unit)
 
     def __rmul__(self, other: float | int) -> Current:
         super().__rmul__(other=other)
@@ -2708,21 +2749,21 @@ class Current(UnitBase):
                 f"by an {self.__class__.__name__}."
             )
 
-        return Current(value=self.__value*other, unit=self.__unit)
+        return Current._new(value=self.__value*other, unit=self.__unit)
 
     def __truediv__(self, other: Current | float | int) -> Current | float:
         super().__truediv__(other=other)
 
-        if not isinstance(other, Current | float | int):
+        if not isinstance(other, float | int | Current):
             raise TypeError(
                 f"It is not allowed to divide an {self.__class__.__name__} by "
                 f"a {other.__class__.__name__}."
             )
 
-        if isinstance(other, Current):
-            return self.__value/other.to(self.__unit).value
+        if isinstance(other, float | int):
+            return Current._new(value=self.__value/other, unit=self.__unit)
         else:
-            return Current(value=self.__value/other, unit=self.__unit)
+            return self.__value/other._to_value(self.__unit)
 
     @property
     def value(self) -> float | int:
@@ -2824,7 +2865,7 @@ class Current(UnitBase):
         """
         super().to(target_unit=target_unit, inplace=inplace)
 
-        if target_unit not in self.__UNITS.keys():
+        if target_unit not in self.__UNITS:
             raise KeyError(
                 f"{self.__class__.__name__} unit '{target_unit}' not "
                 f"available. Available units are: {list(self.__UNITS.keys())}."
@@ -2841,4 +2882,4 @@ class Current(UnitBase):
             self.__unit = target_unit
             return self
         else:
-            return Current(value=target_value, unit=target_unit)
+            return Current._new(value=target_value, unit=target_unit)
@@ -4,6 +4,7 @@ __all__ = [
     "add_fixed_joint",
     "add_gear_mating",
     "add_worm_gear_mating",
+    "LinearLoad",
     "StopCondition"
 ]
 
@@ -13,4 +14,5 @@ from .export import export_time_variables
 from .relations import add_fixed_joint
 from .relations import add_gear_mating
 from .relations import add_worm_gear_mating
+from .linear_load import LinearLoad
 from .stop_condition.stop_condition import StopCondition
@@ -1,12 +1,16 @@
+from __future__ import annotations
 from gearpy.mechanical_objects import DCMotor
-from gearpy.units import Time
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+from gearpy.units import Time, TimeSeries
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from matplotlib.animation import FuncAnimation
 
 
 def dc_motor_characteristics_animation(
     motor: DCMotor,
-    time: list[Time],
+    time: list[Time] | TimeSeries,
     interval: float | int | None = 200,
     torque_speed_curve: bool | None = True,
     torque_current_curve: bool | None = True,
@@ -42,7 +46,7 @@ def dc_motor_characteristics_animation(
     ``motor`` : :py:class:`DCMotor <gearpy.mechanical_objects.dc_motor.DCMotor>`
         DC motor whose characteristic curves and working point have to be
         animated.
-    ``time`` : :py:class:`list`
+    ``time`` : :py:class:`list` or :py:class:`TimeSeries <gearpy.units.time_series.TimeSeries>`
         The list of ``Time`` computed by the solver.
     ``interval`` : :py:class:`float` or :py:class:`int`, optional
         Delay between animation frames in milliseconds. If not provided
@@ -99,7 +103,8 @@ def dc_motor_characteristics_animation(
        ``TypeError``
            - If ``motor`` is not an instance of
              :py:class:`DCMotor <gearpy.mechanical_objects.dc_motor.DCMotor>`,
-           - if ``time`` is not a :py:class:`list`,
+           - if ``time`` is not a :py:class:`list` or an instance of
+             :py:class:`TimeSeries <gearpy.units.time_series.TimeSeries>`,
            - if an element of ``time`` is not an instance of
              :py:class:`Time <gearpy.units.units.Time>`,
            - if ``interval`` is not a :py:class:`float` or an :py:class:`int`,
@@ -144,8 +149,11 @@ def dc_motor_characteristics_animation(
             f"Parameter 'motor' must be an instance of {DCMotor.__name__!r}."
         )
 
-    if not isinstance(time, list):
-        raise TypeError("Parameter 'time' must be a list.")
+    if not isinstance(time, list | TimeSeries):
+        raise TypeError(
+            f"Parameter 'time' must be a list or an instance of "
+            f"{TimeSeries.__name__!r}."
+        )
 
     if not time:
         raise ValueError("Parameter 'time' cannot be an empty list.")
@@ -233,6 +241,9 @@ def dc_motor_characteristics_animation(
     if not isinstance(show, bool):
         raise TypeError("Parameter 'show' must be a bool.")
 
+    import matplotlib.pyplot as plt
+    from matplotlib.animation import FuncAnimation
+
     fig, ax = plt.subplots(
         ncols=torque_speed_curve + torque_current_curve,
         nrows=1,
@@ -242,18 +253,16 @@ def dc_motor_characteristics_animation(
 
     motor_maximum_torque = motor.maximum_torque.to(torque_unit).value
 
-    motor_instant_driving_torque = [
-        torque.to(torque_unit).value
-        for torque in motor.time_variables['driving torque']
-    ]
+    motor_instant_driving_torque = \
+        motor.time_variables['driving torque'].get_values(torque_unit)
 
     total_padding = 1 + padding
 
     if torque_speed_curve:
-        motor_instant_angular_speed = [
-            speed.to(angular_speed_unit).value
-            for speed in motor.time_variables['angular speed']
-        ]
+        motor_instant_angular_speed = \
+            motor.time_variables['angular speed'].get_values(
+                angular_speed_unit
+            )
         motor_no_speed = motor.no_load_speed.to(angular_speed_unit).value
         speeds = [-total_padding*motor_no_speed, total_padding*motor_no_speed]
 
@@ -345,10 +354,8 @@ def dc_motor_characteristics_animation(
         ax_ts.tick_params(bottom=False, top=False, left=False, right=False)
 
     if torque_current_curve:
-        motor_instant_electric_current = [
-            current.to(current_unit).value
-            for current in motor.time_variables['electric current']
-        ]
+        motor_instant_electric_current = \
+            motor.time_variables['electric current'].get_values(current_unit)
         motor_no_load_electric_current = \
             motor.no_load_electric_current.to(current_unit).value
         motor_maximum_electric_current = \
@@ -1,13 +1,18 @@
+from __future__ import annotations
 from gearpy.mechanical_objects import RotatingObject
-from gearpy.units import Time
-import pandas as pd
+from gearpy.units import Time, TimeSeries
 import os
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def export_time_variables(
     rotating_object: RotatingObject,
     file_path: str,
-    time_array: list[Time],
+    time_array: list[Time] | TimeSeries,
     time_unit: str | None = 'sec',
     angular_position_unit: str | None = 'rad',
     angular_speed_unit: str | None = 'rad/s',
@@ -33,8 +38,9 @@ def export_time_variables(
     ``file_path`` : :py:class:`str`
         Path to the file in which to save the time variables. It must be a
         non-empty :py:class:`str`.
-    ``time_array`` : :py:class:`list`
-        Simulated time steps. It must be a non-empty :py:class:`list`.
+    ``time_array`` : :py:class:`list` or :py:class:`TimeSeries <gearpy.units.time_series.TimeSeries>`
+        Simulated time steps. It must be a non-empty :py:class:`list` or
+        :py:class:`TimeSeries <gearpy.units.time_series.TimeSeries>`.
     ``time_unit`` : :py:class:`str`, optional
         Symbol of the unit of measurement to which convert the time values in
         the exported file. It must be a :py:class:`str`. Default is ``'sec'``.
@@ -95,7 +101,8 @@ def export_time_variables(
            - If ``rotating_object`` is not an instance of
              :py:class:`RotatingObject <gearpy.mechanical_objects.mechanical_object_base.RotatingObject>`,
            - if ``file_path`` is not a :py:class:`str`,
-           - if ``time_array`` is not a :py:class:`list`,
+           - if ``time_array`` is not a :py:class:`list` or an instance of
+             :py:class:`TimeSeries <gearpy.units.time_series.TimeSeries>`,
            - if an element of ``time_array`` is not an instance of
              :py:class:`Time <gearpy.units.units.Time>` or a
              :py:class:`str`,
@@ -125,8 +132,11 @@ def export_time_variables(
     if not file_path:
         raise ValueError("Parameter 'file_path' cannot be an empty string.")
 
-    if not isinstance(time_array, list):
-        raise TypeError("Parameter 'time_array' must be a list.")
+    if not isinstance(time_array, list | TimeSeries):
+        raise TypeError(
+            f"Parameter 'time_array' must be a list or an instance of "
+            f"{TimeSeries.__name__!r}."
+        )
 
     if not time_array:
         raise ValueError("Parameter 'time_array' cannot be an empty list.")
@@ -170,7 +180,8 @@ def export_time_variables(
     if not isinstance(current_unit, str):
         raise TypeError("Parameter 'current_unit' must be a string.")
 
-    UNIT = {
+    units = {
+        'time': time_unit,
         'angular position': angular_position_unit,
         'angular speed': angular_speed_unit,
         'angular acceleration': angular_acceleration_unit,
@@ -184,22 +195,11 @@ def export_time_variables(
         'pwm': ''
     }
 
-    data = pd.DataFrame()
-
-    data[f'time ({time_unit})'] = [
-        instant.to(time_unit).value for instant in time_array
-    ]
-
-    for variable in rotating_object.time_variables.keys():
-        unit = UNIT[variable]
-        if unit:
-            data[f'{variable} ({unit})'] = [
-                variable_snapshot.to(unit).value
-                for variable_snapshot
-                in rotating_object.time_variables[variable]
-            ]
-        else:
-            data[variable] = rotating_object.time_variables[variable]
+    data = _get_time_variables_data(
+        rotating_object=rotating_object,
+        time_array=time_array,
+        units=units
+    )
 
     if not os.path.exists(os.path.dirname(file_path)):
         os.makedirs(os.path.dirname(file_path))
@@ -208,3 +208,40 @@ def export_time_variables(
         file_path += '.csv'
 
     data.to_csv(file_path, index=False)
+
+
+def _get_time_variables_data(
+    rotating_object: RotatingObject,
+    time_array: list[Time] | TimeSeries,
+    units: dict[str, str],
+    start: int = 0,
+    stop: int | None = None
+) -> pd.DataFrame:
+    import pandas as pd
+
+    data = pd.DataFrame()
+
+    time_unit = units['time']
+    if isinstance(time_array, TimeSeries):
+        data[f'time ({time_unit})'] = time_array.get_values(
+            unit=time_unit,
+            start=start,
+            stop=stop
+        )
+    else:
+        data[f'time ({time_unit})'] = [
+            instant.to(time_unit).value for instant in time_array[start:stop]
+        ]
+
+    for variable, values in rotating_object.time_variables.items():
+        unit = units[variable]
+        if unit:
+            data[f'{variable} ({unit})'] = values.get_values(
+                unit=unit,
+                start=start,
+                stop=stop
+            )
+        else:
+            data[variable] = values.get_values(start=start, stop=stop)
+
+    return data
@@ -0,0 +1,124 @@
+from gearpy.units import AngularPosition, AngularSpeed, Time, Torque
+
+
+class LinearLoad:
+    r""":py:class:`LinearLoad <gearpy.utils.linear_load.LinearLoad>` object.
+    \n
+    It is an ``external_torque`` function of a gear which is independent of
+    time and angular position and linear in the angular speed of the gear:
+
+    .. math::
+        T_l \left( \dot{\theta} \right) = T_c + c \, \dot{\theta}
+
+    where:
+
+    - :math:`T_l` is the load torque,
+    - :math:`T_c` is the ``constant_torque``,
+    - :math:`c` is the ``viscous_coefficient``,
+    - :math:`\dot{\theta}` is the angular speed of the gear.
+
+    It can be assigned to the ``external_torque`` of a gear like any other
+    function, but the solver recognizes it and it can advance the simulation
+    in closed form while the motor PWM is constant.
+
+    Attributes
+    ----------
+    :py:attr:`constant_torque` : :py:class:`Torque <gearpy.units.units.Torque>`
+        Load torque at null angular speed.
+    :py:attr:`viscous_coefficient` : :py:class:`float`
+        Load torque per unit angular speed, in ``Nm/(rad/s)``.
+
+    .. admonition:: Raises
+       :class: warning
+
+       ``TypeError``
+           - If ``constant_torque`` is not an instance of
+             :py:class:`Torque <gearpy.units.units.Torque>`,
+           - if ``viscous_coefficient`` is not a :py:class:`float` or an
+             :py:class:`int`.
+
+    .. admonition:: See Also
+       :class: seealso
+
+       :py:meth:`Solver.run <gearpy.solver.Solver.run>`
+
+    .. admonition:: Examples
+       :class: important
+
+       >>> from gearpy.units import Torque
+       >>> from gearpy.utils import LinearLoad
+       >>> gear.external_torque = LinearLoad(
+       ...     constant_torque=Torque(0.5, 'Nm'),
+       ...     viscous_coefficient=0.01
+       ... )
+    """
+
+    def __init__(
+        self,
+        constant_torque: Torque,
+        viscous_coefficient: float | int = 0
+    ):
+        if not isinstance(constant_torque, Torque):
+            raise TypeError(
+                f"Parameter 'constant_torque' must be an instance of "
+                f"{Torque.__name__!r}."
+            )
+
+        if not isinstance(viscous_coefficient, float | int):
+            raise TypeError(
+                "Parameter 'viscous_coefficient' must be a float or an "
+                "integer."
+            )
+
+        self.__constant_torque = constant_torque
+        self.__viscous_coefficient = float(viscous_coefficient)
+
+    @property
+    def constant_torque(self) -> Torque:
+        """Load torque at null angular speed.
+
+        Returns
+        -------
+        :py:class:`Torque <gearpy.units.units.Torque>`
+            Load torque at null angular speed.
+        """
+        return self.__constant_torque
+
+    @property
+    def viscous_coefficient(self) -> float:
+        """Load torque per unit angular speed, in ``Nm/(rad/s)``.
+
+        Returns
+        -------
+        :py:class:`float`
+            Load torque per unit angular speed.
+        """
+        return self.__viscous_coefficient
+
+    def __call__(
+        self,
+        time: Time,
+        angular_position: AngularPosition,
+        angular_speed: AngularSpeed
+    ) -> Torque:
+        """It computes the load torque at the ``angular_speed`` of the gear.
+
+        Parameters
+        ----------
+        ``time`` : :py:class:`Time <gearpy.units.units.Time>`
+            Simulation time, not used.
+        ``angular_position`` : :py:class:`AngularPosition <gearpy.units.units.AngularPosition>`
+            Angular position of the gear, not used.
+        ``angular_speed`` : :py:class:`AngularSpeed <gearpy.units.units.AngularSpeed>`
+            Angular speed of the gear.
+
+        Returns
+        -------
+        :py:class:`Torque <gearpy.units.units.Torque>`
+            Load torque applied to the gear.
+        """
+        return Torque(
+            value=self.__constant_torque.to('Nm').value +
+            self.__viscous_coefficient*angular_speed.to('rad/s').value,
+            unit='Nm'
+        )
@@ -7,7 +7,7 @@ from .operator import (
     LessThanOrEqualTo
 )
 from gearpy.sensors import SensorBase
-from gearpy.units import UnitBase
+from gearpy.units import Time, UnitBase
 
 
 class StopCondition:
@@ -22,12 +22,32 @@ class StopCondition:
         The threshold value that triggers the stop condition.
     :py:attr:`operator` : :py:class:`OperatorBase <gearpy.utils.stop_condition.operator_base.OperatorBase>`
         The comparison operator to use to check if the stop condition is valid.
+    :py:attr:`terminal` : :py:class:`bool`
+        Whether the simulation stops when the stop condition becomes valid.
+    :py:attr:`event_times` : :py:class:`list`
+        Time instants at which the stop condition became valid.
 
     Methods
     -------
     :py:meth:`check_condition`
         It applies the comparison :py:attr:`operator` to the :py:attr:`sensor` value and the :py:attr:`threshold` value
         to check if the stop condition is valid.
+    :py:meth:`compute_residual`
+        It computes the difference between the :py:attr:`sensor` value and the :py:attr:`threshold` value.
+    :py:meth:`add_event_time`
+        It appends a time instant to :py:attr:`event_times`.
+
+    .. admonition:: Raises
+       :class: warning
+
+       ``TypeError``
+           - If ``sensor`` is not an instance of
+             :py:class:`SensorBase <gearpy.sensors.sensor_base.SensorBase>`,
+           - if ``threshold`` is not an instance of
+             :py:class:`UnitBase <gearpy.units.unit_base.UnitBase>`,
+           - if ``operator`` is not an instance of
+             :py:class:`OperatorBase <gearpy.utils.stop_condition.operator_base.OperatorBase>`,
+           - if ``terminal`` is not a :py:class:`bool`.
     """
 
     greater_than = GreaterThan()
@@ -40,7 +60,8 @@ class StopCondition:
         self,
         sensor: SensorBase,
         threshold: UnitBase,
-        operator: OperatorBase
+        operator: OperatorBase,
+        terminal: bool = True
     ):
         if not isinstance(sensor, SensorBase):
             raise TypeError(
@@ -60,9 +81,14 @@ class StopCondition:
                 f"{OperatorBase.__name__!r}."
             )
 
+        if not isinstance(terminal, bool):
+            raise TypeError("Parameter 'terminal' must be a boolean.")
+
         self.__sensor = sensor
         self.__threshold = threshold
         self.__operator = operator
+        self.__terminal = terminal
+        self.__event_times = []
 
     @property
     def sensor(self) -> SensorBase:
@@ -144,6 +170,44 @@ class StopCondition:
         """
         return self.__operator
 
+    @property
+    def terminal(self) -> bool:
+        """Whether the simulation stops when the stop condition becomes
+        valid. \n
+        If it is ``True``, then the
+        :py:class:`Solver <gearpy.solver.Solver>` stops the computation at the
+        time instant at which the stop condition becomes valid. If it is
+        ``False``, then the :py:class:`Solver <gearpy.solver.Solver>` only
+        appends that time instant to :py:attr:`event_times` and goes on with
+        the computation.
+
+        Returns
+        -------
+        :py:class:`bool`
+            Whether the simulation stops when the stop condition becomes
+            valid.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If :py:attr:`terminal` is not a :py:class:`bool`.
+        """
+        return self.__terminal
+
+    @property
+    def event_times(self) -> list[Time]:
+        """Time instants at which the stop condition became valid, located
+        by the :py:class:`Solver <gearpy.solver.Solver>` within the simulated
+        time steps.
+
+        Returns
+        -------
+        :py:class:`list`
+            Time instants at which the stop condition became valid.
+        """
+        return self.__event_times
+
     def check_condition(self) -> bool:
         """It applies the comparison :py:attr:`operator` to the
         :py:attr:`sensor` value and the :py:attr:`threshold` value to check if
@@ -161,3 +225,44 @@ class StopCondition:
             sensor_value=self.sensor.get_value(),
             threshold=self.threshold
         )
+
+    def compute_residual(self) -> float:
+        """It computes the difference between the :py:attr:`sensor` value and
+        the :py:attr:`threshold` value, in the unit of the
+        :py:attr:`threshold`. \n
+        The :py:class:`Solver <gearpy.solver.Solver>` looks for the zero of
+        the residual within a time step in order to locate the time instant
+        at which the stop condition becomes valid.
+
+        Returns
+        -------
+        :py:class:`float`
+            Difference between the :py:attr:`sensor` value and the
+            :py:attr:`threshold` value.
+        """
+        return self.sensor.get_value()._to_value(self.threshold.unit) - \
+            self.threshold.value
+
+    def add_event_time(self, instant: Time) -> None:
+        """It appends the ``instant`` at which the stop condition became valid
+        to :py:attr:`event_times`.
+
+        Parameters
+        ----------
+        ``instant`` : :py:class:`Time <gearpy.units.units.Time>`
+            Time instant at which the stop condition became valid.
+
+        .. admonition:: Raises
+           :class: warning
+
+           ``TypeError``
+               If ``instant`` is not an instance of
+               :py:class:`Time <gearpy.units.units.Time>`.
+        """
+        if not isinstance(instant, Time):
+            raise TypeError(
+                f"Parameter 'instant' must be an instance of "
+                f"{Time.__name__!r}."
+            )
+
+        self.__event_times.append(instant)
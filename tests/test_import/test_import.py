@@ -0,0 +1,43 @@
+from pytest import mark
+import subprocess
+import sys
+
+
+LAZY_MODULES = ['matplotlib', 'pandas', 'scipy']
+
+
+def run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+
+@mark.imports
+class TestImport:
+
+    @mark.genuine
+    def test_lazy_modules(self):
+        output = run_python(
+            "import sys\n"
+            "import gearpy\n"
+            f"print([module for module in {LAZY_MODULES} "
+            "if module in sys.modules])"
+        ).stdout
+
+        assert output.strip() == '[]'
+
+    @mark.genuine
+    def test_import_time(self):
+        stderr = run_python('import gearpy').stderr
+        imported_modules = set()
+        for line in stderr.splitlines():
+            module = line.split('|')[-1].strip()
+            imported_modules.add(module.split('.')[0])
+
+        assert 'gearpy' in imported_modules
+        assert 'numpy' in imported_modules
+        for module in LAZY_MODULES:
+            assert module not in imported_modules
@@ -1,5 +1,13 @@
 from gearpy.mechanical_objects import RotatingObject
-from gearpy.units import AngularSpeed, InertiaMoment, Torque, Current
+from gearpy.units import (
+    AngularSpeed,
+    AngularSpeedArray,
+    InertiaMoment,
+    Torque,
+    TorqueArray,
+    Current
+)
+import numpy as np
 from tests.conftest import types_to_check
 from pytest import fixture
 
@@ -165,3 +173,76 @@ def dc_motor_pwm_type_error(request):
 @fixture(params=[-2, 2])
 def dc_motor_pwm_value_error(request):
     return request.param
+
+
+dc_motor_torque_at_type_error_1 = [
+    {'angular_speed': type_to_check, 'pwm': 1}
+    for type_to_check in types_to_check
+    if not isinstance(type_to_check, AngularSpeedArray)
+]
+
+dc_motor_torque_at_type_error_2 = [
+    {'angular_speed': AngularSpeedArray([0, 1], 'rad/s'), 'pwm': type_to_check}
+    for type_to_check in [*types_to_check, ['a', 'b']]
+    if not isinstance(type_to_check, float | int | np.ndarray | tuple)
+    and not (isinstance(type_to_check, list) and type_to_check == [0, 1])
+]
+
+
+@fixture(
+    params=[
+        *dc_motor_torque_at_type_error_1,
+        *dc_motor_torque_at_type_error_2
+    ]
+)
+def dc_motor_torque_at_type_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        {'angular_speed': AngularSpeedArray([0, 1], 'rad/s'), 'pwm': 2},
+        {'angular_speed': AngularSpeedArray([0, 1], 'rad/s'), 'pwm': [-2, 0]},
+        {
+            'angular_speed': AngularSpeedArray([0, 1], 'rad/s'),
+            'pwm': [0.1, 0.2, 0.3]
+        }
+    ]
+)
+def dc_motor_torque_at_value_error(request):
+    return request.param
+
+
+dc_motor_electric_current_at_type_error_1 = [
+    {'driving_torque': type_to_check, 'pwm': 1}
+    for type_to_check in types_to_check
+    if not isinstance(type_to_check, TorqueArray)
+]
+
+dc_motor_electric_current_at_type_error_2 = [
+    {'driving_torque': TorqueArray([0, 1], 'Nm'), 'pwm': type_to_check}
+    for type_to_check in [*types_to_check, ['a', 'b']]
+    if not isinstance(type_to_check, float | int | np.ndarray | tuple)
+    and not (isinstance(type_to_check, list) and type_to_check == [0, 1])
+]
+
+
+@fixture(
+    params=[
+        *dc_motor_electric_current_at_type_error_1,
+        *dc_motor_electric_current_at_type_error_2
+    ]
+)
+def dc_motor_electric_current_at_type_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        {'driving_torque': TorqueArray([0, 1], 'Nm'), 'pwm': 2},
+        {'driving_torque': TorqueArray([0, 1], 'Nm'), 'pwm': [-2, 0]},
+        {'driving_torque': TorqueArray([0, 1], 'Nm'), 'pwm': [0.1, 0.2, 0.3]}
+    ]
+)
+def dc_motor_electric_current_at_value_error(request):
+    return request.param
@@ -1,7 +1,16 @@
 from gearpy.mechanical_objects import DCMotor, SpurGear
-from gearpy.units import Length, Torque, Current
+from gearpy.mechanical_objects.dc_motor import CHARACTERISTIC_CACHE_SIZE
+from gearpy.units import (
+    AngularSpeedArray,
+    Length,
+    Torque,
+    TorqueArray,
+    Current,
+    CurrentArray
+)
 from hypothesis import given, settings
 from hypothesis.strategies import text, floats, booleans
+import numpy as np
 from pytest import mark, raises
 from tests.conftest import basic_dc_motor_1, basic_dc_motor_2
 from tests.test_units.test_angular_speed.conftest import angular_speeds
@@ -165,6 +174,229 @@ class TestDCMotorComputeElectricCurrent:
             assert isinstance(motor.electric_current, Current)
 
 
+@mark.dc_motor
+class TestDCMotorCharacteristic:
+
+    @mark.genuine
+    @given(
+        no_load_speed=angular_speeds(min_value=1, max_value=1000),
+        maximum_torque=torques(min_value=1e-3, max_value=10),
+        no_load_electric_current=currents(min_value=0, max_value=1, unit='A'),
+        maximum_electric_current=currents(min_value=2, max_value=10, unit='A'),
+        speed=angular_speeds(min_value=-1000, max_value=1000),
+        driving_torque=torques(min_value=-10, max_value=10)
+    )
+    @settings(max_examples=20, deadline=None)
+    def test_method(
+        self,
+        no_load_speed,
+        maximum_torque,
+        no_load_electric_current,
+        maximum_electric_current,
+        speed,
+        driving_torque
+    ):
+        motor = DCMotor(
+            name='motor',
+            inertia_moment=basic_inertia_moment,
+            no_load_speed=no_load_speed,
+            maximum_torque=maximum_torque,
+            no_load_electric_current=no_load_electric_current,
+            maximum_electric_current=maximum_electric_current
+        )
+        motor.angular_speed = speed
+        pwm_min = no_load_electric_current/maximum_electric_current
+        pwms = np.linspace(-1, 1, CHARACTERISTIC_CACHE_SIZE + 11).tolist()
+
+        # the relationships are evaluated with the same unit objects
+        # operations, so the cached values give exactly the same results
+        for pwm in [*pwms, *pwms[::-1]]:
+            motor.pwm = pwm
+            if abs(pwm) <= pwm_min:
+                torque = 0
+                electric_current = 0 if pwm_min == 0 else \
+                    (pwm/pwm_min*no_load_electric_current).value
+            else:
+                signed_no_load_electric_current = no_load_electric_current \
+                    if pwm > 0 else -no_load_electric_current
+                pwm_maximum_torque = maximum_torque*(
+                    (pwm*maximum_electric_current -
+                     signed_no_load_electric_current) /
+                    (maximum_electric_current - no_load_electric_current)
+                )
+                torque = (1 - speed/(pwm*no_load_speed)) * \
+                    pwm_maximum_torque.value
+                electric_current = (
+                    (pwm*maximum_electric_current -
+                     signed_no_load_electric_current) *
+                    (driving_torque/pwm_maximum_torque) +
+                    signed_no_load_electric_current
+                ).value
+
+            motor.compute_torque()
+            assert motor.driving_torque.unit == maximum_torque.unit
+            assert motor.driving_torque.value == torque
+
+            motor.driving_torque = driving_torque
+            motor.compute_electric_current()
+            assert motor.electric_current.unit == maximum_electric_current.unit
+            assert motor.electric_current.value == electric_current
+
+
+@mark.dc_motor
+class TestDCMotorTorqueAt:
+
+    @mark.genuine
+    @given(
+        no_load_speed=angular_speeds(min_value=1, max_value=1000),
+        maximum_torque=torques(min_value=1e-3, max_value=10),
+        no_load_electric_current=currents(min_value=0, max_value=1, unit='A'),
+        maximum_electric_current=currents(min_value=2, max_value=10, unit='A'),
+        speed=angular_speeds(min_value=-1000, max_value=1000),
+        electric_motor=booleans()
+    )
+    @settings(max_examples=50, deadline=None)
+    def test_method(
+        self,
+        no_load_speed,
+        maximum_torque,
+        no_load_electric_current,
+        maximum_electric_current,
+        speed,
+        electric_motor
+    ):
+        if electric_motor:
+            motor = DCMotor(
+                name='motor',
+                inertia_moment=basic_inertia_moment,
+                no_load_speed=no_load_speed,
+                maximum_torque=maximum_torque,
+                no_load_electric_current=no_load_electric_current,
+                maximum_electric_current=maximum_electric_current
+            )
+        else:
+            motor = DCMotor(
+                name='motor',
+                inertia_moment=basic_inertia_moment,
+                no_load_speed=no_load_speed,
+                maximum_torque=maximum_torque
+            )
+        speeds = AngularSpeedArray(
+            speed.value*np.linspace(-1, 1, 5),
+            speed.unit
+        )
+        pwms = np.linspace(-1, 1, 9)
+        torques_map = motor.torque_at(
+            angular_speed=speeds[np.newaxis, :],
+            pwm=pwms[:, np.newaxis]
+        )
+
+        assert isinstance(torques_map, TorqueArray)
+        assert torques_map.unit == maximum_torque.unit
+        assert torques_map.values.shape == (len(pwms), len(speeds))
+
+        for i, pwm in enumerate(pwms):
+            motor.pwm = float(pwm)
+            for j, angular_speed in enumerate(speeds):
+                motor.angular_speed = angular_speed
+                motor.compute_torque()
+                assert np.isclose(
+                    torques_map.values[i, j],
+                    motor.driving_torque.value,
+                    rtol=1e-12,
+                    atol=1e-12*maximum_torque.value
+                )
+
+        assert np.allclose(
+            motor.torque_at(angular_speed=speeds).values,
+            torques_map.values[-1]
+        )
+
+    @mark.error
+    def test_raises_type_error(self, dc_motor_torque_at_type_error):
+        with raises(TypeError):
+            basic_dc_motor_1.torque_at(**dc_motor_torque_at_type_error)
+
+    @mark.error
+    def test_raises_value_error(self, dc_motor_torque_at_value_error):
+        with raises(ValueError):
+            basic_dc_motor_1.torque_at(**dc_motor_torque_at_value_error)
+
+
+@mark.dc_motor
+class TestDCMotorElectricCurrentAt:
+
+    @mark.genuine
+    @given(
+        no_load_speed=angular_speeds(min_value=1, max_value=1000),
+        maximum_torque=torques(min_value=1e-3, max_value=10),
+        no_load_electric_current=currents(min_value=0, max_value=1, unit='A'),
+        maximum_electric_current=currents(min_value=2, max_value=10, unit='A'),
+        driving_torque=torques(min_value=-10, max_value=10)
+    )
+    @settings(max_examples=50, deadline=None)
+    def test_method(
+        self,
+        no_load_speed,
+        maximum_torque,
+        no_load_electric_current,
+        maximum_electric_current,
+        driving_torque
+    ):
+        motor = DCMotor(
+            name='motor',
+            inertia_moment=basic_inertia_moment,
+            no_load_speed=no_load_speed,
+            maximum_torque=maximum_torque,
+            no_load_electric_current=no_load_electric_current,
+            maximum_electric_current=maximum_electric_current
+        )
+        driving_torques = TorqueArray(
+            driving_torque.value*np.linspace(-1, 1, 5),
+            driving_torque.unit
+        )
+        pwms = np.linspace(-1, 1, 9)
+        electric_currents_map = motor.electric_current_at(
+            driving_torque=driving_torques[np.newaxis, :],
+            pwm=pwms[:, np.newaxis]
+        )
+
+        assert isinstance(electric_currents_map, CurrentArray)
+        assert electric_currents_map.unit == maximum_electric_current.unit
+        assert electric_currents_map.values.shape == (len(pwms), len(driving_torques))
+
+        for i, pwm in enumerate(pwms):
+            motor.pwm = float(pwm)
+            for j, torque in enumerate(driving_torques):
+                motor.driving_torque = torque
+                motor.compute_electric_current()
+                assert np.isclose(
+                    electric_currents_map.values[i, j],
+                    motor.electric_current.value,
+                    rtol=1e-12,
+                    atol=1e-12*maximum_electric_current.value
+                )
+
+    @mark.error
+    def test_raises_type_error(self, dc_motor_electric_current_at_type_error):
+        with raises(TypeError):
+            basic_dc_motor_2.electric_current_at(
+                **dc_motor_electric_current_at_type_error
+            )
+
+    @mark.error
+    def test_raises_value_error(self, dc_motor_electric_current_at_value_error):
+        with raises(ValueError):
+            basic_dc_motor_2.electric_current_at(
+                **dc_motor_electric_current_at_value_error
+            )
+
+        with raises(ValueError):
+            basic_dc_motor_1.electric_current_at(
+                driving_torque=TorqueArray([0, 1], 'Nm')
+            )
+
+
 @mark.dc_motor
 class TestDCMotorElectricCurrent:
 
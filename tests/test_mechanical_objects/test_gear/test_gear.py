@@ -1,14 +1,33 @@
+from copy import deepcopy
 from gearpy.mechanical_objects import (
+    HelicalGear,
     MatingMaster,
     MatingSlave,
+    SpurGear,
     WormGear,
     WormWheel
 )
-from gearpy.units import Force, Torque, Stress
+from gearpy.mechanical_objects.gear_data import (
+    LEWIS_FACTOR_TABLE,
+    WORM_GEAR_AND_WHEEL_TABLE
+)
+from gearpy.mechanical_objects.mechanical_object_base import (
+    MINIMUM_TEETH_NUMBER,
+    lewis_factor_function,
+    worm_gear_and_wheel_maximum_helix_angle_function,
+    worm_wheel_lewis_factor_function
+)
+from gearpy.units import Angle, Force, InertiaMoment, Length, Torque, Stress
 from gearpy.utils import add_gear_mating, add_worm_gear_mating
 from hypothesis import given, settings
+from math import atan, pi, sqrt
 from hypothesis.strategies import functions
-from pytest import mark, raises
+from pytest import approx, mark, raises
+from tests.conftest import (
+    basic_helical_gear_2,
+    basic_spur_gear_2,
+    basic_worm_wheel_2
+)
 from tests.test_mechanical_objects.test_gear.conftest import (
     basic_gears,
     basic_structural_gears_1,
@@ -74,7 +93,7 @@ class TestGearComputeTangentialForce:
 
             master.driving_torque = Torque(1, 'Nm')
             slave.driving_torque = Torque(1, 'Nm')
-            master.load_torque = Torque(1, 'Nm')
+            master.load_torque = Torque(-1.7, 'Nm')
             slave.load_torque = Torque(1, 'Nm')
             master.compute_tangential_force()
             slave.compute_tangential_force()
@@ -84,6 +103,18 @@ class TestGearComputeTangentialForce:
             assert isinstance(master.tangential_force, Force)
             assert isinstance(slave.tangential_force, Force)
 
+            for gear, torque in zip(
+                [master, slave],
+                [master.load_torque, slave.driving_torque]
+            ):
+                tangential_force = \
+                    abs(torque)/(gear.reference_diameter/2)
+                if isinstance(gear, WormGear):
+                    tangential_force = \
+                        tangential_force*gear.helix_angle.tan()
+                assert gear.tangential_force.unit == tangential_force.unit
+                assert gear.tangential_force.value == tangential_force.value
+
     @mark.error
     def test_raises_value_error(self):
         for gear in basic_structural_gears_1:
@@ -156,6 +187,12 @@ class TestGearComputeBendingStress:
 
                 assert master.bending_stress is not None
                 assert isinstance(master.bending_stress, Stress)
+                if not isinstance(master, WormWheel):
+                    bending_stress = master.tangential_force / \
+                        (master.module*master.face_width)/master.lewis_factor
+                    assert master.bending_stress.unit == bending_stress.unit
+                    assert master.bending_stress.value == \
+                        bending_stress.value
 
             if not isinstance(slave, WormGear):
                 slave.driving_torque = Torque(1, 'Nm')
@@ -165,6 +202,59 @@ class TestGearComputeBendingStress:
 
                 assert slave.bending_stress is not None
                 assert isinstance(slave.bending_stress, Stress)
+                if isinstance(slave, WormWheel):
+                    normal_pitch = \
+                        pi*master.reference_diameter * \
+                        master.helix_angle.sin()/slave.n_teeth
+                    effective_face_width = min(
+                        slave.face_width, 0.67*master.reference_diameter
+                    )
+                    bending_stress = slave.tangential_force / \
+                        (normal_pitch*effective_face_width)/slave.lewis_factor
+                else:
+                    bending_stress = slave.tangential_force / \
+                        (slave.module*slave.face_width)/slave.lewis_factor
+                assert slave.bending_stress.unit == bending_stress.unit
+                assert slave.bending_stress.value == bending_stress.value
+
+    @mark.genuine
+    def test_mating_change(self):
+        worm_wheel = deepcopy(basic_worm_wheel_2)
+        worm_gears = [
+            WormGear(
+                name='worm gear',
+                n_starts=1,
+                inertia_moment=InertiaMoment(1, 'kgm^2'),
+                pressure_angle=Angle(20, 'deg'),
+                helix_angle=Angle(10, 'deg'),
+                reference_diameter=reference_diameter
+            ) for reference_diameter in [Length(10, 'mm'), Length(20, 'mm')]
+        ]
+        bending_stresses = []
+        for worm_gear in worm_gears:
+            add_worm_gear_mating(
+                master=worm_gear,
+                slave=worm_wheel,
+                friction_coefficient=0
+            )
+            worm_wheel.driving_torque = Torque(1, 'Nm')
+            worm_wheel.compute_tangential_force()
+            worm_wheel.compute_bending_stress()
+            bending_stresses.append(worm_wheel.bending_stress)
+
+            new_worm_wheel = deepcopy(basic_worm_wheel_2)
+            add_worm_gear_mating(
+                master=deepcopy(worm_gear),
+                slave=new_worm_wheel,
+                friction_coefficient=0
+            )
+            new_worm_wheel.driving_torque = Torque(1, 'Nm')
+            new_worm_wheel.compute_tangential_force()
+            new_worm_wheel.compute_bending_stress()
+
+            assert worm_wheel.bending_stress == new_worm_wheel.bending_stress
+
+        assert bending_stresses[0] != bending_stresses[1]
 
     @mark.error
     def test_raises_value_error(self):
@@ -220,7 +310,7 @@ class TestGearComputeContactStress:
             if not isinstance(master, WormGear | WormWheel):
                 add_gear_mating(master=master, slave=slave, efficiency=0.9)
 
-                for gear in [master, slave]:
+                for gear, mate in [(master, slave), (slave, master)]:
                     gear.driving_torque = Torque(1, 'Nm')
                     gear.load_torque = Torque(1, 'Nm')
                     gear.compute_tangential_force()
@@ -229,6 +319,73 @@ class TestGearComputeContactStress:
                     assert gear.contact_stress is not None
                     assert isinstance(gear.contact_stress, Stress)
 
+                    pressure_angle = Angle(20, 'deg')
+                    face_width = gear.face_width
+                    if isinstance(gear, HelicalGear):
+                        pressure_angle = Angle(
+                            atan(pressure_angle.tan()/gear.helix_angle.cos()),
+                            'rad'
+                        )
+                        face_width = face_width/gear.helix_angle.cos()
+                    equivalent_elastic_modulus = \
+                        2*gear.elastic_modulus*(
+                            mate.elastic_modulus /
+                            (gear.elastic_modulus + mate.elastic_modulus)
+                        )
+                    inverse_curvature_sum = \
+                        pressure_angle.sin()/2*gear.reference_diameter*(
+                            mate.reference_diameter /
+                            (gear.reference_diameter + mate.reference_diameter)
+                        )
+                    contact_pressure = \
+                        gear.tangential_force/pressure_angle.cos() / \
+                        (face_width*inverse_curvature_sum)
+                    contact_stress = 0.262922*sqrt(
+                        equivalent_elastic_modulus.to('Pa').value *
+                        contact_pressure.to('Pa').value
+                    )
+                    assert gear.contact_stress.to('Pa').value == contact_stress
+
+    @mark.genuine
+    def test_mating_change(self):
+        for gear_class, gear in zip(
+            [SpurGear, HelicalGear],
+            [basic_spur_gear_2, basic_helical_gear_2]
+        ):
+            master = deepcopy(gear)
+            parameters = {
+                'name': 'gear 3',
+                'n_teeth': 30,
+                'inertia_moment': InertiaMoment(1, 'kgm^2'),
+                'module': Length(1, 'mm'),
+                'face_width': Length(5, 'mm'),
+                'elastic_modulus': Stress(200, 'GPa')
+            }
+            if gear_class is HelicalGear:
+                parameters['helix_angle'] = gear.helix_angle
+            slaves = [deepcopy(gear), gear_class(**parameters)]
+            contact_stresses = []
+            for slave in slaves:
+                add_gear_mating(master=master, slave=slave, efficiency=0.9)
+                master.load_torque = Torque(1, 'Nm')
+                master.compute_tangential_force()
+                master.compute_contact_stress()
+                contact_stresses.append(master.contact_stress)
+
+                new_master = deepcopy(gear)
+                add_gear_mating(
+                    master=new_master,
+                    slave=deepcopy(slave),
+                    efficiency=0.9
+                )
+                new_master.load_torque = Torque(1, 'Nm')
+                new_master.compute_tangential_force()
+                new_master.compute_contact_stress()
+
+                assert master.contact_stress == new_master.contact_stress
+
+            assert contact_stresses[0] != contact_stresses[1]
+
     @mark.error
     def test_raises_value_error(self, gear_compute_contact_stress_value_error):
         with raises(ValueError):
@@ -277,3 +434,57 @@ class TestSpurExternalTorque:
         for gear in basic_gears:
             with raises(KeyError):
                 gear.external_torque = gear_external_torque_key_error
+
+
+@mark.gear
+class TestGearData:
+
+    @mark.genuine
+    def test_lewis_factor_function(self):
+        for n_teeth, lewis_factor in LEWIS_FACTOR_TABLE:
+            assert lewis_factor_function(n_teeth).take(0) == lewis_factor
+
+        assert lewis_factor_function(23).take(0) == approx(0.3335)
+        assert lewis_factor_function(MINIMUM_TEETH_NUMBER - 1).take(0) == \
+            LEWIS_FACTOR_TABLE[0, 1]
+        assert lewis_factor_function(1000).take(0) == \
+            LEWIS_FACTOR_TABLE[-1, 1]
+
+    @mark.genuine
+    def test_worm_gear_and_wheel_functions(self):
+        for pressure_angle, maximum_helix_angle, lewis_factor in \
+                WORM_GEAR_AND_WHEEL_TABLE:
+            angle = Angle(pressure_angle, 'deg')
+
+            assert worm_gear_and_wheel_maximum_helix_angle_function(
+                angle
+            ) == Angle(maximum_helix_angle, 'deg')
+            assert worm_wheel_lewis_factor_function(angle) == lewis_factor
+
+    @mark.genuine
+    def test_data_frames(self):
+        from gearpy.mechanical_objects.mechanical_object_base import (
+            LEWIS_FACTOR_DATA,
+            WORM_GEAR_AND_WHEEL_DATA
+        )
+
+        assert LEWIS_FACTOR_DATA.columns.tolist() == [
+            'Number of teeth',
+            'Lewis Factor'
+        ]
+        assert LEWIS_FACTOR_DATA.to_numpy().tolist() == \
+            LEWIS_FACTOR_TABLE.tolist()
+        assert WORM_GEAR_AND_WHEEL_DATA.columns.tolist() == [
+            'Pressure Angle',
+            'Maximum Helix Angle',
+            'Lewis Factor'
+        ]
+        assert WORM_GEAR_AND_WHEEL_DATA.to_numpy().tolist() == \
+            WORM_GEAR_AND_WHEEL_TABLE.tolist()
+
+    @mark.error
+    def test_raises_attribute_error(self):
+        import gearpy.mechanical_objects.mechanical_object_base as base
+
+        with raises(AttributeError):
+            base.NOT_A_TABLE
@@ -1,6 +1,16 @@
-from gearpy.mechanical_objects import GearBase, MotorBase, WormGear
+from gearpy.mechanical_objects import (
+    DCMotor,
+    GearBase,
+    MotorBase,
+    SpurGear,
+    WormGear,
+    unchecked_assignments
+)
+from gearpy.units import AngularSpeed, InertiaMoment, Length, Torque
+from fractions import Fraction
 from hypothesis import given, settings
 from pytest import mark, raises
+from threading import Thread
 from tests.test_mechanical_objects.test_rotating_object.conftest import \
     basic_rotating_objects
 from tests.test_units.test_angular_acceleration.conftest import \
@@ -270,3 +280,89 @@ class TestRotatingObjectUpdateTimeVariables:
                     if rotating_object.contact_stress_is_computable:
                         assert time_variables['contact stress'][-1] == \
                             contact_stress
+
+
+@mark.rotating_object
+class TestUncheckedAssignments:
+
+    @mark.genuine
+    def test_function(self):
+        motor = DCMotor(
+            name='motor',
+            no_load_speed=AngularSpeed(1000, 'rpm'),
+            maximum_torque=Torque(1, 'Nm'),
+            inertia_moment=InertiaMoment(1, 'kgm^2')
+        )
+        gear = SpurGear(
+            name='gear',
+            n_teeth=10,
+            inertia_moment=InertiaMoment(1, 'kgm^2'),
+            module=Length(1, 'mm'),
+            face_width=Length(5, 'mm'),
+            elastic_modulus=None
+        )
+        variables = {
+            motor: [
+                'angular_position',
+                'angular_speed',
+                'angular_acceleration',
+                'torque',
+                'driving_torque',
+                'load_torque',
+                'electric_current'
+            ],
+            gear: [
+                'angular_position',
+                'angular_speed',
+                'angular_acceleration',
+                'torque',
+                'driving_torque',
+                'load_torque',
+                'tangential_force',
+                'bending_stress',
+                'contact_stress'
+            ]
+        }
+
+        with unchecked_assignments():
+            with unchecked_assignments():
+                pass
+            for rotating_object, names in variables.items():
+                for name in names:
+                    setattr(rotating_object, name, 'value')
+                    assert getattr(rotating_object, name) == 'value'
+            motor.pwm = Fraction(1, 2)
+            assert motor.pwm == Fraction(1, 2)
+
+        for rotating_object, names in variables.items():
+            for name in names:
+                with raises(TypeError):
+                    setattr(rotating_object, name, 'value')
+
+        with raises(ValueError):
+            with unchecked_assignments():
+                motor.pwm = 2
+
+        with raises(RuntimeError):
+            with unchecked_assignments():
+                raise RuntimeError
+
+        with raises(TypeError):
+            motor.pwm = Fraction(1, 2)
+
+        # other threads keep checking the assignments
+        errors = []
+
+        def assign():
+            try:
+                gear.angular_speed = 'value'
+            except TypeError as error:
+                errors.append(error)
+
+        with unchecked_assignments():
+            thread = Thread(target=assign)
+            thread.start()
+            thread.join()
+            gear.angular_speed = 'value'
+
+        assert len(errors) == 1
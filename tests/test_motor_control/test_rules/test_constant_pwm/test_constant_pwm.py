@@ -37,6 +37,8 @@ class TestConstantPWMInit:
         assert rule._ConstantPWM__timer == timer
         assert rule._ConstantPWM__powertrain == powertrain
         assert rule._ConstantPWM__target_pwm_value == target_pwm_value
+        assert rule.timer == timer
+        assert rule.target_pwm_value == target_pwm_value
 
     @mark.error
     def test_raises_type_error(self, constant_pwm_init_type_error):
@@ -1,9 +1,19 @@
+from gearpy.mechanical_objects import DCMotor, SpurGear
 from gearpy.motor_control.rules import ReachAngularPosition
+from gearpy.powertrain import Powertrain
 from gearpy.sensors import AbsoluteRotaryEncoder
-from gearpy.units import AngularPosition, Angle, Torque
+from gearpy.units import (
+    AngularPosition,
+    AngularSpeed,
+    Angle,
+    InertiaMoment,
+    Torque
+)
+from gearpy.utils import add_fixed_joint, add_gear_mating
 from hypothesis import given, settings, HealthCheck
 from hypothesis.strategies import integers, floats, booleans
-from pytest import mark, raises
+from math import pi
+from pytest import approx, mark, raises
 from tests.test_motor_control.test_rules.test_reach_angular_position.\
     conftest import PowertrainFake
 from tests.conftest import basic_encoder, powertrains
@@ -133,3 +143,46 @@ class TestReachAngularPositionApply:
 
         if pwm is not None:
             assert isinstance(pwm, float | int)
+
+    @mark.genuine
+    def test_static_error(self):
+        motor = DCMotor(
+            name='motor',
+            inertia_moment=InertiaMoment(1, 'kgm^2'),
+            no_load_speed=AngularSpeed(1000, 'rad/s'),
+            maximum_torque=Torque(2, 'Nm')
+        )
+        gear_1 = SpurGear(
+            name='gear 1',
+            n_teeth=10,
+            inertia_moment=InertiaMoment(1, 'kgm^2')
+        )
+        gear_2 = SpurGear(
+            name='gear 2',
+            n_teeth=20,
+            inertia_moment=InertiaMoment(1, 'kgm^2')
+        )
+        add_fixed_joint(master=motor, slave=gear_1)
+        add_gear_mating(master=gear_1, slave=gear_2, efficiency=0.8)
+        powertrain = Powertrain(motor=motor)
+        rule = ReachAngularPosition(
+            encoder=AbsoluteRotaryEncoder(target=gear_2),
+            powertrain=powertrain,
+            target_angular_position=AngularPosition(10, 'rad'),
+            braking_angle=Angle(90, 'deg')
+        )
+        gear_2.angular_position = AngularPosition(9.6, 'rad')
+
+        # no static error until the motor load torque is available
+        assert rule.apply() == approx(1 - (9.6 - (10 - pi/2))/(pi/2))
+
+        for load_torque, static_error in [
+            (Torque(500, 'mNm'), 0.5/(2*0.8)*pi/2),
+            (Torque(1, 'Nm'), 1/(2*0.8)*pi/2)
+        ]:
+            motor.load_torque = load_torque
+            braking_starting_angle = 10 - pi/2 + static_error
+
+            assert rule.apply() == approx(
+                1 - (9.6 - braking_starting_angle)/(pi/2)
+            )
@@ -3,6 +3,7 @@ from gearpy.motor_control.rules import StartProportionalToAngularPosition
 from gearpy.sensors import AbsoluteRotaryEncoder
 from gearpy.powertrain import Powertrain
 from gearpy.units import (
+    AngularAcceleration,
     AngularPosition,
     InertiaMoment,
     AngularSpeed,
@@ -219,6 +220,54 @@ class TestStartProportionalToAngularPositionApply:
             if pwm is not None:
                 assert isinstance(pwm, float | int)
 
+    @mark.genuine
+    def test_cached_pwm_min(self):
+        motor = DCMotor(
+            name='motor',
+            inertia_moment=InertiaMoment(1, 'kgm^2'),
+            no_load_speed=AngularSpeed(1000, 'rad/s'),
+            maximum_torque=Torque(1, 'Nm'),
+            no_load_electric_current=Current(0.1, 'A'),
+            maximum_electric_current=Current(1, 'A')
+        )
+        gear = SpurGear(
+            name='gear',
+            n_teeth=20,
+            inertia_moment=InertiaMoment(1, 'kgm^2')
+        )
+        add_fixed_joint(master=motor, slave=gear)
+        powertrain = Powertrain(motor=motor)
+        encoder = AbsoluteRotaryEncoder(target=motor)
+        rule = StartProportionalToAngularPosition(
+            encoder=encoder,
+            powertrain=powertrain,
+            target_angular_position=AngularPosition(1, 'rad'),
+            pwm_min_multiplier=2
+        )
+
+        def record(load_torque):
+            for element in powertrain.elements:
+                element.angular_position = AngularPosition(0, 'rad')
+                element.angular_speed = AngularSpeed(0, 'rad/s')
+                element.angular_acceleration = AngularAcceleration(0, 'rad/s^2')
+                element.torque = Torque(0, 'Nm')
+                element.driving_torque = Torque(0, 'Nm')
+                element.load_torque = load_torque
+            motor.electric_current = Current(0, 'A')
+            for element in powertrain.elements:
+                element.update_time_variables()
+
+        record(load_torque=Torque(0.1, 'Nm'))
+        assert rule.apply() == 2*(0.1*0.9 + 0.1)
+
+        # only the first recorded load torque is taken into account
+        record(load_torque=Torque(0.5, 'Nm'))
+        assert rule.apply() == 2*(0.1*0.9 + 0.1)
+
+        powertrain.reset()
+        record(load_torque=Torque(0.2, 'Nm'))
+        assert rule.apply() == 2*(0.2*0.9 + 0.1)
+
     @mark.error
     def test_raises_value_error(self):
         motor = DCMotor(
@@ -347,3 +347,33 @@ powertrain_export_time_variables_type_error_11 = [
 )
 def powertrain_export_time_variables_type_error(request):
     return request.param
+
+
+compiled_powertrain_init_type_error_1 = [
+    {'elements': type_to_check, 'self_locking': False}
+    for type_to_check in types_to_check
+    if not isinstance(type_to_check, tuple)
+]
+
+compiled_powertrain_init_type_error_2 = [
+    {'elements': (type_to_check, ), 'self_locking': False}
+    for type_to_check in types_to_check
+    if not isinstance(type_to_check, RotatingObject)
+]
+
+compiled_powertrain_init_type_error_3 = [
+    {'elements': basic_powertrain.elements, 'self_locking': type_to_check}
+    for type_to_check in types_to_check
+    if not isinstance(type_to_check, bool)
+]
+
+
+@fixture(
+    params=[
+        *compiled_powertrain_init_type_error_1,
+        *compiled_powertrain_init_type_error_2,
+        *compiled_powertrain_init_type_error_3
+    ]
+)
+def compiled_powertrain_init_type_error(request):
+    return request.param
@@ -1,6 +1,12 @@
 from copy import deepcopy
-from gearpy.mechanical_objects import DCMotor, SpurGear, MotorBase, GearBase
-from gearpy.powertrain import Powertrain
+from gearpy.mechanical_objects import (
+    DCMotor,
+    SpurGear,
+    MotorBase,
+    GearBase,
+    WormGear
+)
+from gearpy.powertrain import CompiledPowertrain, Powertrain
 from gearpy.units import (
     AngularAcceleration,
     AngularPosition,
@@ -27,6 +33,7 @@ from hypothesis.strategies import (
     tuples
 )
 import matplotlib.pyplot as plt
+import numpy as np
 import os
 import pandas as pd
 from pytest import mark, raises
@@ -146,6 +153,88 @@ class TestPowertrainInit:
             Powertrain(motor=motor)
 
 
+@mark.powertrain
+class TestPowertrainCompiled:
+
+    @mark.genuine
+    @given(powertrain=powertrains())
+    @settings(
+        max_examples=100,
+        deadline=None,
+        suppress_health_check=[HealthCheck.too_slow]
+    )
+    def test_property(self, powertrain):
+        elements = powertrain.elements
+        compiled = powertrain.compiled
+
+        assert isinstance(compiled, CompiledPowertrain)
+        assert compiled.elements is elements
+        assert compiled.self_locking == powertrain.self_locking
+        assert powertrain.compiled is compiled
+
+        gear_ratios = [1.0, *[element.master_gear_ratio for element in elements[1:]]]
+        efficiencies = [1.0, *[element.master_gear_efficiency for element in elements[1:]]]
+        assert compiled.gear_ratios.tolist() == gear_ratios
+        assert compiled.efficiencies.tolist() == efficiencies
+        assert np.allclose(
+            compiled.kinematic_gains,
+            [np.prod(gear_ratios[i + 1:]) for i in range(len(elements))]
+        )
+        assert np.allclose(
+            compiled.driving_torque_gains,
+            np.cumprod(np.array(efficiencies)*np.array(gear_ratios))
+        )
+        for array in (
+            compiled.gear_ratios,
+            compiled.efficiencies,
+            compiled.kinematic_gains,
+            compiled.driving_torque_gains
+        ):
+            assert not array.flags.writeable
+
+        inertia_moment = elements[0].inertia_moment
+        for element in elements[1:]:
+            inertia_moment = inertia_moment*element.master_gear_ratio + \
+                element.inertia_moment
+        assert compiled.inertia_moment == inertia_moment
+
+        assert compiled.force_elements == tuple(
+            i for i, element in enumerate(elements)
+            if isinstance(element, GearBase | WormGear)
+            and element.tangential_force_is_computable
+        )
+        assert compiled.bending_stress_elements == tuple(
+            i for i, element in enumerate(elements)
+            if isinstance(element, GearBase)
+            and element.bending_stress_is_computable
+        )
+        assert compiled.contact_stress_elements == tuple(
+            i for i, element in enumerate(elements)
+            if isinstance(element, GearBase)
+            and element.contact_stress_is_computable
+        )
+
+        elements[-1].master_gear_ratio = 2*elements[-1].master_gear_ratio
+        recompiled = powertrain.compiled
+
+        assert recompiled is not compiled
+        assert recompiled.gear_ratios[-1] == elements[-1].master_gear_ratio
+
+
+@mark.powertrain
+class TestCompiledPowertrainInit:
+
+    @mark.error
+    def test_raises_type_error(self, compiled_powertrain_init_type_error):
+        with raises(TypeError):
+            CompiledPowertrain(**compiled_powertrain_init_type_error)
+
+    @mark.error
+    def test_raises_value_error(self):
+        with raises(ValueError):
+            CompiledPowertrain(elements=(), self_locking=False)
+
+
 @mark.powertrain
 class TestPowertrainUpdateTime:
 
@@ -324,9 +413,8 @@ class TestPowertrainSnapshot:
         else:
             powertrain_copy = deepcopy(basic_powertrain)
             powertrain_copy.update_time(Time(1, 'sec'))
-            powertrain_copy.time[0] = 1
             with raises(TypeError):
-                powertrain_copy.snapshot(target_time=Time(1, 'sec'))
+                powertrain_copy.time[0] = 1
 
     @mark.error
     def test_raises_value_error(self, powertrain_snapshot_value_error):
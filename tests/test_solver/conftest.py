@@ -4,22 +4,40 @@ from gearpy.mechanical_objects import (
     SpurGear,
     DCMotor
 )
-from gearpy.motor_control import MotorControlBase
+from gearpy.motor_control import MotorControlBase, PWMControl
+from gearpy.motor_control.rules import StartProportionalToAngularPosition
 from gearpy.powertrain import Powertrain
+from gearpy.solver import (
+    CallbackSink,
+    CSVSink,
+    RecordingPolicy,
+    SinkBase,
+    StepSizeControl
+)
+from gearpy.sensors import AbsoluteRotaryEncoder
 from gearpy.units import (
+    AngularPosition,
     AngularSpeed,
+    Current,
     InertiaMoment,
     Length,
+    Stress,
+    Time,
     Torque,
     TimeInterval
 )
-from gearpy.utils import add_fixed_joint, StopCondition
+from gearpy.utils import add_fixed_joint, add_gear_mating, StopCondition
 from pytest import fixture
 from tests.conftest import (
     types_to_check,
     basic_spur_gear_1,
-    basic_dc_motor_1
+    basic_dc_motor_1,
+    basic_flywheel,
+    powertrain_dc_motor,
+    powertrain_flywheel,
+    powertrain_spur_gear_2
 )
+import numpy as np
 
 
 motor_powertrain_solver_init_type_error = DCMotor(
@@ -122,7 +140,105 @@ solver_run_type_error_4 = [
     and type_to_check is not None
 ]
 
-solver_run_type_error_5 = [{}]
+solver_run_type_error_5 = [
+    {
+        'time_discretization': TimeInterval(1, 'sec'),
+        'simulation_time': TimeInterval(10, 'sec'),
+        'engine': type_to_check
+    } for type_to_check in types_to_check if not isinstance(type_to_check, str)
+]
+
+solver_run_type_error_6 = [
+    {
+        'time_discretization': TimeInterval(1, 'sec'),
+        'simulation_time': TimeInterval(10, 'sec'),
+        'recording_policy': type_to_check
+    } for type_to_check in types_to_check
+    if not isinstance(type_to_check, RecordingPolicy)
+    and type_to_check is not None
+]
+
+solver_run_type_error_7 = [
+    {
+        'time_discretization': TimeInterval(1, 'sec'),
+        'simulation_time': TimeInterval(10, 'sec'),
+        'sinks': type_to_check
+    } for type_to_check in types_to_check
+    if not isinstance(type_to_check, list) and type_to_check is not None
+]
+
+solver_run_type_error_8 = [
+    {
+        'time_discretization': TimeInterval(1, 'sec'),
+        'simulation_time': TimeInterval(10, 'sec'),
+        'sinks': [type_to_check]
+    } for type_to_check in types_to_check
+    if not isinstance(type_to_check, SinkBase)
+]
+
+solver_run_type_error_9 = [
+    {
+        'time_discretization': TimeInterval(1, 'sec'),
+        'simulation_time': TimeInterval(10, 'sec'),
+        'sinks': [CallbackSink(callback=lambda data: None)],
+        'retain_time_variables': type_to_check
+    } for type_to_check in types_to_check if not isinstance(type_to_check, bool)
+]
+
+solver_run_type_error_10 = [
+    {
+        'time_discretization': TimeInterval(1, 'sec'),
+        'simulation_time': TimeInterval(10, 'sec'),
+        'integrator': type_to_check
+    } for type_to_check in types_to_check if not isinstance(type_to_check, str)
+]
+
+solver_run_type_error_11 = [
+    {
+        'time_discretization': TimeInterval(1, 'sec'),
+        'simulation_time': TimeInterval(10, 'sec'),
+        'integrator': 'dormand-prince',
+        'step_size_control': type_to_check
+    } for type_to_check in types_to_check
+    if not isinstance(type_to_check, StepSizeControl)
+    and type_to_check is not None
+]
+
+solver_run_type_error_12 = [
+    {
+        'time_discretization': TimeInterval(1, 'sec'),
+        'simulation_time': TimeInterval(10, 'sec'),
+        'stop_condition': [type_to_check]
+    } for type_to_check in types_to_check
+    if not isinstance(type_to_check, StopCondition)
+]
+
+solver_run_type_error_13 = [{}]
+
+solver_run_type_error_14 = [
+    {
+        'time_discretization': TimeInterval(1, 'sec'),
+        'simulation_time': TimeInterval(10, 'sec'),
+        'check_assignments': type_to_check
+    } for type_to_check in types_to_check if not isinstance(type_to_check, bool)
+]
+
+solver_run_type_error_15 = [
+    {
+        'time_discretization': TimeInterval(1, 'sec'),
+        'simulation_time': TimeInterval(10, 'sec'),
+        'defer_force_and_stress': type_to_check
+    } for type_to_check in types_to_check if not isinstance(type_to_check, bool)
+]
+
+solver_run_type_error_16 = [
+    {
+        'time_discretization': TimeInterval(1, 'sec'),
+        'simulation_time': TimeInterval(10, 'sec'),
+        'engine': 'array',
+        'analytic_segments': type_to_check
+    } for type_to_check in types_to_check if not isinstance(type_to_check, bool)
+]
 
 
 @fixture(
@@ -131,7 +247,18 @@ solver_run_type_error_5 = [{}]
         *solver_run_type_error_2,
         *solver_run_type_error_3,
         *solver_run_type_error_4,
-        *solver_run_type_error_5
+        *solver_run_type_error_5,
+        *solver_run_type_error_6,
+        *solver_run_type_error_7,
+        *solver_run_type_error_8,
+        *solver_run_type_error_9,
+        *solver_run_type_error_10,
+        *solver_run_type_error_11,
+        *solver_run_type_error_12,
+        *solver_run_type_error_13,
+        *solver_run_type_error_14,
+        *solver_run_type_error_15,
+        *solver_run_type_error_16
     ]
 )
 def solver_run_type_error(request):
@@ -144,8 +271,907 @@ def solver_run_type_error(request):
             'time_discretization': TimeInterval(5, 'sec'),
             'simulation_time': TimeInterval(1, 'sec')
         },
+        {
+            'time_discretization': TimeInterval(1, 'sec'),
+            'simulation_time': TimeInterval(10, 'sec'),
+            'engine': 'not an engine'
+        },
+        {
+            'time_discretization': TimeInterval(1, 'sec'),
+            'simulation_time': TimeInterval(10, 'sec'),
+            'retain_time_variables': False
+        },
+        {
+            'time_discretization': TimeInterval(1, 'sec'),
+            'simulation_time': TimeInterval(10, 'sec'),
+            'integrator': 'not an integrator'
+        },
+        {
+            'time_discretization': TimeInterval(1, 'sec'),
+            'simulation_time': TimeInterval(10, 'sec'),
+            'step_size_control': StepSizeControl()
+        },
+        {
+            'time_discretization': TimeInterval(1, 'sec'),
+            'simulation_time': TimeInterval(10, 'sec'),
+            'integrator': 'dormand-prince',
+            'recording_policy': RecordingPolicy(
+                interval=TimeInterval(2, 'sec')
+            )
+        },
+        {
+            'time_discretization': TimeInterval(1, 'sec'),
+            'simulation_time': TimeInterval(10, 'sec'),
+            'sinks': [CallbackSink(callback=lambda data: None)],
+            'defer_force_and_stress': True
+        },
+        {
+            'time_discretization': TimeInterval(1, 'sec'),
+            'simulation_time': TimeInterval(10, 'sec'),
+            'recording_policy': RecordingPolicy(every=2, aggregation='mean'),
+            'defer_force_and_stress': True
+        },
+        {
+            'time_discretization': TimeInterval(1, 'sec'),
+            'simulation_time': TimeInterval(10, 'sec'),
+            'engine': 'object',
+            'analytic_segments': True
+        },
+        {
+            'time_discretization': TimeInterval(1, 'sec'),
+            'simulation_time': TimeInterval(10, 'sec'),
+            'engine': 'array',
+            'integrator': 'dormand-prince',
+            'analytic_segments': True
+        },
         {}
     ]
 )
 def solver_run_value_error(request):
     return request.param
+
+
+recording_policy_init_type_error_1 = [
+    {'every': type_to_check} for type_to_check in types_to_check
+    if (not isinstance(type_to_check, int) or isinstance(type_to_check, bool))
+    and type_to_check is not None
+]
+
+recording_policy_init_type_error_2 = [
+    {'interval': type_to_check} for type_to_check in types_to_check
+    if not isinstance(type_to_check, TimeInterval) and type_to_check is not None
+]
+
+recording_policy_init_type_error_3 = [
+    {'aggregation': type_to_check} for type_to_check in types_to_check
+    if not isinstance(type_to_check, str)
+]
+
+
+@fixture(
+    params=[
+        *recording_policy_init_type_error_1,
+        *recording_policy_init_type_error_2,
+        *recording_policy_init_type_error_3
+    ]
+)
+def recording_policy_init_type_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        {'every': 0},
+        {'every': -1},
+        {'every': 2, 'interval': TimeInterval(1, 'sec')},
+        {'aggregation': 'not an aggregation'}
+    ]
+)
+def recording_policy_init_value_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        type_to_check for type_to_check in types_to_check
+        if not isinstance(type_to_check, TimeInterval)
+    ]
+)
+def recording_policy_get_window_type_error(request):
+    return request.param
+
+
+sink_units = [
+    'time_unit',
+    'angular_position_unit',
+    'angular_speed_unit',
+    'angular_acceleration_unit',
+    'torque_unit',
+    'driving_torque_unit',
+    'load_torque_unit',
+    'force_unit',
+    'stress_unit',
+    'current_unit'
+]
+
+csv_sink_init_type_error_1 = [
+    {'folder_path': type_to_check} for type_to_check in types_to_check
+    if not isinstance(type_to_check, str)
+]
+
+csv_sink_init_type_error_2 = [
+    {'folder_path': 'folder', unit: type_to_check}
+    for unit in sink_units for type_to_check in types_to_check
+    if not isinstance(type_to_check, str)
+]
+
+
+@fixture(
+    params=[
+        *csv_sink_init_type_error_1,
+        *csv_sink_init_type_error_2
+    ]
+)
+def csv_sink_init_type_error(request):
+    return request.param
+
+
+callback_sink_init_type_error_1 = [
+    {'callback': type_to_check} for type_to_check in types_to_check
+    if not callable(type_to_check)
+]
+
+callback_sink_init_type_error_2 = [
+    {'callback': lambda data: None, unit: type_to_check}
+    for unit in sink_units for type_to_check in types_to_check
+    if not isinstance(type_to_check, str)
+]
+
+
+@fixture(
+    params=[
+        *callback_sink_init_type_error_1,
+        *callback_sink_init_type_error_2
+    ]
+)
+def callback_sink_init_type_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        {'sink': sink, 'data': type_to_check}
+        for sink in [
+            CSVSink(folder_path='folder'),
+            CallbackSink(callback=lambda data: None)
+        ]
+        for type_to_check in types_to_check
+        if not isinstance(type_to_check, dict)
+    ]
+)
+def sink_write_type_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        {'sink': sink, 'powertrain': type_to_check}
+        for sink in [
+            CSVSink(folder_path='folder'),
+            CallbackSink(callback=lambda data: None)
+        ]
+        for type_to_check in types_to_check
+        if not isinstance(type_to_check, Powertrain)
+    ]
+)
+def sink_open_type_error(request):
+    return request.param
+
+
+step_size_control_init_type_error_1 = [
+    {'relative_tolerance': type_to_check} for type_to_check in types_to_check
+    if not isinstance(type_to_check, float | int)
+    or isinstance(type_to_check, bool)
+]
+
+step_size_control_init_type_error_2 = [
+    {'absolute_tolerance': type_to_check} for type_to_check in types_to_check
+    if not isinstance(type_to_check, float | int)
+    or isinstance(type_to_check, bool)
+]
+
+step_size_control_init_type_error_3 = [
+    {'minimum_time_discretization': type_to_check}
+    for type_to_check in types_to_check
+    if not isinstance(type_to_check, TimeInterval) and type_to_check is not None
+]
+
+step_size_control_init_type_error_4 = [
+    {'maximum_time_discretization': type_to_check}
+    for type_to_check in types_to_check
+    if not isinstance(type_to_check, TimeInterval) and type_to_check is not None
+]
+
+
+@fixture(
+    params=[
+        *step_size_control_init_type_error_1,
+        *step_size_control_init_type_error_2,
+        *step_size_control_init_type_error_3,
+        *step_size_control_init_type_error_4
+    ]
+)
+def step_size_control_init_type_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        {'relative_tolerance': 0},
+        {'relative_tolerance': -1e-3},
+        {'absolute_tolerance': 0},
+        {'absolute_tolerance': -1e-6},
+        {
+            'minimum_time_discretization': TimeInterval(2, 'sec'),
+            'maximum_time_discretization': TimeInterval(1, 'sec')
+        }
+    ]
+)
+def step_size_control_init_value_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        type_to_check for type_to_check in types_to_check
+        if not isinstance(type_to_check, TimeInterval)
+    ]
+)
+def step_size_control_get_time_step_bounds_type_error(request):
+    return request.param
+
+
+batch_solver_init_type_error_1 = [
+    {'powertrain': type_to_check} for type_to_check in types_to_check
+    if not isinstance(type_to_check, Powertrain)
+]
+
+batch_solver_init_type_error_2 = [
+    {'powertrain': PowertrainFake([type_to_check, basic_spur_gear_1])}
+    for type_to_check in types_to_check
+    if not isinstance(type_to_check, DCMotor)
+]
+
+batch_solver_init_type_error_3 = [
+    {'powertrain': PowertrainFake([basic_dc_motor_1, type_to_check])}
+    for type_to_check in types_to_check
+    if not isinstance(type_to_check, RotatingObject)
+]
+
+
+@fixture(
+    params=[
+        *batch_solver_init_type_error_1,
+        *batch_solver_init_type_error_2,
+        *batch_solver_init_type_error_3
+    ]
+)
+def batch_solver_init_type_error(request):
+    return request.param
+
+
+batch_solver_run_type_error_1 = [
+    {
+        'time_discretization': type_to_check,
+        'simulation_time': TimeInterval(1, 'sec'),
+        'parameters': {powertrain_spur_gear_2: {'master_gear_ratio': [4.0]}}
+    } for type_to_check in types_to_check
+    if not isinstance(type_to_check, TimeInterval)
+]
+
+batch_solver_run_type_error_2 = [
+    {
+        'time_discretization': TimeInterval(1, 'sec'),
+        'simulation_time': type_to_check,
+        'parameters': {powertrain_spur_gear_2: {'master_gear_ratio': [4.0]}}
+    } for type_to_check in types_to_check
+    if not isinstance(type_to_check, TimeInterval)
+]
+
+batch_solver_run_type_error_3 = [
+    {
+        'time_discretization': TimeInterval(1, 'sec'),
+        'simulation_time': TimeInterval(10, 'sec'),
+        'parameters': type_to_check
+    } for type_to_check in types_to_check if not isinstance(type_to_check, dict)
+]
+
+batch_solver_run_type_error_4 = [
+    {
+        'time_discretization': TimeInterval(1, 'sec'),
+        'simulation_time': TimeInterval(10, 'sec'),
+        'parameters': {type_to_check: {'master_gear_ratio': [4.0]}}
+    } for type_to_check in types_to_check
+    if not isinstance(type_to_check, RotatingObject)
+    and type_to_check.__hash__ is not None
+]
+
+batch_solver_run_type_error_5 = [
+    {
+        'time_discretization': TimeInterval(1, 'sec'),
+        'simulation_time': TimeInterval(10, 'sec'),
+        'parameters': {powertrain_spur_gear_2: type_to_check}
+    } for type_to_check in types_to_check if not isinstance(type_to_check, dict)
+]
+
+batch_solver_run_type_error_6 = [
+    {
+        'time_discretization': TimeInterval(1, 'sec'),
+        'simulation_time': TimeInterval(10, 'sec'),
+        'parameters': {powertrain_spur_gear_2: {type_to_check: [4.0]}}
+    } for type_to_check in types_to_check
+    if not isinstance(type_to_check, str)
+    and type_to_check.__hash__ is not None
+]
+
+batch_solver_run_type_error_7 = [
+    {
+        'time_discretization': TimeInterval(1, 'sec'),
+        'simulation_time': TimeInterval(10, 'sec'),
+        'parameters': {
+            powertrain_spur_gear_2: {'master_gear_ratio': type_to_check}
+        }
+    } for type_to_check in types_to_check
+    if not isinstance(type_to_check, list | np.ndarray)
+]
+
+batch_solver_run_type_error_8 = [
+    {
+        'time_discretization': TimeInterval(1, 'sec'),
+        'simulation_time': TimeInterval(10, 'sec'),
+        'parameters': {
+            powertrain_spur_gear_2: {'master_gear_ratio': [type_to_check]}
+        }
+    } for type_to_check in types_to_check
+    if not isinstance(type_to_check, float | int) or
+    isinstance(type_to_check, bool)
+]
+
+batch_solver_run_type_error_9 = [
+    {
+        'time_discretization': TimeInterval(1, 'sec'),
+        'simulation_time': TimeInterval(10, 'sec'),
+        'parameters': {
+            powertrain_dc_motor: {'maximum_torque': [type_to_check]}
+        }
+    } for type_to_check in types_to_check
+    if not isinstance(type_to_check, Torque)
+]
+
+batch_solver_run_type_error_10 = [
+    {
+        'time_discretization': TimeInterval(1, 'sec'),
+        'simulation_time': TimeInterval(10, 'sec'),
+        'parameters': {powertrain_spur_gear_2: {'master_gear_ratio': [4.0]}},
+        'integrator': type_to_check
+    } for type_to_check in types_to_check if not isinstance(type_to_check, str)
+]
+
+batch_solver_run_type_error_11 = [
+    {
+        'time_discretization': TimeInterval(1, 'sec'),
+        'simulation_time': TimeInterval(10, 'sec'),
+        'parameters': {powertrain_spur_gear_2: {'master_gear_ratio': [4.0]}},
+        'recording_policy': type_to_check
+    } for type_to_check in types_to_check
+    if not isinstance(type_to_check, RecordingPolicy)
+    and type_to_check is not None
+]
+
+
+@fixture(
+    params=[
+        *batch_solver_run_type_error_1,
+        *batch_solver_run_type_error_2,
+        *batch_solver_run_type_error_3,
+        *batch_solver_run_type_error_4,
+        *batch_solver_run_type_error_5,
+        *batch_solver_run_type_error_6,
+        *batch_solver_run_type_error_7,
+        *batch_solver_run_type_error_8,
+        *batch_solver_run_type_error_9,
+        *batch_solver_run_type_error_10,
+        *batch_solver_run_type_error_11
+    ]
+)
+def batch_solver_run_type_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        {
+            'time_discretization': TimeInterval(5, 'sec'),
+            'simulation_time': TimeInterval(1, 'sec'),
+            'parameters': {
+                powertrain_spur_gear_2: {'master_gear_ratio': [4.0]}
+            }
+        },
+        {
+            'time_discretization': TimeInterval(1, 'sec'),
+            'simulation_time': TimeInterval(10, 'sec'),
+            'parameters': {}
+        },
+        {
+            'time_discretization': TimeInterval(1, 'sec'),
+            'simulation_time': TimeInterval(10, 'sec'),
+            'parameters': {powertrain_spur_gear_2: {}}
+        },
+        {
+            'time_discretization': TimeInterval(1, 'sec'),
+            'simulation_time': TimeInterval(10, 'sec'),
+            'parameters': {basic_flywheel: {'inertia_moment': [
+                InertiaMoment(1, 'kgm^2')
+            ]}}
+        },
+        {
+            'time_discretization': TimeInterval(1, 'sec'),
+            'simulation_time': TimeInterval(10, 'sec'),
+            'parameters': {
+                powertrain_flywheel: {'master_gear_ratio': [4.0]}
+            }
+        },
+        {
+            'time_discretization': TimeInterval(1, 'sec'),
+            'simulation_time': TimeInterval(10, 'sec'),
+            'parameters': {powertrain_spur_gear_2: {'master_gear_ratio': []}}
+        },
+        {
+            'time_discretization': TimeInterval(1, 'sec'),
+            'simulation_time': TimeInterval(10, 'sec'),
+            'parameters': {
+                powertrain_spur_gear_2: {
+                    'master_gear_ratio': [4.0, 5.0],
+                    'master_gear_efficiency': [0.9]
+                }
+            }
+        },
+        {
+            'time_discretization': TimeInterval(1, 'sec'),
+            'simulation_time': TimeInterval(10, 'sec'),
+            'parameters': {
+                powertrain_spur_gear_2: {'master_gear_ratio': [4.0, -1.0]}
+            }
+        },
+        {
+            'time_discretization': TimeInterval(1, 'sec'),
+            'simulation_time': TimeInterval(10, 'sec'),
+            'parameters': {
+                powertrain_spur_gear_2: {'master_gear_efficiency': [1.5]}
+            }
+        },
+        {
+            'time_discretization': TimeInterval(1, 'sec'),
+            'simulation_time': TimeInterval(10, 'sec'),
+            'parameters': {
+                powertrain_spur_gear_2: {'master_gear_ratio': [4.0]}
+            },
+            'integrator': 'dormand-prince'
+        },
+        {}
+    ]
+)
+def batch_solver_run_value_error(request):
+    return request.param
+
+
+def powertrain_factory(random_generator):
+    motor = DCMotor(
+        name='motor',
+        inertia_moment=InertiaMoment(1, 'gm^2'),
+        no_load_speed=AngularSpeed(5000, 'rpm'),
+        maximum_torque=Torque(
+            200*random_generator.uniform(low=0.9, high=1.1),
+            'mNm'
+        ),
+        no_load_electric_current=Current(100, 'mA'),
+        maximum_electric_current=Current(2, 'A')
+    )
+    gear_1 = SpurGear(
+        name='gear 1',
+        n_teeth=10,
+        module=Length(1, 'mm'),
+        inertia_moment=InertiaMoment(1, 'gm^2')
+    )
+    gear_2 = SpurGear(
+        name='gear 2',
+        n_teeth=80,
+        module=Length(1, 'mm'),
+        inertia_moment=InertiaMoment(
+            3*random_generator.uniform(low=0.9, high=1.1),
+            'gm^2'
+        )
+    )
+    add_fixed_joint(master=motor, slave=gear_1)
+    add_gear_mating(master=gear_1, slave=gear_2, efficiency=0.9)
+    gear_2.external_torque = external_torque
+    gear_2.angular_position = AngularPosition(0, 'rad')
+    gear_2.angular_speed = AngularSpeed(0, 'rad/s')
+
+    return Powertrain(motor=motor)
+
+
+def external_torque(time, angular_position, angular_speed):
+    return Torque(0.5, 'Nm')
+
+
+def reference_powertrain_factory():
+    motor = DCMotor(
+        name='motor',
+        no_load_speed=AngularSpeed(100, 'rad/s'),
+        maximum_torque=Torque(1, 'Nm'),
+        inertia_moment=InertiaMoment(1e-5, 'kgm^2'),
+        no_load_electric_current=Current(0.1, 'A'),
+        maximum_electric_current=Current(2, 'A')
+    )
+    gears = [
+        SpurGear(
+            name=f'gear {i}',
+            n_teeth=n_teeth,
+            inertia_moment=InertiaMoment(1e-5*n_teeth, 'kgm^2'),
+            module=Length(1, 'mm'),
+            face_width=Length(5, 'mm'),
+            elastic_modulus=Stress(200, 'GPa')
+        )
+        for i, n_teeth in enumerate([10, 40, 15, 45])
+    ]
+    add_fixed_joint(master=motor, slave=gears[0])
+    add_gear_mating(master=gears[0], slave=gears[1], efficiency=0.9)
+    add_fixed_joint(master=gears[1], slave=gears[2])
+    add_gear_mating(master=gears[2], slave=gears[3], efficiency=0.8)
+    gears[-1].external_torque = \
+        lambda time, angular_position, angular_speed: Torque(
+            0.5 + 0.01*angular_speed.to('rad/s').value, 'Nm'
+        )
+    gears[-1].angular_position = AngularPosition(0, 'rad')
+    gears[-1].angular_speed = AngularSpeed(0, 'rad/s')
+    motor.pwm = 0.8
+
+    return Powertrain(motor=motor)
+
+
+# time variables of the reference powertrain at the time steps
+# reference_time_steps, recorded by gearpy 1.3.0 with two consecutive runs of
+# 0.5 seconds with time discretization of 1 ms
+reference_time_steps = [1, 10, 100, 1000]
+reference_time_variables = {
+    'motor': {
+        'angular speed': ('rad/s', [
+            22.179132040627888,
+            71.40553391071393,
+            73.41823739174731,
+            73.41823739174731
+        ]),
+        'driving torque': ('Nm', [
+            0.5706006706516984,
+            0.08481381009163888,
+            0.06495160468670418,
+            0.06495160468670418
+        ]),
+        'electric current': ('A', [
+            1.184141274238227,
+            0.2611462391741139,
+            0.22340804890473792,
+            0.22340804890473792
+        ]),
+    },
+    'gear 1': {
+        'torque': ('Nm', [
+            1.8381279934986738,
+            0.07220279483312433,
+            5.551115123125783e-16,
+            5.551115123125783e-16
+        ]),
+        'contact stress': ('Pa', [
+            470013755.3435165,
+            181208145.5742541,
+            158576698.5114048,
+            158576698.5114048
+        ]),
+    },
+    'gear 3': {
+        'angular position': ('rad', [
+            0.0018482610033856573,
+            0.04743487449969911,
+            0.5976841693593322,
+            6.104051973740231
+        ]),
+        'angular speed': ('rad/s', [
+            1.8482610033856572,
+            5.95046115922616,
+            6.118186449312276,
+            6.118186449312276
+        ]),
+        'angular acceleration': ('rad/s^2', [
+            1289.914381402578,
+            50.6686279530697,
+            3.895519384649672e-13,
+            3.895519384649672e-13
+        ]),
+        'load torque': ('Nm', [
+            0.5184826100338565,
+            0.5595046115922616,
+            0.5611818644931228,
+            0.5611818644931228
+        ]),
+        'tangential force': ('N', [
+            219.11065753025218,
+            32.568503075189334,
+            24.941416199694405,
+            24.941416199694405
+        ]),
+        'bending stress': ('Pa', [
+            109829903.52393591,
+            16325064.198089888,
+            12501963.007365614,
+            12501963.007365614
+        ]),
+        'contact stress': ('Pa', [
+            578906812.0968665,
+            223190552.80351683,
+            195315839.0885583,
+            195315839.0885583
+        ]),
+    },
+}
+
+
+def motor_control_factory(powertrain):
+    motor_control = PWMControl(powertrain=powertrain)
+    motor_control.add_rule(
+        rule=StartProportionalToAngularPosition(
+            encoder=AbsoluteRotaryEncoder(target=powertrain.elements[-1]),
+            powertrain=powertrain,
+            target_angular_position=AngularPosition(1, 'rad'),
+            pwm_min_multiplier=2
+        )
+    )
+
+    return motor_control
+
+
+def stop_condition_factory(powertrain):
+    return StopCondition(
+        sensor=AbsoluteRotaryEncoder(target=powertrain.elements[-1]),
+        threshold=AngularPosition(3, 'rad'),
+        operator=StopCondition.greater_than_or_equal_to
+    )
+
+
+simulation_job_init_type_error_1 = [
+    {
+        'powertrain_factory': type_to_check,
+        'time_discretization': TimeInterval(1, 'ms'),
+        'simulation_time': TimeInterval(1, 'sec')
+    } for type_to_check in types_to_check if not callable(type_to_check)
+]
+
+simulation_job_init_type_error_2 = [
+    {
+        'powertrain_factory': powertrain_factory,
+        'time_discretization': type_to_check,
+        'simulation_time': TimeInterval(1, 'sec')
+    } for type_to_check in types_to_check
+    if not isinstance(type_to_check, TimeInterval)
+]
+
+simulation_job_init_type_error_3 = [
+    {
+        'powertrain_factory': powertrain_factory,
+        'time_discretization': TimeInterval(1, 'ms'),
+        'simulation_time': type_to_check
+    } for type_to_check in types_to_check
+    if not isinstance(type_to_check, TimeInterval)
+]
+
+simulation_job_init_type_error_4 = [
+    {
+        'powertrain_factory': powertrain_factory,
+        'time_discretization': TimeInterval(1, 'ms'),
+        'simulation_time': TimeInterval(1, 'sec'),
+        'motor_control_factory': type_to_check
+    } for type_to_check in types_to_check
+    if not callable(type_to_check) and type_to_check is not None
+]
+
+simulation_job_init_type_error_5 = [
+    {
+        'powertrain_factory': powertrain_factory,
+        'time_discretization': TimeInterval(1, 'ms'),
+        'simulation_time': TimeInterval(1, 'sec'),
+        'stop_condition_factory': type_to_check
+    } for type_to_check in types_to_check
+    if not callable(type_to_check) and type_to_check is not None
+]
+
+simulation_job_init_type_error_6 = [
+    {
+        'powertrain_factory': powertrain_factory,
+        'time_discretization': TimeInterval(1, 'ms'),
+        'simulation_time': TimeInterval(1, 'sec'),
+        'engine': type_to_check
+    } for type_to_check in types_to_check if not isinstance(type_to_check, str)
+]
+
+simulation_job_init_type_error_7 = [
+    {
+        'powertrain_factory': powertrain_factory,
+        'time_discretization': TimeInterval(1, 'ms'),
+        'simulation_time': TimeInterval(1, 'sec'),
+        'integrator': type_to_check
+    } for type_to_check in types_to_check if not isinstance(type_to_check, str)
+]
+
+simulation_job_init_type_error_8 = [
+    {
+        'powertrain_factory': powertrain_factory,
+        'time_discretization': TimeInterval(1, 'ms'),
+        'simulation_time': TimeInterval(1, 'sec'),
+        'recording_policy': type_to_check
+    } for type_to_check in types_to_check
+    if not isinstance(type_to_check, RecordingPolicy)
+    and type_to_check is not None
+]
+
+
+@fixture(
+    params=[
+        *simulation_job_init_type_error_1,
+        *simulation_job_init_type_error_2,
+        *simulation_job_init_type_error_3,
+        *simulation_job_init_type_error_4,
+        *simulation_job_init_type_error_5,
+        *simulation_job_init_type_error_6,
+        *simulation_job_init_type_error_7,
+        *simulation_job_init_type_error_8
+    ]
+)
+def simulation_job_init_type_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        {
+            'powertrain_factory': powertrain_factory,
+            'time_discretization': TimeInterval(5, 'sec'),
+            'simulation_time': TimeInterval(1, 'sec')
+        },
+        {
+            'powertrain_factory': powertrain_factory,
+            'time_discretization': TimeInterval(1, 'ms'),
+            'simulation_time': TimeInterval(1, 'sec'),
+            'engine': 'not an engine'
+        },
+        {
+            'powertrain_factory': powertrain_factory,
+            'time_discretization': TimeInterval(1, 'ms'),
+            'simulation_time': TimeInterval(1, 'sec'),
+            'integrator': 'not an integrator'
+        }
+    ]
+)
+def simulation_job_init_value_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        {'seed': type_to_check} for type_to_check in types_to_check
+        if (not isinstance(type_to_check, int) or
+            isinstance(type_to_check, bool)) and type_to_check is not None
+    ]
+)
+def simulation_job_run_type_error(request):
+    return request.param
+
+
+parallel_solver_init_type_error_1 = [
+    {'jobs': type_to_check} for type_to_check in types_to_check
+    if not isinstance(type_to_check, list)
+]
+
+parallel_solver_init_type_error_2 = [
+    {'jobs': [type_to_check]} for type_to_check in types_to_check
+]
+
+
+@fixture(
+    params=[
+        *parallel_solver_init_type_error_1,
+        *parallel_solver_init_type_error_2
+    ]
+)
+def parallel_solver_init_type_error(request):
+    return request.param
+
+
+parallel_solver_run_type_error_1 = [
+    {'max_workers': type_to_check} for type_to_check in types_to_check
+    if (not isinstance(type_to_check, int) or isinstance(type_to_check, bool))
+    and type_to_check is not None
+]
+
+parallel_solver_run_type_error_2 = [
+    {'chunk_size': type_to_check} for type_to_check in types_to_check
+    if not isinstance(type_to_check, int) or isinstance(type_to_check, bool)
+]
+
+parallel_solver_run_type_error_3 = [
+    {'seed': type_to_check} for type_to_check in types_to_check
+    if (not isinstance(type_to_check, int) or isinstance(type_to_check, bool))
+    and type_to_check is not None
+]
+
+
+@fixture(
+    params=[
+        *parallel_solver_run_type_error_1,
+        *parallel_solver_run_type_error_2,
+        *parallel_solver_run_type_error_3
+    ]
+)
+def parallel_solver_run_type_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        {'max_workers': 0},
+        {'max_workers': -1},
+        {'chunk_size': 0},
+        {'chunk_size': -1},
+        {'seed': -1}
+    ]
+)
+def parallel_solver_run_value_error(request):
+    return request.param
+
+
+steady_state_solver_init_type_error_1 = [
+    {'powertrain': type_to_check} for type_to_check in types_to_check
+    if not isinstance(type_to_check, Powertrain)
+]
+
+steady_state_solver_init_type_error_2 = [
+    {'powertrain': PowertrainFake([type_to_check, basic_spur_gear_1])}
+    for type_to_check in types_to_check
+    if not isinstance(type_to_check, DCMotor)
+]
+
+steady_state_solver_init_type_error_3 = [
+    {'powertrain': PowertrainFake([basic_dc_motor_1, type_to_check])}
+    for type_to_check in types_to_check
+    if not isinstance(type_to_check, RotatingObject)
+]
+
+
+@fixture(
+    params=[
+        *steady_state_solver_init_type_error_1,
+        *steady_state_solver_init_type_error_2,
+        *steady_state_solver_init_type_error_3
+    ]
+)
+def steady_state_solver_init_type_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        {'time': type_to_check} for type_to_check in types_to_check
+        if not isinstance(type_to_check, Time) and type_to_check is not None
+    ]
+)
+def steady_state_solver_run_type_error(request):
+    return request.param
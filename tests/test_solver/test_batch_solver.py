@@ -0,0 +1,296 @@
+from gearpy.mechanical_objects import DCMotor, SpurGear
+from gearpy.powertrain import Powertrain
+from gearpy.solver import BatchSolver, RecordingPolicy, Solver
+from gearpy.solver.batch_solver import BATCH_INTEGRATORS
+from gearpy.units import (
+    AngularSpeed,
+    InertiaMoment,
+    InertiaMomentArray,
+    TimeInterval,
+    Torque,
+    TorqueArray
+)
+from gearpy.utils import add_fixed_joint
+from hypothesis import given, settings, HealthCheck
+from hypothesis.strategies import floats, integers, lists, sampled_from
+import numpy as np
+from pytest import mark, raises
+from tests.conftest import basic_powertrain, powertrains, time_intervals
+from tests.test_units.test_angular_position.conftest import angular_positions
+from tests.test_units.test_angular_speed.conftest import angular_speeds
+from tests.test_solver.conftest import PowertrainFake
+from copy import deepcopy
+import warnings
+
+
+SI_UNITS = {
+    'angular position': 'rad',
+    'angular speed': 'rad/s',
+    'angular acceleration': 'rad/s^2',
+    'torque': 'Nm',
+    'driving torque': 'Nm',
+    'load torque': 'Nm',
+    'electric current': 'A'
+}
+
+
+@mark.solver
+class TestBatchSolverInit:
+
+    @mark.genuine
+    @given(powertrain=powertrains())
+    @settings(
+        max_examples=100,
+        deadline=None,
+        suppress_health_check=[HealthCheck.too_slow]
+    )
+    def test_method(self, powertrain):
+        batch_solver = BatchSolver(powertrain=powertrain)
+
+        assert batch_solver.n_variants is None
+        assert len(batch_solver.time) == 0
+        assert batch_solver.time_variables == {}
+
+    @mark.error
+    def test_raises_type_error(self, batch_solver_init_type_error):
+        with raises(TypeError):
+            BatchSolver(**batch_solver_init_type_error)
+
+    @mark.error
+    def test_raises_value_error(self):
+        with raises(ValueError):
+            BatchSolver(powertrain=PowertrainFake([]))
+
+
+@mark.solver
+class TestBatchSolverRun:
+
+    @mark.genuine
+    @given(
+        time_discretization=time_intervals(),
+        simulation_steps=integers(min_value=2, max_value=50),
+        integrator=sampled_from(elements=BATCH_INTEGRATORS),
+        powertrain=powertrains(),
+        gear_ratio_factors=lists(
+            elements=floats(min_value=0.5, max_value=2),
+            min_size=1,
+            max_size=4
+        ),
+        initial_angular_position=angular_positions(),
+        initial_angular_speed=angular_speeds())
+    @settings(
+        max_examples=50,
+        deadline=None,
+        suppress_health_check=[HealthCheck.too_slow]
+    )
+    def test_method(
+        self,
+        time_discretization,
+        simulation_steps,
+        integrator,
+        powertrain,
+        gear_ratio_factors,
+        initial_angular_position,
+        initial_angular_speed
+    ):
+        warnings.filterwarnings('ignore', category=RuntimeWarning)
+
+        powertrain.elements[-1].angular_position = initial_angular_position
+        powertrain.elements[-1].angular_speed = initial_angular_speed
+        powertrain.elements[-1].external_torque = \
+            lambda time, angular_position, angular_speed: Torque(0.001, 'Nm')
+        simulation_time = time_discretization*simulation_steps
+        motor = powertrain.elements[0]
+        last = powertrain.elements[-1]
+        gear_ratios = [
+            last.master_gear_ratio*factor for factor in gear_ratio_factors
+        ]
+        efficiencies = [
+            min(1.0, last.master_gear_efficiency*factor)
+            for factor in gear_ratio_factors
+        ]
+        parameters = {
+            motor: {
+                'maximum_torque': [motor.maximum_torque]*len(gear_ratios)
+            },
+            last: {
+                'master_gear_ratio': gear_ratios,
+                'master_gear_efficiency': np.array(efficiencies)
+            }
+        }
+
+        batch_solver = BatchSolver(powertrain=powertrain)
+        batch_solver.run(
+            time_discretization=time_discretization,
+            simulation_time=simulation_time,
+            parameters=parameters,
+            integrator=integrator
+        )
+
+        assert batch_solver.n_variants == len(gear_ratios)
+        assert len(powertrain.time) == 0
+        for k, (gear_ratio, efficiency) in enumerate(
+            zip(gear_ratios, efficiencies)
+        ):
+            variant = deepcopy(powertrain)
+            variant.elements[-1].master_gear_ratio = gear_ratio
+            variant.elements[-1].master_gear_efficiency = efficiency
+            solver = Solver(powertrain=variant)
+            solver.run(
+                time_discretization=time_discretization,
+                simulation_time=simulation_time,
+                engine='array',
+                integrator=integrator
+            )
+
+            np.testing.assert_allclose(
+                batch_solver.time.get_values(),
+                variant.time.get_values()
+            )
+            for element in variant.elements:
+                batch_time_variables = \
+                    batch_solver.time_variables[element.name]
+                for variable, values in batch_time_variables.items():
+                    assert values.shape == (
+                        len(gear_ratios),
+                        len(batch_solver.time)
+                    )
+                    expected_values = element.time_variables[variable]\
+                        .get_values(unit=SI_UNITS[variable])
+                    np.testing.assert_allclose(
+                        values[k],
+                        expected_values,
+                        rtol=1e-9,
+                        atol=1e-12,
+                        equal_nan=True
+                    )
+
+    @mark.genuine
+    def test_recording_policy(self):
+        batch_solver = BatchSolver(powertrain=basic_powertrain)
+        parameters = {
+            basic_powertrain.elements[0]: {
+                'inertia_moment': [
+                    InertiaMoment(1, 'kgm^2'),
+                    InertiaMoment(2, 'kgm^2')
+                ]
+            }
+        }
+        batch_solver.run(
+            time_discretization=TimeInterval(1, 'sec'),
+            simulation_time=TimeInterval(10, 'sec'),
+            parameters=parameters
+        )
+        time = batch_solver.time.get_values()
+        time_variables = deepcopy(batch_solver.time_variables)
+
+        batch_solver.run(
+            time_discretization=TimeInterval(1, 'sec'),
+            simulation_time=TimeInterval(10, 'sec'),
+            parameters=parameters,
+            recording_policy=RecordingPolicy(every=5, aggregation='max')
+        )
+
+        np.testing.assert_array_equal(
+            batch_solver.time.get_values(),
+            time[[0, 5, 10]]
+        )
+        for name, variables in batch_solver.time_variables.items():
+            for variable, values in variables.items():
+                expected_values = time_variables[name][variable]
+                assert values.shape == (2, 3)
+                np.testing.assert_array_equal(
+                    values[:, 0],
+                    expected_values[:, 0]
+                )
+                np.testing.assert_array_equal(
+                    values[:, 1],
+                    expected_values[:, 1:6].max(axis=1)
+                )
+                np.testing.assert_array_equal(
+                    values[:, 2],
+                    expected_values[:, 6:11].max(axis=1)
+                )
+
+    @mark.genuine
+    def test_unit_arrays(self):
+        motor = basic_powertrain.elements[0]
+        parameters = {
+            motor: {
+                'inertia_moment': [
+                    InertiaMoment(1, 'kgm^2'),
+                    InertiaMoment(2000, 'gm^2')
+                ],
+                'maximum_torque': [Torque(1, 'Nm'), Torque(500, 'mNm')]
+            }
+        }
+        array_parameters = {
+            motor: {
+                'inertia_moment': InertiaMomentArray([1000, 2000], 'gm^2'),
+                'maximum_torque': TorqueArray([1, 0.5], 'Nm')
+            }
+        }
+
+        batch_solver = BatchSolver(powertrain=basic_powertrain)
+        batch_solver.run(
+            time_discretization=TimeInterval(1, 'sec'),
+            simulation_time=TimeInterval(10, 'sec'),
+            parameters=parameters
+        )
+        time_variables = deepcopy(batch_solver.time_variables)
+        batch_solver.run(
+            time_discretization=TimeInterval(1, 'sec'),
+            simulation_time=TimeInterval(10, 'sec'),
+            parameters=array_parameters
+        )
+
+        for name, variables in batch_solver.time_variables.items():
+            for variable, values in variables.items():
+                np.testing.assert_allclose(
+                    values,
+                    time_variables[name][variable],
+                    rtol=1e-12,
+                    equal_nan=True
+                )
+
+        array_parameters[motor]['maximum_torque'] = \
+            InertiaMomentArray([1, 2], 'kgm^2')
+        with raises(TypeError):
+            batch_solver.run(
+                time_discretization=TimeInterval(1, 'sec'),
+                simulation_time=TimeInterval(10, 'sec'),
+                parameters=array_parameters
+            )
+
+    @mark.error
+    def test_raises_type_error(self, batch_solver_run_type_error):
+        batch_solver = BatchSolver(powertrain=basic_powertrain)
+        with raises(TypeError):
+            batch_solver.run(**batch_solver_run_type_error)
+
+    @mark.error
+    def test_raises_value_error(self, batch_solver_run_value_error):
+        if batch_solver_run_value_error:
+            batch_solver = BatchSolver(powertrain=basic_powertrain)
+            with raises(ValueError):
+                batch_solver.run(**batch_solver_run_value_error)
+        else:
+            motor = DCMotor(
+                name='motor',
+                no_load_speed=AngularSpeed(1000, 'rpm'),
+                maximum_torque=Torque(1, 'Nm'),
+                inertia_moment=InertiaMoment(1, 'kgm^2')
+            )
+            gear = SpurGear(
+                name='gear',
+                n_teeth=10,
+                inertia_moment=InertiaMoment(1, 'kgm^2')
+            )
+            add_fixed_joint(master=motor, slave=gear)
+            batch_solver = BatchSolver(powertrain=Powertrain(motor=motor))
+            with raises(ValueError):
+                batch_solver.run(
+                    time_discretization=TimeInterval(1, 'sec'),
+                    simulation_time=TimeInterval(10, 'sec'),
+                    parameters={gear: {'master_gear_ratio': [1.0]}}
+                )
@@ -0,0 +1,47 @@
+from gearpy.solver import CallbackSink
+from hypothesis import given, settings
+from hypothesis.strategies import integers
+import numpy as np
+import pandas as pd
+from pytest import mark, raises
+
+
+@mark.solver
+class TestCallbackSinkInit:
+
+    @mark.genuine
+    def test_method(self):
+        def callback(data):
+            pass
+
+        sink = CallbackSink(callback=callback, stress_unit='GPa')
+
+        assert sink.callback is callback
+        assert sink.units['bending stress'] == 'GPa'
+        assert sink.units['contact stress'] == 'GPa'
+
+    @mark.error
+    def test_raises_type_error(self, callback_sink_init_type_error):
+        with raises(TypeError):
+            CallbackSink(**callback_sink_init_type_error)
+
+
+@mark.solver
+class TestCallbackSinkWrite:
+
+    @mark.genuine
+    @given(n_batches=integers(min_value=1, max_value=10))
+    @settings(max_examples=20, deadline=None)
+    def test_method(self, n_batches):
+        received = []
+        sink = CallbackSink(callback=lambda data: received.append(data))
+        batches = [
+            {'gear': pd.DataFrame({'time (sec)': np.random.rand(3)})}
+            for _ in range(n_batches)
+        ]
+        for batch in batches:
+            sink.write(data=batch)
+
+        assert len(received) == n_batches
+        for received_batch, batch in zip(received, batches):
+            assert received_batch is batch
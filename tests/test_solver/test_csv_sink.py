@@ -0,0 +1,98 @@
+from gearpy.solver import CSVSink
+from hypothesis import given, settings
+from hypothesis.strategies import integers, sampled_from
+import numpy as np
+import os
+import pandas as pd
+from pytest import mark, raises
+from tests.conftest import basic_powertrain
+import tempfile
+
+
+@mark.solver
+class TestCSVSinkInit:
+
+    @mark.genuine
+    @given(
+        time_unit=sampled_from(elements=['sec', 'min', 'ms']),
+        torque_unit=sampled_from(elements=['Nm', 'mNm', 'kgfm'])
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, time_unit, torque_unit):
+        sink = CSVSink(
+            folder_path='folder',
+            time_unit=time_unit,
+            torque_unit=torque_unit
+        )
+
+        assert sink.folder_path == 'folder'
+        assert sink.units['time'] == time_unit
+        assert sink.units['torque'] == torque_unit
+        assert sink.units['pwm'] == ''
+
+    @mark.error
+    def test_raises_type_error(self, csv_sink_init_type_error):
+        with raises(TypeError):
+            CSVSink(**csv_sink_init_type_error)
+
+    @mark.error
+    def test_raises_value_error(self):
+        with raises(ValueError):
+            CSVSink(folder_path='')
+
+
+@mark.solver
+class TestCSVSinkOpen:
+
+    @mark.genuine
+    def test_method(self):
+        with tempfile.TemporaryDirectory() as directory:
+            folder_path = os.path.join(directory, 'folder', 'subfolder')
+            sink = CSVSink(folder_path=folder_path)
+            sink.open(powertrain=basic_powertrain)
+            sink.close()
+
+            assert os.path.isdir(folder_path)
+
+    @mark.error
+    def test_raises_type_error(self, sink_open_type_error):
+        with raises(TypeError):
+            sink_open_type_error['sink'].open(
+                powertrain=sink_open_type_error['powertrain']
+            )
+
+
+@mark.solver
+class TestCSVSinkWrite:
+
+    @mark.genuine
+    @given(
+        n_batches=integers(min_value=1, max_value=5),
+        batch_size=integers(min_value=1, max_value=20)
+    )
+    @settings(max_examples=20, deadline=None)
+    def test_method(self, n_batches, batch_size):
+        with tempfile.TemporaryDirectory() as directory:
+            sink = CSVSink(folder_path=directory)
+            batches = [
+                pd.DataFrame({
+                    'time (sec)': np.arange(batch_size) + i*batch_size,
+                    'torque (Nm)': np.random.rand(batch_size)
+                }) for i in range(n_batches)
+            ]
+            for batch in batches:
+                sink.write(data={'gear': batch})
+            data = pd.read_csv(os.path.join(directory, 'gear.csv'))
+
+            assert list(data.columns) == ['time (sec)', 'torque (Nm)']
+            np.testing.assert_allclose(
+                data.values,
+                pd.concat(batches).values
+            )
+
+    @mark.error
+    def test_raises_type_error(self, sink_write_type_error):
+        with raises(TypeError):
+            sink_write_type_error['sink'].write(
+                data=sink_write_type_error['data']
+            )
@@ -0,0 +1,92 @@
+from gearpy.solver import ParallelSolver, SimulationJob
+from gearpy.units import TimeInterval
+import numpy as np
+from pytest import mark, raises
+from tests.test_solver.conftest import (
+    motor_control_factory,
+    powertrain_factory,
+    stop_condition_factory
+)
+
+
+jobs = [
+    SimulationJob(
+        powertrain_factory=powertrain_factory,
+        time_discretization=TimeInterval(10, 'ms'),
+        simulation_time=TimeInterval(1, 'sec'),
+        motor_control_factory=motor_control_factory,
+        stop_condition_factory=stop_condition_factory
+    ) for _ in range(5)
+]
+
+
+@mark.solver
+class TestParallelSolverInit:
+
+    @mark.genuine
+    def test_method(self):
+        parallel_solver = ParallelSolver(jobs=jobs)
+
+        assert parallel_solver.jobs == jobs
+        assert parallel_solver.results == []
+
+    @mark.error
+    def test_raises_type_error(self, parallel_solver_init_type_error):
+        with raises(TypeError):
+            ParallelSolver(**parallel_solver_init_type_error)
+
+    @mark.error
+    def test_raises_value_error(self):
+        with raises(ValueError):
+            ParallelSolver(jobs=[])
+
+
+@mark.solver
+class TestParallelSolverRun:
+
+    @mark.genuine
+    @mark.parametrize(
+        'max_workers, chunk_size',
+        [(1, 1), (2, 1), (2, 2), (3, 5)]
+    )
+    def test_method(self, max_workers, chunk_size):
+        parallel_solver = ParallelSolver(jobs=jobs)
+        parallel_solver.run(
+            max_workers=max_workers,
+            chunk_size=chunk_size,
+            seed=42
+        )
+        results = parallel_solver.results
+
+        seeds = np.random.SeedSequence(42).spawn(len(jobs))
+        assert len(results) == len(jobs)
+        for job, seed, result in zip(jobs, seeds, results):
+            expected_result = job.run(seed=seed)
+            np.testing.assert_array_equal(
+                result['time'],
+                expected_result['time']
+            )
+            for name, time_variables in result['time_variables'].items():
+                for variable, values in time_variables.items():
+                    np.testing.assert_array_equal(
+                        values,
+                        expected_result['time_variables'][name][variable]
+                    )
+
+        speeds = [
+            result['time_variables']['gear 2']['angular speed'][-1]
+            for result in results
+        ]
+        assert len(set(speeds)) == len(jobs)
+
+    @mark.error
+    def test_raises_type_error(self, parallel_solver_run_type_error):
+        parallel_solver = ParallelSolver(jobs=jobs)
+        with raises(TypeError):
+            parallel_solver.run(**parallel_solver_run_type_error)
+
+    @mark.error
+    def test_raises_value_error(self, parallel_solver_run_value_error):
+        parallel_solver = ParallelSolver(jobs=jobs)
+        with raises(ValueError):
+            parallel_solver.run(**parallel_solver_run_value_error)
@@ -0,0 +1,105 @@
+from gearpy.solver import RecordingPolicy
+from gearpy.units import TimeInterval
+from hypothesis import given, settings
+from hypothesis.strategies import integers, sampled_from
+from pytest import mark, raises
+from tests.conftest import time_intervals
+
+
+aggregations = ['last', 'mean', 'min', 'max']
+
+
+@mark.solver
+class TestRecordingPolicyInit:
+
+    @mark.genuine
+    @given(
+        every=integers(min_value=1, max_value=1000),
+        aggregation=sampled_from(elements=aggregations)
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method_every(self, every, aggregation):
+        recording_policy = RecordingPolicy(
+            every=every,
+            aggregation=aggregation
+        )
+
+        assert recording_policy.every == every
+        assert recording_policy.interval is None
+        assert recording_policy.aggregation == aggregation
+
+    @mark.genuine
+    @given(
+        interval=time_intervals(),
+        aggregation=sampled_from(elements=aggregations)
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method_interval(self, interval, aggregation):
+        recording_policy = RecordingPolicy(
+            interval=interval,
+            aggregation=aggregation
+        )
+
+        assert recording_policy.every is None
+        assert recording_policy.interval == interval
+        assert recording_policy.aggregation == aggregation
+
+    @mark.genuine
+    def test_method_default(self):
+        recording_policy = RecordingPolicy()
+
+        assert recording_policy.every == 1
+        assert recording_policy.interval is None
+        assert recording_policy.aggregation == 'last'
+
+    @mark.error
+    def test_raises_type_error(self, recording_policy_init_type_error):
+        with raises(TypeError):
+            RecordingPolicy(**recording_policy_init_type_error)
+
+    @mark.error
+    def test_raises_value_error(self, recording_policy_init_value_error):
+        with raises(ValueError):
+            RecordingPolicy(**recording_policy_init_value_error)
+
+
+@mark.solver
+class TestRecordingPolicyGetWindow:
+
+    @mark.genuine
+    @given(
+        every=integers(min_value=1, max_value=1000),
+        time_discretization=time_intervals()
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method_every(self, every, time_discretization):
+        recording_policy = RecordingPolicy(every=every)
+
+        assert recording_policy.get_window(
+            time_discretization=time_discretization
+        ) == every
+
+    @mark.genuine
+    @given(
+        multiplier=integers(min_value=1, max_value=1000),
+        time_discretization=time_intervals()
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method_interval(self, multiplier, time_discretization):
+        recording_policy = RecordingPolicy(
+            interval=TimeInterval(
+                value=time_discretization.value*multiplier,
+                unit=time_discretization.unit
+            )
+        )
+
+        assert recording_policy.get_window(
+            time_discretization=time_discretization
+        ) == multiplier
+
+    @mark.error
+    def test_raises_type_error(self, recording_policy_get_window_type_error):
+        with raises(TypeError):
+            RecordingPolicy().get_window(
+                time_discretization=recording_policy_get_window_type_error
+            )
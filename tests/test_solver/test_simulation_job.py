@@ -0,0 +1,173 @@
+from gearpy.solver import RecordingPolicy, SimulationJob, Solver
+from gearpy.solver.simulation_job import SI_UNITS
+from gearpy.solver.solver import ENGINES, INTEGRATORS
+from gearpy.units import TimeInterval
+from hypothesis import given, settings
+from hypothesis.strategies import integers, sampled_from
+import numpy as np
+from pytest import mark, raises
+from tests.conftest import time_intervals
+from tests.test_solver.conftest import (
+    motor_control_factory,
+    powertrain_factory,
+    stop_condition_factory
+)
+
+
+@mark.solver
+class TestSimulationJobInit:
+
+    @mark.genuine
+    @given(
+        time_discretization=time_intervals(),
+        simulation_steps=integers(min_value=2, max_value=100),
+        engine=sampled_from(elements=ENGINES),
+        integrator=sampled_from(elements=INTEGRATORS)
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(
+        self,
+        time_discretization,
+        simulation_steps,
+        engine,
+        integrator
+    ):
+        simulation_time = time_discretization*simulation_steps
+        recording_policy = RecordingPolicy(every=2)
+        simulation_job = SimulationJob(
+            powertrain_factory=powertrain_factory,
+            time_discretization=time_discretization,
+            simulation_time=simulation_time,
+            motor_control_factory=motor_control_factory,
+            stop_condition_factory=stop_condition_factory,
+            engine=engine,
+            integrator=integrator,
+            recording_policy=recording_policy
+        )
+
+        assert simulation_job.powertrain_factory is powertrain_factory
+        assert simulation_job.time_discretization == time_discretization
+        assert simulation_job.simulation_time == simulation_time
+        assert simulation_job.motor_control_factory is motor_control_factory
+        assert simulation_job.stop_condition_factory is \
+            stop_condition_factory
+        assert simulation_job.engine == engine
+        assert simulation_job.integrator == integrator
+        assert simulation_job.recording_policy is recording_policy
+
+    @mark.genuine
+    def test_method_default(self):
+        simulation_job = SimulationJob(
+            powertrain_factory=powertrain_factory,
+            time_discretization=TimeInterval(1, 'ms'),
+            simulation_time=TimeInterval(1, 'sec')
+        )
+
+        assert simulation_job.motor_control_factory is None
+        assert simulation_job.stop_condition_factory is None
+        assert simulation_job.engine == 'array'
+        assert simulation_job.integrator == 'semi-implicit euler'
+        assert simulation_job.recording_policy is None
+
+    @mark.error
+    def test_raises_type_error(self, simulation_job_init_type_error):
+        with raises(TypeError):
+            SimulationJob(**simulation_job_init_type_error)
+
+    @mark.error
+    def test_raises_value_error(self, simulation_job_init_value_error):
+        with raises(ValueError):
+            SimulationJob(**simulation_job_init_value_error)
+
+
+@mark.solver
+class TestSimulationJobRun:
+
+    @mark.genuine
+    @mark.parametrize('engine', ENGINES)
+    def test_method(self, engine):
+        simulation_job = SimulationJob(
+            powertrain_factory=powertrain_factory,
+            time_discretization=TimeInterval(1, 'ms'),
+            simulation_time=TimeInterval(1, 'sec'),
+            motor_control_factory=motor_control_factory,
+            stop_condition_factory=stop_condition_factory,
+            engine=engine
+        )
+        result = simulation_job.run(seed=42)
+
+        powertrain = powertrain_factory(np.random.default_rng(42))
+        solver = Solver(powertrain=powertrain)
+        solver.run(
+            time_discretization=TimeInterval(1, 'ms'),
+            simulation_time=TimeInterval(1, 'sec'),
+            motor_control=motor_control_factory(powertrain),
+            stop_condition=stop_condition_factory(powertrain),
+            engine=engine
+        )
+
+        np.testing.assert_array_equal(
+            result['time'],
+            powertrain.time.get_values(unit='sec')
+        )
+        assert set(result['time_variables'].keys()) == \
+            {element.name for element in powertrain.elements}
+        for element in powertrain.elements:
+            time_variables = result['time_variables'][element.name]
+            assert time_variables.keys() == element.time_variables.keys()
+            for variable, values in time_variables.items():
+                assert isinstance(values, np.ndarray)
+                assert len(values) == len(result['time'])
+                np.testing.assert_array_equal(
+                    values,
+                    element.time_variables[variable].get_values(
+                        unit=SI_UNITS[variable]
+                    )
+                )
+
+    @mark.genuine
+    def test_seed(self):
+        simulation_job = SimulationJob(
+            powertrain_factory=powertrain_factory,
+            time_discretization=TimeInterval(10, 'ms'),
+            simulation_time=TimeInterval(1, 'sec')
+        )
+        result_1 = simulation_job.run(seed=1)
+        result_2 = simulation_job.run(seed=np.random.SeedSequence(1))
+        result_3 = simulation_job.run(seed=2)
+
+        speed_1 = result_1['time_variables']['gear 2']['angular speed']
+        speed_2 = result_2['time_variables']['gear 2']['angular speed']
+        speed_3 = result_3['time_variables']['gear 2']['angular speed']
+        np.testing.assert_array_equal(speed_1, speed_2)
+        assert not np.array_equal(speed_1, speed_3)
+
+    @mark.error
+    def test_raises_type_error(self, simulation_job_run_type_error):
+        simulation_job = SimulationJob(
+            powertrain_factory=powertrain_factory,
+            time_discretization=TimeInterval(1, 'ms'),
+            simulation_time=TimeInterval(1, 'sec')
+        )
+        with raises(TypeError):
+            simulation_job.run(**simulation_job_run_type_error)
+
+    @mark.error
+    def test_raises_type_error_factory(self):
+        simulation_job = SimulationJob(
+            powertrain_factory=lambda random_generator: None,
+            time_discretization=TimeInterval(1, 'ms'),
+            simulation_time=TimeInterval(1, 'sec')
+        )
+        with raises(TypeError):
+            simulation_job.run()
+
+    @mark.error
+    def test_raises_value_error(self):
+        simulation_job = SimulationJob(
+            powertrain_factory=powertrain_factory,
+            time_discretization=TimeInterval(1, 'ms'),
+            simulation_time=TimeInterval(1, 'sec')
+        )
+        with raises(ValueError):
+            simulation_job.run(seed=-1)
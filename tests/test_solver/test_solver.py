@@ -1,24 +1,51 @@
-from gearpy.mechanical_objects import DCMotor, SpurGear
+from gearpy.mechanical_objects import DCMotor, SpurGear, WormGear, WormWheel
 from gearpy.motor_control import PWMControl
-from gearpy.sensors import AbsoluteRotaryEncoder
-from gearpy.solver import Solver
+from gearpy.motor_control.rules import ConstantPWM, ReachAngularPosition
+from gearpy.sensors import AbsoluteRotaryEncoder, Tachometer, Timer
+from gearpy.solver import (
+    CallbackSink,
+    CSVSink,
+    RecordingPolicy,
+    Solver,
+    StepSizeControl
+)
+from gearpy.solver.array_engine import ArrayEngine
+from gearpy.solver.solver import ADAPTIVE_INTEGRATORS, ENGINES, INTEGRATORS
 from gearpy.powertrain import Powertrain
 from gearpy.units import (
+    Angle,
+    Current,
     Torque,
     InertiaMoment,
+    Length,
     AngularSpeed,
     AngularPosition,
+    Time,
     TimeInterval
 )
-from gearpy.utils import add_fixed_joint, StopCondition
+from gearpy.utils import (
+    add_fixed_joint,
+    add_worm_gear_mating,
+    LinearLoad,
+    StopCondition
+)
 from hypothesis import given, settings, HealthCheck
-from hypothesis.strategies import integers
+from hypothesis.strategies import booleans, integers, sampled_from
 import numpy as np
+import os
+import pandas as pd
 from pytest import mark, raises
 from tests.conftest import powertrains, time_intervals, basic_solver
 from tests.test_units.test_angular_position.conftest import angular_positions
 from tests.test_units.test_angular_speed.conftest import angular_speeds
-from tests.test_solver.conftest import PowertrainFake
+from tests.test_solver.conftest import (
+    PowertrainFake,
+    reference_powertrain_factory,
+    reference_time_steps,
+    reference_time_variables
+)
+from copy import deepcopy
+import tempfile
 import warnings
 
 
@@ -152,6 +179,1237 @@ class TestSolverRun:
                     )
                 ) + 1
 
+    @mark.genuine
+    @given(
+        time_discretization=time_intervals(),
+        simulation_steps=integers(min_value=2, max_value=100),
+        powertrain=powertrains(),
+        initial_angular_position=angular_positions(),
+        initial_angular_speed=angular_speeds())
+    @settings(max_examples=100, deadline=None)
+    def test_array_engine(
+        self,
+        time_discretization,
+        simulation_steps,
+        powertrain,
+        initial_angular_position,
+        initial_angular_speed
+    ):
+        warnings.filterwarnings('ignore', category=RuntimeWarning)
+
+        powertrain.elements[-1].angular_position = initial_angular_position
+        powertrain.elements[-1].angular_speed = initial_angular_speed
+        powertrain.elements[-1].external_torque = \
+            lambda time, angular_position, angular_speed: Torque(0.001, 'Nm')
+        object_powertrain = deepcopy(powertrain)
+        array_powertrain = deepcopy(powertrain)
+        simulation_time = time_discretization*simulation_steps
+
+        for powertrain_copy, engine in zip(
+            [object_powertrain, array_powertrain],
+            ['object', 'array']
+        ):
+            solver = Solver(powertrain=powertrain_copy)
+            for _ in range(2):
+                solver.run(
+                    time_discretization=time_discretization,
+                    simulation_time=simulation_time,
+                    motor_control=PWMControl(powertrain=powertrain_copy),
+                    engine=engine
+                )
+
+        assert object_powertrain.time == array_powertrain.time
+        for object_element, array_element in zip(
+            object_powertrain.elements,
+            array_powertrain.elements
+        ):
+            assert object_element.time_variables.keys() == \
+                array_element.time_variables.keys()
+            for variable, values in object_element.time_variables.items():
+                array_values = array_element.time_variables[variable]
+                assert len(values) == len(array_values)
+                if variable != 'pwm':
+                    unit = array_values[0].unit
+                    values = [value.to(unit).value for value in values]
+                    array_values = [value.value for value in array_values]
+                values = np.array(values, dtype=float)
+                array_values = np.array(array_values, dtype=float)
+                # diverging simulations may overflow at slightly different
+                # time steps due to unit conversions, so only finite values
+                # are compared
+                finite = np.isfinite(values) & np.isfinite(array_values)
+                np.testing.assert_allclose(
+                    array_values[finite],
+                    values[finite],
+                    rtol=1e-6,
+                    atol=1e-9,
+                    equal_nan=True
+                )
+
+    @mark.genuine
+    @given(
+        time_discretization=time_intervals(),
+        simulation_steps=integers(min_value=2, max_value=100),
+        integrator=sampled_from(elements=INTEGRATORS),
+        every=integers(min_value=1, max_value=5),
+        aggregation=sampled_from(elements=['last', 'mean', 'min', 'max']),
+        defer_force_and_stress=booleans(),
+        powertrain=powertrains(),
+        initial_angular_position=angular_positions(),
+        initial_angular_speed=angular_speeds())
+    @settings(max_examples=100, deadline=None)
+    def test_kernel_engine(
+        self,
+        time_discretization,
+        simulation_steps,
+        integrator,
+        every,
+        aggregation,
+        defer_force_and_stress,
+        powertrain,
+        initial_angular_position,
+        initial_angular_speed
+    ):
+        warnings.filterwarnings('ignore', category=RuntimeWarning)
+
+        powertrain.elements[-1].angular_position = initial_angular_position
+        powertrain.elements[-1].angular_speed = initial_angular_speed
+        powertrain.elements[-1].external_torque = \
+            lambda time, angular_position, angular_speed: \
+            Torque(0.001 + 0.001*angular_speed.to('rad/s').value, 'Nm')
+        array_powertrain = deepcopy(powertrain)
+        kernel_powertrain = deepcopy(powertrain)
+        simulation_time = time_discretization*simulation_steps
+        step_size_control = StepSizeControl() \
+            if integrator == 'dormand-prince' else None
+        if aggregation != 'last':
+            defer_force_and_stress = False
+
+        for powertrain_copy, engine in zip(
+            [array_powertrain, kernel_powertrain],
+            ['array', 'kernel']
+        ):
+            solver = Solver(powertrain=powertrain_copy)
+            for _ in range(2):
+                solver.run(
+                    time_discretization=time_discretization,
+                    simulation_time=simulation_time,
+                    engine=engine,
+                    recording_policy=RecordingPolicy(
+                        every=every,
+                        aggregation=aggregation
+                    ),
+                    integrator=integrator,
+                    step_size_control=step_size_control,
+                    defer_force_and_stress=defer_force_and_stress
+                )
+
+        np.testing.assert_array_equal(
+            kernel_powertrain.time.get_values(),
+            array_powertrain.time.get_values()
+        )
+        for array_element, kernel_element in zip(
+            array_powertrain.elements,
+            kernel_powertrain.elements
+        ):
+            assert kernel_element.time_variables.keys() == \
+                array_element.time_variables.keys()
+            for variable, values in array_element.time_variables.items():
+                np.testing.assert_array_equal(
+                    kernel_element.time_variables[variable].get_values(),
+                    values.get_values()
+                )
+            for variable in ['angular_position', 'angular_speed',
+                             'angular_acceleration', 'torque',
+                             'driving_torque', 'load_torque']:
+                np.testing.assert_array_equal(
+                    getattr(kernel_element, variable).value,
+                    getattr(array_element, variable).value
+                )
+
+    @mark.genuine
+    @mark.parametrize(
+        'integrator',
+        [integrator for integrator in INTEGRATORS
+         if integrator not in ADAPTIVE_INTEGRATORS]
+    )
+    @mark.parametrize('defer_force_and_stress', [True, False])
+    def test_kernel_engine_against_object_engine(
+        self,
+        integrator,
+        defer_force_and_stress
+    ):
+
+        def simulate(engine):
+            powertrain = reference_powertrain_factory()
+            solver = Solver(powertrain=powertrain)
+            for _ in range(2):
+                solver.run(
+                    time_discretization=TimeInterval(1, 'ms'),
+                    simulation_time=TimeInterval(0.5, 'sec'),
+                    engine=engine,
+                    integrator=integrator,
+                    defer_force_and_stress=defer_force_and_stress
+                )
+
+            return powertrain
+
+        object_powertrain = simulate(engine='object')
+        kernel_powertrain = simulate(engine='kernel')
+
+        # the kernel engine transmits torques along the powertrain with
+        # precomputed gains, instead of multiplying or dividing by each gear
+        # ratio and efficiency, and it records values in SI units, so it
+        # rounds differently: each time variable differs by a few ulps of its
+        # largest magnitude in the simulation
+        tolerance = 8*np.finfo(float).eps
+        np.testing.assert_array_equal(
+            kernel_powertrain.time.get_values(),
+            object_powertrain.time.get_values()
+        )
+        for object_element, kernel_element in zip(
+            object_powertrain.elements,
+            kernel_powertrain.elements
+        ):
+            assert kernel_element.time_variables.keys() == \
+                object_element.time_variables.keys()
+            for variable, values in object_element.time_variables.items():
+                kernel_values = kernel_element.time_variables[variable]
+                if variable == 'pwm':
+                    np.testing.assert_array_equal(
+                        kernel_values.get_values(),
+                        values.get_values()
+                    )
+                    continue
+                values = values.get_values(kernel_values.unit)
+                np.testing.assert_allclose(
+                    kernel_values.get_values(),
+                    values,
+                    rtol=0,
+                    atol=tolerance*np.max(np.abs(values))
+                )
+
+    @mark.genuine
+    @mark.parametrize(
+        'integrator',
+        [integrator for integrator in INTEGRATORS
+         if integrator not in ADAPTIVE_INTEGRATORS]
+    )
+    @mark.parametrize('defer_force_and_stress', [True, False])
+    def test_kernel_engine_against_array_engine(
+        self,
+        integrator,
+        defer_force_and_stress
+    ):
+        powertrains = []
+        for engine in ['array', 'kernel']:
+            powertrain = reference_powertrain_factory()
+            solver = Solver(powertrain=powertrain)
+            for _ in range(2):
+                solver.run(
+                    time_discretization=TimeInterval(1, 'ms'),
+                    simulation_time=TimeInterval(0.5, 'sec'),
+                    engine=engine,
+                    integrator=integrator,
+                    defer_force_and_stress=defer_force_and_stress
+                )
+            powertrains.append(powertrain)
+        array_powertrain, kernel_powertrain = powertrains
+
+        np.testing.assert_array_equal(
+            kernel_powertrain.time.get_values(),
+            array_powertrain.time.get_values()
+        )
+        for array_element, kernel_element in zip(
+            array_powertrain.elements,
+            kernel_powertrain.elements
+        ):
+            assert kernel_element.time_variables.keys() == \
+                array_element.time_variables.keys()
+            for variable, values in array_element.time_variables.items():
+                assert kernel_element.time_variables[variable].unit == \
+                    values.unit
+                np.testing.assert_array_equal(
+                    kernel_element.time_variables[variable].get_values(),
+                    values.get_values()
+                )
+
+    @mark.genuine
+    @mark.parametrize('engine', ENGINES)
+    def test_reference_time_variables(self, engine):
+        powertrain = reference_powertrain_factory()
+        solver = Solver(powertrain=powertrain)
+        for _ in range(2):
+            solver.run(
+                time_discretization=TimeInterval(1, 'ms'),
+                simulation_time=TimeInterval(0.5, 'sec'),
+                engine=engine
+            )
+        elements = {element.name: element for element in powertrain.elements}
+
+        assert len(powertrain.time) == 1001
+        for name, variables in reference_time_variables.items():
+            for variable, (unit, values) in variables.items():
+                time_variable = elements[name].time_variables[variable]
+                if engine == 'object':
+                    # same results of the previous releases, bit for bit
+                    for time_step, value in zip(reference_time_steps, values):
+                        assert time_variable[time_step].unit == unit
+                        assert time_variable[time_step].value == value
+                else:
+                    # the array engines round differently, by a few ulps
+                    np.testing.assert_allclose(
+                        time_variable.get_values(unit=unit)[
+                            reference_time_steps
+                        ],
+                        values,
+                        rtol=0,
+                        atol=8*np.finfo(float).eps*np.max(np.abs(values))
+                    )
+
+    @mark.genuine
+    @given(powertrain=powertrains())
+    @settings(max_examples=100, deadline=None)
+    def test_step_functions(self, powertrain):
+        warnings.filterwarnings('ignore', category=RuntimeWarning)
+
+        powertrain.elements[-1].angular_position = AngularPosition(0, 'rad')
+        powertrain.elements[-1].angular_speed = AngularSpeed(0, 'rad/s')
+        powertrain.elements[-1].external_torque = \
+            lambda time, angular_position, angular_speed: Torque(0.001, 'Nm')
+        solvers = []
+        for _ in range(2):
+            powertrain_copy = deepcopy(powertrain)
+            solver = Solver(powertrain=powertrain_copy)
+            solver.run(
+                time_discretization=TimeInterval(0.1, 'sec'),
+                simulation_time=TimeInterval(0.5, 'sec')
+            )
+            solvers.append(solver)
+
+        # same topology, same generated functions
+        assert solvers[0]._Solver__step_functions is \
+            solvers[1]._Solver__step_functions
+
+        gear = powertrain_copy.elements[-1]
+        gear.master_gear_ratio = gear.master_gear_ratio*2
+        powertrain_copy.reset()
+        solvers[1].run(
+            time_discretization=TimeInterval(0.1, 'sec'),
+            simulation_time=TimeInterval(0.5, 'sec')
+        )
+
+        assert solvers[0]._Solver__step_functions is not \
+            solvers[1]._Solver__step_functions
+
+    @mark.genuine
+    @given(
+        time_discretization=time_intervals(),
+        simulation_steps=integers(min_value=2, max_value=100),
+        every=integers(min_value=1, max_value=5),
+        powertrain=powertrains(),
+        initial_angular_position=angular_positions(),
+        initial_angular_speed=angular_speeds())
+    @settings(max_examples=100, deadline=None)
+    def test_analytic_segments(
+        self,
+        time_discretization,
+        simulation_steps,
+        every,
+        powertrain,
+        initial_angular_position,
+        initial_angular_speed
+    ):
+        warnings.filterwarnings('ignore', category=RuntimeWarning)
+
+        powertrain.elements[-1].angular_position = initial_angular_position
+        powertrain.elements[-1].angular_speed = initial_angular_speed
+        powertrain.elements[-1].external_torque = LinearLoad(
+            constant_torque=Torque(0.001, 'Nm'),
+            viscous_coefficient=0.001
+        )
+        array_powertrain = deepcopy(powertrain)
+        analytic_powertrain = deepcopy(powertrain)
+        refined_powertrain = deepcopy(powertrain)
+        simulation_time = time_discretization*simulation_steps
+
+        for powertrain_copy, analytic_segments, refinement in zip(
+            [array_powertrain, analytic_powertrain, refined_powertrain],
+            [False, True, True],
+            [1, 1, 2]
+        ):
+            solver = Solver(powertrain=powertrain_copy)
+            for _ in range(2):
+                solver.run(
+                    time_discretization=time_discretization/refinement,
+                    simulation_time=simulation_time,
+                    engine='array',
+                    recording_policy=RecordingPolicy(every=every*refinement),
+                    defer_force_and_stress=True,
+                    analytic_segments=analytic_segments
+                )
+
+        np.testing.assert_array_equal(
+            analytic_powertrain.time.get_values(),
+            array_powertrain.time.get_values()
+        )
+        for array_element, analytic_element in zip(
+            array_powertrain.elements,
+            analytic_powertrain.elements
+        ):
+            assert analytic_element.time_variables.keys() == \
+                array_element.time_variables.keys()
+            for variable, values in array_element.time_variables.items():
+                assert len(analytic_element.time_variables[variable]) == \
+                    len(values)
+        np.testing.assert_array_equal(
+            analytic_powertrain.elements[0].time_variables['pwm'].get_values(),
+            array_powertrain.elements[0].time_variables['pwm'].get_values()
+        )
+
+        # the closed-form solution does not depend on the time discretization,
+        # unless the powertrain gets locked and it is integrated numerically
+        if not powertrain.compiled.self_locking:
+            for analytic_element, refined_element in zip(
+                analytic_powertrain.elements,
+                refined_powertrain.elements
+            ):
+                for variable in ['angular position', 'angular speed']:
+                    values = analytic_element.time_variables[variable] \
+                        .get_values()
+                    refined_values = refined_element.time_variables[variable] \
+                        .get_values()
+                    finite = np.isfinite(values) & np.isfinite(refined_values)
+                    np.testing.assert_allclose(
+                        refined_values[finite],
+                        values[finite],
+                        rtol=1e-9,
+                        atol=1e-9
+                    )
+
+    @mark.genuine
+    @mark.parametrize('engine', ['array', 'kernel'])
+    def test_analytic_segments_accuracy(self, engine):
+
+        def simulate(time_discretization, integrator, analytic_segments):
+            motor = DCMotor(
+                name='motor',
+                no_load_speed=AngularSpeed(1000, 'rpm'),
+                maximum_torque=Torque(1, 'Nm'),
+                inertia_moment=InertiaMoment(1, 'gm^2'),
+                no_load_electric_current=Current(0.1, 'A'),
+                maximum_electric_current=Current(2, 'A')
+            )
+            gear = SpurGear(
+                name='gear',
+                n_teeth=10,
+                inertia_moment=InertiaMoment(1, 'gm^2')
+            )
+            add_fixed_joint(master=motor, slave=gear)
+            gear.external_torque = LinearLoad(
+                constant_torque=Torque(0.2, 'Nm'),
+                viscous_coefficient=0.002
+            )
+            powertrain = Powertrain(motor=motor)
+            gear.angular_position = AngularPosition(0, 'rad')
+            gear.angular_speed = AngularSpeed(0, 'rad/s')
+            motor_control = PWMControl(powertrain=powertrain)
+            motor_control.add_rule(
+                rule=ConstantPWM(
+                    timer=Timer(
+                        start_time=Time(0.5, 'sec'),
+                        duration=TimeInterval(10, 'sec')
+                    ),
+                    powertrain=powertrain,
+                    target_pwm_value=0.4
+                )
+            )
+            solver = Solver(powertrain=powertrain)
+            solver.run(
+                time_discretization=time_discretization,
+                simulation_time=TimeInterval(1, 'sec'),
+                motor_control=motor_control,
+                engine=engine,
+                integrator=integrator,
+                recording_policy=RecordingPolicy(
+                    interval=TimeInterval(2**-6, 'sec')
+                ),
+                analytic_segments=analytic_segments
+            )
+
+            return gear.time_variables['angular position'].get_values()
+
+        # binary fractions of a second are exact time steps, so the pwm
+        # changes at the same time instant regardless of the discretization
+        reference = simulate(
+            time_discretization=TimeInterval(2**-14, 'sec'),
+            integrator='rk4',
+            analytic_segments=False
+        )
+        analytic_error = np.max(np.abs(simulate(
+            time_discretization=TimeInterval(2**-6, 'sec'),
+            integrator='semi-implicit euler',
+            analytic_segments=True
+        ) - reference))
+        numeric_error = np.max(np.abs(simulate(
+            time_discretization=TimeInterval(2**-6, 'sec'),
+            integrator='rk4',
+            analytic_segments=False
+        ) - reference))
+
+        assert analytic_error < 1e-9
+        assert analytic_error < numeric_error
+
+    @mark.error
+    @mark.parametrize(
+        'linear_load, defer_force_and_stress, stop_condition, motor_control',
+        [(False, True, False, False),
+         (True, False, False, False),
+         (True, True, True, False),
+         (True, True, False, True)]
+    )
+    def test_analytic_segments_not_applicable(
+        self,
+        linear_load,
+        defer_force_and_stress,
+        stop_condition,
+        motor_control
+    ):
+        powertrain = reference_powertrain_factory()
+        gear = powertrain.elements[-1]
+        if linear_load:
+            gear.external_torque = LinearLoad(
+                constant_torque=Torque(0.5, 'Nm'),
+                viscous_coefficient=0.01
+            )
+        encoder = AbsoluteRotaryEncoder(target=gear)
+        kwargs = {}
+        if stop_condition:
+            kwargs['stop_condition'] = StopCondition(
+                sensor=encoder,
+                threshold=AngularPosition(1, 'rad'),
+                operator=StopCondition.greater_than_or_equal_to
+            )
+        if motor_control:
+            kwargs['motor_control'] = PWMControl(powertrain=powertrain)
+            kwargs['motor_control'].add_rule(
+                rule=ReachAngularPosition(
+                    encoder=encoder,
+                    powertrain=powertrain,
+                    target_angular_position=AngularPosition(10, 'rad'),
+                    braking_angle=Angle(1, 'rad')
+                )
+            )
+        solver = Solver(powertrain=powertrain)
+
+        with raises(ValueError):
+            solver.run(
+                time_discretization=TimeInterval(1, 'ms'),
+                simulation_time=TimeInterval(10, 'ms'),
+                engine='array',
+                defer_force_and_stress=defer_force_and_stress,
+                analytic_segments=True,
+                **kwargs
+            )
+        assert not powertrain.time
+
+    @mark.genuine
+    @mark.parametrize(
+        'engine, linear_load, analytic_segments',
+        [('object', False, False),
+         ('object', True, False),
+         ('array', False, False),
+         ('array', True, False),
+         ('array', True, True)]
+    )
+    @mark.parametrize('integrator', ['semi-implicit euler', 'rk4'])
+    def test_fast_forward_locked_time_steps(
+        self,
+        engine,
+        linear_load,
+        analytic_segments,
+        integrator,
+        monkeypatch
+    ):
+
+        def simulate(fast_forward):
+            motor = DCMotor(
+                name='motor',
+                no_load_speed=AngularSpeed(3000, 'rpm'),
+                maximum_torque=Torque(0.1, 'Nm'),
+                inertia_moment=InertiaMoment(1e-5, 'kgm^2'),
+                no_load_electric_current=Current(0.1, 'A'),
+                maximum_electric_current=Current(2, 'A')
+            )
+            worm_gear = WormGear(
+                name='worm gear',
+                n_starts=1,
+                inertia_moment=InertiaMoment(1e-6, 'kgm^2'),
+                pressure_angle=Angle(20, 'deg'),
+                helix_angle=Angle(10, 'deg'),
+                reference_diameter=Length(10, 'mm')
+            )
+            worm_wheel = WormWheel(
+                name='worm wheel',
+                n_teeth=30,
+                inertia_moment=InertiaMoment(1e-4, 'kgm^2'),
+                pressure_angle=Angle(20, 'deg'),
+                helix_angle=Angle(10, 'deg'),
+                module=Length(1, 'mm'),
+                face_width=Length(5, 'mm')
+            )
+            add_fixed_joint(master=motor, slave=worm_gear)
+            add_worm_gear_mating(
+                master=worm_gear,
+                slave=worm_wheel,
+                friction_coefficient=0.4
+            )
+            if linear_load:
+                worm_wheel.external_torque = LinearLoad(
+                    constant_torque=Torque(0.5, 'Nm'),
+                    viscous_coefficient=0.01
+                )
+            else:
+                worm_wheel.external_torque = \
+                    lambda time, angular_position, angular_speed: Torque(
+                        0.5 if time.to('sec').value < 0.6 else 0.8, 'Nm'
+                    )
+            worm_wheel.angular_position = AngularPosition(0, 'rad')
+            worm_wheel.angular_speed = AngularSpeed(0, 'rad/s')
+            motor.pwm = 0
+            powertrain = Powertrain(motor=motor)
+            motor_control = PWMControl(powertrain=powertrain)
+            for start_time, duration, target_pwm_value in [
+                (0, 0.2, 0.8), (0.201, 0.5985, 0), (0.801, 0.1985, -0.8),
+                (1.001, 10, 0)
+            ]:
+                motor_control.add_rule(
+                    rule=ConstantPWM(
+                        timer=Timer(
+                            start_time=Time(start_time, 'sec'),
+                            duration=TimeInterval(duration, 'sec')
+                        ),
+                        powertrain=powertrain,
+                        target_pwm_value=target_pwm_value
+                    )
+                )
+            integrated_time_steps = []
+            for engine_class in [Solver, ArrayEngine]:
+                if not fast_forward:
+                    monkeypatch.setattr(
+                        engine_class,
+                        '_powertrain_is_idle',
+                        lambda self: False
+                    )
+
+                def count_time_integration(
+                    self,
+                    time_integration=engine_class._time_integration,
+                    **kwargs
+                ):
+                    integrated_time_steps.append(kwargs['time'])
+                    time_integration(self, **kwargs)
+
+                monkeypatch.setattr(
+                    engine_class,
+                    '_time_integration',
+                    count_time_integration
+                )
+            solver = Solver(powertrain=powertrain)
+            for _ in range(2):
+                solver.run(
+                    time_discretization=TimeInterval(1, 'ms'),
+                    simulation_time=TimeInterval(0.75, 'sec'),
+                    motor_control=motor_control,
+                    engine=engine,
+                    recording_policy=RecordingPolicy(
+                        every=7,
+                        aggregation='last' if analytic_segments else 'mean'
+                    ),
+                    integrator=integrator,
+                    # the analytic segments need the tangential force and the
+                    # stresses to be computed after the simulation
+                    defer_force_and_stress=analytic_segments,
+                    analytic_segments=analytic_segments
+                )
+            monkeypatch.undo()
+
+            return powertrain, len(integrated_time_steps)
+
+        fast_forward_powertrain, fast_forward_integrations = \
+            simulate(fast_forward=True)
+        reference_powertrain, reference_integrations = \
+            simulate(fast_forward=False)
+
+        # the time integration is skipped at the time steps at which the
+        # powertrain is locked with null pwm
+        assert fast_forward_integrations < reference_integrations
+        # the powertrain is locked while the pwm is null, so the skipped
+        # integration does not change the results
+        assert fast_forward_powertrain.elements[-1].time_variables[
+            'angular speed'].get_values()[-1] == 0
+        np.testing.assert_array_equal(
+            fast_forward_powertrain.time.get_values(),
+            reference_powertrain.time.get_values()
+        )
+        for fast_forward_element, reference_element in zip(
+            fast_forward_powertrain.elements,
+            reference_powertrain.elements
+        ):
+            for variable, values in \
+                    fast_forward_element.time_variables.items():
+                np.testing.assert_array_equal(
+                    values.get_values(),
+                    reference_element.time_variables[variable].get_values()
+                )
+
+    @mark.genuine
+    @given(
+        time_discretization=time_intervals(),
+        simulation_steps=integers(min_value=2, max_value=100),
+        engine=sampled_from(elements=ENGINES),
+        powertrain=powertrains(),
+        initial_angular_position=angular_positions(),
+        initial_angular_speed=angular_speeds())
+    @settings(max_examples=100, deadline=None)
+    def test_check_assignments(
+        self,
+        time_discretization,
+        simulation_steps,
+        engine,
+        powertrain,
+        initial_angular_position,
+        initial_angular_speed
+    ):
+        warnings.filterwarnings('ignore', category=RuntimeWarning)
+
+        powertrain.elements[-1].angular_position = initial_angular_position
+        powertrain.elements[-1].angular_speed = initial_angular_speed
+        powertrain.elements[-1].external_torque = \
+            lambda time, angular_position, angular_speed: Torque(0.001, 'Nm')
+        checked_powertrain = deepcopy(powertrain)
+        unchecked_powertrain = deepcopy(powertrain)
+        simulation_time = time_discretization*simulation_steps
+
+        for powertrain_copy, check_assignments in zip(
+            [checked_powertrain, unchecked_powertrain],
+            [True, False]
+        ):
+            solver = Solver(powertrain=powertrain_copy)
+            solver.run(
+                time_discretization=time_discretization,
+                simulation_time=simulation_time,
+                motor_control=PWMControl(powertrain=powertrain_copy),
+                engine=engine,
+                check_assignments=check_assignments
+            )
+
+        with raises(TypeError):
+            unchecked_powertrain.elements[-1].angular_speed = 1
+
+        assert checked_powertrain.time == unchecked_powertrain.time
+        for checked_element, unchecked_element in zip(
+            checked_powertrain.elements,
+            unchecked_powertrain.elements
+        ):
+            for variable, values in checked_element.time_variables.items():
+                np.testing.assert_array_equal(
+                    unchecked_element.time_variables[variable].get_values(),
+                    values.get_values()
+                )
+
+    @mark.genuine
+    @given(
+        time_discretization=time_intervals(),
+        simulation_steps=integers(min_value=2, max_value=100),
+        engine=sampled_from(elements=ENGINES),
+        every=integers(min_value=1, max_value=5),
+        powertrain=powertrains(),
+        initial_angular_position=angular_positions(),
+        initial_angular_speed=angular_speeds())
+    @settings(max_examples=100, deadline=None)
+    def test_defer_force_and_stress(
+        self,
+        time_discretization,
+        simulation_steps,
+        engine,
+        every,
+        powertrain,
+        initial_angular_position,
+        initial_angular_speed
+    ):
+        warnings.filterwarnings('ignore', category=RuntimeWarning)
+
+        powertrain.elements[-1].angular_position = initial_angular_position
+        powertrain.elements[-1].angular_speed = initial_angular_speed
+        powertrain.elements[-1].external_torque = \
+            lambda time, angular_position, angular_speed: Torque(0.001, 'Nm')
+        reference_powertrain = deepcopy(powertrain)
+        deferred_powertrain = deepcopy(powertrain)
+        simulation_time = time_discretization*simulation_steps
+
+        for powertrain_copy, defer_force_and_stress in zip(
+            [reference_powertrain, deferred_powertrain],
+            [False, True]
+        ):
+            solver = Solver(powertrain=powertrain_copy)
+            for _ in range(2):
+                solver.run(
+                    time_discretization=time_discretization,
+                    simulation_time=simulation_time,
+                    motor_control=PWMControl(powertrain=powertrain_copy),
+                    engine=engine,
+                    recording_policy=RecordingPolicy(every=every),
+                    defer_force_and_stress=defer_force_and_stress
+                )
+
+        assert reference_powertrain.time == deferred_powertrain.time
+        for reference_element, deferred_element in zip(
+            reference_powertrain.elements,
+            deferred_powertrain.elements
+        ):
+            for variable in ['tangential_force', 'bending_stress',
+                             'contact_stress']:
+                reference_value = getattr(reference_element, variable, None)
+                if reference_value is not None:
+                    np.testing.assert_allclose(
+                        getattr(deferred_element, variable).value,
+                        reference_value.value,
+                        rtol=1e-12
+                    )
+            assert deferred_element.time_variables.keys() == \
+                reference_element.time_variables.keys()
+            for variable, values in reference_element.time_variables.items():
+                deferred_values = deferred_element.time_variables[variable]
+                assert len(deferred_values) == len(values)
+                np.testing.assert_allclose(
+                    deferred_values.get_values(unit=values.unit),
+                    values.get_values(),
+                    rtol=1e-12,
+                    equal_nan=True
+                )
+
+    @mark.genuine
+    @given(
+        time_discretization=time_intervals(),
+        simulation_steps=integers(min_value=2, max_value=100),
+        integrator=sampled_from(elements=INTEGRATORS),
+        powertrain=powertrains(),
+        initial_angular_position=angular_positions(),
+        initial_angular_speed=angular_speeds())
+    @settings(max_examples=100, deadline=None)
+    def test_integrator(
+        self,
+        time_discretization,
+        simulation_steps,
+        integrator,
+        powertrain,
+        initial_angular_position,
+        initial_angular_speed
+    ):
+        warnings.filterwarnings('ignore', category=RuntimeWarning)
+
+        powertrain.elements[-1].angular_position = initial_angular_position
+        powertrain.elements[-1].angular_speed = initial_angular_speed
+        powertrain.elements[-1].external_torque = \
+            lambda time, angular_position, angular_speed: Torque(0.001, 'Nm')
+        object_powertrain = deepcopy(powertrain)
+        array_powertrain = deepcopy(powertrain)
+        simulation_time = time_discretization*simulation_steps
+
+        for powertrain_copy, engine in zip(
+            [object_powertrain, array_powertrain],
+            ['object', 'array']
+        ):
+            solver = Solver(powertrain=powertrain_copy)
+            solver.run(
+                time_discretization=time_discretization,
+                simulation_time=simulation_time,
+                motor_control=PWMControl(powertrain=powertrain_copy),
+                engine=engine,
+                integrator=integrator
+            )
+
+        # adaptive time steps depend on the local error, so they may differ
+        # by rounding errors between the engines
+        assert len(object_powertrain.time) == len(array_powertrain.time)
+        np.testing.assert_allclose(
+            array_powertrain.time.get_values(),
+            object_powertrain.time.get_values(),
+            rtol=1e-9
+        )
+        for object_element, array_element in zip(
+            object_powertrain.elements,
+            array_powertrain.elements
+        ):
+            for variable, values in object_element.time_variables.items():
+                array_values = array_element.time_variables[variable]
+                assert len(values) == len(array_values)
+                if variable != 'pwm':
+                    unit = array_values[0].unit
+                    values = [value.to(unit).value for value in values]
+                    array_values = [value.value for value in array_values]
+                values = np.array(values, dtype=float)
+                array_values = np.array(array_values, dtype=float)
+                finite = np.isfinite(values) & np.isfinite(array_values)
+                np.testing.assert_allclose(
+                    array_values[finite],
+                    values[finite],
+                    rtol=1e-6,
+                    atol=1e-9,
+                    equal_nan=True
+                )
+
+    @mark.genuine
+    @mark.parametrize('engine', ['object', 'array'])
+    def test_integrator_accuracy(self, engine):
+
+        def simulate(time_discretization, integrator):
+            motor = DCMotor(
+                name='motor',
+                no_load_speed=AngularSpeed(1000, 'rpm'),
+                maximum_torque=Torque(1, 'Nm'),
+                inertia_moment=InertiaMoment(1, 'gm^2')
+            )
+            gear = SpurGear(
+                name='gear',
+                n_teeth=10,
+                inertia_moment=InertiaMoment(1, 'gm^2')
+            )
+            add_fixed_joint(master=motor, slave=gear)
+            gear.external_torque = \
+                lambda time, angular_position, angular_speed: \
+                Torque(0.5*np.sin(time.to('sec').value), 'Nm')
+            powertrain = Powertrain(motor=motor)
+            gear.angular_position = AngularPosition(0, 'rad')
+            gear.angular_speed = AngularSpeed(0, 'rad/s')
+            solver = Solver(powertrain=powertrain)
+            solver.run(
+                time_discretization=time_discretization,
+                simulation_time=TimeInterval(0.1, 'sec'),
+                engine=engine,
+                integrator=integrator
+            )
+
+            return gear.angular_position.to('rad').value
+
+        reference = simulate(
+            time_discretization=TimeInterval(0.0001, 'sec'),
+            integrator='rk4'
+        )
+        errors = {
+            integrator: abs(simulate(
+                time_discretization=TimeInterval(0.01, 'sec'),
+                integrator=integrator
+            ) - reference) for integrator in INTEGRATORS
+        }
+
+        assert errors['rk4'] < errors['heun'] < errors['explicit euler']
+        assert errors['heun'] < errors['semi-implicit euler']
+
+    @mark.genuine
+    @mark.parametrize('engine', ['object', 'array'])
+    def test_adaptive_integrator(self, engine):
+
+        def simulate(time_discretization, integrator, step_size_control):
+            motor = DCMotor(
+                name='motor',
+                no_load_speed=AngularSpeed(1000, 'rpm'),
+                maximum_torque=Torque(1, 'Nm'),
+                inertia_moment=InertiaMoment(1, 'gm^2')
+            )
+            gear = SpurGear(
+                name='gear',
+                n_teeth=10,
+                inertia_moment=InertiaMoment(5, 'gm^2')
+            )
+            add_fixed_joint(master=motor, slave=gear)
+            gear.external_torque = \
+                lambda time, angular_position, angular_speed: Torque(
+                    0.2 + 0.6*np.exp(-((time.to('sec').value - 0.5)/0.02)**2),
+                    'Nm'
+                )
+            powertrain = Powertrain(motor=motor)
+            gear.angular_position = AngularPosition(0, 'rad')
+            gear.angular_speed = AngularSpeed(0, 'rad/s')
+            solver = Solver(powertrain=powertrain)
+            solver.run(
+                time_discretization=time_discretization,
+                simulation_time=TimeInterval(1, 'sec'),
+                engine=engine,
+                integrator=integrator,
+                step_size_control=step_size_control
+            )
+
+            return powertrain, gear.angular_position.to('rad').value
+
+        reference_powertrain, reference = simulate(
+            time_discretization=TimeInterval(0.0001, 'sec'),
+            integrator='rk4',
+            step_size_control=None
+        )
+        adaptive_powertrain, adaptive = simulate(
+            time_discretization=TimeInterval(0.001, 'sec'),
+            integrator='dormand-prince',
+            step_size_control=StepSizeControl(
+                relative_tolerance=1e-6,
+                absolute_tolerance=1e-6,
+                maximum_time_discretization=TimeInterval(0.01, 'sec')
+            )
+        )
+
+        assert np.isclose(adaptive, reference, rtol=1e-5)
+        assert len(adaptive_powertrain.time) < \
+            len(reference_powertrain.time)/10
+        assert adaptive_powertrain.time[-1] == reference_powertrain.time[-1]
+        time_steps = np.diff(adaptive_powertrain.time.get_values(unit='sec'))
+        assert np.all(time_steps <= 0.01 + 1e-12)
+
+    @mark.genuine
+    @mark.parametrize('engine', ['object', 'array'])
+    @mark.parametrize('integrator', INTEGRATORS)
+    def test_stop_condition_event_location(self, engine, integrator):
+        motor = DCMotor(
+            name='motor',
+            no_load_speed=AngularSpeed(1000, 'rpm'),
+            maximum_torque=Torque(1, 'Nm'),
+            inertia_moment=InertiaMoment(1, 'gm^2'),
+            no_load_electric_current=Current(0.1, 'A'),
+            maximum_electric_current=Current(2, 'A')
+        )
+        gear = SpurGear(
+            name='gear',
+            n_teeth=10,
+            inertia_moment=InertiaMoment(5, 'gm^2')
+        )
+        add_fixed_joint(master=motor, slave=gear)
+        gear.external_torque = \
+            lambda time, angular_position, angular_speed: Torque(0.2, 'Nm')
+        powertrain = Powertrain(motor=motor)
+        gear.angular_position = AngularPosition(0, 'rad')
+        gear.angular_speed = AngularSpeed(0, 'rad/s')
+        speed_condition = StopCondition(
+            sensor=Tachometer(target=gear),
+            threshold=AngularSpeed(20, 'rad/s'),
+            operator=StopCondition.greater_than_or_equal_to,
+            terminal=False
+        )
+        position_condition = StopCondition(
+            sensor=AbsoluteRotaryEncoder(target=gear),
+            threshold=AngularPosition(5, 'rad'),
+            operator=StopCondition.greater_than
+        )
+        late_condition = StopCondition(
+            sensor=AbsoluteRotaryEncoder(target=gear),
+            threshold=AngularPosition(10, 'rad'),
+            operator=StopCondition.greater_than,
+            terminal=False
+        )
+        solver = Solver(powertrain=powertrain)
+        solver.run(
+            time_discretization=TimeInterval(0.05, 'sec'),
+            simulation_time=TimeInterval(5, 'sec'),
+            stop_condition=[speed_condition, position_condition, late_condition],
+            engine=engine,
+            integrator=integrator
+        )
+
+        assert len(speed_condition.event_times) == 1
+        assert len(position_condition.event_times) == 1
+        assert late_condition.event_times == []
+        assert speed_condition.event_times[0] < \
+            position_condition.event_times[0]
+        assert powertrain.time[-1] == position_condition.event_times[0]
+        assert gear.angular_position > AngularPosition(5, 'rad')
+        assert np.isclose(
+            gear.angular_position.to('rad').value,
+            5,
+            rtol=1e-6
+        )
+        assert gear.time_variables['angular position'][-1] == \
+            gear.angular_position
+        speed_values = gear.time_variables['angular speed'].get_values(
+            unit='rad/s'
+        )
+        event_index = np.searchsorted(
+            powertrain.time.get_values(unit='sec'),
+            speed_condition.event_times[0].to('sec').value
+        )
+        assert speed_values[event_index - 1] < 20 <= speed_values[event_index]
+
+    @mark.genuine
+    @given(
+        time_discretization=time_intervals(),
+        simulation_steps=integers(min_value=2, max_value=100),
+        every=integers(min_value=1, max_value=10),
+        aggregation=sampled_from(elements=['last', 'mean', 'min', 'max']),
+        engine=sampled_from(elements=['object', 'array']),
+        powertrain=powertrains(),
+        initial_angular_position=angular_positions(),
+        initial_angular_speed=angular_speeds())
+    @settings(max_examples=100, deadline=None)
+    def test_recording_policy(
+        self,
+        time_discretization,
+        simulation_steps,
+        every,
+        aggregation,
+        engine,
+        powertrain,
+        initial_angular_position,
+        initial_angular_speed
+    ):
+        warnings.filterwarnings('ignore', category=RuntimeWarning)
+
+        powertrain.elements[-1].angular_position = initial_angular_position
+        powertrain.elements[-1].angular_speed = initial_angular_speed
+        powertrain.elements[-1].external_torque = \
+            lambda time, angular_position, angular_speed: Torque(0.001, 'Nm')
+        full_powertrain = deepcopy(powertrain)
+        recorded_powertrain = deepcopy(powertrain)
+        simulation_time = time_discretization*simulation_steps
+
+        Solver(powertrain=full_powertrain).run(
+            time_discretization=time_discretization,
+            simulation_time=simulation_time,
+            engine=engine
+        )
+        Solver(powertrain=recorded_powertrain).run(
+            time_discretization=time_discretization,
+            simulation_time=simulation_time,
+            engine=engine,
+            recording_policy=RecordingPolicy(
+                every=every,
+                aggregation=aggregation
+            )
+        )
+
+        n_steps = len(full_powertrain.time) - 1
+        windows = [
+            slice(1 + i, min(1 + i + every, n_steps + 1))
+            for i in range(0, n_steps, every)
+        ]
+        assert len(recorded_powertrain.time) == len(windows) + 1
+        assert recorded_powertrain.time[0] == full_powertrain.time[0]
+        assert recorded_powertrain.time[-1] == full_powertrain.time[-1]
+
+        function = {
+            'last': lambda values: values[-1],
+            'mean': np.mean,
+            'min': np.min,
+            'max': np.max
+        }[aggregation]
+        for full_element, recorded_element in zip(
+            full_powertrain.elements,
+            recorded_powertrain.elements
+        ):
+            for variable, values in full_element.time_variables.items():
+                if variable == 'pwm':
+                    values = values.get_values()
+                    recorded_values = \
+                        recorded_element.time_variables[variable].get_values()
+                else:
+                    unit = values.unit
+                    values = values.get_values()
+                    recorded_values = recorded_element.time_variables[
+                        variable
+                    ].get_values(unit)
+                expected_values = np.array(
+                    [values[0]] +
+                    [function(values[window]) for window in windows]
+                )
+                finite = np.isfinite(expected_values) & \
+                    np.isfinite(recorded_values)
+                np.testing.assert_allclose(
+                    recorded_values[finite],
+                    expected_values[finite],
+                    rtol=1e-6,
+                    atol=1e-9
+                )
+
+    @mark.genuine
+    @given(
+        time_discretization=time_intervals(),
+        simulation_steps=integers(min_value=2, max_value=2500),
+        engine=sampled_from(elements=['object', 'array']),
+        retain_time_variables=booleans(),
+        powertrain=powertrains(),
+        initial_angular_position=angular_positions(),
+        initial_angular_speed=angular_speeds())
+    @settings(max_examples=20, deadline=None)
+    def test_sinks(
+        self,
+        time_discretization,
+        simulation_steps,
+        engine,
+        retain_time_variables,
+        powertrain,
+        initial_angular_position,
+        initial_angular_speed
+    ):
+        warnings.filterwarnings('ignore', category=RuntimeWarning)
+
+        powertrain.elements[-1].angular_position = initial_angular_position
+        powertrain.elements[-1].angular_speed = initial_angular_speed
+        powertrain.elements[-1].external_torque = \
+            lambda time, angular_position, angular_speed: Torque(0.001, 'Nm')
+        reference_powertrain = deepcopy(powertrain)
+        simulation_time = time_discretization*simulation_steps
+
+        with tempfile.TemporaryDirectory() as directory:
+            batches = []
+            sinks = [
+                CSVSink(folder_path=os.path.join(directory, 'sink')),
+                CallbackSink(callback=lambda data: batches.append(data))
+            ]
+            solver = Solver(powertrain=powertrain)
+            reference_solver = Solver(powertrain=reference_powertrain)
+            for _ in range(2):
+                solver.run(
+                    time_discretization=time_discretization,
+                    simulation_time=simulation_time,
+                    engine=engine,
+                    sinks=sinks,
+                    retain_time_variables=retain_time_variables
+                )
+                reference_solver.run(
+                    time_discretization=time_discretization,
+                    simulation_time=simulation_time,
+                    engine=engine
+                )
+            reference_powertrain.export_time_variables(
+                folder_path=os.path.join(directory, 'reference')
+            )
+
+            if retain_time_variables:
+                assert len(powertrain.time) == len(reference_powertrain.time)
+            else:
+                assert len(powertrain.time) == 2
+                assert powertrain.time[0] == reference_powertrain.time[0]
+                assert powertrain.time[-1] == reference_powertrain.time[-1]
+
+            for element in reference_powertrain.elements:
+                reference_data = pd.read_csv(
+                    os.path.join(directory, 'reference', element.name + '.csv')
+                )
+                sink_data = pd.read_csv(
+                    os.path.join(directory, 'sink', element.name + '.csv')
+                )
+                callback_data = pd.concat(
+                    [batch[element.name] for batch in batches]
+                )
+
+                for data in [sink_data, callback_data]:
+                    assert list(data.columns) == list(reference_data.columns)
+                    assert data.shape == reference_data.shape
+                    np.testing.assert_allclose(
+                        data.values.astype(float),
+                        reference_data.values.astype(float),
+                        rtol=1e-9,
+                        atol=1e-12,
+                        equal_nan=True
+                    )
+
     @mark.error
     def test_raises_type_error(self, solver_run_type_error):
         if solver_run_type_error:
@@ -0,0 +1,221 @@
+from gearpy.mechanical_objects import DCMotor, SpurGear
+from gearpy.powertrain import Powertrain
+from gearpy.solver import Solver, SteadyStateSolver
+from gearpy.units import (
+    AngularPosition,
+    AngularSpeed,
+    Current,
+    InertiaMoment,
+    Length,
+    Stress,
+    Time,
+    TimeInterval,
+    Torque
+)
+from gearpy.utils import add_fixed_joint, add_gear_mating
+from hypothesis import given, settings, HealthCheck
+from hypothesis.strategies import floats
+import numpy as np
+from pytest import mark, raises
+from tests.conftest import powertrains
+from tests.test_solver.conftest import PowertrainFake
+import warnings
+
+
+def build_powertrain(loaded: bool = True) -> Powertrain:
+    motor = DCMotor(
+        name='motor',
+        inertia_moment=InertiaMoment(1e-5, 'kgm^2'),
+        no_load_speed=AngularSpeed(1000, 'rpm'),
+        maximum_torque=Torque(1, 'Nm'),
+        no_load_electric_current=Current(0.1, 'A'),
+        maximum_electric_current=Current(2, 'A')
+    )
+    gear_1 = SpurGear(
+        name='gear 1',
+        n_teeth=10,
+        inertia_moment=InertiaMoment(1e-5, 'kgm^2'),
+        module=Length(1, 'mm'),
+        face_width=Length(5, 'mm'),
+        elastic_modulus=Stress(200, 'GPa')
+    )
+    gear_2 = SpurGear(
+        name='gear 2',
+        n_teeth=40,
+        inertia_moment=InertiaMoment(1e-4, 'kgm^2'),
+        module=Length(1, 'mm'),
+        face_width=Length(5, 'mm'),
+        elastic_modulus=Stress(200, 'GPa')
+    )
+    add_fixed_joint(master=motor, slave=gear_1)
+    add_gear_mating(master=gear_1, slave=gear_2, efficiency=0.9)
+    if loaded:
+        gear_2.external_torque = \
+            lambda time, angular_position, angular_speed: \
+            Torque(1 + 0.01*angular_speed.to('rad/s').value, 'Nm')
+    gear_2.angular_position = AngularPosition(0, 'rad')
+    gear_2.angular_speed = AngularSpeed(0, 'rad/s')
+    motor.pwm = 0.8
+
+    return Powertrain(motor=motor)
+
+
+@mark.solver
+class TestSteadyStateSolverInit:
+
+    @mark.genuine
+    @given(powertrain=powertrains())
+    @settings(
+        max_examples=100,
+        deadline=None,
+        suppress_health_check=[HealthCheck.too_slow]
+    )
+    def test_method(self, powertrain):
+        steady_state_solver = SteadyStateSolver(powertrain=powertrain)
+
+        assert steady_state_solver._SteadyStateSolver__powertrain == \
+            powertrain
+
+    @mark.error
+    def test_raises_type_error(self, steady_state_solver_init_type_error):
+        with raises(TypeError):
+            SteadyStateSolver(**steady_state_solver_init_type_error)
+
+    @mark.error
+    def test_raises_value_error(self):
+        with raises(ValueError):
+            SteadyStateSolver(powertrain=PowertrainFake([]))
+
+
+@mark.solver
+class TestSteadyStateSolverRun:
+
+    @mark.genuine
+    @given(
+        powertrain=powertrains(),
+        load_torque=floats(
+            allow_nan=False,
+            allow_infinity=False,
+            min_value=-10,
+            max_value=10
+        )
+    )
+    @settings(
+        max_examples=100,
+        deadline=None,
+        suppress_health_check=[HealthCheck.too_slow]
+    )
+    def test_method(self, powertrain, load_torque):
+        warnings.filterwarnings('ignore', category=RuntimeWarning)
+
+        powertrain.elements[-1].external_torque = \
+            lambda time, angular_position, angular_speed: \
+            Torque(load_torque, 'Nm')
+        SteadyStateSolver(powertrain=powertrain).run()
+
+        compiled = powertrain.compiled
+        elements = powertrain.elements
+        last_element = elements[-1]
+        angular_speed = last_element.angular_speed.to('rad/s').value
+        for element, kinematic_gain in zip(
+            elements,
+            compiled.kinematic_gains
+        ):
+            np.testing.assert_allclose(
+                element.angular_speed.to('rad/s').value,
+                kinematic_gain*angular_speed,
+                rtol=1e-12
+            )
+            assert element.angular_acceleration.value == 0
+        if angular_speed != 0 or not compiled.self_locking:
+            np.testing.assert_allclose(
+                last_element.driving_torque.to('Nm').value,
+                last_element.load_torque.to('Nm').value,
+                rtol=1e-6,
+                atol=1e-9
+            )
+
+    @mark.genuine
+    def test_transient_convergence(self):
+        steady_state_powertrain = build_powertrain()
+        transient_powertrain = build_powertrain()
+
+        SteadyStateSolver(powertrain=steady_state_powertrain).run()
+        Solver(powertrain=transient_powertrain).run(
+            time_discretization=TimeInterval(1, 'ms'),
+            simulation_time=TimeInterval(5, 'sec'),
+            engine='array'
+        )
+
+        for steady_state_element, transient_element in zip(
+            steady_state_powertrain.elements,
+            transient_powertrain.elements
+        ):
+            np.testing.assert_allclose(
+                steady_state_element.angular_speed.to('rad/s').value,
+                transient_element.angular_speed.to('rad/s').value,
+                rtol=1e-9
+            )
+            for variable in ['driving_torque', 'load_torque']:
+                np.testing.assert_allclose(
+                    getattr(steady_state_element, variable).to('Nm').value,
+                    getattr(transient_element, variable).to('Nm').value,
+                    rtol=1e-9
+                )
+            if isinstance(steady_state_element, SpurGear):
+                for variable in ['tangential_force', 'bending_stress',
+                                 'contact_stress']:
+                    np.testing.assert_allclose(
+                        getattr(steady_state_element, variable).value,
+                        getattr(transient_element, variable).to(
+                            getattr(steady_state_element, variable).unit
+                        ).value,
+                        rtol=1e-9
+                    )
+        np.testing.assert_allclose(
+            steady_state_powertrain.elements[0].electric_current.value,
+            transient_powertrain.elements[0].electric_current.to(
+                steady_state_powertrain.elements[0].electric_current.unit
+            ).value,
+            rtol=1e-9
+        )
+
+    @mark.genuine
+    def test_null_pwm(self):
+        powertrain = build_powertrain()
+        powertrain.elements[0].pwm = 0
+
+        SteadyStateSolver(powertrain=powertrain).run(time=Time(1, 'sec'))
+
+        # a powertrain which is not self-locking is driven backwards by the
+        # load, down to the speed at which the load torque is null
+        np.testing.assert_allclose(
+            powertrain.elements[-1].angular_speed.to('rad/s').value,
+            -100
+        )
+
+    @mark.error
+    def test_raises_type_error(self, steady_state_solver_run_type_error):
+        with raises(TypeError):
+            SteadyStateSolver(powertrain=build_powertrain()).run(
+                **steady_state_solver_run_type_error
+            )
+
+    @mark.error
+    def test_raises_value_error(self):
+        powertrain = build_powertrain(loaded=False)
+        with raises(ValueError):
+            SteadyStateSolver(powertrain=powertrain).run()
+
+        powertrain = build_powertrain()
+        powertrain.elements[-1].external_torque = \
+            lambda time, angular_position, angular_speed: Torque(1, 'Nm')
+        powertrain.elements[0].pwm = 0
+        with raises(ValueError):
+            SteadyStateSolver(powertrain=powertrain).run()
+
+        powertrain = build_powertrain()
+        powertrain.elements[1].external_torque = \
+            lambda time, angular_position, angular_speed: Torque(1, 'Nm')
+        with raises(ValueError):
+            SteadyStateSolver(powertrain=powertrain).run()
@@ -0,0 +1,116 @@
+from gearpy.solver import StepSizeControl
+from hypothesis import given, settings
+from hypothesis.strategies import floats
+import numpy as np
+from pytest import mark, raises
+from tests.conftest import time_intervals
+
+
+@mark.solver
+class TestStepSizeControlInit:
+
+    @mark.genuine
+    @given(
+        relative_tolerance=floats(min_value=1e-12, max_value=1),
+        absolute_tolerance=floats(min_value=1e-12, max_value=1),
+        minimum_time_discretization=time_intervals(),
+        multiplier=floats(min_value=1, max_value=1000)
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(
+        self,
+        relative_tolerance,
+        absolute_tolerance,
+        minimum_time_discretization,
+        multiplier
+    ):
+        maximum_time_discretization = minimum_time_discretization*multiplier
+        step_size_control = StepSizeControl(
+            relative_tolerance=relative_tolerance,
+            absolute_tolerance=absolute_tolerance,
+            minimum_time_discretization=minimum_time_discretization,
+            maximum_time_discretization=maximum_time_discretization
+        )
+
+        assert step_size_control.relative_tolerance == relative_tolerance
+        assert step_size_control.absolute_tolerance == absolute_tolerance
+        assert step_size_control.minimum_time_discretization == \
+            minimum_time_discretization
+        assert step_size_control.maximum_time_discretization == \
+            maximum_time_discretization
+
+    @mark.genuine
+    def test_method_default(self):
+        step_size_control = StepSizeControl()
+
+        assert step_size_control.relative_tolerance == 1e-3
+        assert step_size_control.absolute_tolerance == 1e-6
+        assert step_size_control.minimum_time_discretization is None
+        assert step_size_control.maximum_time_discretization is None
+
+    @mark.error
+    def test_raises_type_error(self, step_size_control_init_type_error):
+        with raises(TypeError):
+            StepSizeControl(**step_size_control_init_type_error)
+
+    @mark.error
+    def test_raises_value_error(self, step_size_control_init_value_error):
+        with raises(ValueError):
+            StepSizeControl(**step_size_control_init_value_error)
+
+
+@mark.solver
+class TestStepSizeControlGetTimeStepBounds:
+
+    @mark.genuine
+    @given(
+        time_discretization=time_intervals(),
+        minimum_time_discretization=time_intervals(),
+        multiplier=floats(min_value=1, max_value=1000)
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(
+        self,
+        time_discretization,
+        minimum_time_discretization,
+        multiplier
+    ):
+        maximum_time_discretization = minimum_time_discretization*multiplier
+        minimum_time_step, maximum_time_step = StepSizeControl(
+            minimum_time_discretization=minimum_time_discretization,
+            maximum_time_discretization=maximum_time_discretization
+        ).get_time_step_bounds(time_discretization=time_discretization)
+
+        assert np.isclose(
+            minimum_time_step,
+            minimum_time_discretization.to('sec').value
+        )
+        assert np.isclose(
+            maximum_time_step,
+            maximum_time_discretization.to('sec').value
+        )
+
+    @mark.genuine
+    @given(time_discretization=time_intervals())
+    @settings(max_examples=100, deadline=None)
+    def test_method_default(self, time_discretization):
+        minimum_time_step, maximum_time_step = \
+            StepSizeControl().get_time_step_bounds(
+                time_discretization=time_discretization
+            )
+
+        assert np.isclose(
+            minimum_time_step,
+            time_discretization.to('sec').value/1000
+        )
+        assert maximum_time_step == np.inf
+
+    @mark.error
+    def test_raises_type_error(
+        self,
+        step_size_control_get_time_step_bounds_type_error
+    ):
+        with raises(TypeError):
+            StepSizeControl().get_time_step_bounds(
+                time_discretization=step_size_control_get_time_step_bounds_type_error
+            )
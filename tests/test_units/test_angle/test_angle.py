@@ -571,3 +571,32 @@ class TestAngleTo:
         for fake_unit in fake_units:
             with raises(KeyError):
                 basic_angle.to(fake_unit)
+
+
+@mark.units
+class TestAngleNew:
+
+    @mark.genuine
+    @given(
+        value=floats(
+            allow_nan=False,
+            allow_infinity=False,
+            min_value=0,
+            max_value=1000
+        ),
+        unit=sampled_from(elements=units_list),
+        target_unit=sampled_from(elements=units_list)
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, value, unit, target_unit):
+        angle = Angle._new(value=value, unit=unit)
+
+        assert isinstance(angle, Angle)
+        assert angle.value == value
+        assert angle.unit == unit
+        assert angle == Angle(value=value, unit=unit)
+
+        angle.to(target_unit, inplace=True)
+
+        assert angle.unit == target_unit
+        assert angle == Angle(value=value, unit=unit)
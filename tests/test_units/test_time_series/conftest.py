@@ -0,0 +1,115 @@
+from gearpy.units import TimeSeries, Torque, UnitBase
+from pytest import fixture
+from tests.conftest import types_to_check
+
+
+time_series_init_type_error = [
+    {'unit_class': type_to_check} for type_to_check in types_to_check
+    if not (
+        isinstance(type_to_check, type) and
+        issubclass(type_to_check, UnitBase)
+    ) and type_to_check is not None
+]
+
+
+@fixture(params=time_series_init_type_error)
+def time_series_init_type_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        type_to_check for type_to_check in types_to_check
+        if not isinstance(type_to_check, Torque) and type_to_check is not None
+    ]
+)
+def time_series_append_type_error(request):
+    return request.param
+
+
+time_series_reserve_type_error = [
+    {'capacity': type_to_check} for type_to_check in types_to_check
+    if not isinstance(type_to_check, int) or isinstance(type_to_check, bool)
+]
+
+
+@fixture(params=time_series_reserve_type_error)
+def time_series_reserve_type_error(request):
+    return request.param
+
+
+time_series_extend_values_type_error = [
+    {'values': [1, 2], 'unit': type_to_check}
+    for type_to_check in types_to_check
+    if not isinstance(type_to_check, str) and type_to_check is not None
+]
+
+
+@fixture(params=time_series_extend_values_type_error)
+def time_series_extend_values_type_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        {'series': TimeSeries(Torque), 'values': [1, 2], 'unit': None},
+        {'series': TimeSeries(), 'values': [1, 2], 'unit': 'Nm'}
+    ]
+)
+def time_series_extend_values_value_error(request):
+    return request.param
+
+
+time_series_get_values_type_error = [
+    *[
+        {'unit': type_to_check} for type_to_check in types_to_check
+        if not isinstance(type_to_check, str) and type_to_check is not None
+    ],
+    *[
+        {'start': type_to_check} for type_to_check in types_to_check
+        if not isinstance(type_to_check, int) or
+        isinstance(type_to_check, bool)
+    ],
+    *[
+        {'stop': type_to_check} for type_to_check in types_to_check
+        if (not isinstance(type_to_check, int) or
+            isinstance(type_to_check, bool)) and type_to_check is not None
+    ]
+]
+
+
+@fixture(params=time_series_get_values_type_error)
+def time_series_get_values_type_error(request):
+    return request.param
+
+
+time_series_aggregate_type_error_1 = [
+    {'window': type_to_check} for type_to_check in types_to_check
+    if not isinstance(type_to_check, int) or isinstance(type_to_check, bool)
+]
+
+time_series_aggregate_type_error_2 = [
+    {'window': 1, 'aggregation': type_to_check}
+    for type_to_check in types_to_check if not isinstance(type_to_check, str)
+]
+
+
+@fixture(
+    params=[
+        *time_series_aggregate_type_error_1,
+        *time_series_aggregate_type_error_2
+    ]
+)
+def time_series_aggregate_type_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        {'window': 0},
+        {'window': 3},
+        {'window': 1, 'aggregation': 'not an aggregation'}
+    ]
+)
+def time_series_aggregate_value_error(request):
+    return request.param
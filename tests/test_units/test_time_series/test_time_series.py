@@ -0,0 +1,324 @@
+from gearpy.units import TimeSeries, Torque, TorqueArray
+from hypothesis import given, settings
+from hypothesis.strategies import integers, lists, sampled_from
+import numpy as np
+from pytest import mark, raises
+from tests.test_units.test_torque.conftest import torques
+
+
+units_list = list(Torque._Torque__UNITS.keys())
+
+
+@mark.units
+class TestTimeSeriesInit:
+
+    @mark.genuine
+    def test_method(self):
+        series = TimeSeries(Torque)
+
+        assert series.unit_class is Torque
+        assert series.unit is None
+        assert len(series) == 0
+        assert series == []
+
+    @mark.error
+    def test_raises_type_error(self, time_series_init_type_error):
+        with raises(TypeError):
+            TimeSeries(**time_series_init_type_error)
+
+
+@mark.units
+class TestTimeSeriesAppend:
+
+    @mark.genuine
+    @given(values=lists(elements=torques(), min_size=1, max_size=100))
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, values):
+        series = TimeSeries(Torque)
+        for value in values:
+            series.append(value)
+
+        assert len(series) == len(values)
+        assert series.unit == values[0].unit
+        assert series.capacity >= len(values)
+        for item, value in zip(series, values):
+            assert isinstance(item, Torque)
+            assert item.unit == values[0].unit
+            assert abs(
+                item.to('Nm').value - value.to('Nm').value
+            ) <= 1e-9*max(1, abs(value.to('Nm').value))
+
+    @mark.genuine
+    def test_missing_values(self):
+        series = TimeSeries(Torque)
+        series.append(None)
+        series.append(Torque(1, 'Nm'))
+
+        assert series[0] is None
+        assert series[1] == Torque(1, 'Nm')
+        assert np.isnan(series.get_values()[0])
+
+    @mark.genuine
+    def test_dimensionless(self):
+        series = TimeSeries()
+        series.extend([1, 0.5, -1])
+
+        assert series.unit is None
+        assert series == [1, 0.5, -1]
+
+    @mark.error
+    def test_raises_type_error(self, time_series_append_type_error):
+        series = TimeSeries(Torque)
+        with raises(TypeError):
+            series.append(time_series_append_type_error)
+        assert len(series) == 0
+
+
+@mark.units
+class TestTimeSeriesMutableSequence:
+
+    @mark.genuine
+    @given(
+        values=lists(elements=torques(unit='Nm'), min_size=2, max_size=20),
+        index=integers(min_value=-20, max_value=20)
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, values, index):
+        series = TimeSeries(Torque)
+        series.extend(values)
+        reference = list(values)
+
+        series.insert(index, Torque(1, 'Nm'))
+        reference.insert(index, Torque(1, 'Nm'))
+        assert series == reference
+
+        series[0] = Torque(2, 'Nm')
+        reference[0] = Torque(2, 'Nm')
+        assert series == reference
+        assert series[1:] == reference[1:]
+
+        del series[-1]
+        del reference[-1]
+        assert series == reference
+
+        series.clear()
+        assert series == []
+        assert series.unit is None
+
+
+@mark.units
+class TestTimeSeriesReserve:
+
+    @mark.genuine
+    @given(capacity=integers(min_value=0, max_value=10000))
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, capacity):
+        series = TimeSeries(Torque)
+        series.reserve(capacity)
+
+        assert series.capacity >= capacity
+        assert len(series) == 0
+
+    @mark.error
+    def test_raises_type_error(self, time_series_reserve_type_error):
+        with raises(TypeError):
+            TimeSeries(Torque).reserve(**time_series_reserve_type_error)
+
+    @mark.error
+    def test_raises_value_error(self):
+        with raises(ValueError):
+            TimeSeries(Torque).reserve(capacity=-1)
+
+
+@mark.units
+class TestTimeSeriesExtendValues:
+
+    @mark.genuine
+    @given(
+        first_value=torques(),
+        values=lists(
+            elements=integers(min_value=-1000, max_value=1000),
+            max_size=100
+        ),
+        unit=sampled_from(elements=units_list)
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, first_value, values, unit):
+        series = TimeSeries(Torque)
+        series.append(first_value)
+        series.extend_values(values=np.array(values), unit=unit)
+
+        assert len(series) == len(values) + 1
+        for item, value in zip(series[1:], values):
+            assert item.unit == first_value.unit
+            assert abs(
+                item.to(unit).value - value
+            ) <= 1e-9*max(1, abs(value))
+
+    @mark.error
+    def test_raises_type_error(self, time_series_extend_values_type_error):
+        with raises(TypeError):
+            TimeSeries(Torque).extend_values(
+                **time_series_extend_values_type_error
+            )
+
+    @mark.error
+    def test_raises_value_error(self, time_series_extend_values_value_error):
+        series = time_series_extend_values_value_error.pop('series')
+        with raises(ValueError):
+            series.extend_values(**time_series_extend_values_value_error)
+
+
+@mark.units
+class TestTimeSeriesGetValues:
+
+    @mark.genuine
+    @given(
+        values=lists(elements=torques(), min_size=1, max_size=100),
+        unit=sampled_from(elements=units_list)
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, values, unit):
+        series = TimeSeries(Torque)
+        series.extend(values)
+
+        np.testing.assert_allclose(
+            series.get_values(unit),
+            [value.to(unit).value for value in values],
+            rtol=1e-9,
+            atol=1e-12
+        )
+
+    @mark.genuine
+    @given(
+        values=lists(elements=torques(), min_size=1, max_size=100),
+        start=integers(min_value=-100, max_value=100),
+        stop=integers(min_value=-100, max_value=100)
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method_slice(self, values, start, stop):
+        series = TimeSeries(Torque)
+        series.extend(values)
+
+        np.testing.assert_array_equal(
+            series.get_values(start=start, stop=stop),
+            series.get_values()[start:stop]
+        )
+
+    @mark.error
+    def test_raises_type_error(self, time_series_get_values_type_error):
+        with raises(TypeError):
+            TimeSeries(Torque).get_values(**time_series_get_values_type_error)
+
+    @mark.error
+    def test_raises_value_error(self):
+        with raises(ValueError):
+            TimeSeries().get_values(unit='Nm')
+
+
+@mark.units
+class TestTimeSeriesGetArray:
+
+    @mark.genuine
+    @given(
+        values=lists(elements=torques(), min_size=1, max_size=100),
+        unit=sampled_from(elements=units_list),
+        start=integers(min_value=-100, max_value=100),
+        stop=integers(min_value=-100, max_value=100)
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, values, unit, start, stop):
+        series = TimeSeries(Torque)
+        series.extend(values)
+        array = series.get_array(unit=unit, start=start, stop=stop)
+
+        assert isinstance(array, TorqueArray)
+        assert array.unit == unit
+        np.testing.assert_array_equal(
+            array.values,
+            series.get_values(unit=unit, start=start, stop=stop)
+        )
+
+        array = series.get_array()
+
+        assert array.unit == series.unit
+        np.testing.assert_array_equal(array.values, series.get_values())
+
+    @mark.error
+    def test_raises_type_error(self, time_series_get_values_type_error):
+        with raises(TypeError):
+            TimeSeries(Torque).get_array(**time_series_get_values_type_error)
+
+    @mark.error
+    def test_raises_key_error(self):
+        with raises(KeyError):
+            TimeSeries(Torque).get_array(unit='fake unit')
+
+    @mark.error
+    def test_raises_value_error(self):
+        with raises(ValueError):
+            TimeSeries().get_array()
+
+        with raises(ValueError):
+            TimeSeries(Torque).get_array()
+
+
+@mark.units
+class TestTimeSeriesAggregate:
+
+    @mark.genuine
+    @given(
+        values=lists(elements=torques(unit='Nm'), min_size=1, max_size=100),
+        window=integers(min_value=1, max_value=100),
+        aggregation=sampled_from(elements=['last', 'mean', 'min', 'max'])
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, values, window, aggregation):
+        window = min(window, len(values))
+        series = TimeSeries(Torque)
+        series.extend(values)
+        numerical_values = series.get_values()
+        series.aggregate(window=window, aggregation=aggregation)
+        function = {
+            'last': lambda array: array[-1],
+            'mean': np.mean,
+            'min': np.min,
+            'max': np.max
+        }[aggregation]
+
+        assert len(series) == len(values) - window + 1
+        np.testing.assert_allclose(
+            series.get_values(),
+            [*numerical_values[:-window], function(numerical_values[-window:])]
+        )
+
+    @mark.genuine
+    def test_missing_values(self):
+        series = TimeSeries(Torque)
+        series.extend([Torque(1, 'Nm'), None, Torque(3, 'Nm'), None, None])
+        series.aggregate(window=3, aggregation='mean')
+
+        assert series == [Torque(1, 'Nm'), None, Torque(3, 'Nm')]
+
+        series.aggregate(window=2, aggregation='max')
+
+        assert series == [Torque(1, 'Nm'), Torque(3, 'Nm')]
+
+        series.extend([None, None])
+        series.aggregate(window=2, aggregation='min')
+
+        assert series[-1] is None
+
+    @mark.error
+    def test_raises_type_error(self, time_series_aggregate_type_error):
+        series = TimeSeries(Torque)
+        series.extend([Torque(1, 'Nm'), Torque(2, 'Nm')])
+        with raises(TypeError):
+            series.aggregate(**time_series_aggregate_type_error)
+
+    @mark.error
+    def test_raises_value_error(self, time_series_aggregate_value_error):
+        series = TimeSeries(Torque)
+        series.extend([Torque(1, 'Nm'), Torque(2, 'Nm')])
+        with raises(ValueError):
+            series.aggregate(**time_series_aggregate_value_error)
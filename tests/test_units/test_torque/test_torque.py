@@ -598,3 +598,50 @@ class TestTorqueTo:
         for fake_unit in fake_units:
             with raises(KeyError):
                 basic_torque.to(fake_unit)
+
+
+@mark.units
+class TestTorqueNew:
+
+    @mark.genuine
+    @given(
+        value=floats(
+            allow_nan=False,
+            allow_infinity=False,
+            min_value=-1000,
+            max_value=1000
+        ),
+        unit=sampled_from(elements=units_list)
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, value, unit):
+        torque = Torque._new(value=value, unit=unit)
+
+        assert isinstance(torque, Torque)
+        assert torque.value == value
+        assert torque.unit == unit
+        assert torque == Torque(value=value, unit=unit)
+        assert not hasattr(torque, '__dict__')
+
+
+@mark.units
+class TestTorqueToValue:
+
+    @mark.genuine
+    @given(
+        value=floats(
+            allow_nan=False,
+            allow_infinity=False,
+            min_value=-1000,
+            max_value=1000
+        ),
+        unit=sampled_from(elements=units_list)
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, value, unit):
+        torque = Torque(value=value, unit=unit)
+
+        for target_unit in units_list:
+            assert torque._to_value(target_unit) == \
+                torque.to(target_unit).value
+        assert torque.unit == unit
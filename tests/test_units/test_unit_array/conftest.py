@@ -0,0 +1,96 @@
+from gearpy.units import InertiaMoment, Length, Torque, TorqueArray
+import numpy as np
+from tests.conftest import types_to_check
+from pytest import fixture
+
+
+basic_torque_array = TorqueArray([1, 2, 3], 'Nm')
+
+
+unit_array_init_type_error_1 = [
+    {'values': type_to_check, 'unit': 'Nm'}
+    for type_to_check in types_to_check
+    if not isinstance(type_to_check, np.ndarray | list | tuple)
+]
+
+unit_array_init_type_error_2 = [
+    {'values': ['a', 'b'], 'unit': 'Nm'},
+    {'values': [None, 1], 'unit': 'Nm'},
+    {'values': np.array(['a', 'b']), 'unit': 'Nm'}
+]
+
+unit_array_init_type_error_3 = [
+    {'values': [1, 2], 'unit': type_to_check}
+    for type_to_check in types_to_check if not isinstance(type_to_check, str)
+]
+
+
+@fixture(
+    params=[
+        *unit_array_init_type_error_1,
+        *unit_array_init_type_error_2,
+        *unit_array_init_type_error_3
+    ]
+)
+def unit_array_init_type_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        type_to_check for type_to_check in types_to_check
+        if not isinstance(type_to_check, Torque)
+    ]
+)
+def unit_array_add_type_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        type_to_check for type_to_check in types_to_check
+        if not isinstance(type_to_check, float | int | np.ndarray)
+    ]
+)
+def unit_array_mul_type_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        type_to_check for type_to_check in types_to_check
+        if not isinstance(
+            type_to_check,
+            float | int | np.ndarray | InertiaMoment | Length | Torque
+        )
+    ]
+)
+def unit_array_truediv_type_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        type_to_check for type_to_check in types_to_check
+        if not isinstance(type_to_check, Torque)
+    ]
+)
+def unit_array_comparison_type_error(request):
+    return request.param
+
+
+unit_array_to_type_error_1 = [
+    {'target_unit': type_to_check, 'inplace': True}
+    for type_to_check in types_to_check if not isinstance(type_to_check, str)
+]
+
+unit_array_to_type_error_2 = [
+    {'target_unit': 'Nm', 'inplace': type_to_check}
+    for type_to_check in types_to_check
+    if not isinstance(type_to_check, bool)
+]
+
+
+@fixture(params=[*unit_array_to_type_error_1, *unit_array_to_type_error_2])
+def unit_array_to_type_error(request):
+    return request.param
@@ -0,0 +1,434 @@
+from gearpy.units import (
+    AngularAccelerationArray,
+    AngularPositionArray,
+    AngularSpeedArray,
+    AngleArray,
+    InertiaMomentArray,
+    ForceArray,
+    Torque,
+    TorqueArray
+)
+from hypothesis.strategies import booleans, floats, lists, sampled_from
+from hypothesis import given, settings
+import numpy as np
+from tests.test_units.test_angular_speed.conftest import angular_speeds
+from tests.test_units.test_inertia_moment.conftest import inertia_moments
+from tests.test_units.test_length.conftest import lengths
+from tests.test_units.test_time_interval.conftest import time_intervals
+from tests.test_units.test_torque.conftest import torques
+from tests.test_units.test_unit_array.conftest import basic_torque_array
+from pytest import mark, raises
+
+
+units_list = list(Torque._Torque__UNITS.keys())
+values_lists = lists(
+    elements=floats(
+        allow_nan=False,
+        allow_infinity=False,
+        min_value=-1000,
+        max_value=1000
+    ),
+    min_size=1,
+    max_size=10
+)
+
+
+@mark.units
+class TestUnitArrayInit:
+
+    @mark.genuine
+    @given(values=values_lists, unit=sampled_from(elements=units_list))
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, values, unit):
+        torque_array = TorqueArray(values=values, unit=unit)
+
+        assert isinstance(torque_array.values, np.ndarray)
+        assert torque_array.values.dtype == float
+        np.testing.assert_array_equal(torque_array.values, values)
+        assert torque_array.unit == unit
+        assert torque_array.unit_class is Torque
+        assert len(torque_array) == len(values)
+
+    @mark.genuine
+    def test_copies_values(self):
+        values = np.array([1.0, 2.0])
+        torque_array = TorqueArray(values=values, unit='Nm')
+        values[0] = 3.0
+
+        assert torque_array.values[0] == 1.0
+
+    @mark.error
+    def test_raises_type_error(self, unit_array_init_type_error):
+        with raises(TypeError):
+            TorqueArray(**unit_array_init_type_error)
+
+    @mark.error
+    def test_raises_key_error(self):
+        for unit in units_list:
+            with raises(KeyError):
+                TorqueArray(values=[1, 2], unit=f'fake {unit}')
+
+    @mark.error
+    def test_raises_value_error(self):
+        with raises(ValueError):
+            InertiaMomentArray(values=[1, -1], unit='kgm^2')
+
+        with raises(ValueError):
+            AngleArray(values=[1, -1], unit='rad')
+
+
+@mark.units
+class TestUnitArrayGetItem:
+
+    @mark.genuine
+    @given(values=values_lists, unit=sampled_from(elements=units_list))
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, values, unit):
+        torque_array = TorqueArray(values=values, unit=unit)
+
+        for i, torque in enumerate(torque_array):
+            assert isinstance(torque, Torque)
+            assert torque_array[i].value == torque.value == values[i]
+            assert torque.unit == unit
+
+        sliced_array = torque_array[1:]
+
+        assert isinstance(sliced_array, TorqueArray)
+        np.testing.assert_array_equal(sliced_array.values, values[1:])
+        assert sliced_array.unit == unit
+
+
+@mark.units
+class TestUnitArrayAbs:
+
+    @mark.genuine
+    @given(values=values_lists, unit=sampled_from(elements=units_list))
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, values, unit):
+        torque_array = abs(TorqueArray(values=values, unit=unit))
+
+        assert isinstance(torque_array, TorqueArray)
+        np.testing.assert_array_equal(torque_array.values, np.abs(values))
+
+
+@mark.units
+class TestUnitArrayNeg:
+
+    @mark.genuine
+    @given(values=values_lists, unit=sampled_from(elements=units_list))
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, values, unit):
+        torque_array = -TorqueArray(values=values, unit=unit)
+
+        assert isinstance(torque_array, TorqueArray)
+        np.testing.assert_array_equal(torque_array.values, -np.array(values))
+
+    @mark.error
+    def test_raises_value_error(self):
+        with raises(ValueError):
+            -InertiaMomentArray(values=[1, 2], unit='kgm^2')
+
+
+@mark.units
+class TestUnitArrayAdd:
+
+    @mark.genuine
+    @given(
+        values=values_lists,
+        unit=sampled_from(elements=units_list),
+        torque=torques()
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, values, unit, torque):
+        torque_array = TorqueArray(values=values, unit=unit)
+
+        for other in [torque, TorqueArray([torque.value], torque.unit)]:
+            result = torque_array + other
+
+            assert isinstance(result, TorqueArray)
+            assert result.unit == unit
+            np.testing.assert_allclose(
+                result.values,
+                [(Torque(value, unit) + torque).value for value in values],
+                rtol=1e-12,
+                atol=1e-12
+            )
+
+    @mark.error
+    def test_raises_type_error(self, unit_array_add_type_error):
+        with raises(TypeError):
+            basic_torque_array + unit_array_add_type_error
+
+
+@mark.units
+class TestUnitArraySub:
+
+    @mark.genuine
+    @given(
+        values=values_lists,
+        unit=sampled_from(elements=units_list),
+        torque=torques()
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, values, unit, torque):
+        torque_array = TorqueArray(values=values, unit=unit)
+
+        for other in [torque, TorqueArray([torque.value], torque.unit)]:
+            result = torque_array - other
+
+            assert isinstance(result, TorqueArray)
+            assert result.unit == unit
+            np.testing.assert_allclose(
+                result.values,
+                [(Torque(value, unit) - torque).value for value in values],
+                rtol=1e-12,
+                atol=1e-12
+            )
+
+    @mark.error
+    def test_raises_type_error(self, unit_array_add_type_error):
+        with raises(TypeError):
+            basic_torque_array - unit_array_add_type_error
+
+    @mark.error
+    def test_raises_value_error(self):
+        with raises(ValueError):
+            AngleArray([1, 2], 'rad') - AngleArray([2, 1], 'rad')
+
+
+@mark.units
+class TestUnitArrayMul:
+
+    @mark.genuine
+    @given(
+        values=values_lists,
+        unit=sampled_from(elements=units_list),
+        multiplier=floats(
+            allow_nan=False,
+            allow_infinity=False,
+            min_value=-1000,
+            max_value=1000
+        )
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, values, unit, multiplier):
+        torque_array = TorqueArray(values=values, unit=unit)
+        multipliers = np.full(len(values), multiplier)
+
+        for result in [
+            torque_array*multiplier,
+            multiplier*torque_array,
+            torque_array*multipliers,
+            multipliers*torque_array
+        ]:
+            assert isinstance(result, TorqueArray)
+            assert result.unit == unit
+            np.testing.assert_array_equal(
+                result.values,
+                [(Torque(value, unit)*multiplier).value for value in values]
+            )
+
+    @mark.genuine
+    @given(
+        values=values_lists,
+        angular_speed_unit=sampled_from(
+            elements=list(AngularSpeedArray.unit_class._AngularSpeed__UNITS)
+        ),
+        time_interval=time_intervals()
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_dimensions(self, values, angular_speed_unit, time_interval):
+        angular_speed_array = AngularSpeedArray(values, angular_speed_unit)
+        result = angular_speed_array*time_interval
+
+        assert isinstance(result, AngularPositionArray)
+        for value, position in zip(values, result):
+            expected = angular_speed_array.unit_class(
+                value,
+                angular_speed_unit
+            )*time_interval
+            assert position.unit == expected.unit
+            assert np.isclose(position.value, expected.value, rtol=1e-12)
+
+    @mark.error
+    def test_raises_type_error(self, unit_array_mul_type_error):
+        with raises(TypeError):
+            basic_torque_array*unit_array_mul_type_error
+
+    @mark.error
+    def test_raises_value_error(self):
+        with raises(ValueError):
+            InertiaMomentArray(values=[1, 2], unit='kgm^2')*(-1)
+
+
+@mark.units
+class TestUnitArrayTrueDiv:
+
+    @mark.genuine
+    @given(
+        values=values_lists,
+        unit=sampled_from(elements=units_list),
+        torque=torques(),
+        inertia_moment=inertia_moments(),
+        length=lengths()
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, values, unit, torque, inertia_moment, length):
+        torque_array = TorqueArray(values=values, unit=unit)
+
+        result = torque_array/inertia_moment
+        assert isinstance(result, AngularAccelerationArray)
+        for value, item in zip(values, result):
+            expected = Torque(value, unit)/inertia_moment
+            assert item.unit == expected.unit
+            assert np.isclose(item.value, expected.value, rtol=1e-12)
+
+        result = torque_array/length
+        assert isinstance(result, ForceArray)
+        for value, item in zip(values, result):
+            expected = Torque(value, unit)/length
+            assert item.unit == expected.unit
+            assert np.isclose(item.value, expected.value, rtol=1e-12)
+
+        if abs(torque.value) > 1e-10:
+            result = torque_array/torque
+            assert isinstance(result, np.ndarray)
+            np.testing.assert_allclose(
+                result,
+                [Torque(value, unit)/torque for value in values],
+                rtol=1e-12,
+                atol=1e-12
+            )
+
+    @mark.error
+    def test_raises_type_error(self, unit_array_truediv_type_error):
+        with raises(TypeError):
+            basic_torque_array/unit_array_truediv_type_error
+
+
+@mark.units
+class TestUnitArrayComparison:
+
+    @mark.genuine
+    @given(
+        values=values_lists,
+        unit=sampled_from(elements=units_list),
+        torque=torques()
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, values, unit, torque):
+        torque_array = TorqueArray(values=values, unit=unit)
+        torques_list = [Torque(value, unit) for value in values]
+
+        for other in [torque, TorqueArray([torque.value], torque.unit)]:
+            np.testing.assert_array_equal(
+                torque_array == other,
+                [item == torque for item in torques_list]
+            )
+            np.testing.assert_array_equal(
+                torque_array != other,
+                [item != torque for item in torques_list]
+            )
+            np.testing.assert_array_equal(
+                torque_array > other,
+                [item > torque for item in torques_list]
+            )
+            np.testing.assert_array_equal(
+                torque_array >= other,
+                [item >= torque for item in torques_list]
+            )
+            np.testing.assert_array_equal(
+                torque_array < other,
+                [item < torque for item in torques_list]
+            )
+            np.testing.assert_array_equal(
+                torque_array <= other,
+                [item <= torque for item in torques_list]
+            )
+
+    @mark.error
+    def test_raises_type_error(self, unit_array_comparison_type_error):
+        for operation in [
+            lambda other: basic_torque_array == other,
+            lambda other: basic_torque_array != other,
+            lambda other: basic_torque_array > other,
+            lambda other: basic_torque_array >= other,
+            lambda other: basic_torque_array < other,
+            lambda other: basic_torque_array <= other
+        ]:
+            with raises(TypeError):
+                operation(unit_array_comparison_type_error)
+
+
+@mark.units
+class TestUnitArrayTo:
+
+    @mark.genuine
+    @given(
+        values=values_lists,
+        unit=sampled_from(elements=units_list),
+        inplace=booleans()
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, values, unit, inplace):
+        for target_unit in units_list:
+            torque_array = TorqueArray(values=values, unit=unit)
+            converted_array = torque_array.to(
+                target_unit=target_unit,
+                inplace=inplace
+            )
+
+            assert isinstance(converted_array, TorqueArray)
+            assert converted_array.unit == target_unit
+            np.testing.assert_allclose(
+                converted_array.values,
+                [
+                    Torque(value, unit).to(target_unit).value
+                    for value in values
+                ],
+                rtol=1e-12,
+                atol=1e-12
+            )
+            if inplace:
+                assert converted_array is torque_array
+            else:
+                assert torque_array.unit == unit
+                np.testing.assert_array_equal(torque_array.values, values)
+
+    @mark.genuine
+    @given(
+        angular_speed=angular_speeds(),
+        inertia_moment=inertia_moments()
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_other_classes(self, angular_speed, inertia_moment):
+        angular_speed_array = AngularSpeedArray(
+            [angular_speed.value],
+            angular_speed.unit
+        )
+        inertia_moment_array = InertiaMomentArray(
+            [inertia_moment.value],
+            inertia_moment.unit
+        )
+
+        assert np.isclose(
+            angular_speed_array.to('rpm').values[0],
+            angular_speed.to('rpm').value,
+            rtol=1e-12
+        )
+        assert np.isclose(
+            inertia_moment_array.to('gm^2').values[0],
+            inertia_moment.to('gm^2').value,
+            rtol=1e-12
+        )
+
+    @mark.error
+    def test_raises_type_error(self, unit_array_to_type_error):
+        with raises(TypeError):
+            basic_torque_array.to(**unit_array_to_type_error)
+
+    @mark.error
+    def test_raises_key_error(self):
+        for unit in units_list:
+            with raises(KeyError):
+                basic_torque_array.to(f'fake {unit}')
@@ -0,0 +1,71 @@
+from tests.conftest import types_to_check
+from pytest import fixture
+
+
+registry_register_type_error_1 = [
+    {'dimension': type_to_check, 'units': {'m': 1}}
+    for type_to_check in types_to_check if not isinstance(type_to_check, str)
+]
+
+registry_register_type_error_2 = [
+    {'dimension': 'Length', 'units': type_to_check}
+    for type_to_check in types_to_check if not isinstance(type_to_check, dict)
+]
+
+registry_register_type_error_3 = [
+    {'dimension': 'Length', 'units': {type_to_check: 1}}
+    for type_to_check in types_to_check
+    if not isinstance(type_to_check, str) and type_to_check.__hash__
+]
+
+registry_register_type_error_4 = [
+    {'dimension': 'Length', 'units': {'m': type_to_check}}
+    for type_to_check in types_to_check
+    if not isinstance(type_to_check, float | int) or
+    isinstance(type_to_check, bool)
+]
+
+
+@fixture(
+    params=[
+        *registry_register_type_error_1,
+        *registry_register_type_error_2,
+        *registry_register_type_error_3,
+        *registry_register_type_error_4
+    ]
+)
+def registry_register_type_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        {'dimension': 'Length', 'units': {}},
+        {'dimension': 'Length', 'units': {'m': 0}},
+        {'dimension': 'Length', 'units': {'m': 1, 'mm': -0.001}},
+        {'dimension': 'Time', 'units': {'sec': 1}}
+    ]
+)
+def registry_register_value_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        {'dimension': 'not a dimension', 'unit': 'm'},
+        {'dimension': 'Length', 'unit': 'not a unit'}
+    ]
+)
+def registry_get_unit_id_key_error(request):
+    return request.param
+
+
+@fixture(
+    params=[
+        {'dimension': 'not a dimension', 'unit': 'm', 'target_unit': 'mm'},
+        {'dimension': 'Length', 'unit': 'not a unit', 'target_unit': 'mm'},
+        {'dimension': 'Length', 'unit': 'm', 'target_unit': 'not a unit'}
+    ]
+)
+def registry_get_conversion_factor_key_error(request):
+    return request.param
@@ -0,0 +1,155 @@
+from gearpy.units import (
+    AngularPosition,
+    AngularSpeed,
+    AngularAcceleration,
+    Current,
+    Force,
+    InertiaMoment,
+    Length,
+    Stress,
+    Surface,
+    Time,
+    Torque
+)
+from gearpy.units.unit_registry import UNIT_REGISTRY, UnitRegistry
+from hypothesis.strategies import dictionaries, floats, text
+from hypothesis import given, settings
+import numpy as np
+from pytest import mark, raises
+
+
+unit_classes = [
+    AngularPosition,
+    AngularSpeed,
+    AngularAcceleration,
+    InertiaMoment,
+    Torque,
+    Time,
+    Length,
+    Surface,
+    Force,
+    Stress,
+    Current
+]
+
+
+@mark.units
+class TestUnitRegistryRegister:
+
+    @mark.genuine
+    @given(
+        units=dictionaries(
+            keys=text(min_size=1, max_size=5),
+            values=floats(min_value=1e-6, max_value=1e6),
+            min_size=1,
+            max_size=10
+        )
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, units):
+        registry = UnitRegistry()
+        registry.register(dimension='Dimension', units=units)
+
+        assert registry.dimensions == ('Dimension',)
+        assert registry.get_units('Dimension') == tuple(units)
+
+        matrix = registry.get_conversion_matrix('Dimension')
+        assert matrix.shape == (len(units), len(units))
+        assert not matrix.flags.writeable
+        assert np.all(np.diag(matrix) == 1)
+
+        for i, unit in enumerate(units):
+            assert registry.get_unit_id('Dimension', unit) == i
+            for j, target_unit in enumerate(units):
+                factor = registry.get_conversion_factor(
+                    dimension='Dimension',
+                    unit=unit,
+                    target_unit=target_unit
+                )
+                assert factor == matrix[i, j]
+                assert factor == registry.get_conversions(
+                    'Dimension'
+                )[unit][target_unit]
+                if i != j:
+                    assert factor == units[unit]/units[target_unit]
+
+        registry.register(dimension='Dimension', units=dict(units))
+        assert registry.dimensions == ('Dimension',)
+
+    @mark.error
+    def test_raises_type_error(self, registry_register_type_error):
+        with raises(TypeError):
+            UnitRegistry().register(**registry_register_type_error)
+
+    @mark.error
+    def test_raises_value_error(self, registry_register_value_error):
+        registry = UnitRegistry()
+        registry.register(dimension='Time', units={'sec': 1, 'min': 60})
+        with raises(ValueError):
+            registry.register(**registry_register_value_error)
+
+
+@mark.units
+class TestUnitRegistryGetUnitId:
+
+    @mark.error
+    def test_raises_key_error(self, registry_get_unit_id_key_error):
+        with raises(KeyError):
+            UNIT_REGISTRY.get_unit_id(**registry_get_unit_id_key_error)
+
+
+@mark.units
+class TestUnitRegistryGetConversionFactor:
+
+    @mark.genuine
+    def test_method(self):
+        for unit_class in unit_classes:
+            dimension = unit_class.__name__
+            units = unit_class._UnitBase__UNITS
+            assert UNIT_REGISTRY.get_units(dimension) == tuple(units)
+            for unit in units:
+                for target_unit in units:
+                    factor = UNIT_REGISTRY.get_conversion_factor(
+                        dimension=dimension,
+                        unit=unit,
+                        target_unit=target_unit
+                    )
+                    assert factor == unit_class._conversion_factor(
+                        unit=unit,
+                        target_unit=target_unit
+                    )
+                    assert factor == unit_class(1, unit).to(target_unit).value
+
+    @mark.genuine
+    @given(
+        value=floats(
+            allow_nan=False,
+            allow_infinity=False,
+            min_value=1e-3,
+            max_value=1000
+        )
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_scalar_conversion(self, value):
+        # single values are converted with the factors of the two units, not
+        # with the precomputed factor, so converted values are not changed by
+        # a different rounding
+        for unit_class in unit_classes:
+            units = unit_class._UnitBase__UNITS
+            for unit in units:
+                unit_object = unit_class(value, unit)
+                for target_unit in units:
+                    if target_unit == unit:
+                        continue
+                    expected_value = value*units[unit]/units[target_unit]
+                    assert unit_object.to(target_unit).value == \
+                        expected_value
+                    assert unit_object._to_value(target_unit) == \
+                        expected_value
+
+    @mark.error
+    def test_raises_key_error(self, registry_get_conversion_factor_key_error):
+        with raises(KeyError):
+            UNIT_REGISTRY.get_conversion_factor(
+                **registry_get_conversion_factor_key_error
+            )
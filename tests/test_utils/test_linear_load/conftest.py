@@ -0,0 +1,26 @@
+from gearpy.units import Torque
+from pytest import fixture
+from tests.conftest import types_to_check
+
+
+linear_load_init_type_error_1 = [
+    {'constant_torque': type_to_check, 'viscous_coefficient': 1}
+    for type_to_check in types_to_check
+    if not isinstance(type_to_check, Torque)
+]
+
+linear_load_init_type_error_2 = [
+    {'constant_torque': Torque(1, 'Nm'), 'viscous_coefficient': type_to_check}
+    for type_to_check in types_to_check
+    if not isinstance(type_to_check, float | int)
+]
+
+
+@fixture(
+    params=[
+        *linear_load_init_type_error_1,
+        *linear_load_init_type_error_2
+    ]
+)
+def linear_load_init_type_error(request):
+    return request.param
@@ -0,0 +1,71 @@
+from gearpy.units import AngularPosition, Time, Torque
+from gearpy.utils import LinearLoad
+from hypothesis import given, settings
+from hypothesis.strategies import floats
+from pytest import mark, raises
+from tests.test_units.test_angular_speed.conftest import angular_speeds
+from tests.test_units.test_torque.conftest import torques
+import numpy as np
+
+
+@mark.utils
+class TestLinearLoadInit:
+
+    @mark.genuine
+    @given(
+        constant_torque=torques(),
+        viscous_coefficient=floats(
+            allow_nan=False,
+            allow_infinity=False,
+            min_value=-10,
+            max_value=10
+        )
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, constant_torque, viscous_coefficient):
+        linear_load = LinearLoad(
+            constant_torque=constant_torque,
+            viscous_coefficient=viscous_coefficient
+        )
+
+        assert linear_load.constant_torque == constant_torque
+        assert linear_load.viscous_coefficient == viscous_coefficient
+
+    @mark.error
+    def test_raises_type_error(self, linear_load_init_type_error):
+        with raises(TypeError):
+            LinearLoad(**linear_load_init_type_error)
+
+
+@mark.utils
+class TestLinearLoadCall:
+
+    @mark.genuine
+    @given(
+        constant_torque=torques(),
+        viscous_coefficient=floats(
+            allow_nan=False,
+            allow_infinity=False,
+            min_value=-10,
+            max_value=10
+        ),
+        angular_speed=angular_speeds()
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, constant_torque, viscous_coefficient, angular_speed):
+        linear_load = LinearLoad(
+            constant_torque=constant_torque,
+            viscous_coefficient=viscous_coefficient
+        )
+        load_torque = linear_load(
+            time=Time(1, 'sec'),
+            angular_position=AngularPosition(1, 'rad'),
+            angular_speed=angular_speed
+        )
+
+        assert isinstance(load_torque, Torque)
+        np.testing.assert_allclose(
+            load_torque.to('Nm').value,
+            constant_torque.to('Nm').value +
+            viscous_coefficient*angular_speed.to('rad/s').value
+        )
@@ -1,5 +1,5 @@
 from gearpy.sensors import SensorBase
-from gearpy.units import Current, UnitBase
+from gearpy.units import Current, Time, UnitBase
 from gearpy.utils import StopCondition
 from gearpy.utils.stop_condition.operator_base import OperatorBase
 from pytest import fixture
@@ -34,11 +34,23 @@ stop_condition_init_type_error_3 = [
 ]
 
 
+stop_condition_init_type_error_4 = [
+    {
+        'sensor': basic_amperometer,
+        'threshold': Current(1, 'A'),
+        'operator': StopCondition.greater_than,
+        'terminal': type_to_check
+    } for type_to_check in types_to_check
+    if not isinstance(type_to_check, bool)
+]
+
+
 @fixture(
     params=[
         *stop_condition_init_type_error_1,
         *stop_condition_init_type_error_2,
-        *stop_condition_init_type_error_3
+        *stop_condition_init_type_error_3,
+        *stop_condition_init_type_error_4
     ]
 )
 def stop_condition_init_type_error(request):
@@ -66,3 +78,13 @@ stop_condition_check_condition_type_error_2 = [
 )
 def stop_condition_check_condition_type_error(request):
     return request.param
+
+
+@fixture(
+    params=[
+        type_to_check for type_to_check in types_to_check
+        if not isinstance(type_to_check, Time)
+    ]
+)
+def stop_condition_add_event_time_type_error(request):
+    return request.param
@@ -10,13 +10,14 @@ from gearpy.units import (
     AngularSpeed,
     Current,
     InertiaMoment,
+    Time,
     Torque,
     UnitBase
 )
 from gearpy.utils import StopCondition
 from gearpy.utils.stop_condition.operator_base import OperatorBase
 from hypothesis import given, settings
-from hypothesis.strategies import sampled_from, one_of
+from hypothesis.strategies import booleans, floats, sampled_from, one_of
 from pytest import mark, raises
 from tests.conftest import basic_amperometer, basic_encoder, basic_tachometer
 from tests.test_units.test_current.conftest import currents
@@ -47,15 +48,17 @@ class TestStopConditionInit:
                 StopCondition.less_than,
                 StopCondition.less_than_or_equal_to
             ]
-        )
+        ),
+        terminal=booleans()
     )
     @settings(max_examples=100, deadline=None)
-    def test_method(self, sensor, operator):
+    def test_method(self, sensor, operator, terminal):
         threshold = threshold_map[sensor]
         condition = StopCondition(
             sensor=sensor,
             threshold=threshold,
-            operator=operator
+            operator=operator,
+            terminal=terminal
         )
 
         assert isinstance(condition.sensor, SensorBase)
@@ -64,6 +67,8 @@ class TestStopConditionInit:
         assert condition.threshold == threshold
         assert isinstance(condition.operator, OperatorBase)
         assert condition.operator == operator
+        assert condition.terminal == terminal
+        assert condition.event_times == []
 
     @mark.error
     def test_raises_type_error(self, stop_condition_init_type_error):
@@ -140,3 +145,82 @@ class TestStopConditionCheckCondition:
         ]:
             with raises(TypeError):
                 operator(**stop_condition_check_condition_type_error)
+
+
+@mark.utils
+class TestStopConditionComputeResidual:
+
+    @mark.genuine
+    @given(
+        threshold=one_of(angular_positions(), angular_speeds(), currents())
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, threshold):
+        motor = DCMotor(
+            name='motor',
+            inertia_moment=InertiaMoment(1, 'kgm^2'),
+            no_load_speed=AngularSpeed(1000, 'rpm'),
+            maximum_torque=Torque(10, 'Nm'),
+            no_load_electric_current=Current(0, 'A'),
+            maximum_electric_current=Current(5, 'A')
+        )
+
+        if isinstance(threshold, AngularPosition):
+            motor.angular_position = AngularPosition(1, 'rot')
+            sensor = AbsoluteRotaryEncoder(target=motor)
+        elif isinstance(threshold, AngularSpeed):
+            motor.angular_speed = AngularSpeed(10, 'rad/s')
+            sensor = Tachometer(target=motor)
+        elif isinstance(threshold, Current):
+            motor.electric_current = Current(1, 'A')
+            sensor = Amperometer(target=motor)
+
+        condition = StopCondition(
+            sensor=sensor,
+            threshold=threshold,
+            operator=StopCondition.greater_than
+        )
+        residual = condition.compute_residual()
+
+        assert isinstance(residual, float | int)
+        assert residual == \
+            sensor.get_value(unit=threshold.unit) - threshold.value
+
+
+@mark.utils
+class TestStopConditionAddEventTime:
+
+    @mark.genuine
+    @given(
+        values=floats(
+            min_value=0,
+            max_value=1000,
+            allow_nan=False,
+            allow_infinity=False
+        )
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_method(self, values):
+        condition = StopCondition(
+            sensor=basic_amperometer,
+            threshold=Current(1, 'A'),
+            operator=StopCondition.greater_than,
+            terminal=False
+        )
+        instants = [Time(values, 'sec'), Time(2*values, 'sec')]
+        for instant in instants:
+            condition.add_event_time(instant=instant)
+
+        assert condition.event_times == instants
+
+    @mark.error
+    def test_raises_type_error(self, stop_condition_add_event_time_type_error):
+        condition = StopCondition(
+            sensor=basic_amperometer,
+            threshold=Current(1, 'A'),
+            operator=StopCondition.greater_than
+        )
+        with raises(TypeError):
+            condition.add_event_time(
+                instant=stop_condition_add_event_time_type_error
+            )